@@ -6,6 +6,10 @@ API 패키지
 # 인증 관련
 from . import kis_auth
 
+# 호출 속도 제어 (우선순위 레인 스케줄러) / 공용 HTTP 세션
+from . import kis_rate_limiter
+from . import kis_http
+
 # 시장 데이터 관련
 from . import kis_market_api
 
@@ -17,6 +21,8 @@ from . import kis_account_api
 
 __all__ = [
     'kis_auth',
+    'kis_rate_limiter',
+    'kis_http',
     'kis_market_api', 
     'kis_order_api',
     'kis_account_api'
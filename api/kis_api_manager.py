@@ -12,6 +12,8 @@ from dataclasses import dataclass
 import pandas as pd
 
 from . import kis_auth
+from . import kis_http
+from . import kis_rate_limiter
 from . import kis_account_api
 from . import kis_market_api
 from . import kis_order_api
@@ -59,10 +61,9 @@ class KISAPIManager:
         self.is_authenticated = False
         self.last_auth_time = None
         
-        # API 호출 통계
+        # API 호출 통계 (호출 간격 제어는 kis_auth._url_fetch 의 공용 스케줄러가 담당)
         self.call_count = 0
         self.error_count = 0
-        self.last_call_time = time.time()
         
         # 실패 재시도 설정
         self.max_retries = 3
@@ -152,9 +153,6 @@ class KISAPIManager:
                 if not self._ensure_authenticated():
                     raise Exception("인증 실패")
                 
-                # API 호출 속도 제한
-                self._rate_limit()
-                
                 # 실제 API 호출
                 result = api_func(*args, **kwargs)
                 
@@ -181,17 +179,6 @@ class KISAPIManager:
         
         return None
     
-    def _rate_limit(self):
-        """API 호출 속도 제한"""
-        current_time = time.time()
-        time_diff = current_time - self.last_call_time
-        
-        # 최소 간격 (60ms) 보장
-        if time_diff < 0.06:
-            time.sleep(0.06 - time_diff)
-        
-        self.last_call_time = time.time()
-    
     # ===========================================
     # 계좌 조회 API
     # ===========================================
@@ -314,16 +301,13 @@ class KISAPIManager:
             return None
     
     def get_current_prices(self, stock_codes: List[str]) -> Dict[str, StockPrice]:
-        """여러 종목 현재가 조회"""
+        """여러 종목 현재가 조회 (호출 간격은 _url_fetch 의 공용 스케줄러가 제어)"""
         prices = {}
         
         for stock_code in stock_codes:
             price = self.get_current_price(stock_code)
             if price:
                 prices[stock_code] = price
-            
-            # API 호출 간격 조절
-            time.sleep(0.1)
         
         return prices
     
@@ -949,7 +933,9 @@ class KISAPIManager:
             'error_count': self.error_count,
             'success_rate': (self.call_count - self.error_count) / max(self.call_count, 1) * 100,
             'is_authenticated': self.is_authenticated,
-            'last_auth_time': self.last_auth_time.isoformat() if self.last_auth_time else None
+            'last_auth_time': self.last_auth_time.isoformat() if self.last_auth_time else None,
+            'rate_limit_lanes': kis_rate_limiter.get_scheduler().get_stats(),
+            'call_timing': kis_http.get_call_stats()
         }
     
 
@@ -969,4 +955,5 @@ class KISAPIManager:
         self.logger.info("KIS API Manager 종료 중...")
         self.is_initialized = False
         self.is_authenticated = False
+        kis_http.close()
         self.logger.info("KIS API Manager 종료 완료") 
\ No newline at end of file
@@ -0,0 +1,112 @@
+"""
+KIS API 비동기 파사드
+
+KIS 함수들은 동기(requests + 스케줄러 대기/재시도 sleep)라서 async 코드에서 직접 부르면
+호출 시간만큼 이벤트 루프 전체(주문 모니터링, 텔레그램 포함)가 멈춘다.
+여기서는 블로킹 호출을 크기가 제한된 전용 스레드 풀에서 실행하고 await 로 돌려준다.
+
+- 호출 간격/우선순위는 기존대로 kis_rate_limiter 스케줄러가 담당 (스레드 간 공유)
+- contextvars 를 복사해 실행하므로 lane_scope() 레인 지정이 그대로 전달된다
+- 주문 경로는 별도 executor 를 넘겨 조회 호출 대기열과 분리할 수 있다
+
+Usage:
+    from api.kis_async import AsyncKISAPIManager, run_blocking
+
+    async_api = AsyncKISAPIManager(api_manager)
+    price = await async_api.get_current_price('005930')
+    prices = await async_api.get_current_prices(['005930', '000660'])
+
+    df = await run_blocking(get_inquire_price, div_code="J", itm_no='005930')
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from .kis_api_manager import AccountInfo, KISAPIManager, OrderResult, StockPrice
+
+# 공용 KIS 호출 스레드 수 (실제 호출 간격은 스케줄러가 제한하므로 HTTP 지연을 겹칠 정도면 충분)
+DEFAULT_MAX_WORKERS = 4
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """프로세스 공용 KIS 호출 executor (최초 호출 시 생성)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix='kis-async')
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """공용 executor 종료 (봇 종료 시)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+async def run_blocking(func: Callable[..., Any], *args, executor: Optional[Executor] = None, **kwargs) -> Any:
+    """동기 함수를 KIS executor 에서 실행하고 결과를 await (현재 컨텍스트 유지)"""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(executor or get_executor(), call)
+
+
+class AsyncKISAPIManager:
+    """KISAPIManager 의 await 가능한 래퍼"""
+
+    def __init__(self, api_manager: KISAPIManager, executor: Optional[Executor] = None):
+        """
+        Args:
+            api_manager: 실제 호출을 수행할 KISAPIManager
+            executor: 전용 executor (None 이면 공용 executor 사용)
+        """
+        self.api_manager = api_manager
+        self._executor = executor
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """임의의 동기 함수를 이 파사드의 executor 에서 실행"""
+        return await run_blocking(func, *args, executor=self._executor, **kwargs)
+
+    # 시장 데이터
+    async def get_current_price(self, stock_code: str) -> Optional[StockPrice]:
+        return await self.run(self.api_manager.get_current_price, stock_code)
+
+    async def get_current_prices(self, stock_codes: List[str]) -> Dict[str, StockPrice]:
+        """여러 종목 현재가 동시 조회 (간격은 스케줄러가 제어)"""
+        results = await asyncio.gather(*(self.get_current_price(code) for code in stock_codes))
+        return {code: price for code, price in zip(stock_codes, results) if price}
+
+    async def get_ohlcv_data(self, stock_code: str, period: str = "D", days: int = 30) -> Optional[pd.DataFrame]:
+        return await self.run(self.api_manager.get_ohlcv_data, stock_code, period, days)
+
+    # 계좌
+    async def get_account_balance(self) -> Optional[AccountInfo]:
+        return await self.run(self.api_manager.get_account_balance)
+
+    async def get_account_balance_quick(self) -> Optional[AccountInfo]:
+        return await self.run(self.api_manager.get_account_balance_quick)
+
+    # 주문
+    async def place_buy_order(self, stock_code: str, quantity: int, price: int, order_type: str = "00") -> OrderResult:
+        return await self.run(self.api_manager.place_buy_order, stock_code, quantity, price, order_type)
+
+    async def place_sell_order(self, stock_code: str, quantity: int, price: int, order_type: str = "00") -> OrderResult:
+        return await self.run(self.api_manager.place_sell_order, stock_code, quantity, price, order_type)
+
+    async def cancel_order(self, order_id: str, stock_code: str, order_type: str = "00") -> OrderResult:
+        return await self.run(self.api_manager.cancel_order, order_id, stock_code, order_type)
+
+    async def get_order_status(self, order_id: str) -> Optional[Dict[str, Any]]:
+        return await self.run(self.api_manager.get_order_status, order_id)
@@ -4,13 +4,14 @@ KIS API 인증/토큰 관리 모듈 (공식 문서 기반)
 import os
 import json
 import time
-import threading
 import yaml
 import requests
 from datetime import datetime
 from typing import Dict, Optional, NamedTuple
 from utils.logger import setup_logger
 from utils.korean_time import now_kst
+from . import kis_http
+from . import kis_rate_limiter
 
 # 설정 import (settings.py에서 .env 파일을 읽어서 제공)
 from config.settings import (
@@ -38,11 +39,12 @@ _last_auth_time = now_kst()
 _autoReAuth = True
 _DEBUG = False
 
-# API 호출 속도 제어를 위한 전역 변수들 추가
-_last_api_call_time = None
+# API 호출 속도 제어를 위한 전역 변수들 추가 (실제 대기는 kis_rate_limiter 스케줄러가 담당)
 _min_api_interval = 0.06  # 최소 60ms 간격 (초당 16-17회로 안전하게 설정, KIS 제한: 1초당 20건)
 _max_retries = 3  # 최대 재시도 횟수
 _retry_delay_base = 1.0  # 기본 재시도 지연 시간(초) - 줄임
+kis_rate_limiter.get_scheduler().configure(_min_api_interval)
+kis_http.configure_pool(_min_api_interval)
 
 # 기본 헤더
 _base_headers = {
@@ -167,7 +169,7 @@ def auth(svr: str = 'prod', product: str = '01') -> bool:
         url += '/oauth2/tokenP'
 
         try:
-            res = requests.post(url, data=json.dumps(p), headers=_getBaseHeader())
+            res = kis_http.post(url, tr_id='tokenP', data=json.dumps(p), headers=_getBaseHeader())
 
             if res.status_code == 200:
                 result = _getResultObject(res.json())
@@ -232,7 +234,7 @@ def set_order_hash_key(headers: Dict, params: Dict) -> None:
     url = f"{_TRENV.my_url}/uapi/hashkey"
 
     try:
-        res = requests.post(url, data=json.dumps(params), headers=headers)
+        res = kis_http.post(url, tr_id='hashkey', data=json.dumps(params), headers=headers)
         if res.status_code == 200:
             headers['hashkey'] = _getResultObject(res.json()).HASH
     except Exception as e:
@@ -316,7 +318,7 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
     for attempt in range(_max_retries + 1):
         try:
             # API 호출 속도 제한 적용
-            _wait_for_api_limit()
+            _wait_for_api_limit(tr_id)
 
             # 헤더 설정
             headers = _getBaseHeader()
@@ -335,9 +337,9 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
             if postFlag:
                 if hashFlag:
                     set_order_hash_key(headers, params)
-                res = requests.post(url, headers=headers, data=json.dumps(params))
+                res = kis_http.post(url, tr_id=tr_id, headers=headers, data=json.dumps(params))
             else:
-                res = requests.get(url, headers=headers, params=params)
+                res = kis_http.get(url, tr_id=tr_id, headers=headers, params=params)
 
             # 응답 처리
             if res.status_code == 200:
@@ -376,9 +378,9 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
                                 if postFlag:
                                     if hashFlag:
                                         set_order_hash_key(headers, params)
-                                    res = requests.post(url, headers=headers, data=json.dumps(params))
+                                    res = kis_http.post(url, tr_id=tr_id, headers=headers, data=json.dumps(params))
                                 else:
-                                    res = requests.get(url, headers=headers, params=params)
+                                    res = kis_http.get(url, tr_id=tr_id, headers=headers, params=params)
 
                                 # 재호출 결과 처리
                                 if res.status_code == 200:
@@ -454,24 +456,12 @@ def _url_fetch(api_url: str, ptr_id: str, tr_cont: str, params: Dict,
     return None
 
 
-_api_rate_lock = threading.Lock()
-
-def _wait_for_api_limit():
-    """API 호출 속도 제한을 위한 대기 (스레드 안전)"""
-    global _last_api_call_time
-
-    with _api_rate_lock:
-        current_time = now_kst().timestamp()
-
-        if _last_api_call_time is not None:
-            elapsed = current_time - _last_api_call_time
-            if elapsed < _min_api_interval:
-                wait_time = _min_api_interval - elapsed
-                if _DEBUG:
-                    logger.debug(f"API 속도 제한: {wait_time:.3f}초 대기 (이전 호출로부터 {elapsed:.3f}초 경과)")
-                time.sleep(wait_time)
-
-        _last_api_call_time = now_kst().timestamp()
+def _wait_for_api_limit(tr_id: Optional[str] = None):
+    """API 호출 속도 제한을 위한 대기 (공용 토큰 버킷 스케줄러, TR ID별 우선순위 레인)"""
+    lane = kis_rate_limiter.lane_for_tr(tr_id)
+    waited = kis_rate_limiter.get_scheduler().acquire(lane)
+    if _DEBUG and waited > 0.001:
+        logger.debug(f"API 속도 제한: {waited:.3f}초 대기 (TR: {tr_id}, 레인: {lane.name})")
 
 
 def _is_rate_limit_error(response_text: str) -> bool:
@@ -491,6 +481,8 @@ def set_api_rate_limit(interval_seconds: float = 0.35, max_retries: int = 3, ret
     _min_api_interval = interval_seconds
     _max_retries = max_retries
     _retry_delay_base = retry_delay
+    kis_rate_limiter.get_scheduler().configure(interval_seconds)
+    kis_http.configure_pool(interval_seconds)
 
     logger.info(f"API 속도 제한 설정 변경: 간격={interval_seconds}초, 최대재시도={max_retries}회, 재시도지연={retry_delay}초")
 
@@ -500,7 +492,10 @@ def get_api_rate_limit_info():
     return {
         'min_interval': _min_api_interval,
         'max_retries': _max_retries,
-        'retry_delay_base': _retry_delay_base
+        'retry_delay_base': _retry_delay_base,
+        'lanes': kis_rate_limiter.get_scheduler().get_stats(),
+        'pool_size': kis_http.pool_size_for_interval(_min_api_interval),
+        'call_timing': kis_http.get_call_stats()
     }
 
 
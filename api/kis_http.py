@@ -0,0 +1,133 @@
+"""
+KIS REST 호출용 공용 HTTP 세션 (keep-alive 커넥션 풀 + 호출 시간 계측)
+
+requests.get/post 를 직접 호출하면 매번 TCP+TLS 핸드셰이크가 발생한다.
+모든 KIS 호출(kis_auth._url_fetch, 해시키, 토큰 발급)이 이 모듈의
+세션을 공유해 커넥션을 재사용한다. kis_chart_api/kis_market_api/
+kis_order_api/kis_account_api 는 모두 _url_fetch 를 거치므로 자동 적용.
+
+풀 크기는 호출 속도 제한에서 동시에 진행될 수 있는 요청 수
+(평균 응답 시간 / 최소 호출 간격) 에 맞춘다.
+"""
+import math
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_EXPECTED_LATENCY = 0.5  # 초, 평균 응답 시간 가정 (풀 크기 산정용)
+_MIN_POOL_SIZE = 4
+_MAX_POOL_SIZE = 32
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_pool_size = _MIN_POOL_SIZE
+
+# tr_id → [호출 수, 누적(초), 최대(초), 마지막(초), 오류 수]
+_call_stats: Dict[str, list] = {}
+_stats_lock = threading.Lock()
+
+
+def pool_size_for_interval(min_interval: float) -> int:
+    """최소 호출 간격에서 동시 진행 가능한 요청 수 기준 풀 크기"""
+    if min_interval <= 0:
+        return _MAX_POOL_SIZE
+    size = int(math.ceil(_EXPECTED_LATENCY / min_interval)) + 1
+    return max(_MIN_POOL_SIZE, min(_MAX_POOL_SIZE, size))
+
+
+def _build_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """공용 세션 반환 (최초 호출 시 생성)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session(_pool_size)
+    return _session
+
+
+def configure_pool(min_interval: float) -> None:
+    """호출 간격 변경 시 풀 크기 재설정 (기존 세션은 닫고 교체)"""
+    global _session, _pool_size
+    new_size = pool_size_for_interval(min_interval)
+    with _session_lock:
+        if new_size == _pool_size and _session is not None:
+            return
+        old = _session
+        _pool_size = new_size
+        _session = _build_session(new_size)
+    if old is not None:
+        old.close()
+
+
+def close() -> None:
+    """세션 종료 (프로그램 종료 시)"""
+    global _session
+    with _session_lock:
+        old, _session = _session, None
+    if old is not None:
+        old.close()
+
+
+def _record(tr_id: str, elapsed: float, failed: bool) -> None:
+    with _stats_lock:
+        stat = _call_stats.get(tr_id)
+        if stat is None:
+            stat = _call_stats[tr_id] = [0, 0.0, 0.0, 0.0, 0]
+        stat[0] += 1
+        stat[1] += elapsed
+        if elapsed > stat[2]:
+            stat[2] = elapsed
+        stat[3] = elapsed
+        if failed:
+            stat[4] += 1
+
+
+def request(method: str, url: str, tr_id: str = "-", **kwargs) -> requests.Response:
+    """공용 세션으로 요청 후 TR ID 별 소요 시간 기록"""
+    start = time.perf_counter()
+    failed = True
+    try:
+        res = get_session().request(method, url, **kwargs)
+        failed = res.status_code != 200
+        return res
+    finally:
+        _record(tr_id, time.perf_counter() - start, failed)
+
+
+def get(url: str, tr_id: str = "-", **kwargs) -> requests.Response:
+    return request("GET", url, tr_id=tr_id, **kwargs)
+
+
+def post(url: str, tr_id: str = "-", **kwargs) -> requests.Response:
+    return request("POST", url, tr_id=tr_id, **kwargs)
+
+
+def get_call_stats() -> Dict[str, Dict[str, float]]:
+    """TR ID 별 호출 수/평균·최대·마지막 소요 시간(ms)/HTTP 오류 수"""
+    with _stats_lock:
+        return {
+            tr_id: {
+                'calls': count,
+                'avg_ms': total / count * 1000 if count else 0.0,
+                'max_ms': peak * 1000,
+                'last_ms': last * 1000,
+                'errors': errors,
+            }
+            for tr_id, (count, total, peak, last, errors) in _call_stats.items()
+        }
+
+
+def reset_call_stats() -> None:
+    with _stats_lock:
+        _call_stats.clear()
@@ -0,0 +1,226 @@
+"""
+KIS API 호출 속도 제어 스케줄러 (토큰 버킷 + 우선순위 레인)
+
+모든 KIS REST 호출(_url_fetch)이 하나의 토큰 버킷을 공유하고,
+대기 중인 호출은 레인 우선순위 순서로 토큰을 받는다.
+
+레인 (낮은 값이 우선):
+- ORDER: 주문/취소/체결조회/매수가능조회
+- PRICE: 현재가 조회 (매도 판단용 가격 체크)
+- CHART: 분봉/일봉 차트 갱신
+- SCAN : 스크리너/장전 스캔 (거래량순위, 조건검색 등)
+
+스레드(run_in_executor) 호출은 acquire(), 이벤트 루프 코드는
+await acquire_async() 를 사용한다. 두 경로는 같은 버킷/대기열을 공유한다.
+
+Usage:
+    from api.kis_rate_limiter import get_scheduler, Lane, lane_scope
+
+    get_scheduler().acquire(Lane.ORDER)            # 동기 (스레드)
+    await get_scheduler().acquire_async(Lane.SCAN)  # 비동기
+
+    with lane_scope(Lane.SCAN):                     # TR ID 기본 레인 덮어쓰기
+        get_inquire_price(itm_no=code)
+"""
+import asyncio
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+class Lane(IntEnum):
+    """호출 우선순위 레인 (값이 작을수록 우선)"""
+    ORDER = 0
+    PRICE = 1
+    CHART = 2
+    SCAN = 3
+
+
+# TR ID → 기본 레인 (미등록 TR은 PRICE)
+TR_LANES: Dict[str, Lane] = {
+    # 주문/취소
+    "TTTC0012U": Lane.ORDER,  # 현금 매수
+    "TTTC0011U": Lane.ORDER,  # 현금 매도
+    "TTTC0013U": Lane.ORDER,  # 정정/취소
+    "TTTC0802U": Lane.ORDER,
+    "TTTC0801U": Lane.ORDER,
+    "TTTC0803U": Lane.ORDER,
+    # 체결/미체결/매수가능 조회 (주문 흐름의 일부)
+    "TTTC8036R": Lane.ORDER,  # 정정취소가능주문
+    "TTTC0081R": Lane.ORDER,  # 일별주문체결 (3개월 이내)
+    "CTSC9215R": Lane.ORDER,  # 일별주문체결 (3개월 이전)
+    "TTTC8908R": Lane.ORDER,  # 매수가능조회
+    # 현재가
+    "FHKST01010100": Lane.PRICE,  # 주식현재가 시세
+    "FHKST01010300": Lane.PRICE,  # 주식현재가 체결
+    "FHPST01010000": Lane.PRICE,  # 주식현재가 시세2
+    "TTTC8434R": Lane.PRICE,      # 주식잔고조회
+    # 차트
+    "FHKST03010200": Lane.CHART,  # 주식당일분봉조회
+    "FHKST03010230": Lane.CHART,  # 주식일별분봉조회
+    "FHKST03010100": Lane.CHART,  # 국내주식기간별시세
+    "FHKST01010400": Lane.CHART,  # 주식현재가 일자별
+    # 스캔
+    "FHPST01710000": Lane.SCAN,   # 거래량순위
+    "HHKST03900400": Lane.SCAN,   # 종목조건검색조회
+    "FHPTJ04400000": Lane.SCAN,   # 외국인/기관 매매종목가집계
+    "FHPUP02100000": Lane.SCAN,   # 국내업종 현재지수
+}
+
+_DEFAULT_LANE = Lane.PRICE
+
+# lane_scope() 로 지정한 레인 (TR ID 기본값보다 우선)
+_lane_override: contextvars.ContextVar[Optional[Lane]] = contextvars.ContextVar(
+    "kis_lane_override", default=None
+)
+
+
+def lane_for_tr(tr_id: Optional[str]) -> Lane:
+    """현재 컨텍스트의 레인 결정 (lane_scope > TR ID 매핑 > 기본값)"""
+    override = _lane_override.get()
+    if override is not None:
+        return override
+    if tr_id:
+        return TR_LANES.get(tr_id, _DEFAULT_LANE)
+    return _DEFAULT_LANE
+
+
+@contextmanager
+def lane_scope(lane: Lane) -> Iterator[None]:
+    """블록 내 KIS 호출의 레인을 지정 (asyncio.to_thread 로 전달되는 컨텍스트 포함)"""
+    token = _lane_override.set(lane)
+    try:
+        yield
+    finally:
+        _lane_override.reset(token)
+
+
+class KISRateScheduler:
+    """우선순위 레인을 가진 스레드 안전 토큰 버킷"""
+
+    def __init__(self, min_interval: float = 0.06, burst: int = 1):
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._waiters: List[Tuple[int, int]] = []  # heap of (lane, seq)
+        self._rate = 1.0 / min_interval
+        self._capacity = float(max(1, burst))
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        # lane → [호출 수, 누적 대기(초), 최대 대기(초)]
+        self._stats: Dict[Lane, List[float]] = {lane: [0, 0.0, 0.0] for lane in Lane}
+
+    def configure(self, min_interval: float, burst: Optional[int] = None) -> None:
+        """호출 간격/버스트 크기 변경"""
+        with self._cond:
+            self._refill(time.monotonic())
+            self._rate = 1.0 / min_interval
+            if burst is not None:
+                self._capacity = float(max(1, burst))
+            self._tokens = min(self._tokens, self._capacity)
+            self._cond.notify_all()
+
+    @property
+    def min_interval(self) -> float:
+        return 1.0 / self._rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._last_refill = now
+
+    def _try_grant(self, ticket: Tuple[int, int]) -> float:
+        """ticket 이 대기열 선두이고 토큰이 있으면 발급. 발급 시 0, 아니면 다음 확인까지 대기 시간."""
+        self._refill(time.monotonic())
+        if self._waiters and self._waiters[0] == ticket and self._tokens >= 1.0:
+            heapq.heappop(self._waiters)
+            self._tokens -= 1.0
+            self._cond.notify_all()
+            return 0.0
+        return max((1.0 - self._tokens) / self._rate, 0.001)
+
+    def _record(self, lane: Lane, waited: float) -> None:
+        stat = self._stats[lane]
+        stat[0] += 1
+        stat[1] += waited
+        if waited > stat[2]:
+            stat[2] = waited
+
+    def _cancel(self, ticket: Tuple[int, int]) -> None:
+        if ticket in self._waiters:
+            self._waiters.remove(ticket)
+            heapq.heapify(self._waiters)
+            self._cond.notify_all()
+
+    def acquire(self, lane: Lane = _DEFAULT_LANE) -> float:
+        """토큰 1개 획득까지 블로킹 (스레드용). 대기한 시간(초) 반환."""
+        start = time.monotonic()
+        with self._cond:
+            ticket = (int(lane), next(self._seq))
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    wait = self._try_grant(ticket)
+                    if wait == 0.0:
+                        break
+                    self._cond.wait(wait)
+            except BaseException:
+                self._cancel(ticket)
+                raise
+            waited = time.monotonic() - start
+            self._record(lane, waited)
+        return waited
+
+    async def acquire_async(self, lane: Lane = _DEFAULT_LANE) -> float:
+        """토큰 1개 획득까지 이벤트 루프를 막지 않고 대기. 대기한 시간(초) 반환."""
+        start = time.monotonic()
+        with self._cond:
+            ticket = (int(lane), next(self._seq))
+            heapq.heappush(self._waiters, ticket)
+        try:
+            while True:
+                with self._cond:
+                    wait = self._try_grant(ticket)
+                if wait == 0.0:
+                    break
+                await asyncio.sleep(wait)
+        except BaseException:
+            with self._cond:
+                self._cancel(ticket)
+            raise
+        waited = time.monotonic() - start
+        with self._cond:
+            self._record(lane, waited)
+        return waited
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """레인별 호출 수/평균·최대 대기 시간"""
+        with self._cond:
+            result = {}
+            for lane, (count, total, peak) in self._stats.items():
+                result[lane.name] = {
+                    'calls': int(count),
+                    'avg_wait_ms': (total / count * 1000) if count else 0.0,
+                    'max_wait_ms': peak * 1000,
+                }
+            result['_queue'] = {'waiting': len(self._waiters), 'tokens': self._tokens}
+            return result
+
+
+_scheduler: Optional[KISRateScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler() -> KISRateScheduler:
+    """프로세스 공용 스케줄러 (최초 호출 시 생성)"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = KISRateScheduler()
+    return _scheduler
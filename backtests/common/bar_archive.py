@@ -0,0 +1,335 @@
+"""분봉/일봉 컬럼형 디스크 아카이브 (NumPy .npy + mmap 읽기).
+
+백테스트마다 minute_candles 를 pd.read_sql 로 다시 읽는 대신, 한 번 내보낸
+컬럼 파일을 np.load(mmap_mode="r") 로 매핑해 필요한 종목 구간만 읽는다.
+여러 워커 프로세스가 같은 파일을 매핑하면 OS 페이지 캐시를 공유한다.
+(pyarrow 가 의존성에 없어 Parquet 대신 무압축 .npy 컬럼 파일 사용 — 그대로 mmap 가능)
+
+레이아웃 (root 기본: <repo>/cache/bar_archive, 환경변수 BAR_ARCHIVE_DIR 로 변경):
+    <root>/minute/<YYYYMMDD>/   거래일 파티션
+    <root>/daily/<YYYYMM>/      월 파티션
+        codes.npy     종목코드 (정렬, 고유)
+        offsets.npy   종목별 행 범위 (len(codes)+1) — 종목 파티션
+        <col>.npy     컬럼 배열 (종목·날짜·시간 순)
+    <root>/<kind>/manifest.json  내보낸 구간 목록 {start, end, codes(None=전체 종목)}
+
+load_minute_df / load_daily_df 는 요청 (종목, 기간) 이 manifest 의 한 구간에
+완전히 포함될 때만 아카이브를 읽고, 아니면 기존대로 DB 를 조회한다.
+
+내보내기:
+    python -m backtests.common.bar_archive minute 20250101 20250630
+    python -m backtests.common.bar_archive daily 20240101 20250630 --codes 005930,000660
+"""
+import argparse
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_ROOT = Path(__file__).resolve().parents[2] / "cache" / "bar_archive"
+
+# kind → (파티션 키 길이, 저장 컬럼, 반환 컬럼 순서)
+_KINDS = {
+    "minute": (
+        8,
+        ["trade_time", "open", "high", "low", "close", "volume", "amount"],
+        ["stock_code", "trade_date", "trade_time",
+         "open", "high", "low", "close", "volume", "amount"],
+    ),
+    "daily": (
+        6,
+        ["trade_date", "open", "high", "low", "close", "volume", "amount"],
+        ["stock_code", "trade_date",
+         "open", "high", "low", "close", "volume", "amount"],
+    ),
+}
+_STRING_COLUMNS = {"trade_date", "trade_time"}
+_SORT_COLUMNS = {"minute": ["stock_code", "trade_time"], "daily": ["stock_code", "trade_date"]}
+
+
+def archive_root() -> Path:
+    """아카이브 루트 (BAR_ARCHIVE_DIR 우선)."""
+    return Path(os.environ.get("BAR_ARCHIVE_DIR") or DEFAULT_ROOT)
+
+
+def _kind_dir(kind: str, root: Optional[Path]) -> Path:
+    if kind not in _KINDS:
+        raise ValueError(f"unknown archive kind: {kind}")
+    return Path(root or archive_root()) / kind
+
+
+def _partition_key(kind: str, trade_date: str) -> str:
+    return trade_date[:_KINDS[kind][0]]
+
+
+# ---------------------------------------------------------------- manifest
+
+def _manifest_path(kind: str, root: Optional[Path]) -> Path:
+    return _kind_dir(kind, root) / "manifest.json"
+
+
+def _read_manifest(kind: str, root: Optional[Path]) -> List[dict]:
+    path = _manifest_path(kind, root)
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("segments", [])
+
+
+def record_export(
+    kind: str, start_date: str, end_date: str,
+    codes: Optional[Sequence[str]] = None, root: Optional[Path] = None,
+) -> None:
+    """내보낸 구간을 manifest 에 추가. codes=None 은 해당 기간 전체 종목."""
+    segments = _read_manifest(kind, root)
+    segments.append({
+        "start": start_date,
+        "end": end_date,
+        "codes": sorted(set(codes)) if codes is not None else None,
+        "exported_at": datetime.now().isoformat(timespec="seconds"),
+    })
+    path = _manifest_path(kind, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"segments": segments}, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, path)
+
+
+def covers(
+    kind: str, codes: Sequence[str], start_date: str, end_date: str,
+    root: Optional[Path] = None,
+) -> bool:
+    """요청 (종목, 기간) 이 내보낸 한 구간에 완전히 포함되는지."""
+    wanted = set(codes)
+    for seg in _read_manifest(kind, root):
+        if seg["start"] <= start_date and end_date <= seg["end"]:
+            if seg["codes"] is None or wanted.issubset(seg["codes"]):
+                return True
+    return False
+
+
+# ---------------------------------------------------------------- partitions
+
+def _open_partition(path: Path, columns: List[str]):
+    codes = np.load(path / "codes.npy")
+    offsets = np.load(path / "offsets.npy")
+    arrays = {col: np.load(path / f"{col}.npy", mmap_mode="r") for col in columns}
+    return codes, offsets, arrays
+
+
+def _ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """[starts[i], starts[i]+lengths[i]) 구간들을 이어붙인 행 인덱스."""
+    lengths = lengths.astype(np.int64)
+    total = int(lengths.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    out_begin = np.cumsum(lengths) - lengths
+    return np.repeat(starts.astype(np.int64) - out_begin, lengths) + np.arange(total)
+
+
+def write_partition(
+    kind: str, key: str, df: pd.DataFrame, root: Optional[Path] = None,
+) -> int:
+    """파티션 1개 기록 (기존 파티션의 다른 종목 행은 유지). 기록 행 수 반환."""
+    _, stored, _ = _KINDS[kind]
+    part_dir = _kind_dir(kind, root) / key
+
+    df = df[["stock_code"] + stored].copy()
+    if part_dir.exists():
+        old = read_partition(kind, key, root)
+        old = old[~old["stock_code"].isin(set(df["stock_code"]))]
+        if not old.empty:
+            df = pd.concat([old[["stock_code"] + stored], df], ignore_index=True)
+    df = df.sort_values(_SORT_COLUMNS[kind], kind="stable").reset_index(drop=True)
+
+    codes_col = df["stock_code"].astype(str).to_numpy()
+    codes, first = np.unique(codes_col, return_index=True)
+    offsets = np.append(first, len(df)).astype(np.int64)
+
+    tmp_dir = part_dir.with_name(f".{key}.tmp")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    tmp_dir.mkdir(parents=True)
+    np.save(tmp_dir / "codes.npy", codes.astype(str))
+    np.save(tmp_dir / "offsets.npy", offsets)
+    for col in stored:
+        if col in _STRING_COLUMNS:
+            values = df[col].astype(str).to_numpy().astype(str)
+        elif df[col].dtype == object:
+            # NUMERIC → Decimal 로 읽힌 컬럼은 float64 로 저장
+            values = pd.to_numeric(df[col]).to_numpy(dtype=np.float64)
+        else:
+            values = df[col].to_numpy()
+        np.save(tmp_dir / f"{col}.npy", values)
+
+    if part_dir.exists():
+        shutil.rmtree(part_dir)
+    os.replace(tmp_dir, part_dir)
+    return len(df)
+
+
+def read_partition(kind: str, key: str, root: Optional[Path] = None) -> pd.DataFrame:
+    """파티션 전체를 DataFrame 으로 (stock_code + 저장 컬럼)."""
+    _, stored, _ = _KINDS[kind]
+    codes, offsets, arrays = _open_partition(_kind_dir(kind, root) / key, stored)
+    data = {"stock_code": np.repeat(codes, np.diff(offsets))}
+    data.update({col: np.asarray(arrays[col]) for col in stored})
+    return pd.DataFrame(data)
+
+
+def _partition_keys(kind: str, start_date: str, end_date: str, root: Optional[Path]) -> List[str]:
+    base = _kind_dir(kind, root)
+    if not base.exists():
+        return []
+    lo, hi = _partition_key(kind, start_date), _partition_key(kind, end_date)
+    return sorted(
+        p.name for p in base.iterdir()
+        if p.is_dir() and not p.name.startswith(".") and lo <= p.name <= hi
+    )
+
+
+def load_frame(
+    kind: str, codes: Sequence[str], start_date: str, end_date: str,
+    root: Optional[Path] = None,
+) -> Optional[pd.DataFrame]:
+    """아카이브에서 (종목, 기간) 로드. 구간이 아카이브에 없으면 None.
+
+    반환 스키마·정렬은 DB 조회와 동일 (stock_code, trade_date, 시간 순).
+    """
+    if not covers(kind, codes, start_date, end_date, root):
+        return None
+
+    _, stored, out_columns = _KINDS[kind]
+    wanted = np.array(sorted(set(codes)), dtype=str)
+
+    chunks: Dict[str, List[np.ndarray]] = {col: [] for col in stored}
+    seg_code, seg_key, seg_start, seg_len = [], [], [], []
+    base = 0
+    for key in _partition_keys(kind, start_date, end_date, root):
+        part_codes, offsets, arrays = _open_partition(_kind_dir(kind, root) / key, stored)
+        pos = np.searchsorted(part_codes, wanted)
+        hit = (pos < len(part_codes)) & (part_codes[np.minimum(pos, len(part_codes) - 1)] == wanted)
+        if not hit.any():
+            continue
+        starts = offsets[pos[hit]]
+        lengths = offsets[pos[hit] + 1] - starts
+        rows = _ranges(starts, lengths)
+        for col in stored:
+            chunks[col].append(arrays[col][rows])  # mmap 에서 필요한 행만 복사
+
+        seg_code.append(np.flatnonzero(hit))
+        seg_key.append(np.full(len(lengths), key))
+        seg_start.append(base + np.cumsum(lengths) - lengths)
+        seg_len.append(lengths)
+        base += int(lengths.sum())
+
+    if not seg_code:
+        return pd.DataFrame(columns=out_columns)
+
+    # 파티션(날짜) 순으로 모인 구간을 종목 순으로 재배열
+    seg_code = np.concatenate(seg_code)
+    seg_len = np.concatenate(seg_len)
+    seg_start = np.concatenate(seg_start)
+    seg_key = np.concatenate(seg_key)
+    order = np.argsort(seg_code, kind="stable")
+    rows = _ranges(seg_start[order], seg_len[order])
+
+    data = {"stock_code": np.repeat(wanted[seg_code[order]], seg_len[order])}
+    if kind == "minute":
+        data["trade_date"] = np.repeat(seg_key[order], seg_len[order])
+    for col in stored:
+        data[col] = np.concatenate(chunks[col])[rows]
+    df = pd.DataFrame(data, columns=out_columns)
+
+    if kind == "daily":
+        df = df[(df["trade_date"] >= start_date) & (df["trade_date"] <= end_date)]
+        df = df.reset_index(drop=True)
+    return df
+
+
+# ---------------------------------------------------------------- export
+
+def _month_bounds(start_date: str, end_date: str) -> List[tuple]:
+    months = pd.period_range(
+        pd.Timestamp(start_date).to_period("M"), pd.Timestamp(end_date).to_period("M"), freq="M"
+    )
+    return [
+        (p.start_time.strftime("%Y%m%d"), p.end_time.strftime("%Y%m%d")) for p in months
+    ]
+
+
+def export_minute(
+    start_date: str, end_date: str, codes: Optional[Sequence[str]] = None,
+    root: Optional[Path] = None, verbose: bool = True,
+) -> int:
+    """minute_candles → 거래일 파티션. codes=None 이면 전체 종목. 기록 행 수 반환."""
+    from backtests.common.data_loader import _query_minute_df, list_minute_dates
+
+    total = 0
+    last_written = None
+    for trade_date in list_minute_dates(start_date, end_date):
+        df = _query_minute_df(codes, trade_date, trade_date)
+        if df.empty:
+            continue
+        total += write_partition("minute", trade_date, df, root)
+        last_written = trade_date
+        if verbose:
+            print(f"  minute {trade_date}: {len(df):,} rows")
+    # 실제 기록한 마지막 거래일까지만 커버로 기록 (이후 추가되는 분봉은 DB 에서 읽도록)
+    if last_written is not None:
+        record_export("minute", start_date, last_written, codes, root)
+    return total
+
+
+def export_daily(
+    start_date: str, end_date: str, codes: Optional[Sequence[str]] = None,
+    root: Optional[Path] = None, verbose: bool = True,
+) -> int:
+    """daily_prices → 월 파티션 (월 단위로 확장해 기록). 기록 행 수 반환."""
+    from backtests.common.data_loader import _query_daily_df
+
+    months = _month_bounds(start_date, end_date)
+    total = 0
+    last_written = None
+    for month_start, month_end in months:
+        df = _query_daily_df(codes, month_start, month_end)
+        if df.empty:
+            continue
+        total += write_partition("daily", month_start[:6], df, root)
+        last_written = max(last_written or "", str(df["trade_date"].max()))
+        if verbose:
+            print(f"  daily {month_start[:6]}: {len(df):,} rows")
+    # 월 말일이 아니라 실제 기록한 마지막 일자까지만 커버로 기록
+    if last_written is not None:
+        record_export("daily", months[0][0], last_written, codes, root)
+    return total
+
+
+def parse_args():
+    p = argparse.ArgumentParser(description="분봉/일봉 컬럼형 아카이브 내보내기")
+    p.add_argument("kind", choices=sorted(_KINDS))
+    p.add_argument("start_date", help="YYYYMMDD")
+    p.add_argument("end_date", help="YYYYMMDD")
+    p.add_argument("--codes", default=None, help="종목코드 콤마 구분 (default: 전체)")
+    p.add_argument("--root", default=None, help=f"아카이브 경로 (default: {DEFAULT_ROOT})")
+    return p.parse_args()
+
+
+def main():
+    args = parse_args()
+    codes = args.codes.split(",") if args.codes else None
+    root = Path(args.root) if args.root else None
+    export = export_minute if args.kind == "minute" else export_daily
+    rows = export(args.start_date, args.end_date, codes, root)
+    print(f"{args.kind} 아카이브 완료: {rows:,} rows → {_kind_dir(args.kind, root)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,13 +6,17 @@
 - 지수 일봉 (KS11/KQ11): robotrader.daily_candles (KIS raw 컬럼)
 
 날짜 정규화: quant DB 의 date 는 DATE (YYYY-MM-DD) → 분봉/지수 와 동일한 YYYYMMDD 문자열로 변환.
+
+분봉/일봉은 컬럼형 아카이브(backtests.common.bar_archive)에 요청 구간이 있으면
+DB 대신 아카이브를 읽는다 (use_archive=False 로 항상 DB 조회).
 """
 from contextlib import contextmanager
-from typing import List
+from typing import List, Optional, Sequence
 
 import pandas as pd
 import psycopg2
 
+from backtests.common import bar_archive
 from config.settings import (
     PG_HOST, PG_PORT, PG_DATABASE, PG_USER, PG_PASSWORD,
 )
@@ -36,57 +40,96 @@ def _conn(database: str = None):
 
 
 def load_minute_df(
-    codes: List[str], start_date: str, end_date: str
+    codes: List[str], start_date: str, end_date: str, use_archive: bool = True,
 ) -> pd.DataFrame:
     """분봉 데이터. date 포맷: 'YYYYMMDD'. 빈 codes 는 빈 DataFrame 반환."""
     if not codes:
         return pd.DataFrame()
-    sql = """
+    if use_archive:
+        df = bar_archive.load_frame("minute", codes, start_date, end_date)
+        if df is not None:
+            return df
+    return _query_minute_df(codes, start_date, end_date)
+
+
+def _query_minute_df(
+    codes: Optional[Sequence[str]], start_date: str, end_date: str
+) -> pd.DataFrame:
+    """minute_candles 조회. codes=None 이면 전체 종목."""
+    code_filter = "AND stock_code = ANY(%s)" if codes is not None else ""
+    sql = f"""
         SELECT stock_code, trade_date,
                time AS trade_time,
                open, high, low, close, volume, amount
         FROM minute_candles
-        WHERE stock_code = ANY(%s)
-          AND trade_date >= %s
+        WHERE trade_date >= %s
           AND trade_date <= %s
+          {code_filter}
         ORDER BY stock_code, trade_date, time
     """
+    params = (start_date, end_date) + ((list(codes),) if codes is not None else ())
     with _conn() as c:
-        df = pd.read_sql(sql, c, params=(list(codes), start_date, end_date))
+        df = pd.read_sql(sql, c, params=params)
     return df
 
 
+def list_minute_dates(start_date: str, end_date: str) -> List[str]:
+    """minute_candles 에 존재하는 거래일 (YYYYMMDD, 오름차순)."""
+    sql = """
+        SELECT DISTINCT trade_date FROM minute_candles
+        WHERE trade_date >= %s AND trade_date <= %s
+        ORDER BY trade_date
+    """
+    with _conn() as c, c.cursor() as cur:
+        cur.execute(sql, (start_date, end_date))
+        return [row[0] for row in cur.fetchall()]
+
+
 def load_daily_df(
-    codes: List[str], start_date: str, end_date: str
+    codes: List[str], start_date: str, end_date: str, use_archive: bool = True,
 ) -> pd.DataFrame:
     """일봉 데이터 (robotrader_quant.daily_prices, 2,495 종목 커버).
 
     Args:
         codes: 종목 코드 리스트
         start_date, end_date: 'YYYYMMDD' 형식 (분봉과 동일)
+        use_archive: 컬럼형 아카이브에 구간이 있으면 아카이브 사용
 
     Returns:
         trade_date 가 'YYYYMMDD' 문자열로 정규화된 DataFrame.
     """
     if not codes:
         return pd.DataFrame()
+    if use_archive:
+        df = bar_archive.load_frame("daily", codes, start_date, end_date)
+        if df is not None:
+            return df
+    return _query_daily_df(codes, start_date, end_date)
+
+
+def _query_daily_df(
+    codes: Optional[Sequence[str]], start_date: str, end_date: str
+) -> pd.DataFrame:
+    """daily_prices 조회. codes=None 이면 전체 종목."""
     # YYYYMMDD → YYYY-MM-DD 변환 (quant DB 는 DATE 타입)
     sd = f"{start_date[:4]}-{start_date[4:6]}-{start_date[6:8]}"
     ed = f"{end_date[:4]}-{end_date[4:6]}-{end_date[6:8]}"
+    code_filter = "AND stock_code = ANY(%s)" if codes is not None else ""
     # date 는 TEXT (YYYY-MM-DD) — REPLACE 로 하이픈 제거 후 YYYYMMDD 반환
-    sql = """
+    sql = f"""
         SELECT stock_code,
                REPLACE(date, '-', '') AS trade_date,
                open, high, low, close, volume,
                trading_value AS amount
         FROM daily_prices
-        WHERE stock_code = ANY(%s)
-          AND date >= %s
+        WHERE date >= %s
           AND date <= %s
+          {code_filter}
         ORDER BY stock_code, date
     """
+    params = (sd, ed) + ((list(codes),) if codes is not None else ())
     with _conn(PG_DATABASE_QUANT) as c:
-        df = pd.read_sql(sql, c, params=(list(codes), sd, ed))
+        df = pd.read_sql(sql, c, params=params)
     return df
 
 
@@ -1,7 +1,14 @@
-"""시간순 백테스트 엔진 — 3원칙 강제 실행."""
+"""시간순 백테스트 엔진 — 3원칙 강제 실행.
+
+vectorized=True 면 전략의 entry_mask / exit_mask 로 신호 후보 bar 를 미리 구해
+후보 bar 와 포지션 변화가 있는 bar 에서만 Python 로직을 실행한다. 후보 bar 에서는
+기존과 같은 entry_signal / exit_signal / CapitalManager 경로를 그대로 타므로
+BacktestResult 는 bar 루프 모드와 동일하다.
+"""
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from backtests.common.capital_manager import CapitalManager
@@ -9,7 +16,7 @@ from backtests.common.execution_model import (
     ExecutionModel, BUY_COMMISSION, SELL_COMMISSION,
 )
 from backtests.common.metrics import compute_all_metrics
-from backtests.strategies.base import StrategyBase, Position
+from backtests.strategies.base import StrategyBase, Position, EntryOrder
 
 
 @dataclass
@@ -28,21 +35,23 @@ class BacktestEngine:
         universe: List[str],
         minute_df_by_code: Dict[str, pd.DataFrame],
         daily_df_by_code: Dict[str, pd.DataFrame],
+        vectorized: bool = False,
     ):
         self.strategy = strategy
         self.initial_capital = initial_capital
         self.universe = universe
         self.minute_df_by_code = minute_df_by_code
         self.daily_df_by_code = daily_df_by_code
+        self.vectorized = vectorized
 
     def run(self) -> BacktestResult:
-        cm = CapitalManager(initial_capital=self.initial_capital)
-        positions: Dict[str, Position] = {}
-        trades: List[Dict] = []
-        equity_points: List[float] = []
+        if self.vectorized:
+            return self._run_vectorized()
+        return self._run_bar_loop()
 
-        # 종목별 피처 사전 계산
-        features_by_code = {
+    def _prepare_features(self) -> Dict[str, pd.DataFrame]:
+        """종목별 피처 사전 계산."""
+        return {
             code: self.strategy.prepare_features(
                 self.minute_df_by_code[code],
                 self.daily_df_by_code.get(code, pd.DataFrame()),
@@ -50,6 +59,14 @@ class BacktestEngine:
             for code in self.universe
         }
 
+    def _run_bar_loop(self) -> BacktestResult:
+        cm = CapitalManager(initial_capital=self.initial_capital)
+        positions: Dict[str, Position] = {}
+        trades: List[Dict] = []
+        equity_points: List[float] = []
+
+        features_by_code = self._prepare_features()
+
         n_bars = max(len(df) for df in self.minute_df_by_code.values())
 
         for t in range(n_bars):
@@ -73,18 +90,9 @@ class BacktestEngine:
                 if fill_idx >= len(df_min):
                     continue
                 next_open = float(df_min["open"].iloc[fill_idx])
-                sell_fill = ExecutionModel.compute_sell_fill_price(next_open)
-                proceed = sell_fill * pos.quantity * (1 - SELL_COMMISSION)
-                original_cost = pos.entry_price * pos.quantity
-                sell_orders.append({
-                    "stock_code": code,
-                    "proceed": proceed,
-                    "original_cost": original_cost,
-                    "exit_bar_idx": fill_idx,
-                    "exit_price": sell_fill,
-                    "reason": exit_order.reason,
-                    "position": pos,
-                })
+                sell_orders.append(
+                    self._sell_order(code, pos, exit_order.reason, fill_idx, next_open)
+                )
 
             # 2. 매수 신호 수집
             for code in self.universe:
@@ -103,50 +111,14 @@ class BacktestEngine:
                 if fill_idx >= len(df_min):
                     continue
                 next_open = float(df_min["open"].iloc[fill_idx])
-                buy_fill = ExecutionModel.compute_buy_fill_price(next_open)
-                budget = cm.available_cash * entry_order.budget_ratio
-                quantity = int(budget / (buy_fill * (1 + BUY_COMMISSION)))
-                if quantity <= 0:
-                    continue
-                cost = buy_fill * quantity * (1 + BUY_COMMISSION)
-                buy_orders.append({
-                    "stock_code": code,
-                    "cost": cost,
-                    "priority": entry_order.priority,
-                    "entry_bar_idx": fill_idx,
-                    "entry_price": buy_fill,
-                    "quantity": quantity,
-                })
-
-            # 3. step_orders — 매도 선처리, 그다음 매수
-            executed = cm.step_orders(sell_orders=sell_orders, buy_orders=buy_orders)
-
-            # 4. 체결된 매도: 포지션 제거 + trade 기록
-            for s in executed["sells"]:
-                pos: Position = s["position"]
-                trades.append({
-                    "stock_code": pos.stock_code,
-                    "entry_bar_idx": pos.entry_bar_idx,
-                    "entry_price": pos.entry_price,
-                    "exit_bar_idx": s["exit_bar_idx"],
-                    "exit_price": s["exit_price"],
-                    "quantity": pos.quantity,
-                    "pnl": s["proceed"] - s["original_cost"],
-                    "reason": s["reason"],
-                })
-                del positions[pos.stock_code]
-
-            # 5. 체결된 매수: 포지션 추가
-            for b in executed["buys"]:
-                code = b["stock_code"]
-                df_min = self.minute_df_by_code[code]
-                positions[code] = Position(
-                    stock_code=code,
-                    entry_bar_idx=b["entry_bar_idx"],
-                    entry_price=b["entry_price"],
-                    quantity=b["quantity"],
-                    entry_date=str(df_min["trade_date"].iloc[b["entry_bar_idx"]]),
+                buy_order = self._buy_order(
+                    code, entry_order, fill_idx, next_open, cm.available_cash
                 )
+                if buy_order is not None:
+                    buy_orders.append(buy_order)
+
+            # 3~5. 매도 선처리 후 매수, 포지션 반영
+            self._apply_orders(cm, positions, trades, sell_orders, buy_orders)
 
             # 6. equity 스냅샷 (매 bar)
             equity = cm.available_cash + sum(
@@ -154,6 +126,237 @@ class BacktestEngine:
             )
             equity_points.append(equity)
 
+        return self._finalize(cm, positions, trades, equity_points, n_bars)
+
+    @staticmethod
+    def _sell_order(
+        code: str, pos: Position, reason: str, fill_idx: int, next_open: float
+    ) -> Dict:
+        sell_fill = ExecutionModel.compute_sell_fill_price(next_open)
+        proceed = sell_fill * pos.quantity * (1 - SELL_COMMISSION)
+        original_cost = pos.entry_price * pos.quantity
+        return {
+            "stock_code": code,
+            "proceed": proceed,
+            "original_cost": original_cost,
+            "exit_bar_idx": fill_idx,
+            "exit_price": sell_fill,
+            "reason": reason,
+            "position": pos,
+        }
+
+    @staticmethod
+    def _buy_order(
+        code: str, entry_order: EntryOrder, fill_idx: int, next_open: float, available_cash: float
+    ) -> Optional[Dict]:
+        buy_fill = ExecutionModel.compute_buy_fill_price(next_open)
+        budget = available_cash * entry_order.budget_ratio
+        quantity = int(budget / (buy_fill * (1 + BUY_COMMISSION)))
+        if quantity <= 0:
+            return None
+        cost = buy_fill * quantity * (1 + BUY_COMMISSION)
+        return {
+            "stock_code": code,
+            "cost": cost,
+            "priority": entry_order.priority,
+            "entry_bar_idx": fill_idx,
+            "entry_price": buy_fill,
+            "quantity": quantity,
+        }
+
+    def _apply_orders(
+        self,
+        cm: CapitalManager,
+        positions: Dict[str, Position],
+        trades: List[Dict],
+        sell_orders: List[Dict],
+        buy_orders: List[Dict],
+    ) -> List[Dict]:
+        """step_orders — 매도 선처리, 그다음 매수. 체결된 매수 주문 리스트 반환."""
+        executed = cm.step_orders(sell_orders=sell_orders, buy_orders=buy_orders)
+
+        # 체결된 매도: 포지션 제거 + trade 기록
+        for s in executed["sells"]:
+            pos: Position = s["position"]
+            trades.append({
+                "stock_code": pos.stock_code,
+                "entry_bar_idx": pos.entry_bar_idx,
+                "entry_price": pos.entry_price,
+                "exit_bar_idx": s["exit_bar_idx"],
+                "exit_price": s["exit_price"],
+                "quantity": pos.quantity,
+                "pnl": s["proceed"] - s["original_cost"],
+                "reason": s["reason"],
+            })
+            del positions[pos.stock_code]
+
+        # 체결된 매수: 포지션 추가
+        for b in executed["buys"]:
+            code = b["stock_code"]
+            df_min = self.minute_df_by_code[code]
+            positions[code] = Position(
+                stock_code=code,
+                entry_bar_idx=b["entry_bar_idx"],
+                entry_price=b["entry_price"],
+                quantity=b["quantity"],
+                entry_date=str(df_min["trade_date"].iloc[b["entry_bar_idx"]]),
+            )
+        return executed["buys"]
+
+    def _run_vectorized(self) -> BacktestResult:
+        """후보 bar 만 방문하는 이벤트 루프. 결과는 _run_bar_loop 와 동일."""
+        cm = CapitalManager(initial_capital=self.initial_capital)
+        positions: Dict[str, Position] = {}
+        trades: List[Dict] = []
+
+        features_by_code = self._prepare_features()
+        n_bars = max(len(df) for df in self.minute_df_by_code.values())
+
+        opens = {
+            code: np.asarray(self.minute_df_by_code[code]["open"], dtype=float)
+            for code in self.universe
+        }
+        closes = {
+            code: np.asarray(self.minute_df_by_code[code]["close"], dtype=float)
+            for code in self.universe
+        }
+
+        # 매수 후보 (bar, universe 순서) — 체결 bar 가 없는 신호는 미리 제외
+        cand_bars: List[np.ndarray] = []
+        cand_codes: List[np.ndarray] = []
+        for i, code in enumerate(self.universe):
+            bars = self._entry_candidates(code, features_by_code[code])
+            bars = bars[ExecutionModel.next_fill_index(bars) < len(opens[code])]
+            cand_bars.append(bars)
+            cand_codes.append(np.full(len(bars), i, dtype=np.int64))
+        all_bars = np.concatenate(cand_bars) if cand_bars else np.empty(0, dtype=np.int64)
+        all_codes = np.concatenate(cand_codes) if cand_codes else np.empty(0, dtype=np.int64)
+        order = np.lexsort((all_codes, all_bars))
+        entry_bars, split_at = np.unique(all_bars[order], return_index=True)
+        entry_codes = np.split(all_codes[order], split_at[1:])
+        entry_ptr = 0
+
+        # 포지션별 exit 후보 bar 와 다음 후보 위치
+        exit_cands: Dict[str, np.ndarray] = {}
+        exit_ptr: Dict[str, int] = {}
+
+        # equity 는 체결이 있는 bar 에서만 바뀜 — (bar, 값) 변화점만 기록 후 전개
+        change_bars: List[int] = [0]
+        change_values: List[float] = [cm.available_cash]
+
+        while True:
+            next_entry = int(entry_bars[entry_ptr]) if entry_ptr < len(entry_bars) else n_bars
+            t = next_entry
+            for code in positions:
+                k = exit_ptr[code]
+                if k < len(exit_cands[code]) and exit_cands[code][k] < t:
+                    t = int(exit_cands[code][k])
+            if t >= n_bars:
+                break
+
+            sell_orders: List[Dict] = []
+            buy_orders: List[Dict] = []
+
+            # 1. 보유 포지션 exit 체크 (후보 bar 인 포지션만, 보유 순서 유지)
+            for code, pos in list(positions.items()):
+                k = exit_ptr[code]
+                cands = exit_cands[code]
+                if k >= len(cands) or cands[k] != t:
+                    continue
+                exit_ptr[code] = k + 1
+                close = closes[code]
+                current_price = float(close[t]) if t < len(close) else None
+                exit_order = self.strategy.exit_signal(
+                    pos, features_by_code[code], bar_idx=t, current_price=current_price
+                )
+                if exit_order is None:
+                    continue
+                fill_idx = ExecutionModel.next_fill_index(t)
+                if fill_idx >= len(opens[code]):
+                    continue
+                sell_orders.append(
+                    self._sell_order(
+                        code, pos, exit_order.reason, fill_idx, float(opens[code][fill_idx])
+                    )
+                )
+
+            # 2. 매수 신호 수집 (이 bar 가 후보인 종목만, universe 순서 유지)
+            if t == next_entry:
+                for i in entry_codes[entry_ptr]:
+                    code = self.universe[i]
+                    if code in positions:
+                        continue
+                    entry_order = self.strategy.entry_signal(
+                        features_by_code[code], bar_idx=t, stock_code=code
+                    )
+                    if entry_order is None:
+                        continue
+                    fill_idx = ExecutionModel.next_fill_index(t)
+                    buy_order = self._buy_order(
+                        code, entry_order, fill_idx, float(opens[code][fill_idx]),
+                        cm.available_cash,
+                    )
+                    if buy_order is not None:
+                        buy_orders.append(buy_order)
+                entry_ptr += 1
+
+            if not sell_orders and not buy_orders:
+                continue
+
+            # 3~5. 매도 선처리 후 매수, 포지션 반영
+            executed_buys = self._apply_orders(cm, positions, trades, sell_orders, buy_orders)
+            for s in sell_orders:
+                exit_cands.pop(s["stock_code"], None)
+                exit_ptr.pop(s["stock_code"], None)
+            for b in executed_buys:
+                code = b["stock_code"]
+                exit_cands[code] = self._exit_candidates(
+                    positions[code], features_by_code[code], closes[code]
+                )
+                exit_ptr[code] = 0
+
+            # 6. equity 변화점
+            change_bars.append(t)
+            change_values.append(cm.available_cash + sum(
+                p.entry_price * p.quantity for p in positions.values()
+            ))
+
+        run_lengths = np.diff(np.append(change_bars, n_bars))
+        equity_points = np.repeat(change_values, run_lengths).tolist()
+        return self._finalize(cm, positions, trades, equity_points, n_bars)
+
+    def _entry_candidates(self, code: str, features: pd.DataFrame) -> np.ndarray:
+        """entry_signal 을 호출할 bar 인덱스 (오름차순)."""
+        n = len(features)
+        mask = self.strategy.entry_mask(features)
+        if mask is None:
+            return np.array(
+                [t for t in range(n)
+                 if self.strategy.entry_signal(features, bar_idx=t, stock_code=code) is not None],
+                dtype=np.int64,
+            )
+        return np.flatnonzero(np.asarray(mask, dtype=bool)[:n]).astype(np.int64)
+
+    def _exit_candidates(
+        self, pos: Position, features: pd.DataFrame, close: np.ndarray
+    ) -> np.ndarray:
+        """position 의 exit_signal 을 호출할 bar 인덱스 (entry_bar_idx 이후, 오름차순)."""
+        n = len(features)
+        start = pos.entry_bar_idx
+        mask = self.strategy.exit_mask(pos, features, close)
+        if mask is None:
+            return np.arange(start, n, dtype=np.int64)
+        mask = np.asarray(mask, dtype=bool)[:n]
+        return np.flatnonzero(mask[start:]).astype(np.int64) + start
+
+    def _finalize(
+        self,
+        cm: CapitalManager,
+        positions: Dict[str, Position],
+        trades: List[Dict],
+        equity_points: List[float],
+        n_bars: int,
+    ) -> BacktestResult:
         # 포지션 정리: 마지막 bar 종가로 강제 청산
         for code, pos in list(positions.items()):
             df_min = self.minute_df_by_code[code]
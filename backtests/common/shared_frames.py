@@ -0,0 +1,246 @@
+"""종목별 DataFrame 묶음을 공유 메모리에 한 번 배치하고 워커에서 view 로 복원.
+
+multiverse 병렬 실행은 워커마다 minute_by_code / daily_by_code 를 unpickle 해
+메모리가 워커 수에 비례해 늘어난다. SharedFrames 는 그룹(minute/daily)별로
+모든 종목 행을 이어붙인 컬럼 배열을 multiprocessing.shared_memory 블록 하나에
+배치하고, 워커는 작은 handle(dict) 만 받아 attach 후 종목별 DataFrame 을 만든다.
+
+- 숫자 컬럼 (OHLCV 등): 공유 메모리 배열의 읽기 전용 view (복사 없음)
+- 문자열 컬럼 (trade_date, trade_time, stock_code): 코드(int32) 만 공유,
+  워커에서 고유 문자열 객체 배열로 복원 (행당 포인터 8바이트)
+- 숫자형 object 컬럼 (Decimal 등) 은 float64 로 저장
+
+Usage:
+    with SharedFrames.create({"minute": minute_by_code, "daily": daily_by_code}) as shared:
+        handle = shared.handle            # initargs 로 전달 (수 KB)
+        ...
+    # worker
+    shared = SharedFrames.attach(handle)  # 프로세스 종료 시까지 참조 유지
+    minute_by_code = shared.frames("minute")
+
+multiverse stage1/stage2 병렬 래퍼는 publish_worker_data / load_worker_data 로 워커에
+데이터를 넘긴다 (공유 메모리 생성 실패 시 임시 pickle 파일로 대체).
+"""
+import os
+import pickle
+import tempfile
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+_ALIGN = 64
+
+# attach 된 공유 메모리 — 살아있는 view 가 있는 동안 GC 로 매핑이 닫히지 않도록 참조 유지
+_ATTACHED: List[shared_memory.SharedMemory] = []
+
+
+def _is_string_column(values: np.ndarray) -> bool:
+    return values.dtype == object and pd.api.types.infer_dtype(values, skipna=False) == "string"
+
+
+class SharedFrames:
+    """공유 메모리에 배치된 {group: {code: DataFrame}} 묶음."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, layout: Dict, owner: bool):
+        self._shm = shm
+        self._layout = layout
+        self._owner = owner
+
+    # ------------------------------------------------------------ 생성 (메인)
+
+    @classmethod
+    def create(cls, groups: Dict[str, Dict[str, pd.DataFrame]]) -> "SharedFrames":
+        """그룹별 종목 DataFrame 을 공유 메모리로 복사. 공간 부족 시 OSError."""
+        layout: Dict[str, Dict] = {}
+        payload: List[tuple] = []  # (byte_offset, ndarray)
+        size = 0
+
+        def _reserve(arr: np.ndarray) -> int:
+            nonlocal size
+            offset = -(-size // _ALIGN) * _ALIGN
+            payload.append((offset, arr))
+            size = offset + arr.nbytes
+            return offset
+
+        for group, frames in groups.items():
+            codes = list(frames.keys())
+            bare = [c for c in codes if frames[c].shape[1] == 0]
+            stacked_codes = [c for c in codes if c not in bare]
+            lengths = [len(frames[c]) for c in stacked_codes]
+            offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64).tolist()
+
+            columns = []
+            if stacked_codes:
+                combined = pd.concat([frames[c] for c in stacked_codes], ignore_index=True)
+                for name in combined.columns:
+                    values = combined[name].to_numpy()
+                    if _is_string_column(values):
+                        categories, inverse = np.unique(values.astype(str), return_inverse=True)
+                        arr = inverse.astype(np.int32)
+                        columns.append({"name": name, "kind": "str", "dtype": arr.dtype.str,
+                                        "offset": _reserve(arr), "categories": categories.tolist()})
+                    else:
+                        if values.dtype == object:
+                            values = pd.to_numeric(combined[name]).to_numpy(dtype=np.float64)
+                        arr = np.ascontiguousarray(values)
+                        columns.append({"name": name, "kind": "num", "dtype": arr.dtype.str,
+                                        "offset": _reserve(arr)})
+
+            layout[group] = {
+                "codes": stacked_codes, "offsets": offsets, "bare": bare,
+                "order": codes, "columns": columns,
+            }
+
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            for offset, arr in payload:
+                dst = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf, offset=offset)
+                dst[...] = arr
+        except Exception:
+            shm.close()
+            shm.unlink()
+            raise
+        return cls(shm, layout, owner=True)
+
+    @property
+    def handle(self) -> Dict:
+        """워커에 넘길 picklable 핸들 (공유 메모리 이름 + 배치 정보)."""
+        return {"name": self._shm.name, "layout": self._layout}
+
+    @property
+    def nbytes(self) -> int:
+        return self._shm.size
+
+    # ------------------------------------------------------------ 복원 (워커)
+
+    @classmethod
+    def attach(cls, handle: Dict) -> "SharedFrames":
+        """기존 공유 메모리에 연결 (읽기 전용 사용)."""
+        shm = shared_memory.SharedMemory(name=handle["name"])
+        _ATTACHED.append(shm)
+        return cls(shm, handle["layout"], owner=False)
+
+    def _column_views(self, group: str) -> Dict[str, np.ndarray]:
+        spec = self._layout[group]
+        total = spec["offsets"][-1]
+        views = {}
+        for col in spec["columns"]:
+            # frombuffer 는 버퍼 export 를 잡아 view 가 살아있는 동안 close() 가 매핑을 해제하지 못함
+            arr = np.frombuffer(self._shm.buf, dtype=np.dtype(col["dtype"]),
+                                count=total, offset=col["offset"])
+            arr.flags.writeable = False
+            views[col["name"]] = arr
+        return views
+
+    def frames(self, group: str) -> Dict[str, pd.DataFrame]:
+        """{code: DataFrame} 복원 (입력 순서·컬럼 순서·RangeIndex 동일)."""
+        spec = self._layout[group]
+        views = self._column_views(group)
+        categories = {
+            col["name"]: np.array(col["categories"], dtype=object)
+            for col in spec["columns"] if col["kind"] == "str"
+        }
+        names = [col["name"] for col in spec["columns"]]
+
+        result: Dict[str, pd.DataFrame] = {}
+        bounds = dict(zip(spec["codes"], zip(spec["offsets"][:-1], spec["offsets"][1:])))
+        for code in spec["order"]:
+            if code not in bounds:
+                result[code] = pd.DataFrame()
+                continue
+            start, stop = bounds[code]
+            data = {}
+            for name in names:
+                part = views[name][start:stop]
+                data[name] = categories[name][part] if name in categories else part
+            result[code] = pd.DataFrame(data, columns=names, copy=False)
+        return result
+
+    # ------------------------------------------------------------ 정리
+
+    def close(self) -> None:
+        """매핑 해제 (소유자면 공유 메모리 삭제)."""
+        shm, self._shm = self._shm, None
+        if shm is None:
+            return
+        try:
+            shm.close()
+            if shm in _ATTACHED:
+                _ATTACHED.remove(shm)
+        except BufferError:
+            # 아직 살아있는 view 가 있으면 매핑은 유지 (프로세스 종료 시 해제)
+            pass
+        if self._owner:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> "SharedFrames":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ---------------------------------------------------------------- 워커 데이터 소스
+
+
+def _dump_data_pickle(
+    minute_by_code: Dict[str, pd.DataFrame],
+    daily_by_code: Dict[str, pd.DataFrame],
+) -> str:
+    """데이터를 임시 pickle 파일로 dump. 경로 반환."""
+    fd, path = tempfile.mkstemp(suffix=".pkl", prefix="multiverse_data_")
+    os.close(fd)
+    with open(path, "wb") as f:
+        pickle.dump({"minute": minute_by_code, "daily": daily_by_code}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def publish_worker_data(
+    minute_by_code: Dict[str, pd.DataFrame],
+    daily_by_code: Dict[str, pd.DataFrame],
+    shared_memory: bool = True,
+) -> Tuple[Dict[str, Any], Callable[[], None]]:
+    """워커용 데이터 소스 생성. (source, cleanup) 반환.
+
+    source 는 {"shm": handle} 또는 {"pickle": path}. 공유 메모리 생성 실패
+    (예: /dev/shm 용량 부족) 시 pickle 로 대체.
+    """
+    if shared_memory:
+        try:
+            shared = SharedFrames.create({"minute": minute_by_code, "daily": daily_by_code})
+            print(f"  공유 메모리 데이터: {shared.nbytes / 1024 / 1024:.0f} MB")
+            return {"shm": shared.handle}, shared.close
+        except OSError as e:
+            print(f"  공유 메모리 생성 실패 ({e}) — pickle 파일로 대체")
+
+    pickle_path = _dump_data_pickle(minute_by_code, daily_by_code)
+
+    def _cleanup():
+        try:
+            os.remove(pickle_path)
+        except OSError:
+            pass
+
+    return {"pickle": pickle_path}, _cleanup
+
+
+def load_worker_data(
+    source: Dict[str, Any],
+) -> Tuple[Dict[str, pd.DataFrame], Dict[str, pd.DataFrame]]:
+    """워커에서 데이터 소스 → (minute_by_code, daily_by_code).
+
+    공유 메모리 매핑은 _ATTACHED 가 프로세스 종료 시까지 유지한다.
+    """
+    if "shm" in source:
+        shared = SharedFrames.attach(source["shm"])
+        return shared.frames("minute"), shared.frames("daily")
+    with open(source["pickle"], "rb") as f:
+        data = pickle.load(f)
+    return data["minute"], data["daily"]
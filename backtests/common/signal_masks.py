@@ -0,0 +1,42 @@
+"""벡터 엔진용 exit 후보 마스크 헬퍼.
+
+BacktestEngine(vectorized=True) 는 전략의 entry_mask / exit_mask 가 True 인 bar 에서만
+entry_signal / exit_signal 을 호출한다. 마스크는 신호가 날 수 있는 bar 의 상위집합이면
+충분하고 (최종 판정은 항상 원래 signal 메서드), 여기 헬퍼는 전략들이 공유하는
+TP/SL · hold_limit 규칙을 exit_signal 과 같은 식으로 벡터화한다.
+"""
+import numpy as np
+import pandas as pd
+
+from backtests.common.trading_day import get_day_index
+
+
+def tp_sl_exit_mask(
+    close: np.ndarray, entry_price: float, take_profit_pct: float, stop_loss_pct: float
+) -> np.ndarray:
+    """pnl_pct >= take_profit_pct 또는 <= stop_loss_pct 인 bar 마스크 (exit_signal 과 동일 식)."""
+    close = np.asarray(close, dtype=float)
+    if entry_price <= 0:
+        return np.zeros(len(close), dtype=bool)
+    pnl_pct = (close - entry_price) / entry_price * 100.0
+    return (pnl_pct >= take_profit_pct) | (pnl_pct <= stop_loss_pct)
+
+
+def hold_limit_exit_mask(
+    df_minute: pd.DataFrame, from_idx: int, hold_days: int, n_bars: int,
+    calendar: bool = False,
+) -> np.ndarray:
+    """count_trading_days_between(df_minute, from_idx, t, calendar) >= hold_days 후보 마스크.
+
+    trading_day.get_day_index 의 거래일 서수 차이로 계산 (캐시 공유). 날짜가 연속 구간이
+    아닌 DF 에서도 서수 차이 >= 구간 고유 날짜 수 - 1 이므로 상위집합이 된다.
+    iloc 슬라이스가 잘리는 범위 (t >= len) 는 마지막 행 기준으로 계산한다.
+    """
+    mask = np.zeros(n_bars, dtype=bool)
+    day_index = get_day_index(df_minute)
+    ordinals = day_index.calendar_ordinals() if calendar else day_index.ordinals
+    if from_idx >= len(ordinals) or from_idx >= n_bars:
+        return mask
+    to_idx = np.minimum(np.arange(from_idx, n_bars), len(ordinals) - 1)
+    mask[from_idx:] = (ordinals[to_idx] - ordinals[from_idx]) >= hold_days
+    return mask
@@ -1,9 +1,127 @@
-"""거래일 카운팅 유틸 — trade_date 컬럼 기반."""
+"""거래일 카운팅 유틸 — trade_date 컬럼 기반.
+
+hold_limit exit 는 보유 포지션마다 매 bar count_trading_days_between 을 호출한다.
+매번 구간 nunique 를 세면 장기 보유 백테스트가 O(n²) 이 되므로, DataFrame 별로
+거래일 서수(day ordinal) 배열을 한 번 계산해 df.attrs 에 캐시하고 (feature_cache 와
+같은 방식) 두 서수의 차이로 O(1) 계산한다.
+
+기본 카운트는 DF 에 나타난 고유 trade_date 기준이다 (분봉이 빠진 날은 세지 않음).
+calendar=True 를 주면 config.krx_calendar 의 영업일 서수를 쓴다 — 거래정지 등으로 분봉이
+빠진 날도 경과 영업일로 세어 실거래 (main._count_krx_trading_days_between) 와 같은 값이
+된다. 이 모드에서 trade_date 에 KRX 영업일이 아닌 값 (주말·휴장일·합성 날짜) 이 있거나
+날짜가 연속 구간이 아니면 ValueError.
+
+Usage:
+    idx = get_day_index(df_minute)
+    days = idx.days_between(from_idx, to_idx)   # == count_trading_days_between(...)
+    days = count_trading_days_between(df_minute, from_idx, to_idx, calendar=True)
+"""
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
+from config.krx_calendar import get_krx_calendar
+
+
+_ATTR_KEY = "_trading_day_index"
+
+
+def _calendar_ordinals(values: np.ndarray) -> np.ndarray:
+    """trade_date 배열 → KRX 영업일 서수. 날짜 형식이 아니거나 휴장일이 섞이면 ValueError."""
+    try:
+        ordinals = get_krx_calendar().day_ordinals(values)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"KRX 영업일 카운트: trade_date 를 날짜로 해석할 수 없음 ({e})") from e
+    invalid = ordinals < 0
+    if invalid.any():
+        raise ValueError(
+            f"KRX 영업일 카운트: 영업일이 아닌 trade_date {values[int(np.argmax(invalid))]!r}"
+        )
+    return ordinals
+
+
+class DayIndex:
+    """분봉 DF 의 bar 별 거래일 서수 (trade_date 가 바뀔 때마다 +1).
+
+    날짜가 연속 구간으로만 나타나면 (정렬된 분봉) 서수 차이 == 구간 고유 날짜 수 - 1.
+    그렇지 않은 DF (날짜 재등장·결측) 는 contiguous=False 로 두고 nunique 로 계산한다.
+    KRX 영업일 서수 (calendar_ordinals) 는 처음 요청될 때 계산해 보관한다.
+    """
+
+    __slots__ = ("ordinals", "contiguous", "_first", "_last", "_values", "_calendar")
+
+    def __init__(self, trade_date: pd.Series):
+        values = trade_date.to_numpy()
+        n = len(values)
+        if n:
+            ordinals = np.concatenate(([0], np.cumsum(values[1:] != values[:-1])))
+            contiguous = (
+                not trade_date.isna().any()
+                and int(ordinals[-1]) + 1 == trade_date.nunique()
+            )
+        else:
+            ordinals = np.zeros(0, dtype=np.int64)
+            contiguous = True
+        self.ordinals = ordinals.astype(np.int64)
+        self.contiguous = contiguous
+        self._first = values[0] if n else None
+        self._last = values[-1] if n else None
+        self._values = values
+        self._calendar: Optional[np.ndarray] = None
+
+    def __deepcopy__(self, memo):
+        # pandas 는 연산마다 attrs 를 deepcopy 한다 — 불변 객체이므로 공유 (O(1))
+        return self
+
+    def matches(self, trade_date: pd.Series) -> bool:
+        """캐시가 현재 trade_date 컬럼과 일치하는지 (길이·처음·끝 값) 확인."""
+        n = len(trade_date)
+        if n != len(self.ordinals):
+            return False
+        if not n:
+            return True
+        values = trade_date.to_numpy()
+        return values[0] == self._first and values[-1] == self._last
+
+    def calendar_ordinals(self) -> np.ndarray:
+        """bar 별 KRX 영업일 서수 (첫 bar = 0). 연속 구간 DF 가 아니거나 영업일이 아닌 날짜가 있으면 ValueError."""
+        if self._calendar is None:
+            if not self.contiguous:
+                raise ValueError("KRX 영업일 카운트: trade_date 가 연속 구간이 아님 (정렬되지 않은 DF)")
+            if len(self._values):
+                ordinals = _calendar_ordinals(self._values)
+                self._calendar = (ordinals - ordinals[0]).astype(np.int64)
+            else:
+                self._calendar = np.zeros(0, dtype=np.int64)
+        return self._calendar
+
+    def days_between(self, from_idx: int, to_idx: int, calendar: bool = False) -> Optional[int]:
+        """연속 구간 DF 에서 경과 거래일 수 (iloc 슬라이스와 같은 범위 규칙). 아니면 None.
+
+        calendar=True 면 KRX 영업일 차이 (calendar_ordinals 의 ValueError 를 그대로 전파).
+        """
+        n = len(self.ordinals)
+        ordinals = self.calendar_ordinals() if calendar else self.ordinals
+        if not self.contiguous or from_idx < 0 or to_idx < 0:
+            return None
+        if from_idx >= n:
+            return -1  # 빈 슬라이스: nunique 0 - 1
+        return int(ordinals[min(to_idx, n - 1)] - ordinals[from_idx])
+
+
+def get_day_index(df_minute: pd.DataFrame) -> DayIndex:
+    """df_minute 의 DayIndex 반환. attrs 캐시 재사용."""
+    trade_date = df_minute["trade_date"]
+    cache = df_minute.attrs.get(_ATTR_KEY)
+    if not isinstance(cache, DayIndex) or not cache.matches(trade_date):
+        cache = DayIndex(trade_date)
+        df_minute.attrs[_ATTR_KEY] = cache
+    return cache
+
 
 def count_trading_days_between(
-    df_minute: pd.DataFrame, from_idx: int, to_idx: int
+    df_minute: pd.DataFrame, from_idx: int, to_idx: int, calendar: bool = False
 ) -> int:
     """df_minute[from_idx] ~ df_minute[to_idx] 사이 고유 trade_date 의 개수 - 1.
 
@@ -11,12 +129,19 @@ def count_trading_days_between(
         df_minute: trade_date 컬럼 포함된 분봉 DF.
         from_idx: 시작 bar 인덱스 (inclusive).
         to_idx: 종료 bar 인덱스 (inclusive).
+        calendar: True 면 분봉이 빠진 날도 포함한 KRX 영업일 차이 (모듈 docstring).
 
     Returns:
         경과한 거래일 수. 같은 날짜 안에서는 0.
+
+    Raises:
+        ValueError: from_idx > to_idx, 또는 calendar=True 인데 KRX 영업일로 셀 수 없는 DF.
     """
     if from_idx > to_idx:
         raise ValueError(f"from_idx {from_idx} > to_idx {to_idx}")
+    days = get_day_index(df_minute).days_between(from_idx, to_idx, calendar=calendar)
+    if days is not None:
+        return days
     subset = df_minute["trade_date"].iloc[from_idx : to_idx + 1]
     return int(subset.nunique() - 1)
 
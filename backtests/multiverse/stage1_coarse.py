@@ -189,6 +189,7 @@ def run_one_trial(
             universe=nonempty_tr,
             minute_df_by_code={c: m_tr[c] for c in nonempty_tr},
             daily_df_by_code={c: d_tr.get(c, pd.DataFrame()) for c in nonempty_tr},
+            vectorized=True,
         )
         res.train_metrics = eng_tr.run().metrics
 
@@ -206,6 +207,7 @@ def run_one_trial(
             universe=nonempty_te,
             minute_df_by_code={c: m_te[c] for c in nonempty_te},
             daily_df_by_code={c: d_te.get(c, pd.DataFrame()) for c in nonempty_te},
+            vectorized=True,
         )
         res.test_metrics = eng_te.run().metrics
 
@@ -1,19 +1,19 @@
 """Stage 1 멀티프로세싱 래퍼 — N workers × trial 분산.
 
 Pattern:
-  - 메인 프로세스가 데이터 → 임시 pickle 파일로 dump
-  - Worker initializer 가 pickle 파일에서 load (Windows pipe 한계 우회)
+  - 메인 프로세스가 데이터 → 공유 메모리 (SharedFrames) 에 한 번 배치
+    (shared_memory=False 또는 공유 메모리 부족 시 임시 pickle 파일로 dump)
+  - Worker initializer 가 공유 메모리에 attach 해 view 로 DataFrame 복원
+    (pickle 모드는 파일에서 load — Windows pipe 한계 우회)
   - 각 task = (strategy_class, params, trial_id) — 가벼운 인자
   - ProcessPoolExecutor.map 으로 분산
 
 Windows 호환: 큰 데이터를 initargs 로 전달하면 pipe 한계 (수십 MB) 초과 시
 "pickle data was truncated" 또는 "OSError: Invalid argument" 발생. 디스크
-경유로 우회.
+경유로 우회. 공유 메모리 모드는 handle(수 KB) 만 넘기고 숫자 컬럼을 워커 간 공유해
+워커 수만큼 데이터 사본이 생기지 않는다.
 """
-import os
-import pickle
 import random
-import tempfile
 import time
 from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
@@ -22,6 +22,7 @@ from typing import Any, Dict, List, Optional, Type
 import pandas as pd
 
 from backtests.common.data_loader import load_minute_df, load_daily_df
+from backtests.common.shared_frames import load_worker_data, publish_worker_data
 from backtests.multiverse.fold import Fold
 from backtests.multiverse.stage1_coarse import (
     TrialResult, run_one_trial, sample_params,
@@ -50,15 +51,12 @@ def _worker_init_inproc(
     _WORKER_INITIAL_CAPITAL = initial_capital
 
 
-def _worker_init_from_pickle(
-    pickle_path: str, fold: Fold, initial_capital: float,
+def _worker_init_from_source(
+    source: Dict[str, Any], fold: Fold, initial_capital: float,
 ) -> None:
-    """Worker initializer — pickle 파일에서 데이터 로드 (Windows pipe 우회)."""
+    """Worker initializer — 공유 메모리 또는 pickle 파일에서 데이터 로드."""
     global _WORKER_MINUTE, _WORKER_DAILY, _WORKER_FOLD, _WORKER_INITIAL_CAPITAL
-    with open(pickle_path, "rb") as f:
-        data = pickle.load(f)
-    _WORKER_MINUTE = data["minute"]
-    _WORKER_DAILY = data["daily"]
+    _WORKER_MINUTE, _WORKER_DAILY = load_worker_data(source)
     _WORKER_FOLD = fold
     _WORKER_INITIAL_CAPITAL = initial_capital
 
@@ -87,11 +85,13 @@ def run_stage1_parallel(
     minute_by_code: Optional[Dict[str, pd.DataFrame]] = None,
     daily_by_code: Optional[Dict[str, pd.DataFrame]] = None,
     progress_every: int = 50,
+    shared_memory: bool = True,
 ) -> List[TrialResult]:
     """전략 1개에 대해 n_trials trials 를 N workers 로 병렬 실행.
 
     Args:
         n_workers: ProcessPool worker 수. 1 이면 sequential (디버깅용).
+        shared_memory: True 면 데이터를 공유 메모리로 워커에 전달 (False: pickle 파일).
     """
     # 데이터 로드 (필요 시)
     if minute_by_code is None or daily_by_code is None:
@@ -133,15 +133,15 @@ def run_stage1_parallel(
                 print(f"  [{strategy_class.name}] {i+1}/{n_trials} trials ({el:.0f}s)")
         return results
 
-    # Parallel — 디스크 pickle 경유 (Windows pipe 한계 우회)
-    pickle_path = _dump_data_pickle(minute_by_code, daily_by_code)
+    # Parallel — 공유 메모리 (또는 디스크 pickle) 경유
+    source, cleanup = publish_worker_data(minute_by_code, daily_by_code, shared_memory)
     try:
         results: List[TrialResult] = []
         t0 = time.perf_counter()
         with ProcessPoolExecutor(
             max_workers=n_workers,
-            initializer=_worker_init_from_pickle,
-            initargs=(pickle_path, fold, initial_capital),
+            initializer=_worker_init_from_source,
+            initargs=(source, fold, initial_capital),
         ) as ex:
             for i, r in enumerate(ex.map(_worker_run, tasks, chunksize=1)):
                 results.append(r)
@@ -150,20 +150,4 @@ def run_stage1_parallel(
                     print(f"  [{strategy_class.name}] {i+1}/{n_trials} trials ({el:.0f}s)")
         return results
     finally:
-        try:
-            os.remove(pickle_path)
-        except OSError:
-            pass
-
-
-def _dump_data_pickle(
-    minute_by_code: Dict[str, pd.DataFrame],
-    daily_by_code: Dict[str, pd.DataFrame],
-) -> str:
-    """데이터를 임시 pickle 파일로 dump. 경로 반환."""
-    fd, path = tempfile.mkstemp(suffix=".pkl", prefix="stage1_data_")
-    os.close(fd)
-    with open(path, "wb") as f:
-        pickle.dump({"minute": minute_by_code, "daily": daily_by_code}, f,
-                    protocol=pickle.HIGHEST_PROTOCOL)
-    return path
+        cleanup()
@@ -95,6 +95,7 @@ def evaluate_fold(
         initial_capital=initial_capital, universe=nonempty_tr,
         minute_df_by_code={c: m_tr[c] for c in nonempty_tr},
         daily_df_by_code={c: d_tr.get(c, pd.DataFrame()) for c in nonempty_tr},
+        vectorized=True,
     )
     train_m = eng_tr.run().metrics
 
@@ -110,6 +111,7 @@ def evaluate_fold(
         initial_capital=initial_capital, universe=nonempty_te,
         minute_df_by_code={c: m_te[c] for c in nonempty_te},
         daily_df_by_code={c: d_te.get(c, pd.DataFrame()) for c in nonempty_te},
+        vectorized=True,
     )
     test_m = eng_te.run().metrics
 
@@ -1,17 +1,15 @@
 """Stage 2 Optuna 멀티프로세싱 — PostgreSQL 기반 공유 study + N workers.
 
 Pattern:
-  - 메인: PostgreSQL `robotrader_optuna` DB 에 공유 study 생성 + 데이터 임시 pickle dump
-  - 각 worker: pickle 에서 데이터 로드 + PG study 에 join + study.optimize(local_n_trials)
+  - 메인: PostgreSQL `robotrader_optuna` DB 에 공유 study 생성 + 데이터 공유 메모리 배치
+    (shared_memory=False 또는 공유 메모리 부족 시 임시 pickle dump)
+  - 각 worker: 공유 메모리 attach (또는 pickle load) + PG study 에 join + study.optimize(local_n_trials)
   - PostgreSQL 이 concurrent trial 추가/조회 처리 (트랜잭션)
   - 시계열 순서 / look-ahead 무관: 각 worker 의 백테스트는 자기 trial 안에서 시간 순서대로 진행
 
 TPE 의 sequential learning 효율은 약간 둔화 (동시 실행 trial 들은 같은 prior 사용)
 하지만 결과 정확성은 영향 없음.
 """
-import os
-import pickle
-import tempfile
 import time
 from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
@@ -21,6 +19,7 @@ import optuna
 import pandas as pd
 
 from backtests.common.data_loader import load_minute_df, load_daily_df
+from backtests.common.shared_frames import load_worker_data, publish_worker_data
 from backtests.multiverse.fold import Fold, STAGE2_FOLDS, stage2_data_range
 from backtests.multiverse.stage2_fine import (
     make_objective, save_study_results,
@@ -34,19 +33,16 @@ optuna.logging.set_verbosity(optuna.logging.WARNING)
 
 
 def _worker_run_optuna(args) -> int:
-    """Worker process: pickle 로드 → study 로드 → optimize.
+    """Worker process: 데이터 attach/로드 → study 로드 → optimize.
 
     Returns: 처리한 trial 수.
     """
     (
-        pickle_path, storage_url, study_name, strategy_class, folds,
+        source, storage_url, study_name, strategy_class, folds,
         n_trials_local, initial_capital, seed_offset,
     ) = args
-    # 데이터 로드
-    with open(pickle_path, "rb") as f:
-        data = pickle.load(f)
-    minute_by_code = data["minute"]
-    daily_by_code = data["daily"]
+    # 데이터 로드 (공유 메모리 view 또는 pickle)
+    minute_by_code, daily_by_code = load_worker_data(source)
 
     # Study 로드 (이미 메인이 만들어둠)
     study = optuna.load_study(study_name=study_name, storage=storage_url)
@@ -76,8 +72,12 @@ def run_stage2_parallel(
     universe: Optional[List[str]] = None,
     storage_dir: Path = Path("backtests/reports/stage2"),
     progress_every: int = 50,
+    shared_memory: bool = True,
 ):
-    """전략 1개에 대해 N workers 가 PostgreSQL study 공유로 Optuna TPE 분산 실행."""
+    """전략 1개에 대해 N workers 가 PostgreSQL study 공유로 Optuna TPE 분산 실행.
+
+    shared_memory: True 면 데이터를 공유 메모리로 워커에 전달 (False: pickle 파일).
+    """
     storage_dir.mkdir(parents=True, exist_ok=True)
     name = strategy_class.name
 
@@ -98,12 +98,8 @@ def run_stage2_parallel(
             for c in universe
         }
 
-    # 데이터 → 임시 pickle (Windows pipe 우회, Stage 1 패턴 동일)
-    pickle_fd, pickle_path = tempfile.mkstemp(suffix=".pkl", prefix=f"stage2_{name}_")
-    os.close(pickle_fd)
-    with open(pickle_path, "wb") as f:
-        pickle.dump({"minute": minute_by_code, "daily": daily_by_code}, f,
-                    protocol=pickle.HIGHEST_PROTOCOL)
+    # 데이터 → 공유 메모리 (또는 임시 pickle, Stage 1 패턴 동일)
+    source, cleanup = publish_worker_data(minute_by_code, daily_by_code, shared_memory)
 
     storage_url = optuna_pg_url()
     study_name = f"stage2_{name}"
@@ -134,7 +130,7 @@ def run_stage2_parallel(
               f"{n_workers} workers × {worker_loads}")
 
         tasks = [
-            (pickle_path, storage_url, study_name, strategy_class, folds,
+            (source, storage_url, study_name, strategy_class, folds,
              load, initial_capital, i)
             for i, load in enumerate(worker_loads)
         ]
@@ -151,7 +147,4 @@ def run_stage2_parallel(
         save_study_results(study, storage_dir, name)
         return study
     finally:
-        try:
-            os.remove(pickle_path)
-        except OSError:
-            pass
+        cleanup()
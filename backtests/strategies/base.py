@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
+import numpy as np
 import pandas as pd
 
 
@@ -61,3 +62,26 @@ class StrategyBase(ABC):
             bar_idx: 현재 분봉 인덱스.
             current_price: 현재 분봉 close (TP/SL 체크용). None 이면 훅 미사용 전략.
         """
+
+    def entry_mask(self, features: pd.DataFrame) -> Optional[np.ndarray]:
+        """벡터 엔진용 — entry_signal 이 주문을 낼 수 있는 bar 의 bool 마스크 (len(features)).
+
+        entry_signal 이 None 이 아닌 bar 를 모두 포함해야 한다 (상위집합 허용, 최종 판정은
+        entry_signal). None 이면 엔진이 bar 마다 entry_signal 을 호출해 마스크를 만든다.
+        """
+        return None
+
+    def exit_mask(
+        self, position: Position, features: pd.DataFrame, close: np.ndarray
+    ) -> Optional[np.ndarray]:
+        """벡터 엔진용 — position 의 exit_signal 이 주문을 낼 수 있는 bar 의 bool 마스크.
+
+        Args:
+            position: 보유 포지션 (entry_bar_idx 이후 bar 만 사용됨).
+            features: 전략이 prepare_features 로 계산한 DF.
+            close: 해당 종목 분봉 close 배열 (current_price 와 동일 값).
+
+        Returns:
+            상위집합 마스크. None 이면 엔진이 매 bar exit_signal 을 호출한다.
+        """
+        return None
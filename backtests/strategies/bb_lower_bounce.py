@@ -1,9 +1,11 @@
 """볼린저 하단 반등 (BB Lower Bounce) — 하단밴드 이탈 후 반등 매수."""
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from backtests.common.feature_cache import get_arrays
+from backtests.common.signal_masks import tp_sl_exit_mask
 from backtests.strategies.base import StrategyBase, EntryOrder, ExitOrder
 
 
@@ -78,6 +80,16 @@ class BBLowerBounceStrategy(StrategyBase):
             stock_code=stock_code, priority=1, budget_ratio=self.budget_ratio
         )
 
+    def entry_mask(self, features: pd.DataFrame) -> np.ndarray:
+        """entry_signal 과 같은 조건의 벡터 마스크 (NaN 비교는 False)."""
+        arr = get_arrays(features)
+        close = arr["close"]
+        return (
+            (arr["bar_in_day"] <= self.entry_window_end_bar)
+            & (close > arr["prev_lower"])
+            & (close > arr["prev_close"])
+        )
+
     def exit_signal(
         self, position, features, bar_idx, current_price: Optional[float] = None
     ) -> Optional[ExitOrder]:
@@ -89,3 +101,8 @@ class BBLowerBounceStrategy(StrategyBase):
         if pnl_pct <= self.stop_loss_pct:
             return ExitOrder(stock_code=position.stock_code, reason="sl")
         return None
+
+    def exit_mask(self, position, features: pd.DataFrame, close: np.ndarray) -> np.ndarray:
+        return tp_sl_exit_mask(
+            close, position.entry_price, self.take_profit_pct, self.stop_loss_pct
+        )
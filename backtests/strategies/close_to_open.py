@@ -1,9 +1,11 @@
 """close_to_open — 강한 종가(전일대비 ≥ +X%) 매수, 익일 시가 매도. hold_days=1."""
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from backtests.common.feature_cache import get_arrays
+from backtests.common.signal_masks import hold_limit_exit_mask
 from backtests.common.trading_day import count_trading_days_between
 from backtests.strategies.base import StrategyBase, EntryOrder, ExitOrder
 
@@ -80,6 +82,15 @@ class CloseToOpenStrategy(StrategyBase):
             stock_code=stock_code, priority=1, budget_ratio=self.budget_ratio
         )
 
+    def entry_mask(self, features: pd.DataFrame) -> np.ndarray:
+        """entry_signal 과 같은 조건의 벡터 마스크 (NaN 비교는 False)."""
+        arr = get_arrays(features)
+        hhmm = arr["hhmm"]
+        return (
+            (hhmm >= self.entry_hhmm_min) & (hhmm <= self.entry_hhmm_max)
+            & (arr["today_change_pct"] >= self.min_change_pct)
+        )
+
     def exit_signal(
         self,
         position,
@@ -97,3 +108,10 @@ class CloseToOpenStrategy(StrategyBase):
         if days_held >= self.hold_days:
             return ExitOrder(stock_code=position.stock_code, reason="hold_limit")
         return None
+
+    def exit_mask(self, position, features: pd.DataFrame, close: np.ndarray) -> np.ndarray:
+        if self._last_df_minute is None:
+            return np.zeros(len(features), dtype=bool)
+        return hold_limit_exit_mask(
+            self._last_df_minute, position.entry_bar_idx, self.hold_days, len(features)
+        )
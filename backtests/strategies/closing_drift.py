@@ -10,6 +10,7 @@ import numpy as np
 import pandas as pd
 
 from backtests.common.feature_cache import get_arrays
+from backtests.common.signal_masks import hold_limit_exit_mask
 from backtests.common.trading_day import count_trading_days_between
 from backtests.strategies.base import StrategyBase, EntryOrder, ExitOrder
 
@@ -120,6 +121,19 @@ class ClosingDriftStrategy(StrategyBase):
             stock_code=stock_code, priority=1, budget_ratio=self.budget_ratio
         )
 
+    def entry_mask(self, features: pd.DataFrame) -> np.ndarray:
+        """entry_signal 과 같은 조건의 벡터 마스크 (NaN 비교는 False)."""
+        arr = get_arrays(features)
+        hhmm = arr["hhmm"]
+        close = arr["close"]
+        return (
+            (hhmm >= self.entry_hhmm_start) & (hhmm < self.entry_hhmm_end)
+            & (arr["prev_body_pct"] >= self.min_prev_body_pct)
+            & (arr["day_low_pct"] >= self.max_day_decline_pct)
+            & (close > arr["day_open"])
+            & (close > arr["vwap"])
+        )
+
     def exit_signal(
         self,
         position,
@@ -138,3 +152,10 @@ class ClosingDriftStrategy(StrategyBase):
         if days_held >= self.hold_days:
             return ExitOrder(stock_code=position.stock_code, reason="hold_limit")
         return None
+
+    def exit_mask(self, position, features: pd.DataFrame, close: np.ndarray) -> np.ndarray:
+        if self._last_df_minute is None:
+            return np.zeros(len(features), dtype=bool)
+        return hold_limit_exit_mask(
+            self._last_df_minute, position.entry_bar_idx, self.hold_days, len(features)
+        )
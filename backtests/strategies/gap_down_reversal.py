@@ -1,9 +1,11 @@
 """갭다운 역행 (Gap-Down Reversal) — 시가 갭다운 후 반등 매수."""
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from backtests.common.feature_cache import get_arrays
+from backtests.common.signal_masks import tp_sl_exit_mask
 from backtests.strategies.base import StrategyBase, EntryOrder, ExitOrder
 
 
@@ -102,6 +104,15 @@ class GapDownReversalStrategy(StrategyBase):
             stock_code=stock_code, priority=1, budget_ratio=self.budget_ratio
         )
 
+    def entry_mask(self, features: pd.DataFrame) -> np.ndarray:
+        """entry_signal 과 같은 조건의 벡터 마스크 (NaN 비교는 False)."""
+        arr = get_arrays(features)
+        return (
+            (arr["bar_in_day"] <= self.entry_window_end_bar)
+            & (arr["gap_pct"] <= self.gap_threshold_pct)
+            & (arr["rebound_pct"] >= self.reversal_threshold_pct)
+        )
+
     def exit_signal(
         self,
         position,
@@ -117,3 +128,8 @@ class GapDownReversalStrategy(StrategyBase):
         if pnl_pct <= self.stop_loss_pct:
             return ExitOrder(stock_code=position.stock_code, reason="sl")
         return None
+
+    def exit_mask(self, position, features: pd.DataFrame, close: np.ndarray) -> np.ndarray:
+        return tp_sl_exit_mask(
+            close, position.entry_price, self.take_profit_pct, self.stop_loss_pct
+        )
@@ -1,9 +1,11 @@
 """갭업 추격 (Gap-Up Continuation) — 시가 갭업 + 거래량 급증 추격."""
 from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from backtests.common.feature_cache import get_arrays
+from backtests.common.signal_masks import tp_sl_exit_mask
 from backtests.strategies.base import StrategyBase, EntryOrder, ExitOrder
 
 
@@ -108,6 +110,15 @@ class GapUpChaseStrategy(StrategyBase):
             stock_code=stock_code, priority=1, budget_ratio=self.budget_ratio
         )
 
+    def entry_mask(self, features: pd.DataFrame) -> np.ndarray:
+        """entry_signal 과 같은 조건의 벡터 마스크 (NaN 비교는 False)."""
+        arr = get_arrays(features)
+        return (
+            (arr["bar_in_day"] <= self.entry_window_end_bar)
+            & (arr["gap_pct"] >= self.gap_threshold_pct)
+            & (arr["vol_ratio"] >= self.volume_mult)
+        )
+
     def exit_signal(
         self,
         position,
@@ -123,3 +134,8 @@ class GapUpChaseStrategy(StrategyBase):
         if pnl_pct <= self.stop_loss_pct:
             return ExitOrder(stock_code=position.stock_code, reason="sl")
         return None
+
+    def exit_mask(self, position, features: pd.DataFrame, close: np.ndarray) -> np.ndarray:
+        return tp_sl_exit_mask(
+            close, position.entry_price, self.take_profit_pct, self.stop_loss_pct
+        )
@@ -1,9 +1,11 @@
 """장중 눌림목 (Intraday Pullback to 20EMA) — 상승추세 중 EMA 근접 눌림 후 반등."""
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from backtests.common.feature_cache import get_arrays
+from backtests.common.signal_masks import tp_sl_exit_mask
 from backtests.strategies.base import StrategyBase, EntryOrder, ExitOrder
 
 
@@ -104,6 +106,18 @@ class IntradayPullbackStrategy(StrategyBase):
             stock_code=stock_code, priority=1, budget_ratio=self.budget_ratio
         )
 
+    def entry_mask(self, features: pd.DataFrame) -> np.ndarray:
+        """entry_signal 과 같은 조건의 벡터 마스크 (NaN 비교는 False)."""
+        arr = get_arrays(features)
+        prev_ema = arr["prev_ema"]
+        proximity_threshold = prev_ema * (1.0 + self.proximity_pct / 100.0)
+        return (
+            (arr["bar_in_day"] <= self.entry_window_end_bar)
+            & (arr["recent_high"] > prev_ema)
+            & (arr["recent_low"] <= proximity_threshold)
+            & (arr["close"] > arr["prev_close"])
+        )
+
     def exit_signal(
         self, position, features, bar_idx, current_price: Optional[float] = None
     ) -> Optional[ExitOrder]:
@@ -115,3 +129,8 @@ class IntradayPullbackStrategy(StrategyBase):
         if pnl_pct <= self.stop_loss_pct:
             return ExitOrder(stock_code=position.stock_code, reason="sl")
         return None
+
+    def exit_mask(self, position, features: pd.DataFrame, close: np.ndarray) -> np.ndarray:
+        return tp_sl_exit_mask(
+            close, position.entry_price, self.take_profit_pct, self.stop_loss_pct
+        )
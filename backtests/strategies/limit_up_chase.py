@@ -5,9 +5,11 @@
 """
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from backtests.common.feature_cache import get_arrays
+from backtests.common.signal_masks import tp_sl_exit_mask
 from backtests.strategies.base import StrategyBase, EntryOrder, ExitOrder
 
 
@@ -110,6 +112,18 @@ class LimitUpChaseStrategy(StrategyBase):
             stock_code=stock_code, priority=1, budget_ratio=self.budget_ratio
         )
 
+    def entry_mask(self, features: pd.DataFrame) -> np.ndarray:
+        """entry_signal 과 같은 조건의 벡터 마스크 (NaN 비교는 False)."""
+        arr = get_arrays(features)
+        change = arr["price_change_pct"]
+        return (
+            pd.notna(arr["prev_close"])
+            & (arr["bar_in_day"] <= self.entry_window_end_bar)
+            & (change >= self.chase_threshold_pct)
+            & (change < self.limit_proximity_pct)
+            & (arr["vol_ratio"] >= self.volume_mult)
+        )
+
     def exit_signal(
         self, position, features, bar_idx, current_price: Optional[float] = None
     ) -> Optional[ExitOrder]:
@@ -121,3 +135,8 @@ class LimitUpChaseStrategy(StrategyBase):
         if pnl_pct <= self.stop_loss_pct:
             return ExitOrder(stock_code=position.stock_code, reason="sl")
         return None
+
+    def exit_mask(self, position, features: pd.DataFrame, close: np.ndarray) -> np.ndarray:
+        return tp_sl_exit_mask(
+            close, position.entry_price, self.take_profit_pct, self.stop_loss_pct
+        )
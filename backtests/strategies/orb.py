@@ -1,9 +1,11 @@
 """ORB (Opening Range Breakout) — 장 시작 N분 고점 돌파 전략."""
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from backtests.common.feature_cache import get_arrays
+from backtests.common.signal_masks import tp_sl_exit_mask
 from backtests.strategies.base import StrategyBase, EntryOrder, ExitOrder
 
 
@@ -82,6 +84,12 @@ class ORBStrategy(StrategyBase):
             stock_code=stock_code, priority=1, budget_ratio=self.budget_ratio
         )
 
+    def entry_mask(self, features: pd.DataFrame) -> np.ndarray:
+        """entry_signal 과 같은 조건의 벡터 마스크 (NaN 비교는 False)."""
+        arr = get_arrays(features)
+        threshold = arr["or_high"] * (1 + self.breakout_buffer_pct / 100.0)
+        return (arr["bar_in_day"] <= self.entry_end_bar) & (arr["close"] > threshold)
+
     def exit_signal(
         self,
         position,
@@ -98,3 +106,8 @@ class ORBStrategy(StrategyBase):
         if pnl_pct <= self.stop_loss_pct:
             return ExitOrder(stock_code=position.stock_code, reason="sl")
         return None
+
+    def exit_mask(self, position, features: pd.DataFrame, close: np.ndarray) -> np.ndarray:
+        return tp_sl_exit_mask(
+            close, position.entry_price, self.take_profit_pct, self.stop_loss_pct
+        )
@@ -5,6 +5,7 @@ import numpy as np
 import pandas as pd
 
 from backtests.common.feature_cache import get_arrays
+from backtests.common.signal_masks import tp_sl_exit_mask
 from backtests.strategies.base import StrategyBase, EntryOrder, ExitOrder
 
 
@@ -90,6 +91,18 @@ class RSIOversoldStrategy(StrategyBase):
             stock_code=stock_code, priority=1, budget_ratio=self.budget_ratio
         )
 
+    def entry_mask(self, features: pd.DataFrame) -> np.ndarray:
+        """entry_signal 과 같은 조건의 벡터 마스크 (NaN 비교는 False)."""
+        arr = get_arrays(features)
+        prev_rsi = arr["prev_rsi"]
+        prev_prev_rsi = arr["prev_prev_rsi"]
+        return (
+            (arr["bar_in_day"] <= self.entry_window_end_bar)
+            & ((prev_rsi < self.oversold_threshold) | (prev_prev_rsi < self.oversold_threshold))
+            & (prev_rsi > prev_prev_rsi)
+            & (arr["close"] > arr["prev_close"])
+        )
+
     def exit_signal(
         self, position, features, bar_idx, current_price: Optional[float] = None
     ) -> Optional[ExitOrder]:
@@ -101,3 +114,8 @@ class RSIOversoldStrategy(StrategyBase):
         if pnl_pct <= self.stop_loss_pct:
             return ExitOrder(stock_code=position.stock_code, reason="sl")
         return None
+
+    def exit_mask(self, position, features: pd.DataFrame, close: np.ndarray) -> np.ndarray:
+        return tp_sl_exit_mask(
+            close, position.entry_price, self.take_profit_pct, self.stop_loss_pct
+        )
@@ -1,9 +1,11 @@
 """trend_followthrough — N일 고점 돌파 follow-through, 2일 홀드."""
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from backtests.common.feature_cache import get_arrays
+from backtests.common.signal_masks import hold_limit_exit_mask
 from backtests.common.trading_day import count_trading_days_between
 from backtests.strategies.base import StrategyBase, EntryOrder, ExitOrder
 
@@ -77,6 +79,16 @@ class TrendFollowthroughStrategy(StrategyBase):
             stock_code=stock_code, priority=1, budget_ratio=self.budget_ratio
         )
 
+    def entry_mask(self, features: pd.DataFrame) -> np.ndarray:
+        """entry_signal 과 같은 조건의 벡터 마스크 (NaN 비교는 False)."""
+        arr = get_arrays(features)
+        hhmm = arr["hhmm"]
+        threshold = arr["prev_high"] * (1.0 + self.buffer_pct / 100.0)
+        return (
+            (hhmm >= self.entry_hhmm_min) & (hhmm <= self.entry_hhmm_max)
+            & (arr["close"] > threshold)
+        )
+
     def exit_signal(
         self,
         position,
@@ -94,3 +106,10 @@ class TrendFollowthroughStrategy(StrategyBase):
         if days_held >= self.hold_days:
             return ExitOrder(stock_code=position.stock_code, reason="hold_limit")
         return None
+
+    def exit_mask(self, position, features: pd.DataFrame, close: np.ndarray) -> np.ndarray:
+        if self._last_df_minute is None:
+            return np.zeros(len(features), dtype=bool)
+        return hold_limit_exit_mask(
+            self._last_df_minute, position.entry_bar_idx, self.hold_days, len(features)
+        )
@@ -10,6 +10,11 @@ subprocess 대신 signal_replay 모듈을 직접 import하여 호출합니다.
 사용법:
 python batch_signal_replay_fast.py --start 20250901 --end 20260130
 python batch_signal_replay_fast.py -s 20250901 -e 20260130 --advanced-filter
+python batch_signal_replay_fast.py -s 20250901 -e 20260130 --processes 16
+
+--processes 지정 시 (날짜, 종목) 작업 단위를 프로세스 풀로 분산합니다.
+각 워커는 initializer 에서 ML 모델·고급 필터·캐시를 한 번만 로드하고,
+날짜별 결과는 모든 종목이 끝나는 대로 메인 프로세스에서 종목 순서대로 병합·저장합니다.
 """
 
 import argparse
@@ -19,10 +24,10 @@ import json
 import time as time_module
 from datetime import datetime, timedelta, time
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from multiprocessing import cpu_count
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 import threading
 
 # UTF-8 인코딩 설정
@@ -103,7 +108,7 @@ logging.disable(logging.INFO)
 logging.basicConfig(level=logging.CRITICAL, format='%(message)s', force=True)
 logging.getLogger().setLevel(logging.CRITICAL)
 
-from utils.data_cache import DataCache, DailyDataCache
+from utils.data_cache import DataCache, DailyDataCache, required_last_bar_time
 from utils.signal_replay import (
     simulate_trades,
     calculate_trading_signals_once,
@@ -138,7 +143,8 @@ class BatchReplayContext:
     """배치 리플레이에서 공유되는 리소스를 관리하는 컨텍스트 클래스"""
 
     def __init__(self, advanced_filter: bool = False, ml_filter: bool = False,
-                 ml_model_path: str = "ml_model.pkl", ml_threshold: float = None):
+                 ml_model_path: str = "ml_model.pkl", ml_threshold: float = None,
+                 verbose: bool = True):
         self.minute_cache = DataCache()
         self.daily_cache = DailyDataCache()
         self.stock_names = load_stock_names()
@@ -152,7 +158,8 @@ class BatchReplayContext:
                 from core.indicators.advanced_filters import AdvancedFilterManager
                 self.advanced_filter_manager = AdvancedFilterManager()
                 active_filters = self.advanced_filter_manager.get_active_filters()
-                print(f"🔰 고급 필터 활성화: {', '.join(active_filters) if active_filters else '없음'}")
+                if verbose:
+                    print(f"🔰 고급 필터 활성화: {', '.join(active_filters) if active_filters else '없음'}")
             except Exception as e:
                 print(f"⚠️ 고급 필터 초기화 실패: {e}")
                 self.advanced_filter_enabled = False
@@ -170,7 +177,8 @@ class BatchReplayContext:
                     print("⚠️ ML 모델 로드 실패 - ML 필터 비활성화")
                     self.ml_filter_enabled = False
                 else:
-                    print(f"🤖 ML 필터 활성화 (임계값: {self.ml_threshold:.1%})")
+                    if verbose:
+                        print(f"🤖 ML 필터 활성화 (임계값: {self.ml_threshold:.1%})")
             except Exception as e:
                 print(f"⚠️ ML 모델 로드 실패: {e}")
                 self.ml_filter_enabled = False
@@ -224,32 +232,34 @@ def process_single_stock(
     date_str: str,
     stock_selection_map: Dict[str, str],
     ctx: BatchReplayContext,
-    pattern_data_cache: Dict
+    pattern_data_cache: Dict,
+    minute_data: Optional[Dict[str, pd.DataFrame]] = None
 ) -> Tuple[str, List[Dict], pd.DataFrame, List[Dict]]:
-    """단일 종목 처리 함수"""
+    """단일 종목 처리 함수
+
+    Args:
+        minute_data: load_minute_data_bulk 로 미리 로드한 {종목: 완결된 1분봉}.
+            None 이면 종목별로 캐시 조회 및 검증
+    """
     try:
         df_1min = None
 
         # PG 캐시에서 데이터 로드 시도
-        cached_data = ctx.minute_cache.load_data(stock_code, date_str)
+        cached_data = None
+        if minute_data is not None:
+            df_1min = minute_data.get(stock_code)
+        else:
+            cached_data = ctx.minute_cache.load_data(stock_code, date_str)
 
         if cached_data is not None and not cached_data.empty:
             try:
                 if 'datetime' in cached_data.columns:
                     cached_data['datetime'] = pd.to_datetime(cached_data['datetime'])
 
-                    # 시장 시간 검증
-                    target_date = datetime.strptime(date_str, '%Y%m%d')
-                    market_hours = MarketHours.get_market_hours('KRX', target_date)
-                    market_open_time = market_hours['market_open']
-                    market_close_time = market_hours['market_close']
-
-                    times = cached_data['datetime'].dt.time
-                    has_morning = any(t >= market_open_time for t in times)
-                    check_time = time(market_close_time.hour - 1, 0)
-                    has_afternoon = any(t >= check_time for t in times)
+                    # 시장 시간 검증 (시장 시작 이후 + 마감 1시간 전 이후 봉 존재 = 마지막 봉 시각 기준)
+                    last_time = cached_data['datetime'].dropna().dt.time.max()
 
-                    if has_morning and has_afternoon:
+                    if pd.notna(last_time) and last_time >= required_last_bar_time(date_str):
                         df_1min = cached_data
             except Exception as e:
                 logger.debug(f"[{stock_code}] 캐시 검증 실패: {e}")
@@ -295,6 +305,25 @@ def process_single_stock(
         return stock_code, [], pd.DataFrame(), []
 
 
+def load_minute_data_bulk(
+    minute_cache: DataCache,
+    date_str: str,
+    codes: List[str]
+) -> Optional[Dict[str, pd.DataFrame]]:
+    """날짜의 전체 종목 1분봉을 쿼리 한 번으로 로드 (완결성은 서버측 마지막 봉 시각으로 판단)
+
+    Returns:
+        {종목: 1분봉} (불완전/없는 종목 제외). 일괄 로드 결과가 비면 None → 종목별 경로 사용
+    """
+    bulk = minute_cache.load_data_bulk(
+        [(code, date_str) for code in codes],
+        min_last_time=required_last_bar_time(date_str)
+    )
+    if not bulk:
+        return None
+    return {code: df for (code, _), df in bulk.items()}
+
+
 def process_single_date(
     date_str: str,
     ctx: BatchReplayContext,
@@ -313,6 +342,13 @@ def process_single_date(
         # 패턴 데이터 캐시 로드 (ML 필터용)
         pattern_data_cache = ctx.load_pattern_data_cache(date_str)
 
+        # 일봉 특징 테이블 선생성 (워커 스레드가 같은 종목을 동시에 만들지 않도록, 이미 만든 종목은 생략)
+        if ctx.advanced_filter_manager is not None:
+            ctx.advanced_filter_manager.preload_daily_features(codes)
+
+        # 1분봉 일괄 로드 (쿼리 1회)
+        minute_data = load_minute_data_bulk(ctx.minute_cache, date_str, codes)
+
         # 종목별 병렬 처리
         all_trades: Dict[str, List[Dict]] = {}
         all_missed_opportunities: Dict[str, List[Dict]] = {}
@@ -321,7 +357,7 @@ def process_single_date(
             future_to_stock = {
                 executor.submit(
                     process_single_stock,
-                    code, date_str, stock_selection_map, ctx, pattern_data_cache
+                    code, date_str, stock_selection_map, ctx, pattern_data_cache, minute_data
                 ): code for code in codes
             }
 
@@ -337,29 +373,194 @@ def process_single_date(
                     all_trades[stock_code] = []
                     all_missed_opportunities[stock_code] = []
 
-        # 결과 집계
-        all_completed_trades = [trade for trades in all_trades.values() for trade in trades]
-        total_wins = sum(1 for trade in all_completed_trades if trade.get('profit_rate', 0) > 0 and trade.get('sell_time'))
-        total_losses = sum(1 for trade in all_completed_trades if trade.get('profit_rate', 0) <= 0 and trade.get('sell_time'))
-        max_concurrent = calculate_max_concurrent_holdings(all_trades)
-
-        # 결과 파일 저장
-        save_result_file(
-            date_str, all_trades, all_missed_opportunities,
-            stock_selection_map, output_dir, time_range, max_concurrent
+        stats = finalize_date_results(
+            date_str, codes, all_trades, all_missed_opportunities,
+            stock_selection_map, output_dir, time_range
         )
-
-        return True, date_str, {
-            'trades': len(all_completed_trades),
-            'wins': total_wins,
-            'losses': total_losses
-        }
+        return True, date_str, stats
 
     except Exception as e:
         print(f"❌ [{date_str}] 처리 오류: {e}")
         return False, date_str, {'trades': 0, 'wins': 0, 'losses': 0}
 
 
+def finalize_date_results(
+    date_str: str,
+    codes: List[str],
+    all_trades: Dict[str, List[Dict]],
+    all_missed_opportunities: Dict[str, List[Dict]],
+    stock_selection_map: Dict[str, str],
+    output_dir: str,
+    time_range: str
+) -> Dict:
+    """날짜별 종목 결과를 종목 순서(codes)대로 병합해 집계·저장하고 통계 반환
+
+    완료 순서와 무관하게 같은 결과 파일이 나오도록 codes 순서로 정렬합니다.
+    """
+    all_trades = {code: all_trades.get(code, []) for code in codes}
+    all_missed_opportunities = {code: all_missed_opportunities.get(code, []) for code in codes}
+
+    # 결과 집계
+    all_completed_trades = [trade for trades in all_trades.values() for trade in trades]
+    total_wins = sum(1 for trade in all_completed_trades if trade.get('profit_rate', 0) > 0 and trade.get('sell_time'))
+    total_losses = sum(1 for trade in all_completed_trades if trade.get('profit_rate', 0) <= 0 and trade.get('sell_time'))
+    max_concurrent = calculate_max_concurrent_holdings(all_trades)
+
+    # 결과 파일 저장
+    save_result_file(
+        date_str, all_trades, all_missed_opportunities,
+        stock_selection_map, output_dir, time_range, max_concurrent
+    )
+
+    return {
+        'trades': len(all_completed_trades),
+        'wins': total_wins,
+        'losses': total_losses
+    }
+
+
+# ==================== 프로세스 풀 모드 ====================
+# 워커 프로세스 전역 상태 (initializer 에서 한 번만 생성)
+_worker_ctx: Optional[BatchReplayContext] = None
+_worker_pattern_cache: Dict[str, Dict] = {}
+
+
+def _init_process_worker(advanced_filter: bool, ml_filter: bool,
+                         ml_model_path: str, ml_threshold: Optional[float]):
+    """프로세스 워커 초기화: ML 모델, AdvancedFilterManager, 캐시를 워커당 한 번 로드"""
+    global _worker_ctx
+    _worker_ctx = BatchReplayContext(
+        advanced_filter=advanced_filter,
+        ml_filter=ml_filter,
+        ml_model_path=ml_model_path,
+        ml_threshold=ml_threshold,
+        verbose=False
+    )
+
+
+def _process_stock_unit(
+    date_str: str,
+    stock_code: str,
+    selection_date: Optional[str],
+    minute_data: Optional[Dict[str, pd.DataFrame]] = None
+) -> Tuple[str, str, List[Dict], List[Dict]]:
+    """(날짜, 종목) 작업 단위 처리 (워커 프로세스에서 실행)
+
+    minute_data 는 메인 프로세스가 일괄 로드한 해당 종목 1분봉 ({} = 데이터 없음, None = 워커에서 조회).
+    1분봉 DataFrame 은 돌려보내지 않고 거래/놓친 기회 리스트만 반환합니다.
+    """
+    # 작업은 날짜 순으로 제출되므로 패턴 데이터 캐시는 최근 날짜 하나만 유지
+    pattern_data_cache = _worker_pattern_cache.get(date_str)
+    if pattern_data_cache is None:
+        _worker_pattern_cache.clear()
+        pattern_data_cache = _worker_ctx.load_pattern_data_cache(date_str)
+        _worker_pattern_cache[date_str] = pattern_data_cache
+
+    stock_selection_map = {stock_code: selection_date}
+    _, trades, _, missed = process_single_stock(
+        stock_code, date_str, stock_selection_map, _worker_ctx, pattern_data_cache, minute_data
+    )
+    return date_str, stock_code, trades, missed
+
+
+def process_dates_with_processes(
+    dates: List[str],
+    output_dir: str,
+    time_range: str,
+    processes: int,
+    advanced_filter: bool = False,
+    ml_filter: bool = False,
+    ml_model_path: str = "ml_model.pkl",
+    ml_threshold: Optional[float] = None
+) -> Iterator[Tuple[bool, str, Dict]]:
+    """(날짜, 종목) 단위를 프로세스 풀로 분산 처리
+
+    날짜별 1분봉은 메인 프로세스에서 쿼리 한 번으로 로드해 작업과 함께 넘기고,
+    진행 중 작업이 워커 수의 몇 배를 넘지 않도록 날짜 단위로 제출합니다 (메모리 제한).
+    날짜의 모든 종목이 끝나는 대로 결과 파일을 저장하고 (성공 여부, 날짜, 통계) 를 yield 합니다.
+    """
+    try:
+        minute_cache = DataCache()
+    except Exception as e:
+        logger.debug(f"1분봉 캐시 초기화 실패 (워커에서 종목별 조회): {e}")
+        minute_cache = None
+
+    max_in_flight = processes * 4
+    pending: Dict[str, Dict] = {}
+    in_flight = {}
+    date_iter = iter(dates)
+    dates_exhausted = False
+
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        initializer=_init_process_worker,
+        initargs=(advanced_filter, ml_filter, ml_model_path, ml_threshold)
+    ) as executor:
+        while True:
+            # 다음 날짜 작업 제출
+            while not dates_exhausted and len(in_flight) < max_in_flight:
+                date_str = next(date_iter, None)
+                if date_str is None:
+                    dates_exhausted = True
+                    break
+                try:
+                    stock_selection_map = get_stocks_with_selection_date(date_str)
+                    codes = list(stock_selection_map.keys())
+                    minute_data = load_minute_data_bulk(minute_cache, date_str, codes) if (codes and minute_cache) else None
+                except Exception as e:
+                    print(f"❌ [{date_str}] 처리 오류: {e}")
+                    yield False, date_str, {'trades': 0, 'wins': 0, 'losses': 0}
+                    continue
+
+                if not codes:
+                    yield True, date_str, {'trades': 0, 'wins': 0, 'losses': 0}
+                    continue
+
+                pending[date_str] = {
+                    'selection_map': stock_selection_map,
+                    'codes': codes,
+                    'remaining': len(codes),
+                    'trades': {},
+                    'missed': {},
+                }
+                for code in codes:
+                    unit_data = None
+                    if minute_data is not None:
+                        unit_data = {code: minute_data[code]} if code in minute_data else {}
+                    future = executor.submit(
+                        _process_stock_unit, date_str, code, stock_selection_map.get(code), unit_data
+                    )
+                    in_flight[future] = (date_str, code)
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                date_str, code = in_flight.pop(future)
+                state = pending[date_str]
+                try:
+                    _, _, trades, missed = future.result()
+                except Exception as e:
+                    logger.debug(f"[{date_str}/{code}] 처리 실패: {e}")
+                    trades, missed = [], []
+                state['trades'][code] = trades
+                state['missed'][code] = missed
+                state['remaining'] -= 1
+
+                if state['remaining'] == 0:
+                    del pending[date_str]
+                    try:
+                        stats = finalize_date_results(
+                            date_str, state['codes'], state['trades'], state['missed'],
+                            state['selection_map'], output_dir, time_range
+                        )
+                        yield True, date_str, stats
+                    except Exception as e:
+                        print(f"❌ [{date_str}] 처리 오류: {e}")
+                        yield False, date_str, {'trades': 0, 'wins': 0, 'losses': 0}
+
+
 def save_result_file(
     date_str: str,
     all_trades: Dict[str, List[Dict]],
@@ -572,6 +773,7 @@ def main():
   python batch_signal_replay_fast.py -s 20250901 -e 20260130
   python batch_signal_replay_fast.py -s 20250901 -e 20260130 --advanced-filter
   python batch_signal_replay_fast.py -s 20250901 -e 20260130 --workers 8
+  python batch_signal_replay_fast.py -s 20250901 -e 20260130 --processes 16
         """
     )
 
@@ -585,6 +787,8 @@ def main():
     parser.add_argument('--ml-model', default='ml_model.pkl', help='ML 모델 경로')
     parser.add_argument('--ml-threshold', type=float, default=None, help='ML 임계값')
     parser.add_argument('--serial', action='store_true', help='순차 실행')
+    parser.add_argument('--processes', '-p', type=int, default=None,
+                        help='프로세스 풀 모드 워커 수 (0=CPU 코어 수). 지정 시 (날짜, 종목) 단위로 분산')
 
     args = parser.parse_args()
 
@@ -608,8 +812,11 @@ def main():
         sys.exit(1)
 
     # 병렬 작업 수 결정
+    use_processes = args.processes is not None and not args.serial
     if args.serial:
         max_workers = 1
+    elif use_processes:
+        max_workers = args.processes or cpu_count()
     else:
         max_workers = args.workers or max(1, min(cpu_count() // 2, 4))
 
@@ -617,7 +824,10 @@ def main():
     print("🚀 고속 배치 신호 리플레이 (직접 함수 호출 방식)")
     print("=" * 70)
     print(f"📅 처리 기간: {dates[0]} ~ {dates[-1]} ({len(dates)}일)")
-    print(f"⚙️ 날짜 병렬 처리: {max_workers}개")
+    if use_processes:
+        print(f"⚙️ 프로세스 풀 처리: {max_workers}개 (날짜×종목 단위)")
+    else:
+        print(f"⚙️ 날짜 병렬 처리: {max_workers}개")
     print(f"📁 출력 디렉토리: {args.output_dir}")
     if args.advanced_filter:
         print(f"🔰 고급 필터: 활성화")
@@ -625,19 +835,21 @@ def main():
         print(f"🤖 ML 필터: 활성화")
     print("=" * 70)
 
-    # 컨텍스트 초기화 (리소스 한 번만 로드)
-    print("\n⏳ 리소스 초기화 중...")
+    # 컨텍스트 초기화 (리소스 한 번만 로드, 프로세스 모드는 워커별 initializer 에서 로드)
     start_time = time_module.time()
+    ctx = None
+    if not use_processes:
+        print("\n⏳ 리소스 초기화 중...")
+
+        ctx = BatchReplayContext(
+            advanced_filter=args.advanced_filter,
+            ml_filter=args.ml_filter,
+            ml_model_path=args.ml_model,
+            ml_threshold=args.ml_threshold
+        )
 
-    ctx = BatchReplayContext(
-        advanced_filter=args.advanced_filter,
-        ml_filter=args.ml_filter,
-        ml_model_path=args.ml_model,
-        ml_threshold=args.ml_threshold
-    )
-
-    init_time = time_module.time() - start_time
-    print(f"✅ 리소스 초기화 완료 ({init_time:.1f}초)")
+        init_time = time_module.time() - start_time
+        print(f"✅ 리소스 초기화 완료 ({init_time:.1f}초)")
 
     # 날짜별 처리
     print(f"\n🔄 {len(dates)}일 처리 시작...\n")
@@ -647,7 +859,31 @@ def main():
     failed_dates = []
     total_stats = {'trades': 0, 'wins': 0, 'losses': 0}
 
-    if max_workers == 1:
+    if use_processes:
+        # 프로세스 풀 실행 (날짜별 결과는 완료되는 대로 스트리밍)
+        completed = 0
+        for success, result_date, stats in process_dates_with_processes(
+            dates, args.output_dir, args.time_range, max_workers,
+            advanced_filter=args.advanced_filter,
+            ml_filter=args.ml_filter,
+            ml_model_path=args.ml_model,
+            ml_threshold=args.ml_threshold
+        ):
+            completed += 1
+            if success:
+                success_count += 1
+                total_stats['trades'] += stats['trades']
+                total_stats['wins'] += stats['wins']
+                total_stats['losses'] += stats['losses']
+
+                if stats['trades'] > 0:
+                    print(f"✅ [{completed}/{len(dates)}] {result_date}: {stats['wins']}승 {stats['losses']}패")
+                else:
+                    print(f"⬚ [{completed}/{len(dates)}] {result_date}: 거래 없음")
+            else:
+                failed_dates.append(result_date)
+                print(f"❌ [{completed}/{len(dates)}] {result_date}: 처리 실패")
+    elif max_workers == 1:
         # 순차 실행
         for i, date in enumerate(dates, 1):
             success, result_date, stats = process_single_date(
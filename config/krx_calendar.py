@@ -0,0 +1,168 @@
+"""
+KRX 거래일 캘린더 (실거래 / 백테스트 공용)
+
+영업일 판단이 세 곳에 흩어져 있었다.
+- main._count_krx_trading_days_between: 호출마다 daily_candles / minute_candles SQL 조회
+- backtests.common.trading_day: 분봉 trade_date 고유값 카운트
+- MarketHours: 주말 + KOREAN_HOLIDAYS, 특수일 거래시간
+
+KRXCalendar 는 KOREAN_HOLIDAYS / MarketHours.MARKET_CONFIG['KRX'] (로컬 테이블) 로
+일자별 영업일 여부와 누적 영업일 수 배열을 한 번 만들어 두고 다음을 O(1) 로 계산한다.
+- trading_days_between(a, b): a (exclusive) ~ b (inclusive) 영업일 수
+- next_trading_day / prev_trading_day
+- session(d): 해당일 거래시간 (수능일 10:00 개장 등 특수일 반영)
+- day_ordinals(trade_dates): 날짜 배열 → 영업일 서수 (백테스트 벡터화용)
+
+테이블 범위 밖 날짜는 범위를 넓혀 다시 만든다 (공휴일 미등록 연도는 주말만 휴장 처리 + 경고 1회).
+
+Usage:
+    cal = get_krx_calendar()
+    cal.trading_days_between(buy_date, today)   # 보유 영업일 수
+    cal.session('2025-11-13')['market_open']    # time(10, 0)
+"""
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from config.market_hours import KOREAN_HOLIDAYS, MarketHours
+from utils.logger import setup_logger
+
+DateLike = Union[date, datetime, str, pd.Timestamp]
+
+# 공휴일 테이블 연도 밖 조회 시 확장 여유 (일)
+_EXTEND_MARGIN_DAYS = 366
+
+
+def to_date(value: DateLike) -> date:
+    """date / datetime / 'YYYYMMDD' / 'YYYY-MM-DD' → date"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    s = str(value).strip()
+    if len(s) == 8 and s.isdigit():
+        return date(int(s[:4]), int(s[4:6]), int(s[6:]))
+    return datetime.strptime(s[:10], '%Y-%m-%d').date()
+
+
+class KRXCalendar:
+    """KRX 영업일 / 거래시간 캘린더 (일자 오프셋 기반 배열)"""
+
+    def __init__(self, holidays: Optional[Iterable[str]] = None,
+                 special_sessions: Optional[Mapping[str, Dict[str, Any]]] = None,
+                 default_session: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            holidays: 휴장일 YYYYMMDD 목록 (기본 KOREAN_HOLIDAYS)
+            special_sessions: {'YYYY-MM-DD': 거래시간 설정} (기본 MARKET_CONFIG['KRX']['special_days'])
+            default_session: 평일 거래시간 설정 (기본 MARKET_CONFIG['KRX']['default'])
+        """
+        self.logger = setup_logger(__name__)
+        krx = MarketHours.MARKET_CONFIG['KRX']
+        self._holidays = frozenset(to_date(h) for h in (KOREAN_HOLIDAYS if holidays is None else holidays))
+        self._special = dict(krx['special_days'] if special_sessions is None else special_sessions)
+        self._default = dict(krx['default'] if default_session is None else default_session)
+        self._timezone = krx['timezone']
+        years = [d.year for d in self._holidays] or [date.today().year]
+        self._table_years = (min(years), max(years))
+        self._warned_years: set = set()
+        self._lock = threading.Lock()
+        self._build(date(min(years), 1, 1), date(max(years), 12, 31))
+
+    def _build(self, start: date, end: date) -> None:
+        n = (end - start).days + 1
+        weekdays = (start.weekday() + np.arange(n)) % 7
+        is_trading = weekdays < 5
+        for h in self._holidays:
+            off = (h - start).days
+            if 0 <= off < n:
+                is_trading[off] = False
+        # (start, end, 영업일 여부, 누적 영업일 수, 영업일 오프셋) — 한 번에 교체
+        self._state = (start, end, is_trading, np.cumsum(is_trading), np.flatnonzero(is_trading))
+
+    def _offset(self, d: date) -> int:
+        start, end = self._state[0], self._state[1]
+        if d < start or d > end:
+            with self._lock:
+                start, end = self._state[0], self._state[1]
+                if d < start or d > end:
+                    self._build(min(start, d - timedelta(days=_EXTEND_MARGIN_DAYS)),
+                                max(end, d + timedelta(days=_EXTEND_MARGIN_DAYS)))
+        if not (self._table_years[0] <= d.year <= self._table_years[1]) and d.year not in self._warned_years:
+            self._warned_years.add(d.year)
+            self.logger.warning(f"⚠️ KRX 공휴일 테이블에 {d.year}년 없음 → 주말만 휴장 처리 (KOREAN_HOLIDAYS 갱신 필요)")
+        return (d - self._state[0]).days
+
+    # 영업일
+    def is_trading_day(self, d: DateLike) -> bool:
+        d = to_date(d)
+        self._offset(d)
+        start, _, is_trading, _, _ = self._state
+        return bool(is_trading[(d - start).days])
+
+    def trading_days_between(self, start: DateLike, end: DateLike) -> int:
+        """start (exclusive) ~ end (inclusive) 영업일 수. start > end 면 음수."""
+        a, b = to_date(start), to_date(end)
+        self._offset(min(a, b))
+        self._offset(max(a, b))  # 범위 확장을 먼저 끝낸 뒤 한 스냅샷 기준으로 오프셋 계산
+        base, _, _, cum, _ = self._state
+        return int(cum[(b - base).days] - cum[(a - base).days])
+
+    def next_trading_day(self, d: DateLike) -> date:
+        """d 다음 영업일 (d 미포함)"""
+        d = to_date(d)
+        self._offset(d)
+        self._offset(d + timedelta(days=30))  # 연휴 구간 확보 — 확장을 끝낸 뒤 한 스냅샷 기준으로 계산
+        start, _, _, cum, offsets = self._state
+        off = (d - start).days
+        return start + timedelta(days=int(offsets[cum[off]]))
+
+    def prev_trading_day(self, d: DateLike) -> date:
+        """d 이전 영업일 (d 미포함)"""
+        d = to_date(d)
+        self._offset(d)
+        self._offset(d - timedelta(days=30))  # 확장을 끝낸 뒤 한 스냅샷 기준으로 계산
+        start, _, _, cum, offsets = self._state
+        off = (d - start).days
+        count_before = int(cum[off - 1]) if off > 0 else 0
+        return start + timedelta(days=int(offsets[count_before - 1]))
+
+    def day_ordinals(self, trade_dates) -> np.ndarray:
+        """날짜 배열 → 영업일 서수 (휴장일은 -1). 고유 날짜만 변환 후 펼침."""
+        codes, uniques = pd.factorize(pd.Series(trade_dates), sort=False)
+        if not len(codes):
+            return np.zeros(0, dtype=np.int64)
+        days = [to_date(value) for value in uniques]
+        self._offset(min(days))
+        self._offset(max(days))  # 범위 확장을 먼저 끝낸 뒤 한 스냅샷 기준으로 서수 계산
+        base, _, is_trading, cum, _ = self._state
+        offsets = np.array([(d - base).days for d in days], dtype=np.int64)
+        lookup = np.where(is_trading[offsets], cum[offsets] - 1, -1).astype(np.int64)
+        return lookup[codes]
+
+    # 거래시간
+    def session(self, d: DateLike) -> Dict[str, Any]:
+        """해당일 KRX 거래시간 설정 (MarketHours.get_market_hours 와 같은 형식)"""
+        key = to_date(d).strftime('%Y-%m-%d')
+        special = self._special.get(key)
+        config = dict(special if special is not None else self._default)
+        config['timezone'] = self._timezone
+        config['is_special_day'] = special is not None
+        return config
+
+
+_calendar: Optional[KRXCalendar] = None
+_calendar_lock = threading.Lock()
+
+
+def get_krx_calendar() -> KRXCalendar:
+    """프로세스 공용 KRXCalendar (최초 호출 시 생성)"""
+    global _calendar
+    if _calendar is None:
+        with _calendar_lock:
+            if _calendar is None:
+                _calendar = KRXCalendar()
+    return _calendar
@@ -138,6 +138,10 @@ class MarketHours:
             tz = pytz.timezone(market_config['timezone'])
             dt = datetime.now(tz)
 
+        if market == 'KRX':
+            from config.krx_calendar import get_krx_calendar
+            return get_krx_calendar().session(dt)
+
         # 해당 날짜의 특수일 설정 확인
         date_str = dt.strftime('%Y-%m-%d')
         special_days = market_config.get('special_days', {})
@@ -163,7 +167,7 @@ class MarketHours:
           - 공휴일(KOREAN_HOLIDAYS) → False
           - 그 외 → True
 
-        현재 KRX만 공휴일 캘린더 지원. 해외 시장은 주말만 체크(향후 확장).
+        KRX 는 config.krx_calendar (공휴일 캘린더) 에 위임. 해외 시장은 주말만 체크(향후 확장).
         """
         market_config = cls.MARKET_CONFIG.get(market)
         if market_config is None:
@@ -173,17 +177,12 @@ class MarketHours:
             tz = pytz.timezone(market_config['timezone'])
             dt = datetime.now(tz)
 
-        # 주말 체크
-        if dt.weekday() >= 5:
-            return False
-
-        # 한국 공휴일 체크
         if market == 'KRX':
-            date_str = dt.strftime('%Y%m%d')
-            if date_str in KOREAN_HOLIDAYS:
-                return False
+            from config.krx_calendar import get_krx_calendar
+            return get_krx_calendar().is_trading_day(dt)
 
-        return True
+        # 주말 체크
+        return dt.weekday() < 5
 
     @classmethod
     def is_market_open(cls, market: str = 'KRX', dt: Optional[datetime] = None) -> bool:
@@ -204,8 +203,8 @@ class MarketHours:
         elif dt.tzinfo is None:
             dt = tz.localize(dt)
 
-        # 평일만 확인 (월-금)
-        if dt.weekday() >= 5:  # 토요일(5), 일요일(6)
+        # 거래일만 확인 (주말 + KRX 공휴일 제외)
+        if not cls.is_trading_day(market, dt):
             return False
 
         market_open = hours['market_open']
@@ -225,8 +224,8 @@ class MarketHours:
         elif dt.tzinfo is None:
             dt = tz.localize(dt)
 
-        # 평일이 아니면 False
-        if dt.weekday() >= 5:
+        # 거래일이 아니면 False
+        if not cls.is_trading_day(market, dt):
             return False
 
         market_open = hours['market_open']
@@ -238,7 +237,7 @@ class MarketHours:
         """시장 상태 반환
 
         Returns:
-            'weekend', 'pre_market', 'market_open', 'after_market'
+            'weekend', 'pre_market', 'market_open', 'after_market' (KRX 공휴일도 'weekend')
         """
         hours = cls.get_market_hours(market, dt)
         tz = pytz.timezone(hours['timezone'])
@@ -248,7 +247,7 @@ class MarketHours:
         elif dt.tzinfo is None:
             dt = tz.localize(dt)
 
-        if dt.weekday() >= 5:
+        if not cls.is_trading_day(market, dt):
             return "weekend"
         elif cls.is_before_market_open(market, dt):
             return "pre_market"
@@ -102,6 +102,7 @@ class StrategySettings:
         MAX_GAP_PCT = 1.5                       # 시가 vs 전일종가 갭 최대 (%, 상방) - 멀티버스: 1.5%가 +32%p 개선
         MIN_GAP_DOWN_PCT = -2.0                 # 시가 vs 전일종가 갭다운 하한 (실거래: -2% 이하 승률 9%)
         MAX_PHASE3_CHECKS = 15                  # Phase3 최대 검증 종목 수
+        PARALLEL_API_CALLS = True               # Phase1/3 KIS 조회 동시 제출 (간격은 kis_rate_limiter 스케줄러, False = 순차)
 
         # 제한
         MAX_CANDIDATES_PER_SCAN = 5             # 스캔당 최대 추가 종목 수
@@ -122,7 +123,6 @@ class StrategySettings:
         SNAPSHOT_INTERVAL_SECONDS = 300          # 스냅샷 수집 주기 (5분)
         MAX_BELLWETHER_STOCKS = 30              # 모니터링 대표 종목 수
         NXT_DIV_CODE = "NX"                     # NXT 시장 코드
-        API_CALL_INTERVAL_MS = 100              # API 호출 간격 (ms)
 
         # 분석 시간 (08:00 ~ 08:55)
         ANALYSIS_START_HOUR = 8
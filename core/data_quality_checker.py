@@ -3,7 +3,6 @@
 
 IntradayStockManager에서 분리된 데이터 품질 검사 로직
 """
-import pandas as pd
 from typing import Dict, List, Any
 
 from utils.logger import setup_logger
@@ -36,37 +35,21 @@ class DataQualityChecker:
     def check_data_quality(self, stock_code: str) -> Dict[str, Any]:
         """실시간 데이터 품질 검사"""
         try:
-            with self._lock:
-                stock_data = self.manager.selected_stocks.get(stock_code)
+            snapshot = self.manager.get_snapshot(stock_code)
 
-            if not stock_data:
+            if not snapshot:
                 return {'has_issues': True, 'issues': ['데이터 없음']}
 
-            # historical_data와 realtime_data를 합쳐서 전체 분봉 데이터 생성
-            all_data = pd.concat([stock_data.historical_data, stock_data.realtime_data], ignore_index=True)
-            if all_data.empty:
+            # 전체 분봉 데이터 (bars: historical + realtime, 분 단위 정렬/중복 없음)
+            if snapshot.total_count == 0:
                 return {'has_issues': True, 'issues': ['데이터 없음']}
 
-            # 당일 데이터만 필터링 (품질 검사 전 최우선)
+            # 당일 데이터만 사용 (품질 검사 전 최우선) - bars는 거래일 단위로 관리됨
             today_str = now_kst().strftime('%Y%m%d')
-            before_filter_count = len(all_data)
-
-            if 'date' in all_data.columns:
-                all_data = all_data[all_data['date'].astype(str) == today_str].copy()
-            elif 'datetime' in all_data.columns:
-                all_data['date_str'] = pd.to_datetime(all_data['datetime']).dt.strftime('%Y%m%d')
-                all_data = all_data[all_data['date_str'] == today_str].copy()
-                if 'date_str' in all_data.columns:
-                    all_data = all_data.drop('date_str', axis=1)
-
-            if all_data.empty:
+            if snapshot.session_date != today_str:
                 return {'has_issues': True, 'issues': ['당일 데이터 없음']}
 
-            # 시간순 정렬 및 중복 제거
-            if 'time' in all_data.columns:
-                all_data = all_data.drop_duplicates(subset=['time'], keep='last').sort_values('time').reset_index(drop=True)
-            elif 'datetime' in all_data.columns:
-                all_data = all_data.drop_duplicates(subset=['datetime'], keep='last').sort_values('datetime').reset_index(drop=True)
+            all_data = snapshot.bars
 
             issues = []
             data = all_data.to_dict('records')
@@ -8,7 +8,6 @@
 (즉, 실제로는 거래가 있었던 경우)를 감지하고 해당 데이터를 재조회하여 업데이트합니다.
 """
 
-import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import logging
@@ -16,6 +15,8 @@ import asyncio
 
 from utils.korean_time import now_kst
 from api.kis_chart_api import get_recent_minute_data
+from core.minute_bar_store import MinuteBarStore
+from core.timeframe_converter import TimeFrameConverter
 
 logger = logging.getLogger(__name__)
 
@@ -58,18 +59,15 @@ async def reconfirm_intraday_data(
     total_suspicious = 0
     total_updated = 0
 
-    # IntradayStockManager에서 모든 종목의 realtime_data 수집
-    with intraday_manager._lock:
-        stocks_to_check = list(intraday_manager.selected_stocks.items())
+    # IntradayStockManager 스냅샷에서 모든 종목의 realtime 구간 조회 (락/복사 없음)
+    stocks_to_check = list(intraday_manager.get_snapshots().items())
 
-    for stock_code, stock in stocks_to_check:
-        if stock.realtime_data is None or len(stock.realtime_data) < 2:
+    for stock_code, snapshot in stocks_to_check:
+        if snapshot.realtime_count < 2:
             continue
 
-        realtime_data = stock.realtime_data
-
         # 최근 N분 데이터 필터링
-        recent_data = realtime_data.tail(minutes_back + 1).copy()
+        recent_data = snapshot.realtime_frame().tail(minutes_back + 1)
 
         if len(recent_data) < 2:
             continue
@@ -90,14 +88,20 @@ async def reconfirm_intraday_data(
             total_suspicious += len(suspicious_times)
             logger.info(f"[{stock_code}] 재확인 필요: {len(suspicious_times)}개 봉 - {suspicious_times}")
 
+            stock = intraday_manager.get_stock_data(stock_code)
+            if stock is None:
+                continue
+
             # 해당 시간의 데이터를 다시 조회 (비동기로 실행)
             updated_times = await _requery_and_update(
                 stock_code,
-                realtime_data,
-                suspicious_times
+                stock.bars,
+                suspicious_times,
+                intraday_manager._lock
             )
 
             if updated_times:
+                intraday_manager.publish_snapshot(stock_code)
                 updated_stocks[stock_code] = updated_times
                 total_updated += len(updated_times)
 
@@ -113,16 +117,18 @@ async def reconfirm_intraday_data(
 
 async def _requery_and_update(
     stock_code: str,
-    realtime_data: pd.DataFrame,
-    suspicious_times: List[str]
+    bars: MinuteBarStore,
+    suspicious_times: List[str],
+    lock
 ) -> List[str]:
     """
     의심스러운 시간의 데이터를 다시 조회하고 업데이트합니다.
 
     Args:
         stock_code: 종목코드
-        realtime_data: 실시간 데이터 DataFrame (원본, in-place 수정됨)
+        bars: 종목 분봉 저장소 (해당 분 봉이 제자리 갱신됨)
         suspicious_times: 재확인이 필요한 시간 리스트 (예: ['095200', '095300'])
+        lock: 저장소 쓰기 직렬화용 락 (IntradayStockManager._lock)
 
     Returns:
         실제로 업데이트된 시간 리스트
@@ -162,24 +168,18 @@ async def _requery_and_update(
 
                 target_row = target_rows.iloc[0]
 
-                # 원본 데이터에서 해당 시간의 인덱스 찾기
-                if 'time' in realtime_data.columns:
-                    # realtime_data의 time도 문자열로 변환하여 비교
-                    realtime_data['time_str_tmp'] = realtime_data['time'].astype(str).str.zfill(6)
-                    idx = realtime_data[realtime_data['time_str_tmp'] == time_str].index
-                    realtime_data.drop('time_str_tmp', axis=1, inplace=True)
-                else:
-                    idx = []
+                # 저장소에서 해당 분의 봉 찾기
+                minute = int(time_str[:2]) * 60 + int(time_str[2:4])
+                with lock:
+                    old_bar = bars.get_bar(minute)
 
-                if len(idx) == 0:
+                if old_bar is None:
                     logger.warning(f"[{stock_code}] {time_str} 업데이트 실패: 원본에서 시간 찾을 수 없음")
                     continue
 
-                idx = idx[0]
-
                 # 이전 값 저장 (로깅용)
-                old_volume = realtime_data.loc[idx, 'volume']
-                old_close = realtime_data.loc[idx, 'close']
+                old_volume = old_bar['volume']
+                old_close = old_bar['close']
 
                 # 새 값으로 업데이트
                 new_volume = target_row['volume']
@@ -190,11 +190,11 @@ async def _requery_and_update(
 
                 # 실제로 값이 변경된 경우만 업데이트
                 if new_volume != old_volume or new_close != old_close:
-                    realtime_data.loc[idx, 'close'] = new_close
-                    realtime_data.loc[idx, 'open'] = new_open
-                    realtime_data.loc[idx, 'high'] = new_high
-                    realtime_data.loc[idx, 'low'] = new_low
-                    realtime_data.loc[idx, 'volume'] = new_volume
+                    with lock:
+                        bars.upsert(
+                            minute, new_open, new_high, new_low, new_close,
+                            new_volume, old_bar['amount']
+                        )
 
                     logger.info(
                         f"[{stock_code}] {time_str} 업데이트 완료: "
@@ -203,6 +203,8 @@ async def _requery_and_update(
                     )
 
                     updated_times.append(time_str)
+                    # 과거 분봉이 바뀌었으므로 증분 N분봉 캐시 재계산
+                    TimeFrameConverter.clear_cache(stock_code)
                 else:
                     logger.debug(f"[{stock_code}] {time_str} 값 변경 없음")
 
@@ -24,12 +24,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Set
 
+import numpy as np
 import psycopg2
 import pandas as pd
 
 from config.settings import PG_HOST, PG_PORT, PG_DATABASE, PG_USER, PG_PASSWORD
 from api.kis_market_api import get_volume_rank
 from api.kis_chart_api import get_full_trading_day_data
+from db.bulk_copy import copy_upsert
 
 
 class ExpandedMinuteCollector:
@@ -151,38 +153,44 @@ class ExpandedMinuteCollector:
             [stock_code, trade_date]
         )
 
-        for idx, (_, row) in enumerate(df.iterrows()):
-            try:
-                time_val = str(row.get('time', row.get('stck_cntg_hour', '')))
-                close_val = int(float(row.get('close', row.get('stck_prpr', 0))))
-                open_val = int(float(row.get('open', row.get('stck_oprc', 0))))
-                high_val = int(float(row.get('high', row.get('stck_hgpr', 0))))
-                low_val = int(float(row.get('low', row.get('stck_lwpr', 0))))
-                volume_val = int(float(row.get('volume', row.get('cntg_vol', 0))))
-                amount_val = int(float(row.get('amount', row.get('acml_tr_pbmn', 0))))
-
-                datetime_val = None
-                if len(time_val) >= 6:
-                    try:
-                        datetime_val = datetime.strptime(
-                            f'{trade_date}{time_val[:6]}', '%Y%m%d%H%M%S'
-                        )
-                    except Exception:
-                        pass
-
-                cur.execute('''
-                    INSERT INTO minute_candles
-                        (stock_code, trade_date, idx, date, time, close, open, high, low,
-                         volume, amount, datetime)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (stock_code, trade_date, idx) DO NOTHING
-                ''', [
-                    stock_code, trade_date, idx,
-                    trade_date, time_val, close_val, open_val, high_val, low_val,
-                    volume_val, amount_val, datetime_val,
-                ])
-            except Exception:
-                continue
+        copy_upsert(cur, 'minute_candles', self._build_minute_rows(stock_code, trade_date, df),
+                    key_columns=['stock_code', 'trade_date', 'idx'], on_conflict='nothing')
+
+    @staticmethod
+    def _build_minute_rows(stock_code: str, trade_date: str, df: pd.DataFrame) -> pd.DataFrame:
+        """KIS 분봉 DF → minute_candles 행 (변환 실패 행 제외, idx 는 원래 순번 유지)"""
+        df = df.reset_index(drop=True)
+
+        def pick(name, fallback, default):
+            if name in df.columns:
+                return df[name]
+            if fallback in df.columns:
+                return df[fallback]
+            return pd.Series(default, index=df.index)
+
+        time_val = pick('time', 'stck_cntg_hour', '').astype(str)
+        numbers = {}
+        for col, fallback in [('close', 'stck_prpr'), ('open', 'stck_oprc'), ('high', 'stck_hgpr'),
+                              ('low', 'stck_lwpr'), ('volume', 'cntg_vol'), ('amount', 'acml_tr_pbmn')]:
+            values = pd.to_numeric(pick(col, fallback, 0), errors='coerce').astype(float)
+            numbers[col] = values.where(np.isfinite(values))
+
+        # 숫자 변환 실패 행은 건너뜀 (기존 int(float(...)) 예외 시 continue 와 동일)
+        valid = pd.concat(numbers, axis=1).notna().all(axis=1)
+        datetime_val = pd.to_datetime(
+            trade_date + time_val.str[:6], format='%Y%m%d%H%M%S', errors='coerce'
+        ).where(time_val.str.len() >= 6)
+
+        rows = pd.DataFrame({
+            'stock_code': stock_code,
+            'trade_date': trade_date,
+            'idx': df.index,
+            'date': trade_date,
+            'time': time_val,
+            **{col: np.trunc(values).astype('Int64') for col, values in numbers.items()},
+            'datetime': datetime_val,
+        }, index=df.index)
+        return rows[valid]
 
     # ============================================================
     # 3. 메인 실행
@@ -60,6 +60,11 @@ class HistoricalDataCollector:
                 stock_data = self.manager.selected_stocks[stock_code]
                 selected_time = stock_data.selected_time
 
+            # 재시작 warm-start: 체크포인트 분봉 적재 후 마지막 분 이후 꼬리 구간만 수집
+            warm_entry = self.manager.pop_warm_start(stock_code)
+            if warm_entry is not None and await self._restore_from_checkpoint(stock_code, warm_entry, selected_time):
+                return True
+
             self.logger.debug(f"[수집] {stock_code} 전체 거래시간 분봉 데이터 수집 시작 (선정: {selected_time.strftime('%H:%M:%S')})")
 
             # 동적 시장 거래시간 가져오기
@@ -115,6 +120,7 @@ class HistoricalDataCollector:
                     self.manager.selected_stocks[stock_code].daily_data = pd.DataFrame()
                     self.manager.selected_stocks[stock_code].data_complete = True
                     self.manager.selected_stocks[stock_code].last_update = now_kst()
+                    self.manager.publish_snapshot(stock_code)
 
             # 데이터 분석 및 로깅
             self._log_collection_result(filtered_data, stock_code, market_open, selected_time, start_time_str)
@@ -125,6 +131,84 @@ class HistoricalDataCollector:
             self.logger.error(f"[오류] {stock_code} 전체 거래시간 분봉 데이터 수집 오류: {e}")
             return await self.collect_historical_data_fallback(stock_code)
 
+    async def _restore_from_checkpoint(self, stock_code: str, entry: dict, selected_time: datetime) -> bool:
+        """
+        체크포인트 분봉 복원 + 꼬리 구간 보충
+
+        실패(꼬리 조회 실패, 연속성 위반 등) 시 저장소를 비우고 False 를 반환해
+        호출 측이 전체 수집으로 진행하게 한다.
+
+        Args:
+            stock_code: 종목코드
+            entry: IntradayCheckpoint.load() 의 종목 entry
+            selected_time: 수집 상한 시각 (선정 시각)
+
+        Returns:
+            bool: 복원 성공 여부
+        """
+        target_date = selected_time.strftime("%Y%m%d")
+        minutes = entry['minutes']
+        if len(minutes) == 0:
+            return False
+
+        try:
+            with self._lock:
+                if stock_code not in self.manager.selected_stocks:
+                    return False
+                stock_data = self.manager.selected_stocks[stock_code]
+                stock_data.bars.load_arrays(target_date, minutes, entry['values'])
+                stock_data.historical_end_minute = stock_data.bars.last_minute
+                if entry.get('current_price_info'):
+                    stock_data.current_price_info = entry['current_price_info']
+
+            # 꼬리 구간: 체크포인트 마지막 분 다음 분 ~ 선정 시점
+            next_minute = int(minutes[-1]) + 1
+            tail_start = f"{next_minute // 60:02d}{next_minute % 60:02d}00"
+            target_hour = selected_time.strftime("%H%M%S")
+            tail_count = 0
+            if tail_start < target_hour:
+                tail_data = await get_full_trading_day_data_async(
+                    stock_code=stock_code,
+                    target_date=target_date,
+                    selected_time=target_hour,
+                    start_time=tail_start
+                )
+                if tail_data is not None and not tail_data.empty:
+                    tail_data = self._filter_today_data(tail_data, selected_time, stock_code)
+                    tail_data = self._filter_and_sort_data(tail_data, selected_time)
+                if tail_data is None or tail_data.empty:
+                    raise ValueError(f"꼬리 구간 {tail_start}~{target_hour} 조회 실패")
+                tail_count = len(tail_data)
+
+            with self._lock:
+                if stock_code not in self.manager.selected_stocks:
+                    return False
+                if tail_count:
+                    stock_data.historical_data = tail_data
+                validation_result = validate_minute_data_continuity(
+                    stock_data.bars.to_frame(), stock_code, self.logger
+                )
+                if not validation_result['valid']:
+                    raise ValueError(f"연속성 검증 실패: {validation_result['reason']}")
+                stock_data.daily_data = pd.DataFrame()
+                stock_data.data_complete = True
+                stock_data.last_update = now_kst()
+                self.manager.publish_snapshot(stock_code)
+
+            self.logger.info(
+                f"[복원] {stock_code} 체크포인트 분봉 {len(minutes)}건 + 꼬리 {tail_count}건"
+            )
+            return True
+
+        except Exception as e:
+            self.logger.warning(f"[경고] {stock_code} 체크포인트 복원 실패, 전체 수집으로 전환: {e}")
+            with self._lock:
+                if stock_code in self.manager.selected_stocks:
+                    self.manager.selected_stocks[stock_code].historical_data = pd.DataFrame()
+                    self.manager.selected_stocks[stock_code].current_price_info = None
+                    self.manager.publish_snapshot(stock_code)
+            return False
+
     async def _retry_with_time_adjustment(self, stock_code: str, target_date: str,
                                           target_hour: str, start_time_str: str,
                                           selected_time: datetime) -> Optional[pd.DataFrame]:
@@ -158,6 +242,7 @@ class HistoricalDataCollector:
                             second=new_time_dt.second
                         )
                         self.manager.selected_stocks[stock_code].selected_time = new_selected_time
+                        self.manager.publish_snapshot(stock_code)
                         self.logger.info(f"[성공] {stock_code} 시간 조정으로 전체 데이터 조회 성공, selected_time 업데이트: {new_selected_time.strftime('%H:%M:%S')}")
 
             return historical_data
@@ -286,6 +371,7 @@ class HistoricalDataCollector:
                     if stock_code in self.manager.selected_stocks:
                         self.manager.selected_stocks[stock_code].historical_data = pd.DataFrame()
                         self.manager.selected_stocks[stock_code].data_complete = True
+                        self.manager.publish_snapshot(stock_code)
                 return True
 
             # 선정 시점 이전 데이터만 필터링
@@ -301,6 +387,7 @@ class HistoricalDataCollector:
                     self.manager.selected_stocks[stock_code].historical_data = historical_data
                     self.manager.selected_stocks[stock_code].data_complete = True
                     self.manager.selected_stocks[stock_code].last_update = now_kst()
+                    self.manager.publish_snapshot(stock_code)
 
             # 데이터 분석
             data_count = len(historical_data)
@@ -352,6 +439,7 @@ class HistoricalDataCollector:
                             second=new_time_dt.second
                         )
                         self.manager.selected_stocks[stock_code].selected_time = new_selected_time
+                        self.manager.publish_snapshot(stock_code)
                         self.logger.info(f"[성공] {stock_code} 시간 조정으로 조회 성공, selected_time 업데이트: {new_selected_time.strftime('%H:%M:%S')}")
 
             return result
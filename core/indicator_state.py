@@ -0,0 +1,213 @@
+"""
+일봉 지표 증분 상태 저장소 (EMA / MACD)
+
+macd_cross 는 매일 아침 종목마다 일봉 ~150일로 EWM 3개를 처음부터 다시 계산했다.
+하루에 새로 생기는 종가는 1개뿐이므로 (종목, 파라미터) 별 마지막 fast/slow/signal EMA 값을
+보관해 두고 하루씩 전진시킨다 (ewm_step — 전체 재계산과 비트 단위 동일).
+
+seed 와 재계산 fallback 은 모두 해당 종목의 전체 일봉 이력을 입력으로 받아야 한다.
+EWM 은 시작점에 의존하므로 고정 윈도우 (예: 최근 150일) 로 재계산한 값은 상태 파일의
+나이에 따라 달라지고, 전체 이력 기준인 증분 상태와 일치하지 않는다.
+
+- 장 마감 후: 당일 종가로 1일 전진 (advance)
+- 다음 날 아침: DB 최근 3일 (거래일, 종가) 와 대조 (reconcile)
+    * 마지막 2일 일치 → 그대로 사용
+    * 전진 전 상태가 일치 (당일 종가가 DB 확정 종가와 다름) → 확정 종가로 다시 전진
+    * 하루 밀림 (장 마감 후 전진 누락) → DB 종가로 1일 전진
+    * 그 외 (수정주가 반영·결측 등 이력 변경) → None → 호출자가 전체 재계산 후 seed
+- 파일: cache/indicator_state/macd_state.pkl (원자적 교체)
+
+Usage:
+    store = MacdStateStore.load()
+    state = store.reconcile('005930', (14, 34, 12), tail_rows)  # None 이면 재계산
+    store.seed('005930', (14, 34, 12), df_daily)
+    store.advance('005930', (14, 34, 12), '20260105', 71200.0)
+    store.save()
+"""
+import os
+import pickle
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from core.strategies.macd_cross_signal import ewm_step
+from utils.logger import setup_logger
+
+STATE_VERSION = 1
+STATE_PATH = Path('cache') / 'indicator_state' / 'macd_state.pkl'
+
+# (fast, slow, signal)
+MacdParams = Tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class MacdState:
+    """종목 1개의 MACD 증분 상태 (마지막 2 거래일 기준)"""
+    dates: Tuple[str, ...]        # 최근 거래일 (YYYYMMDD, 오래된 → 최신, 최대 2)
+    closes: Tuple[float, ...]     # dates 와 1:1 종가
+    ema_fast: float
+    ema_slow: float
+    ema_signal: float
+    prev_hist: float              # 마지막 거래일 hist
+    prev_prev_hist: float         # 그 직전 거래일 hist
+    previous: Optional['MacdState'] = None  # 1일 전 상태 (당일 종가 정정용, 1단계만 보관)
+
+    def matches(self, dates: Sequence[str], closes: Sequence[float]) -> bool:
+        """상태의 최근 거래일/종가가 주어진 꼬리 구간 (오래된 → 최신) 의 마지막 2일과 같은지"""
+        n = len(self.dates)
+        if len(dates) < n:
+            return False
+        return (tuple(dates[-n:]) == self.dates
+                and tuple(float(c) for c in closes[-n:]) == self.closes)
+
+
+def seed_macd_state(df_daily: pd.DataFrame, params: MacdParams) -> Optional[MacdState]:
+    """일봉 전체 이력으로 상태 생성 (compute_macd_histogram_series 와 같은 식)."""
+    fast, slow, signal = params
+    if df_daily is None or len(df_daily) < 2:
+        return None
+    d = df_daily.sort_values("trade_date")
+    close = d["close"].astype(float)
+    ema_fast = close.ewm(span=fast, adjust=False).mean()
+    ema_slow = close.ewm(span=slow, adjust=False).mean()
+    macd = ema_fast - ema_slow
+    sig = macd.ewm(span=signal, adjust=False).mean()
+    hist = macd - sig
+    return MacdState(
+        dates=tuple(str(x) for x in d["trade_date"].iloc[-2:]),
+        closes=tuple(float(x) for x in close.iloc[-2:]),
+        ema_fast=float(ema_fast.iloc[-1]),
+        ema_slow=float(ema_slow.iloc[-1]),
+        ema_signal=float(sig.iloc[-1]),
+        prev_hist=float(hist.iloc[-1]),
+        prev_prev_hist=float(hist.iloc[-2]),
+    )
+
+
+def advance_macd_state(state: MacdState, trade_date: str, close: float,
+                       params: MacdParams) -> MacdState:
+    """새 거래일 종가 1개로 상태 전진 (O(1))."""
+    fast, slow, signal = params
+    close = float(close)
+    ema_fast = ewm_step(state.ema_fast, close, fast)
+    ema_slow = ewm_step(state.ema_slow, close, slow)
+    macd = ema_fast - ema_slow
+    ema_signal = ewm_step(state.ema_signal, macd, signal)
+    return MacdState(
+        dates=(state.dates[-1], str(trade_date)),
+        closes=(state.closes[-1], close),
+        ema_fast=ema_fast,
+        ema_slow=ema_slow,
+        ema_signal=ema_signal,
+        prev_hist=macd - ema_signal,
+        prev_prev_hist=state.prev_hist,
+        previous=replace(state, previous=None),
+    )
+
+
+class MacdStateStore:
+    """(종목, 파라미터) 별 MacdState 저장소 (스레드 안전, 파일 영속화)"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.logger = setup_logger(__name__)
+        self.path = Path(path) if path else STATE_PATH
+        self._states: Dict[Tuple[str, MacdParams], MacdState] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> 'MacdStateStore':
+        """파일에서 적재 (없거나 버전이 다르면 빈 저장소)"""
+        store = cls(path)
+        if not store.path.exists():
+            return store
+        try:
+            with open(store.path, 'rb') as f:
+                payload = pickle.load(f)
+            if payload.get('version') == STATE_VERSION:
+                store._states = dict(payload.get('states', {}))
+        except Exception as e:
+            store.logger.warning(f"⚠️ MACD 상태 파일 읽기 실패 ({store.path}): {e}")
+        return store
+
+    def save(self) -> Optional[Path]:
+        """임시 파일에 쓴 뒤 os.replace 로 교체"""
+        with self._lock:
+            states = dict(self._states)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': STATE_VERSION, 'states': states}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+        return self.path
+
+    def get(self, stock_code: str, params: MacdParams) -> Optional[MacdState]:
+        return self._states.get((stock_code, tuple(params)))
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def seed(self, stock_code: str, params: MacdParams, df_daily: pd.DataFrame) -> Optional[MacdState]:
+        """전체 재계산으로 상태 교체"""
+        state = seed_macd_state(df_daily, params)
+        with self._lock:
+            if state is None:
+                self._states.pop((stock_code, tuple(params)), None)
+            else:
+                self._states[(stock_code, tuple(params))] = state
+        return state
+
+    def advance(self, stock_code: str, params: MacdParams, trade_date: str,
+                close: float) -> Optional[MacdState]:
+        """장 마감 후 당일 종가로 1일 전진.
+
+        이미 같은 거래일까지 반영돼 있으면 종가가 다를 때만 1일 전 상태에서 다시 전진.
+        상태가 없거나 더 최근 거래일이면 None (아무것도 안 함).
+        """
+        key = (stock_code, tuple(params))
+        trade_date = str(trade_date)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                return None
+            last_date = state.dates[-1]
+            if trade_date == last_date:
+                if state.closes[-1] == float(close) or state.previous is None:
+                    return state
+                state = advance_macd_state(state.previous, trade_date, close, params)
+            elif trade_date > last_date:
+                state = advance_macd_state(state, trade_date, close, params)
+            else:
+                return None
+            self._states[key] = state
+            return state
+
+    def reconcile(self, stock_code: str, params: MacdParams,
+                  dates: Sequence[str], closes: Sequence[float]) -> Optional[MacdState]:
+        """DB 최근 일봉 꼬리 (오래된 → 최신, 3일 권장) 와 대조해 쓸 수 있는 상태 반환.
+
+        Returns:
+            MacdState (필요하면 갱신해서 저장) / 이력이 달라 재계산이 필요하면 None
+        """
+        key = (stock_code, tuple(params))
+        dates = [str(x) for x in dates]
+        closes = [float(x) for x in closes]
+        with self._lock:
+            state = self._states.get(key)
+            if state is None or not dates:
+                return None
+            if state.matches(dates, closes):
+                return state
+            new_state = None
+            if state.previous is not None and state.previous.matches(dates[:-1], closes[:-1]):
+                new_state = advance_macd_state(state.previous, dates[-1], closes[-1], params)
+            elif state.matches(dates[:-1], closes[:-1]):
+                new_state = advance_macd_state(state, dates[-1], closes[-1], params)
+            if new_state is None:
+                self._states.pop(key, None)
+                return None
+            self._states[key] = new_state
+            return new_state
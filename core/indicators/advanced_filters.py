@@ -28,9 +28,10 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
-import pandas as pd
 import numpy as np
 
+from core.indicators.daily_feature_table import DailyFeatureTable
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,11 +63,13 @@ class AdvancedFilterManager:
         self._daily_trade_count: Dict[str, int] = {}
         self._last_reset_date: Optional[str] = None
 
-        # 일봉 데이터 캐시
+        # 일봉 데이터 캐시 + (종목, 거래일) 특징 테이블
         self._daily_cache = None
+        self._daily_features: Optional[DailyFeatureTable] = None
         if self._has_daily_filters_enabled():
             from utils.data_cache import DailyDataCache
             self._daily_cache = DailyDataCache()
+            self._daily_features = DailyFeatureTable(self._daily_cache)
             logger.info("일봉 필터 활성화 - DailyDataCache 초기화")
 
     def _load_preset(self):
@@ -613,67 +616,21 @@ class AdvancedFilterManager:
         return FilterResult(passed=True)
 
     def _extract_daily_features(self, stock_code: str, trade_date: str) -> Optional[Dict]:
-        """일봉 데이터에서 특징 추출 (거래일 기준 과거 20일)"""
-        if not self._daily_cache:
-            return None
-
-        # 일봉 데이터 로드
-        daily_df = self._daily_cache.load_data(stock_code)
-        if daily_df is None or daily_df.empty:
+        """일봉 데이터에서 특징 추출 (거래일 기준 과거 20일, 종목별 사전 계산 테이블 조회)"""
+        if not self._daily_features:
             return None
-
-        # 숫자 변환
-        daily_df = daily_df.copy()
-        for col in ['stck_clpr', 'stck_oprc', 'stck_hgpr', 'stck_lwpr', 'acml_vol']:
-            daily_df[col] = pd.to_numeric(daily_df[col], errors='coerce')
-
-        # 거래일 이전 데이터만 (당일 제외)
-        daily_df = daily_df[daily_df['stck_bsop_date'] < trade_date].copy()
-        daily_df = daily_df.sort_values('stck_bsop_date').tail(20)
-
-        if len(daily_df) < 5:
-            return None
-
-        features = {}
-
-        # 1. 20일 가격 위치
-        high_20d = daily_df['stck_hgpr'].max()
-        low_20d = daily_df['stck_lwpr'].min()
-        last_close = daily_df['stck_clpr'].iloc[-1]
-
-        if high_20d > low_20d:
-            features['price_position_20d'] = (last_close - low_20d) / (high_20d - low_20d)
-        else:
-            features['price_position_20d'] = 0.5
-
-        # 2. 거래량 비율
-        if len(daily_df) >= 2:
-            vol_ma20 = daily_df['acml_vol'].mean()
-            last_vol = daily_df['acml_vol'].iloc[-1]
-            if vol_ma20 > 0:
-                features['volume_ratio_20d'] = last_vol / vol_ma20
-            else:
-                features['volume_ratio_20d'] = 1.0
-
-        # 3. 연속 상승일 수
-        consecutive_up = 0
-        closes = daily_df['stck_clpr'].values
-        for i in range(len(closes) - 1, 0, -1):
-            if closes[i] > closes[i - 1]:
-                consecutive_up += 1
-            else:
-                break
-        features['consecutive_up_days'] = consecutive_up
-
-        # 4. 전일 대비 등락률
-        if len(daily_df) >= 2:
-            prev_close = daily_df['stck_clpr'].iloc[-2]
-            if prev_close > 0:
-                features['prev_day_change'] = (last_close - prev_close) / prev_close * 100
-            else:
-                features['prev_day_change'] = 0
-
-        return features
+        return self._daily_features.get(stock_code, trade_date)
+
+    def preload_daily_features(self, stock_codes: List[str]) -> int:
+        """배치 리플레이용 — 종목들의 일봉 특징 테이블을 미리 생성"""
+        if not self._daily_features:
+            return 0
+        return self._daily_features.preload(stock_codes)
+
+    def invalidate_daily_features(self, stock_code: Optional[str] = None) -> None:
+        """일봉 데이터 갱신 후 호출 — 특징 테이블 재생성 예약"""
+        if self._daily_features:
+            self._daily_features.invalidate(stock_code)
 
     def _check_daily_consecutive_up(self, features: Dict) -> FilterResult:
         """일봉 연속 상승일 필터"""
@@ -0,0 +1,149 @@
+"""
+일봉 특징 테이블 (AdvancedFilterManager 일봉 필터용)
+
+신호 체크마다 일봉을 DB에서 다시 읽고 문자열 컬럼을 숫자로 변환해 20일 특징을
+재계산하던 것을, 종목별로 한 번 (하루 1회 또는 리플레이 실행당 1회) 전체 거래일에
+대해 벡터화 계산해 두고 (종목, 거래일) 조회는 dict + 이진 탐색으로 처리합니다.
+
+각 거래일 D 의 특징은 D 이전(당일 제외) 최근 20개 일봉으로 계산하며,
+AdvancedFilterManager 의 기존 계산식과 동일합니다.
+
+사용법:
+    table = DailyFeatureTable(DailyDataCache())
+    table.preload(['005930', '000660'])           # 선택 (배치 리플레이)
+    features = table.get('005930', '20260131')    # dict 또는 None
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.korean_time import now_kst
+
+logger = logging.getLogger(__name__)
+
+NUMERIC_COLUMNS = ['stck_clpr', 'stck_oprc', 'stck_hgpr', 'stck_lwpr', 'acml_vol']
+WINDOW = 20
+MIN_ROWS = 5
+
+
+def compute_daily_feature_arrays(daily_df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """일봉 DF → 행(날짜 오름차순)별 '해당 행까지 최근 20일' 특징 배열
+
+    Returns:
+        {'dates', 'rows', 'price_position_20d', 'volume_ratio_20d',
+         'consecutive_up_days', 'prev_day_change'} — i 번째 값은 0..i 행 중 최근 20개 기준
+    """
+    df = daily_df.sort_values('stck_bsop_date', kind='mergesort')
+    dates = df['stck_bsop_date'].to_numpy()
+    num = {col: pd.to_numeric(df[col], errors='coerce').astype(float).reset_index(drop=True)
+           for col in NUMERIC_COLUMNS}
+    n = len(df)
+
+    close = num['stck_clpr']
+    rows = np.minimum(np.arange(1, n + 1), WINDOW)
+    high_20d = num['stck_hgpr'].rolling(WINDOW, min_periods=1).max().to_numpy()
+    low_20d = num['stck_lwpr'].rolling(WINDOW, min_periods=1).min().to_numpy()
+    vol_ma20 = num['acml_vol'].rolling(WINDOW, min_periods=1).mean().to_numpy()
+    last_close = close.to_numpy()
+    last_vol = num['acml_vol'].to_numpy()
+    prev_close = close.shift(1).to_numpy()
+
+    # 1. 20일 가격 위치 (고가 > 저가 아니면 0.5)
+    span = high_20d - low_20d
+    with np.errstate(invalid='ignore', divide='ignore'):
+        price_position = np.where(high_20d > low_20d, (last_close - low_20d) / span, 0.5)
+        # 2. 거래량 비율 (평균 <= 0 이면 1.0)
+        volume_ratio = np.where(vol_ma20 > 0, last_vol / vol_ma20, 1.0)
+        # 4. 전일 대비 등락률 (전일 종가 <= 0 이면 0)
+        prev_change = np.where(prev_close > 0, (last_close - prev_close) / prev_close * 100, 0.0)
+
+    # 3. 연속 상승일 수 — 상승 run 길이, 20일 창 안으로 제한
+    up = np.zeros(n, dtype=bool)
+    up[1:] = last_close[1:] > last_close[:-1]
+    idx = np.arange(n)
+    last_break = np.maximum.accumulate(np.where(up, 0, idx))
+    consecutive_up = np.minimum(idx - last_break, rows - 1)
+
+    return {
+        'dates': dates,
+        'rows': rows,
+        'price_position_20d': price_position,
+        'volume_ratio_20d': volume_ratio,
+        'consecutive_up_days': consecutive_up,
+        'prev_day_change': prev_change,
+    }
+
+
+class DailyFeatureTable:
+    """(종목, 거래일) → 일봉 특징 dict 조회 테이블"""
+
+    def __init__(self, daily_cache=None):
+        """
+        Args:
+            daily_cache: load_data(stock_code) 를 제공하는 일봉 캐시 (DailyDataCache)
+        """
+        self._daily_cache = daily_cache
+        self._tables: Dict[str, Tuple[str, Optional[Dict[str, np.ndarray]]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, stock_code: str, trade_date: str) -> Optional[Dict]:
+        """trade_date 이전(당일 제외) 최근 20일 일봉 특징. 데이터 5일 미만이면 None."""
+        arrays = self._get_arrays(stock_code)
+        if arrays is None:
+            return None
+        # trade_date 미만 마지막 행 (이진 탐색, 종목당 수백 행)
+        pos = int(np.searchsorted(arrays['dates'], trade_date, side='left')) - 1
+        if pos < 0 or arrays['rows'][pos] < MIN_ROWS:
+            return None
+        return {
+            'price_position_20d': float(arrays['price_position_20d'][pos]),
+            'volume_ratio_20d': float(arrays['volume_ratio_20d'][pos]),
+            'consecutive_up_days': int(arrays['consecutive_up_days'][pos]),
+            'prev_day_change': float(arrays['prev_day_change'][pos]),
+        }
+
+    def preload(self, stock_codes: Iterable[str]) -> int:
+        """여러 종목 테이블을 미리 생성 (배치 리플레이용). 생성된 종목 수 반환."""
+        return sum(1 for code in stock_codes if self._get_arrays(code) is not None)
+
+    def invalidate(self, stock_code: Optional[str] = None) -> None:
+        """일봉 데이터 갱신 후 호출 — 종목(또는 전체) 테이블 폐기"""
+        with self._lock:
+            if stock_code is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(stock_code, None)
+
+    def _get_arrays(self, stock_code: str) -> Optional[Dict[str, np.ndarray]]:
+        today = self._today()
+        entry = self._tables.get(stock_code)
+        if entry is not None and entry[0] == today:
+            return entry[1]
+
+        daily_df = self._daily_cache.load_data(stock_code) if self._daily_cache else None
+        arrays = self._build(daily_df)
+        with self._lock:
+            if arrays is not None:
+                self._tables[stock_code] = (today, arrays)
+            else:
+                # 데이터 없는 종목은 캐시하지 않음 (이후 수집되면 다음 조회에 반영)
+                self._tables.pop(stock_code, None)
+        return arrays
+
+    @staticmethod
+    def _build(daily_df: Optional[pd.DataFrame]) -> Optional[Dict[str, np.ndarray]]:
+        if daily_df is None or daily_df.empty:
+            return None
+        try:
+            return compute_daily_feature_arrays(daily_df)
+        except Exception as e:
+            logger.warning(f"일봉 특징 테이블 생성 실패: {e}")
+            return None
+
+    @staticmethod
+    def _today() -> str:
+        return now_kst().strftime('%Y%m%d')
@@ -65,6 +65,9 @@ class SupportPatternResult:
 
 class SupportPatternAnalyzer:
     """지지 패턴 분석기"""
+
+    # 구간 탐색 시 벡터화 사전 필터 사용 여부 (False 면 모든 조합을 검증 함수로 검사)
+    use_vectorized_filters = True
     
     def __init__(self, 
                  uptrend_min_gain: float = 0.03,  # 상승 구간 최소 상승률 3% (기본 5% → 3%)
@@ -87,6 +90,10 @@ class SupportPatternAnalyzer:
             data: 분석할 데이터
             target_time: 특정 시점 분석 (예: "133300"). None이면 전체 데이터에서 최적 패턴 검색
         """
+        # 분석은 최근 35개 캔들만 사용하므로 (_analyze_all_scenarios) 전처리 전에 잘라 변환 비용 절감
+        if len(data) > 35:
+            data = data.tail(35)
+
         # 전처리 최적화: 한 번만 데이터 타입 변환 수행하고 NumPy 배열 생성
         data, numpy_arrays = self._preprocess_data(data)
         
@@ -103,23 +110,25 @@ class SupportPatternAnalyzer:
     
     def _preprocess_data(self, data: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, np.ndarray]]:
         """전처리 최적화: 데이터 타입 변환을 한 번만 수행하고 NumPy 배열 생성"""
-        data = data.copy()
         numeric_columns = ['open', 'high', 'low', 'close', 'volume']
-        
-        # NumPy 배열로 한 번에 변환하여 성능 향상
-        for col in numeric_columns:
-            if col in data.columns:
+        dtypes = data.dtypes
+        present_columns = [col for col in numeric_columns if col in dtypes.index]
+
+        # 이미 float64 면 복사/변환 없이 배열만 참조 (분석은 읽기 전용)
+        if any(dtypes[col] != np.float64 for col in present_columns):
+            data = data.copy()
+            
+            # NumPy 배열로 한 번에 변환하여 성능 향상
+            for col in present_columns:
                 # 문자열에서 쉼표 제거 후 float 변환
                 if data[col].dtype == 'object':
                     data[col] = data[col].astype(str).str.replace(',', '').astype(float)
-                else:
+                elif data[col].dtype != np.float64:
                     data[col] = data[col].astype(float)
         
-        # NumPy 배열로 변환하여 빠른 인덱스 접근 지원 (로직 변경 없이)
-        numpy_arrays = {}
-        for col in numeric_columns:
-            if col in data.columns:
-                numpy_arrays[col] = data[col].values
+        # NumPy 배열로 변환하여 빠른 인덱스 접근 지원 (컬럼별 연속 배열, 한 번에 추출)
+        values = np.asfortranarray(data[present_columns].to_numpy(dtype=np.float64))
+        numpy_arrays = {col: values[:, i] for i, col in enumerate(present_columns)}
         
         return data, numpy_arrays
     
@@ -236,8 +245,11 @@ class SupportPatternAnalyzer:
                 reasons=["현재 캔들 거래량이 직전봉보다 낮아 거래량 돌파 아님"]
             )
         
-        # 2. 고성능 3중 반복문으로 상승-하락-지지 구간 탐색  
-        # 🔥 성능 최적화 2: 구간 길이 제한으로 반복 횟수 대폭 감소
+        # 2. 상승-하락-지지 구간 탐색
+        # 🔥 벡터화 사전 필터: 구간별 필요조건(상승률/고점 대비 종가/기준거래량 양봉,
+        # 하락률/악성매물, 지지구간 거래량)을 누적 max/min 배열로 한 번에 계산해
+        # 반드시 실패하는 조합은 검증 함수 호출 없이 건너뜀.
+        # 탐색 순서와 검증 함수는 그대로이므로 결과는 기존 3중 반복문과 동일.
         max_uptrend_length = min(15, len(data) - 4)  # 상승구간 최대 15개 캔들 (성능 최적화)
         
         # 🔥 성능 최적화 5: 미리 계산된 값들 캐싱
@@ -246,19 +258,51 @@ class SupportPatternAnalyzer:
         data_len_minus_3 = data_len - 3
         data_len_minus_2 = data_len - 2
         data_len_minus_1 = data_len - 1
+
+        # 필터는 유한값에서만 검증 함수와 동치 (NaN 포함 시 전체 조합 검사)
+        use_filters = self.use_vectorized_filters and all(np.isfinite(numpy_arrays[col]).all() for col in ['open', 'high', 'low', 'close', 'volume'])
+
+        # 돌파봉의 지지구간 무관 조건 (직전봉 몸통 대비 위치/크기) 사전 확인
+        if use_filters and not self._breakout_prev_candle_ok(numpy_arrays, breakout_idx):
+            return SupportPatternResult(
+                has_pattern=False, uptrend_phase=None, decline_phase=None, support_phase=None,
+                breakout_candle=None, entry_price=None, confidence=0.0, 
+                reasons=["모든 시나리오에서 4단계 패턴 미발견"]
+            )
         
-        for uptrend_start in range(max(0, data_len - 25), data_len_minus_4):  # 최근 25개 탐색 (35개 데이터 기준)
-            for uptrend_end in range(uptrend_start + 1, min(uptrend_start + max_uptrend_length, data_len_minus_3)):  # 최소 2개 캔들
+        first_uptrend_start = max(0, data_len - 25)
+        if use_filters:
+            uptrend_candidates = self._uptrend_end_candidates(
+                numpy_arrays, first_uptrend_start, data_len_minus_4, max_uptrend_length, data_len_minus_3)
+
+        for uptrend_start in range(first_uptrend_start, data_len_minus_4):  # 최근 25개 탐색 (35개 데이터 기준)
+            if use_filters:
+                uptrend_ends = uptrend_candidates[uptrend_start]
+            else:
+                uptrend_ends = range(uptrend_start + 1, min(uptrend_start + max_uptrend_length, data_len_minus_3))  # 최소 2개 캔들
+
+            for uptrend_end in uptrend_ends:
+                uptrend_end = int(uptrend_end)
                 
                 # 상승구간 검증 - NumPy 배열 사용 (로직 변경 없이)
                 uptrend = self._validate_uptrend(data, numpy_arrays, uptrend_start, uptrend_end)
                 if not uptrend:
                     continue
+
+                # 돌파봉 거래량이 기준거래량의 1/2 초과면 이 상승구간으로는 돌파 불가
+                if use_filters and uptrend.max_volume > 0 and current_volume / uptrend.max_volume > 0.5:
+                    continue
                 
                 # 하락구간 탐색 (상승구간 바로 다음부터 연속적으로)
                 decline_start = uptrend_end + 1  # 상승구간 끝 바로 다음부터 시작
                 max_decline_end = min(decline_start + 15, data_len_minus_2)  # 하락구간 최대 길이 15개
-                for decline_end in range(decline_start + 1, max_decline_end):  # 최소 2개 캔들
+                if use_filters:
+                    decline_ends = self._decline_end_candidates(numpy_arrays, uptrend, decline_start, max_decline_end)
+                else:
+                    decline_ends = range(decline_start + 1, max_decline_end)  # 최소 2개 캔들
+
+                for decline_end in decline_ends:
+                    decline_end = int(decline_end)
 
                     # 하락구간 검증 - NumPy 배열 사용 (로직 변경 없이)
                     decline = self._validate_decline(data, numpy_arrays, uptrend, decline_start, decline_end)
@@ -268,7 +312,13 @@ class SupportPatternAnalyzer:
                     # 지지구간 탐색 (하락구간 바로 다음부터 연속적으로)
                     support_start = decline_end + 1  # 하락구간 끝 바로 다음부터 시작
                     max_support_end = min(support_start + 15, data_len_minus_1)  # 지지구간 최대 길이 15개
-                    for support_end in range(support_start, max_support_end):  # 최소 1개 캔들
+                    if use_filters:
+                        support_ends = self._support_end_candidates(numpy_arrays, uptrend, support_start, max_support_end)
+                    else:
+                        support_ends = range(support_start, max_support_end)  # 최소 1개 캔들
+
+                    for support_end in support_ends:
+                        support_end = int(support_end)
 
                         # 지지구간 검증 - NumPy 배열 사용 (로직 변경 없이)
                         support = self._validate_support(data, numpy_arrays, uptrend, decline, support_start, support_end)
@@ -353,6 +403,99 @@ class SupportPatternAnalyzer:
             reasons=["모든 시나리오에서 4단계 패턴 미발견"]
         )
     
+    def _uptrend_end_candidates(self, numpy_arrays: Dict[str, np.ndarray], first_start: int, start_stop: int,
+                                max_length: int, end_limit: int) -> Dict[int, np.ndarray]:
+        """상승구간 시작별로 _validate_uptrend 필요조건을 통과하는 끝 인덱스 (시작 × 길이 2차원 일괄 계산)
+
+        시작 s 의 끝 후보는 range(s+1, min(s+max_length, end_limit)).
+        상승률, 끝가 >= 구간 최고가*0.8, 최대 거래량 캔들 양봉 조건을 누적 max 로 계산.
+        """
+        starts = np.arange(first_start, start_stop)
+        if len(starts) == 0 or max_length < 2:
+            return {}
+
+        stops = np.minimum(starts + max_length, end_limit)
+        offsets = np.arange(max_length)
+        positions = starts[:, None] + offsets[None, :]
+        valid = positions < stops[:, None]
+        positions = np.minimum(positions, len(numpy_arrays['close']) - 1)
+
+        closes = numpy_arrays['close'][positions]
+        opens = numpy_arrays['open'][positions]
+        volumes = numpy_arrays['volume'][positions]
+        max_highs = np.maximum.accumulate(numpy_arrays['high'][positions], axis=1)
+
+        # 구간별 최대 거래량 위치 (np.argmax 와 동일하게 첫 번째 최대값)
+        is_new_max = np.ones_like(valid)
+        is_new_max[:, 1:] = volumes[:, 1:] > np.maximum.accumulate(volumes, axis=1)[:, :-1]
+        max_vol_offset = np.maximum.accumulate(np.where(is_new_max, offsets[None, :], 0), axis=1)
+        rows = np.arange(len(starts))[:, None]
+
+        start_closes = closes[:, :1]
+        overall_gain = closes / start_closes - 1
+        ok = (
+            valid
+            & (offsets[None, :] >= 1)
+            & (start_closes > 0)
+            & ~(overall_gain < self.uptrend_min_gain)
+            & ~(closes < max_highs * 0.8)
+            & ~(closes[rows, max_vol_offset] < opens[rows, max_vol_offset])
+        )
+
+        candidates = {}
+        for row, start in enumerate(starts):
+            candidates[int(start)] = start + np.flatnonzero(ok[row])
+        return candidates
+
+    def _decline_end_candidates(self, numpy_arrays: Dict[str, np.ndarray], uptrend: UptrrendPhase, start_idx: int, end_stop: int) -> np.ndarray:
+        """range(start_idx+1, end_stop) 중 _validate_decline 필요조건을 통과하는 끝 인덱스
+
+        하락률(누적 최저 종가)과 악성매물(누적 최대 거래량) 조건을 일괄 계산.
+        """
+        if end_stop <= start_idx + 1:
+            return np.empty(0, dtype=np.int64)
+
+        uptrend_high_price = numpy_arrays['close'][uptrend.end_idx]
+        if uptrend_high_price <= 0:
+            return np.empty(0, dtype=np.int64)
+
+        min_prices = np.minimum.accumulate(numpy_arrays['close'][start_idx:end_stop])[1:]
+        ok = ~((uptrend_high_price - min_prices) / uptrend_high_price < self.decline_min_pct)
+
+        if uptrend.max_volume > 0:
+            peak_volumes = np.maximum.accumulate(numpy_arrays['volume'][start_idx:end_stop])[1:]
+            ok &= ~(peak_volumes / uptrend.max_volume > 0.6)
+
+        return np.arange(start_idx + 1, end_stop)[ok]
+
+    def _support_end_candidates(self, numpy_arrays: Dict[str, np.ndarray], uptrend: UptrrendPhase, start_idx: int, end_stop: int) -> np.ndarray:
+        """range(start_idx, end_stop) 중 _validate_support 거래량 조건을 통과하는 끝 인덱스"""
+        ends = np.arange(start_idx, max(start_idx, end_stop))
+        if uptrend.max_volume > 0 and len(ends) > 0:
+            ratios = numpy_arrays['volume'][start_idx:end_stop] / uptrend.max_volume
+            ok = (np.cumsum(ratios > 0.5) == 0) & (np.cumsum(ratios > 0.3) <= 1)
+            ends = ends[ok]
+        return ends
+
+    def _breakout_prev_candle_ok(self, numpy_arrays: Dict[str, np.ndarray], breakout_idx: int) -> bool:
+        """_validate_breakout 의 직전봉 조건 (시가 > 직전봉 몸통 중간 또는 몸통 >= 직전봉 몸통*5/3)"""
+        if breakout_idx <= 0:
+            return True
+
+        breakout_open = numpy_arrays['open'][breakout_idx]
+        breakout_body = abs(numpy_arrays['close'][breakout_idx] - breakout_open)
+        prev_open = numpy_arrays['open'][breakout_idx - 1]
+        prev_close = numpy_arrays['close'][breakout_idx - 1]
+        prev_body = abs(prev_close - prev_open)
+        prev_body_mid = prev_body / 2
+
+        if prev_close > prev_open:
+            prev_body_mid_price = prev_open + prev_body_mid
+        else:
+            prev_body_mid_price = prev_close + prev_body_mid
+
+        return bool(breakout_open > prev_body_mid_price or breakout_body >= prev_body * (5/3))
+    
     def _validate_uptrend(self, data: pd.DataFrame, numpy_arrays: Dict[str, np.ndarray], start_idx: int, end_idx: int) -> Optional[UptrrendPhase]:
         """상승구간 검증 - 중간 음봉/하락 허용하면서 전체적 상승 확인"""
         if end_idx - start_idx + 1 < 2:  # 최소 2개 캔들
@@ -736,14 +879,20 @@ class SupportPatternAnalyzer:
 
         return min(confidence, 100.0)
 
-    def get_debug_info(self, data: pd.DataFrame) -> Dict:
-        """디버그 정보 반환"""
-        result = self.analyze(data)
+    def get_debug_info(self, data: pd.DataFrame, result: Optional[SupportPatternResult] = None) -> Dict:
+        """디버그 정보 반환
+
+        Args:
+            data: analyze 에 넘긴 것과 같은 데이터
+            result: 이미 계산된 analyze(data) 결과 (None 이면 다시 분석)
+        """
+        if result is None:
+            result = self.analyze(data)
         
         debug_info = {
             'has_pattern': result.has_pattern,
             'confidence': result.confidence,
-            'reasons': result.reasons
+            'reasons': list(result.reasons)
         }
         
         if result.uptrend_phase:
@@ -7,7 +7,7 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, Tuple, List, Union
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, List, Union
 import logging
 from utils.logger import setup_logger
 from datetime import datetime
@@ -220,11 +220,12 @@ class PullbackCandlePattern:
             'reasons': result.reasons
         }
 
+        # 디버그 정보는 위 분석 결과로 생성 (analyze 재실행 없음)
         if debug:
-            pattern_info.update(analyzer.get_debug_info(data))
+            pattern_info.update(analyzer.get_debug_info(data, result))
 
         # 중복 신호 방지를 위해 항상 디버그 정보 포함 (동일한 분석기 사용)
-        pattern_info['debug_info'] = analyzer.get_debug_info(data)
+        pattern_info['debug_info'] = analyzer.get_debug_info(data, result)
         
         '''
         # 🚫 마이너스 수익 조합 필터링
@@ -444,13 +445,7 @@ class PullbackCandlePattern:
         """핵심 눌림목 신호 생성 - 4단계 패턴만 허용"""
 
         # 데이터 전처리
-        data = data.copy()
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            if col in data.columns:
-                if pd.api.types.is_numeric_dtype(data[col]):
-                    data[col] = data[col].astype(float)
-                else:
-                    data[col] = pd.to_numeric(data[col].astype(str).str.replace(',', ''), errors='coerce').fillna(0.0)
+        data = PullbackCandlePattern._coerce_ohlcv(data)
 
         if len(data) < 5:
             result = SignalStrength(SignalType.AVOID, 0, 0, ['데이터 부족'], 0, BisectorStatus.BROKEN) if return_risk_signals else None
@@ -461,8 +456,6 @@ class PullbackCandlePattern:
             logger._stock_code = stock_code
 
         try:
-            current = data.iloc[-1]
-
             # 이등분선 계산
             try:
                 from core.indicators.bisector_line import BisectorLine
@@ -471,278 +464,431 @@ class PullbackCandlePattern:
             except:
                 bisector_line = None
 
-            # 위험 신호 체크
             baseline_volumes = PullbackUtils.calculate_daily_baseline_volume(data)
-            period = min(10, len(data) - 1)
-            volume_analysis = PullbackUtils.analyze_volume(data, period, baseline_volumes)
-            candle_analysis = PullbackUtils.analyze_candle(data, period, prev_close)
-            recent_low = PullbackUtils.find_recent_low(data) or 0
-
-            risk_signals = PullbackUtils.check_risk_signals(
-                current, bisector_line, entry_low, recent_low, entry_price,
-                volume_analysis, candle_analysis
+
+            return PullbackCandlePattern._evaluate_improved_signal(
+                data, data, bisector_line, baseline_volumes,
+                lambda: PullbackCandlePattern._resolve_day_open(data),
+                stock_code=stock_code, debug=debug, entry_price=entry_price, entry_low=entry_low,
+                logger=logger, return_risk_signals=return_risk_signals, prev_close=prev_close,
+                daily_data=daily_data
             )
 
-            if risk_signals:
-                signal_strength = SignalStrength(
-                    SignalType.SELL if return_risk_signals else SignalType.AVOID,
-                    100 if return_risk_signals else 0,
-                    0,
-                    [f'위험신호: {r.value}' for r in risk_signals],
-                    volume_analysis.volume_ratio,
-                    PullbackUtils.get_bisector_status(current['close'], bisector_line) if bisector_line else BisectorStatus.BROKEN
-                )
-                return (signal_strength, risk_signals) if return_risk_signals else signal_strength
-
-            # 핵심 매수 조건들만 체크
-            # 1. 당일 시가 이상 (시장 시작 3분봉의 시가 = 1분봉 시작시간의 시가) - 동적 시간 적용
-            # data는 3분봉이지만, 시작~시작+3분 3분봉의 open은 1분봉 시작시간의 open과 동일
-            from config.market_hours import MarketHours
-
-            day_open_price = None
-            if len(data) > 0:
-                # 첫 번째 3분봉의 datetime 확인
-                first_candle_time = pd.to_datetime(data['datetime'].iloc[0]) if 'datetime' in data.columns else None
-
-                if first_candle_time:
-                    # 동적 시장 시작 시간 가져오기
-                    market_hours = MarketHours.get_market_hours('KRX', first_candle_time)
-                    market_open = market_hours['market_open']
-
-                    # 시장 시작 3분봉인 경우만 시가로 인정
-                    if first_candle_time.hour == market_open.hour and first_candle_time.minute == market_open.minute:
-                        day_open_price = float(data['open'].iloc[0])
-                    else:
-                        # 시장 시작 3분봉이 아니면 데이터 부족으로 판단
-                        result = SignalStrength(SignalType.AVOID, 0, 0, [f"{market_open.strftime('%H:%M')}시가없음"], volume_analysis.volume_ratio, BisectorStatus.BROKEN)
-                        return (result, []) if return_risk_signals else result
-
-            if day_open_price and float(current['close']) <= day_open_price:
-                result = SignalStrength(SignalType.AVOID, 0, 0, [f"당일시가이하(시가:{day_open_price:.0f})"], volume_analysis.volume_ratio, BisectorStatus.BROKEN)
-                return (result, []) if return_risk_signals else result
+        except Exception as e:
+            if debug and logger:
+                logger.error(f"신호 생성 중 오류: {e}")
+            result = SignalStrength(SignalType.AVOID, 0, 0, [f'오류: {str(e)}'], 0, BisectorStatus.BROKEN) if return_risk_signals else None
+            return (result, []) if return_risk_signals else result
 
-            # 2. 이등분선 위
-            if bisector_line and float(current['close']) < float(bisector_line):
-                result = SignalStrength(SignalType.AVOID, 0, 0, ["이등분선아래"], volume_analysis.volume_ratio, BisectorStatus.BROKEN)
-                return (result, []) if return_risk_signals else result
+    @staticmethod
+    def iter_improved_signals(
+        data: pd.DataFrame,
+        stock_code: str = "UNKNOWN",
+        debug: bool = False,
+        entry_price: Optional[float] = None,
+        entry_low: Optional[float] = None,
+        logger: Optional[logging.Logger] = None,
+        return_risk_signals: bool = False,
+        prev_close: Optional[float] = None,
+        daily_data: Optional[pd.DataFrame] = None,
+        indices: Optional[Iterable[int]] = None
+    ) -> Iterator[Tuple[int, Union[Optional[SignalStrength], Tuple[SignalStrength, List[RiskSignal]]]]]:
+        """봉 단위 스트리밍 신호 생성 (리플레이용)
 
-            # 3. 시가 대비 2% 이상 상승 체크 (매수 필수 조건)
-            if day_open_price:
-                current_price = float(current['close'])
-                price_increase_pct = (current_price - day_open_price) / day_open_price * 100
-                
-                if price_increase_pct < 2.0:
-                    result = SignalStrength(
-                        SignalType.AVOID, 0, 0,
-                        [f"시가대비{price_increase_pct:.1f}%상승(2%미만차단)"],
-                        volume_analysis.volume_ratio,
-                        BisectorStatus.BROKEN
-                    )
-                    return (result, []) if return_risk_signals else result
-
-            # 4. 시가 대비 22% 상승 체크 (매수 차단)
-            if day_open_price:
-                current_price = float(current['close'])
-                price_increase_pct = (current_price - day_open_price) / day_open_price * 100
-
-                if price_increase_pct >= 22.0:
-                    result = SignalStrength(
-                        SignalType.AVOID, 0, 0,
-                        [f"시가대비{price_increase_pct:.1f}%상승(22%이상차단)"],
-                        volume_analysis.volume_ratio,
-                        BisectorStatus.BROKEN
-                    )
-                    return (result, []) if return_risk_signals else result
+        각 i 에 대해 generate_improved_signals(data.iloc[:i+1]) 와 같은 결과를 (i, 결과) 로 반환.
+        전처리·이등분선·기준거래량·당일 시가는 하루 데이터에 대해 한 번만 계산하고
+        (모두 누적값이라 접두 구간 값과 동일), 봉마다 필요한 최근 구간만 분석합니다.
 
-            # 5. 4단계 지지 패턴 분석 (핵심)
-            # 통합된 로직 사용 (현재 시간 기준 분석 + 전체 데이터 분석)
-            support_pattern_info = PullbackCandlePattern.analyze_support_pattern(data, debug)
+        Args:
+            indices: 평가할 봉 인덱스 (오름차순). None 이면 전체 봉
+        """
+        data = PullbackCandlePattern._coerce_ohlcv(data)
+        n = len(data)
+        positions = range(n) if indices is None else indices
 
-            from datetime import datetime
+        if logger is None:
+            logger = setup_logger(f"pullback_pattern_{stock_code}")
+            logger._stock_code = stock_code
+
+        # 이등분선 = 누적 (최고+최저)/2 → 전체 계산 후 i 번째 값이 접두 구간 마지막 값
+        try:
+            from core.indicators.bisector_line import BisectorLine
+            bisector_values = BisectorLine.calculate_bisector_line(data['high'], data['low']).to_numpy()
+        except:
+            bisector_values = None
+
+        # 기준거래량 = 당일 누적 최대 → 마찬가지로 한 번만 계산
+        # (날짜 변환 실패 시에는 접두 구간마다 기존 방식으로 계산)
+        try:
+            if 'datetime' in data.columns:
+                dates = pd.to_datetime(data['datetime']).dt.normalize()
+            else:
+                dates = pd.to_datetime(data.index).normalize()
+            baseline_all = data['volume'].groupby(dates).cummax()
+        except Exception:
+            baseline_all = None
 
-            # 시간대별 + 일봉 결합 조건
-            # 시뮬레이션 테스트에서는 봉의 실제 시간 사용 (datetime 컬럼 우선)
-            current_time = None
+        # 당일 시가는 첫 봉으로만 결정 (예외도 봉마다 같은 위치에서 재발생)
+        day_open_state = {}
 
-            # 1순위: datetime 컬럼
-            if 'datetime' in data.columns and not pd.isna(data['datetime'].iloc[-1]):
-                current_time = pd.to_datetime(data['datetime'].iloc[-1])
-            # 2순위: index가 datetime이면 사용
-            elif hasattr(data.index, 'to_pydatetime') and len(data.index) > 0:
+        def day_open():
+            if not day_open_state:
                 try:
-                    current_time = data.index[-1].to_pydatetime()
-                except:
-                    pass
-            # 3순위: 현재 시간 (실시간 거래용)
-            if current_time is None:
-                current_time = datetime.now()
-
-            # 일봉 패턴 분석 (전달받은 daily_data 사용)
-            daily_pattern = analyze_daily_pattern_strength(stock_code, current_time.strftime('%Y%m%d'), daily_data)
-            daily_strength = daily_pattern['strength']
-            is_ideal_daily = daily_pattern['ideal_pattern']
-
-            # 개선사항: 신뢰도 상한선 94% (95% 이상 차단)
-            # 시간대 필터는 사용자가 직접 적용
-
-            # 기본 시간대별 조건
-            if 12 <= current_time.hour < 14:  # 오후시간 (승률 29.6%)
-                min_confidence = 85
-                # 오후시간 일봉 강화 조건
-                if daily_strength < 60:  # 약한 일봉 패턴
-                    min_confidence = 95  # 거의 불가능한 조건
-                elif is_ideal_daily:  # 이상적 일봉 패턴
-                    min_confidence = 80  # 약간 완화
-            elif 9 <= current_time.hour < 10:  # 개장시간 (승률 55.4%)
-                min_confidence = 70
-                # 개장시간 일봉 조건 (관대하게)
-                if daily_strength >= 70:  # 강한 일봉 패턴
-                    min_confidence = 65  # 더욱 완화
-                elif daily_strength < 40:  # 매우 약한 일봉
-                    min_confidence = 80  # 조건 강화
-            else:  # 오전/늦은시간
-                min_confidence = 75
-                # 일반 시간대 일봉 조건
-                if is_ideal_daily and daily_strength >= 70:  # 이상적이고 강한 패턴
-                    min_confidence = 70  # 완화
-                elif daily_strength < 50:  # 약한 일봉 패턴
-                    min_confidence = 85  # 강화
-
-            # 디버그 로그 (logger가 없어도 print로 출력)
-            if debug:
-                if logger:
-                    logger.info(f"[{stock_code}] 일봉분석: 강도{daily_strength:.0f}, 이상적패턴{is_ideal_daily}, 요구신뢰도{min_confidence}")
-                    logger.info(f"[{stock_code}] 일봉상세: 가격변화{daily_pattern.get('price_change_pct', 0):.1f}%, 거래량변화{daily_pattern.get('volume_change_pct', 0):.1f}%")
+                    day_open_state['value'] = PullbackCandlePattern._resolve_day_open(data)
+                except Exception as e:
+                    day_open_state['error'] = e
+            if 'error' in day_open_state:
+                raise day_open_state['error']
+            return day_open_state['value']
+
+        daily_pattern_cache: Dict[str, dict] = {}
+
+        for i in positions:
+            if i < 4 or i >= n:
+                result = SignalStrength(SignalType.AVOID, 0, 0, ['데이터 부족'], 0, BisectorStatus.BROKEN) if return_risk_signals else None
+                yield i, ((result, []) if return_risk_signals else result)
+                continue
+
+            prefix = data.iloc[:i + 1]
+            try:
+                bisector_line = float(bisector_values[i]) if bisector_values is not None else None
+                # 거래량/캔들 분석은 최근 period(최대 10)+1 개 봉만 사용
+                lo = max(0, i - 10)
+                recent = data.iloc[lo:i + 1]
+                if baseline_all is not None:
+                    baseline_volumes = baseline_all.iloc[lo:i + 1]
                 else:
-                    print(f"[{stock_code}] 일봉분석: 강도{daily_strength:.0f}, 이상적패턴{is_ideal_daily}, 요구신뢰도{min_confidence}")
-                    print(f"[{stock_code}] 일봉상세: 가격변화{daily_pattern.get('price_change_pct', 0):.1f}%, 거래량변화{daily_pattern.get('volume_change_pct', 0):.1f}%")
+                    baseline_volumes = PullbackUtils.calculate_daily_baseline_volume(prefix)
 
-            # 신뢰도 상한선 94% 체크 (개선사항 1)
-            if support_pattern_info['confidence'] >= 95:
-                result = SignalStrength(SignalType.AVOID, 0, 0, ["신뢰도95%이상차단"], volume_analysis.volume_ratio, BisectorStatus.BROKEN)
-                return (result, []) if return_risk_signals else result
+                result = PullbackCandlePattern._evaluate_improved_signal(
+                    prefix, recent, bisector_line, baseline_volumes, day_open,
+                    stock_code=stock_code, debug=debug, entry_price=entry_price, entry_low=entry_low,
+                    logger=logger, return_risk_signals=return_risk_signals, prev_close=prev_close,
+                    daily_data=daily_data, daily_pattern_cache=daily_pattern_cache
+                )
+            except Exception as e:
+                if debug and logger:
+                    logger.error(f"신호 생성 중 오류: {e}")
+                result = SignalStrength(SignalType.AVOID, 0, 0, [f'오류: {str(e)}'], 0, BisectorStatus.BROKEN) if return_risk_signals else None
+                result = (result, []) if return_risk_signals else result
+            yield i, result
 
-            if support_pattern_info['has_support_pattern'] and support_pattern_info['confidence'] >= min_confidence:
-                # ================================
-                # 기술 지표 필터 (현재 비활성화 - 성능 저하로 주석 처리)
-                # 총 거래 325개 → 110개 감소
-                # 승률 52% → 57.3%로 향상했으나
-                # 총 수익 2,015,000원 → 1,030,000원으로 감소
-                # ================================
-                # tech_filter = TechnicalFilter.create_balanced_filter()
-                # filter_result = tech_filter.check_filter(
-                #     data=data,
-                #     current_idx=len(data) - 1,
-                #     daily_data=daily_data,
-                #     current_time=current_time.time() if hasattr(current_time, 'time') else None
-                # )
-                #
-                # # 필터 통과 체크
-                # if not filter_result['passed']:
-                #     # 필터 실패시 AVOID 반환
-                #     reasons = ['기술지표필터실패'] + filter_result['reasons']
-                #     result = SignalStrength(SignalType.AVOID, 0, 0, reasons, volume_analysis.volume_ratio, BisectorStatus.BROKEN)
-                #
-                #     if debug and logger:
-                #         logger.info(f"[{stock_code}] 기술필터실패: {', '.join(filter_result['reasons'])}")
-                #
-                #     return (result, []) if return_risk_signals else result
-                #
-                # # 필터 통과시 기존 로직 진행
-                # if debug and logger:
-                #     logger.info(f"[{stock_code}] 기술필터통과 (초반모드: {filter_result.get('early_mode', False)})")
-                #     for reason in filter_result['reasons']:
-                #         logger.info(f"  {reason}")
-
-                # 중복 신호 방지 로직 추가
-                current_time = datetime.now()
-
-                # 패턴 구간 정보 추출 (디버그 정보에서)
-                debug_info = support_pattern_info.get('debug_info', {})
-                uptrend_info = debug_info.get('uptrend', {})
-                decline_info = debug_info.get('decline', {})
-                support_info = debug_info.get('support', {})
-
-                # 구간 인덱스 추출
-                uptrend_start = uptrend_info.get('start_idx', 0) if uptrend_info else 0
-                uptrend_end = uptrend_info.get('end_idx', 0) if uptrend_info else 0
-                decline_start = decline_info.get('start_idx', 0) if decline_info else 0
-                decline_end = decline_info.get('end_idx', 0) if decline_info else 0
-                support_start = support_info.get('start_idx', 0) if support_info else 0
-                support_end = support_info.get('end_idx', 0) if support_info else 0
-
-                # 매수 신호 발생
-                determined_signal_type = SignalType.STRONG_BUY if support_pattern_info['confidence'] >= 80 else SignalType.CAUTIOUS_BUY
-                determined_confidence = support_pattern_info['confidence']
-
-                # 🆕 ML 예측기를 위한 완전한 pattern_data 구조 생성
-                complete_pattern_data = support_pattern_info.copy()
-                complete_pattern_data['signal_info'] = {
-                    'signal_type': determined_signal_type.value,
-                    'confidence': determined_confidence
-                }
+    @staticmethod
+    def _coerce_ohlcv(data: pd.DataFrame) -> pd.DataFrame:
+        """OHLCV 컬럼을 float 로 변환한 복사본 (쉼표 포함 문자열 허용)"""
+        data = data.copy()
+        for col in ['open', 'high', 'low', 'close', 'volume']:
+            if col in data.columns:
+                if pd.api.types.is_numeric_dtype(data[col]):
+                    data[col] = data[col].astype(float)
+                else:
+                    data[col] = pd.to_numeric(data[col].astype(str).str.replace(',', ''), errors='coerce').fillna(0.0)
+        return data
 
-                # 🆕 pattern_stages 추가 (고급 필터용 - advanced_filters.py에서 사용)
-                breakout_info = debug_info.get('breakout', {})
+    @staticmethod
+    def _resolve_day_open(data: pd.DataFrame) -> Tuple[Optional[float], Optional[str]]:
+        """첫 3분봉으로 당일 시가 판단 → (시가, 시가없음 사유)"""
+        # 시작~시작+3분 3분봉의 open은 1분봉 시작시간의 open과 동일 - 동적 시간 적용
+        from config.market_hours import MarketHours
+
+        # 첫 번째 3분봉의 datetime 확인
+        first_candle_time = pd.to_datetime(data['datetime'].iloc[0]) if 'datetime' in data.columns else None
+
+        if first_candle_time:
+            # 동적 시장 시작 시간 가져오기
+            market_hours = MarketHours.get_market_hours('KRX', first_candle_time)
+            market_open = market_hours['market_open']
+
+            # 시장 시작 3분봉인 경우만 시가로 인정
+            if first_candle_time.hour == market_open.hour and first_candle_time.minute == market_open.minute:
+                return float(data['open'].iloc[0]), None
+            # 시장 시작 3분봉이 아니면 데이터 부족으로 판단
+            return None, f"{market_open.strftime('%H:%M')}시가없음"
+        return None, None
 
-                # decline_pct 변환 (문자열 "2.50%" → 숫자 2.50)
-                decline_pct_raw = decline_info.get('decline_pct', 0)
-                if isinstance(decline_pct_raw, str):
-                    decline_pct_value = float(decline_pct_raw.replace('%', '').replace(',', '').strip() or 0)
-                else:
-                    decline_pct_value = float(decline_pct_raw) * 100 if decline_pct_raw else 0  # 소수 → %
-
-                complete_pattern_data['pattern_stages'] = {
-                    '1_uptrend': {
-                        'start_idx': uptrend_info.get('start_idx'),
-                        'end_idx': uptrend_info.get('end_idx'),
-                        'candle_count': uptrend_info.get('bar_count', 0),
-                        'price_gain': uptrend_info.get('gain_pct', 0),  # 0~1 범위
-                    },
-                    '2_decline': {
-                        'start_idx': decline_info.get('start_idx'),
-                        'end_idx': decline_info.get('end_idx'),
-                        'candle_count': decline_info.get('bar_count', 0),
-                        'decline_pct': decline_pct_value,  # % 값 (예: 2.50)
-                    },
-                    '3_support': {
-                        'start_idx': support_info.get('start_idx'),
-                        'end_idx': support_info.get('end_idx'),
-                        'candle_count': support_info.get('bar_count', 0),
-                    },
-                    '4_breakout': {
-                        'idx': breakout_info.get('idx'),
-                    }
-                }
+    @staticmethod
+    def _evaluate_improved_signal(
+        data: pd.DataFrame,
+        recent: pd.DataFrame,
+        bisector_line: Optional[float],
+        baseline_volumes: pd.Series,
+        day_open: Callable[[], Tuple[Optional[float], Optional[str]]],
+        *,
+        stock_code: str,
+        debug: bool,
+        entry_price: Optional[float],
+        entry_low: Optional[float],
+        logger: Optional[logging.Logger],
+        return_risk_signals: bool,
+        prev_close: Optional[float],
+        daily_data: Optional[pd.DataFrame],
+        daily_pattern_cache: Optional[Dict[str, dict]] = None
+    ) -> Union[Optional[SignalStrength], Tuple[SignalStrength, List[RiskSignal]]]:
+        """마지막 봉 기준 신호 판정 (generate_improved_signals / iter_improved_signals 공통)
 
-                signal_strength = SignalStrength(
-                    signal_type=determined_signal_type,
-                    confidence=determined_confidence,
-                    target_profit=3.0,
-                    reasons=support_pattern_info['reasons'] + ['기술필터통과'],
-                    volume_ratio=volume_analysis.volume_ratio,
-                    bisector_status=PullbackUtils.get_bisector_status(current['close'], bisector_line) if bisector_line else BisectorStatus.BROKEN,
-                    buy_price=support_pattern_info.get('entry_price'),
-                    entry_low=support_pattern_info.get('entry_price'),
-                    pattern_data=complete_pattern_data  # 📊 4단계 패턴 구간 데이터 + signal_info
+        Args:
+            data: 전처리된 당일 처음~현재 봉 데이터
+            recent: data 의 최근 봉 구간 (최소 11개 또는 전체) - 거래량/캔들 분석용
+            bisector_line: 현재 봉 이등분선 값
+            baseline_volumes: recent 와 같은 구간의 기준거래량
+            day_open: (당일 시가, 시가없음 사유) 반환 함수
+        """
+        current = data.iloc[-1]
+
+        # 위험 신호 체크
+        period = min(10, len(data) - 1)
+        volume_analysis = PullbackUtils.analyze_volume(recent, period, baseline_volumes)
+        candle_analysis = PullbackUtils.analyze_candle(recent, period, prev_close)
+        recent_low = PullbackUtils.find_recent_low(recent) or 0
+
+        risk_signals = PullbackUtils.check_risk_signals(
+            current, bisector_line, entry_low, recent_low, entry_price,
+            volume_analysis, candle_analysis
+        )
+
+        if risk_signals:
+            signal_strength = SignalStrength(
+                SignalType.SELL if return_risk_signals else SignalType.AVOID,
+                100 if return_risk_signals else 0,
+                0,
+                [f'위험신호: {r.value}' for r in risk_signals],
+                volume_analysis.volume_ratio,
+                PullbackUtils.get_bisector_status(current['close'], bisector_line) if bisector_line else BisectorStatus.BROKEN
+            )
+            return (signal_strength, risk_signals) if return_risk_signals else signal_strength
+
+        # 핵심 매수 조건들만 체크
+        # 1. 당일 시가 이상 (시장 시작 3분봉의 시가 = 1분봉 시작시간의 시가)
+        day_open_price, missing_open_reason = day_open()
+        if missing_open_reason:
+            result = SignalStrength(SignalType.AVOID, 0, 0, [missing_open_reason], volume_analysis.volume_ratio, BisectorStatus.BROKEN)
+            return (result, []) if return_risk_signals else result
+
+        if day_open_price and float(current['close']) <= day_open_price:
+            result = SignalStrength(SignalType.AVOID, 0, 0, [f"당일시가이하(시가:{day_open_price:.0f})"], volume_analysis.volume_ratio, BisectorStatus.BROKEN)
+            return (result, []) if return_risk_signals else result
+
+        # 2. 이등분선 위
+        if bisector_line and float(current['close']) < float(bisector_line):
+            result = SignalStrength(SignalType.AVOID, 0, 0, ["이등분선아래"], volume_analysis.volume_ratio, BisectorStatus.BROKEN)
+            return (result, []) if return_risk_signals else result
+
+        # 3. 시가 대비 2% 이상 상승 체크 (매수 필수 조건)
+        if day_open_price:
+            current_price = float(current['close'])
+            price_increase_pct = (current_price - day_open_price) / day_open_price * 100
+            
+            if price_increase_pct < 2.0:
+                result = SignalStrength(
+                    SignalType.AVOID, 0, 0,
+                    [f"시가대비{price_increase_pct:.1f}%상승(2%미만차단)"],
+                    volume_analysis.volume_ratio,
+                    BisectorStatus.BROKEN
                 )
+                return (result, []) if return_risk_signals else result
 
-                if debug and logger:
-                    entry_price = support_pattern_info.get('entry_price', 0)
-                    entry_price_str = f"{entry_price:,.0f}" if isinstance(entry_price, (int, float)) and entry_price > 0 else "0"
-                    logger.info(f"[{stock_code}] 4단계패턴매수: 신뢰도{support_pattern_info['confidence']:.0f}%, 진입가{entry_price_str}원")
+        # 4. 시가 대비 22% 상승 체크 (매수 차단)
+        if day_open_price:
+            current_price = float(current['close'])
+            price_increase_pct = (current_price - day_open_price) / day_open_price * 100
 
-                return (signal_strength, []) if return_risk_signals else signal_strength
+            if price_increase_pct >= 22.0:
+                result = SignalStrength(
+                    SignalType.AVOID, 0, 0,
+                    [f"시가대비{price_increase_pct:.1f}%상승(22%이상차단)"],
+                    volume_analysis.volume_ratio,
+                    BisectorStatus.BROKEN
+                )
+                return (result, []) if return_risk_signals else result
+
+        # 5. 4단계 지지 패턴 분석 (핵심)
+        # 통합된 로직 사용 (현재 시간 기준 분석 + 전체 데이터 분석)
+        support_pattern_info = PullbackCandlePattern.analyze_support_pattern(data, debug)
 
-            # 4단계 패턴이 없으면 매수금지
-            result = SignalStrength(SignalType.AVOID, 0, 0, ["4단계패턴없음"], volume_analysis.volume_ratio, BisectorStatus.BROKEN)
+        from datetime import datetime
+
+        # 시간대별 + 일봉 결합 조건
+        # 시뮬레이션 테스트에서는 봉의 실제 시간 사용 (datetime 컬럼 우선)
+        current_time = None
+
+        # 1순위: datetime 컬럼
+        if 'datetime' in data.columns and not pd.isna(data['datetime'].iloc[-1]):
+            current_time = pd.to_datetime(data['datetime'].iloc[-1])
+        # 2순위: index가 datetime이면 사용
+        elif hasattr(data.index, 'to_pydatetime') and len(data.index) > 0:
+            try:
+                current_time = data.index[-1].to_pydatetime()
+            except:
+                pass
+        # 3순위: 현재 시간 (실시간 거래용)
+        if current_time is None:
+            current_time = datetime.now()
+
+        # 일봉 패턴 분석 (전달받은 daily_data 사용, 스트리밍 시 날짜별 캐시)
+        trade_date = current_time.strftime('%Y%m%d')
+        daily_pattern = daily_pattern_cache.get(trade_date) if daily_pattern_cache is not None else None
+        if daily_pattern is None:
+            daily_pattern = analyze_daily_pattern_strength(stock_code, trade_date, daily_data)
+            if daily_pattern_cache is not None:
+                daily_pattern_cache[trade_date] = daily_pattern
+        daily_strength = daily_pattern['strength']
+        is_ideal_daily = daily_pattern['ideal_pattern']
+
+        # 개선사항: 신뢰도 상한선 94% (95% 이상 차단)
+        # 시간대 필터는 사용자가 직접 적용
+
+        # 기본 시간대별 조건
+        if 12 <= current_time.hour < 14:  # 오후시간 (승률 29.6%)
+            min_confidence = 85
+            # 오후시간 일봉 강화 조건
+            if daily_strength < 60:  # 약한 일봉 패턴
+                min_confidence = 95  # 거의 불가능한 조건
+            elif is_ideal_daily:  # 이상적 일봉 패턴
+                min_confidence = 80  # 약간 완화
+        elif 9 <= current_time.hour < 10:  # 개장시간 (승률 55.4%)
+            min_confidence = 70
+            # 개장시간 일봉 조건 (관대하게)
+            if daily_strength >= 70:  # 강한 일봉 패턴
+                min_confidence = 65  # 더욱 완화
+            elif daily_strength < 40:  # 매우 약한 일봉
+                min_confidence = 80  # 조건 강화
+        else:  # 오전/늦은시간
+            min_confidence = 75
+            # 일반 시간대 일봉 조건
+            if is_ideal_daily and daily_strength >= 70:  # 이상적이고 강한 패턴
+                min_confidence = 70  # 완화
+            elif daily_strength < 50:  # 약한 일봉 패턴
+                min_confidence = 85  # 강화
+
+        # 디버그 로그 (logger가 없어도 print로 출력)
+        if debug:
+            if logger:
+                logger.info(f"[{stock_code}] 일봉분석: 강도{daily_strength:.0f}, 이상적패턴{is_ideal_daily}, 요구신뢰도{min_confidence}")
+                logger.info(f"[{stock_code}] 일봉상세: 가격변화{daily_pattern.get('price_change_pct', 0):.1f}%, 거래량변화{daily_pattern.get('volume_change_pct', 0):.1f}%")
+            else:
+                print(f"[{stock_code}] 일봉분석: 강도{daily_strength:.0f}, 이상적패턴{is_ideal_daily}, 요구신뢰도{min_confidence}")
+                print(f"[{stock_code}] 일봉상세: 가격변화{daily_pattern.get('price_change_pct', 0):.1f}%, 거래량변화{daily_pattern.get('volume_change_pct', 0):.1f}%")
+
+        # 신뢰도 상한선 94% 체크 (개선사항 1)
+        if support_pattern_info['confidence'] >= 95:
+            result = SignalStrength(SignalType.AVOID, 0, 0, ["신뢰도95%이상차단"], volume_analysis.volume_ratio, BisectorStatus.BROKEN)
             return (result, []) if return_risk_signals else result
 
-        except Exception as e:
+        if support_pattern_info['has_support_pattern'] and support_pattern_info['confidence'] >= min_confidence:
+            # ================================
+            # 기술 지표 필터 (현재 비활성화 - 성능 저하로 주석 처리)
+            # 총 거래 325개 → 110개 감소
+            # 승률 52% → 57.3%로 향상했으나
+            # 총 수익 2,015,000원 → 1,030,000원으로 감소
+            # ================================
+            # tech_filter = TechnicalFilter.create_balanced_filter()
+            # filter_result = tech_filter.check_filter(
+            #     data=data,
+            #     current_idx=len(data) - 1,
+            #     daily_data=daily_data,
+            #     current_time=current_time.time() if hasattr(current_time, 'time') else None
+            # )
+            #
+            # # 필터 통과 체크
+            # if not filter_result['passed']:
+            #     # 필터 실패시 AVOID 반환
+            #     reasons = ['기술지표필터실패'] + filter_result['reasons']
+            #     result = SignalStrength(SignalType.AVOID, 0, 0, reasons, volume_analysis.volume_ratio, BisectorStatus.BROKEN)
+            #
+            #     if debug and logger:
+            #         logger.info(f"[{stock_code}] 기술필터실패: {', '.join(filter_result['reasons'])}")
+            #
+            #     return (result, []) if return_risk_signals else result
+            #
+            # # 필터 통과시 기존 로직 진행
+            # if debug and logger:
+            #     logger.info(f"[{stock_code}] 기술필터통과 (초반모드: {filter_result.get('early_mode', False)})")
+            #     for reason in filter_result['reasons']:
+            #         logger.info(f"  {reason}")
+
+            # 중복 신호 방지 로직 추가
+            current_time = datetime.now()
+
+            # 패턴 구간 정보 추출 (디버그 정보에서)
+            debug_info = support_pattern_info.get('debug_info', {})
+            uptrend_info = debug_info.get('uptrend', {})
+            decline_info = debug_info.get('decline', {})
+            support_info = debug_info.get('support', {})
+
+            # 구간 인덱스 추출
+            uptrend_start = uptrend_info.get('start_idx', 0) if uptrend_info else 0
+            uptrend_end = uptrend_info.get('end_idx', 0) if uptrend_info else 0
+            decline_start = decline_info.get('start_idx', 0) if decline_info else 0
+            decline_end = decline_info.get('end_idx', 0) if decline_info else 0
+            support_start = support_info.get('start_idx', 0) if support_info else 0
+            support_end = support_info.get('end_idx', 0) if support_info else 0
+
+            # 매수 신호 발생
+            determined_signal_type = SignalType.STRONG_BUY if support_pattern_info['confidence'] >= 80 else SignalType.CAUTIOUS_BUY
+            determined_confidence = support_pattern_info['confidence']
+
+            # 🆕 ML 예측기를 위한 완전한 pattern_data 구조 생성
+            complete_pattern_data = support_pattern_info.copy()
+            complete_pattern_data['signal_info'] = {
+                'signal_type': determined_signal_type.value,
+                'confidence': determined_confidence
+            }
+
+            # 🆕 pattern_stages 추가 (고급 필터용 - advanced_filters.py에서 사용)
+            breakout_info = debug_info.get('breakout', {})
+
+            # decline_pct 변환 (문자열 "2.50%" → 숫자 2.50)
+            decline_pct_raw = decline_info.get('decline_pct', 0)
+            if isinstance(decline_pct_raw, str):
+                decline_pct_value = float(decline_pct_raw.replace('%', '').replace(',', '').strip() or 0)
+            else:
+                decline_pct_value = float(decline_pct_raw) * 100 if decline_pct_raw else 0  # 소수 → %
+
+            complete_pattern_data['pattern_stages'] = {
+                '1_uptrend': {
+                    'start_idx': uptrend_info.get('start_idx'),
+                    'end_idx': uptrend_info.get('end_idx'),
+                    'candle_count': uptrend_info.get('bar_count', 0),
+                    'price_gain': uptrend_info.get('gain_pct', 0),  # 0~1 범위
+                },
+                '2_decline': {
+                    'start_idx': decline_info.get('start_idx'),
+                    'end_idx': decline_info.get('end_idx'),
+                    'candle_count': decline_info.get('bar_count', 0),
+                    'decline_pct': decline_pct_value,  # % 값 (예: 2.50)
+                },
+                '3_support': {
+                    'start_idx': support_info.get('start_idx'),
+                    'end_idx': support_info.get('end_idx'),
+                    'candle_count': support_info.get('bar_count', 0),
+                },
+                '4_breakout': {
+                    'idx': breakout_info.get('idx'),
+                }
+            }
+
+            signal_strength = SignalStrength(
+                signal_type=determined_signal_type,
+                confidence=determined_confidence,
+                target_profit=3.0,
+                reasons=support_pattern_info['reasons'] + ['기술필터통과'],
+                volume_ratio=volume_analysis.volume_ratio,
+                bisector_status=PullbackUtils.get_bisector_status(current['close'], bisector_line) if bisector_line else BisectorStatus.BROKEN,
+                buy_price=support_pattern_info.get('entry_price'),
+                entry_low=support_pattern_info.get('entry_price'),
+                pattern_data=complete_pattern_data  # 📊 4단계 패턴 구간 데이터 + signal_info
+            )
+
             if debug and logger:
-                logger.error(f"신호 생성 중 오류: {e}")
-            result = SignalStrength(SignalType.AVOID, 0, 0, [f'오류: {str(e)}'], 0, BisectorStatus.BROKEN) if return_risk_signals else None
-            return (result, []) if return_risk_signals else result
+                entry_price = support_pattern_info.get('entry_price', 0)
+                entry_price_str = f"{entry_price:,.0f}" if isinstance(entry_price, (int, float)) and entry_price > 0 else "0"
+                logger.info(f"[{stock_code}] 4단계패턴매수: 신뢰도{support_pattern_info['confidence']:.0f}%, 진입가{entry_price_str}원")
+
+            return (signal_strength, []) if return_risk_signals else signal_strength
+
+        # 4단계 패턴이 없으면 매수금지
+        result = SignalStrength(SignalType.AVOID, 0, 0, ["4단계패턴없음"], volume_analysis.volume_ratio, BisectorStatus.BROKEN)
+        return (result, []) if return_risk_signals else result
     
     # 기존 호환성을 위한 메서드들
     @staticmethod
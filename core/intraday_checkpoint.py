@@ -0,0 +1,129 @@
+"""
+장중 상태 warm-start 체크포인트
+
+장중 재시작 시 후보 종목마다 당일 전체 분봉을 KIS 에서 30분 구간 단위로 다시 받느라
+재개까지 수 분이 걸렸다 (종목 수 × 장 경과 시간 만큼의 호출).
+IntradayStockManager 스냅샷(분봉 배열 + 현재가 + 메타)을 주기적으로 로컬 파일에 기록하고,
+재시작 시 이를 적재한 뒤 마지막 분 이후 꼬리 구간만 API 로 보충한다 (종목당 1~2회 호출).
+
+- 파일: cache/intraday_checkpoint/checkpoint_YYYYMMDD.pkl (거래일별, 원자적 교체)
+- 다른 거래일 파일은 무시 (전일 분봉 혼입 방지)
+- 현재가는 PRICE_MAX_AGE_SEC 이내일 때만 복원 (오래된 가격으로 매도 판단 방지)
+
+Usage:
+    checkpoint = IntradayCheckpoint()
+    checkpoint.save(manager.get_snapshots(), '20260105')
+    entries = checkpoint.load('20260105')   # {stock_code: entry}
+"""
+import os
+import pickle
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+import numpy as np
+
+from core.minute_bar_store import FIELDS
+from utils.korean_time import now_kst
+from utils.logger import setup_logger
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_DIR = Path('cache') / 'intraday_checkpoint'
+
+# 복원 시 캐시 현재가로 인정하는 최대 경과 시간 (초)
+PRICE_MAX_AGE_SEC = 60
+
+
+def _minutes_of_day(datetimes: np.ndarray) -> np.ndarray:
+    """datetime64 배열 → minute-of-day (int32)"""
+    dt = np.asarray(datetimes, dtype='datetime64[m]')
+    return (dt - dt.astype('datetime64[D]')).astype(np.int32)
+
+
+class IntradayCheckpoint:
+    """IntradayStockManager 스냅샷 파일 저장/복원"""
+
+    def __init__(self, checkpoint_dir: Optional[Path] = None):
+        self.logger = setup_logger(__name__)
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else CHECKPOINT_DIR
+
+    def path_for(self, session_date: str) -> Path:
+        return self.checkpoint_dir / f"checkpoint_{session_date}.pkl"
+
+    def save(self, snapshots: Mapping[str, Any], session_date: str) -> Optional[Path]:
+        """
+        스냅샷 저장 (임시 파일에 쓴 뒤 os.replace 로 교체)
+
+        Args:
+            snapshots: {stock_code: StockSnapshot} (IntradayStockManager.get_snapshots())
+            session_date: 거래일 (YYYYMMDD). 다른 거래일 봉을 가진 종목은 제외
+
+        Returns:
+            Path: 저장 경로 (저장할 종목이 없으면 None)
+        """
+        stocks: Dict[str, Dict[str, Any]] = {}
+        for stock_code, snap in snapshots.items():
+            if snap.session_date != session_date or snap.total_count == 0:
+                continue
+            bars = snap.bars
+            stocks[stock_code] = {
+                'stock_name': snap.stock_name,
+                'selected_time': snap.selected_time,
+                'last_update': snap.last_update,
+                'data_complete': snap.data_complete,
+                'historical_count': snap.historical_count,
+                'current_price_info': snap.current_price_info,
+                'minutes': _minutes_of_day(bars['datetime'].to_numpy()),
+                'values': bars[list(FIELDS)].to_numpy(dtype=np.float64),
+            }
+        if not stocks:
+            return None
+
+        payload = {
+            'version': CHECKPOINT_VERSION,
+            'session_date': session_date,
+            'saved_at': now_kst(),
+            'stocks': stocks,
+        }
+        path = self.path_for(session_date)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        return path
+
+    def load(self, session_date: str, now: Optional[datetime] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        거래일 체크포인트 로드
+
+        Returns:
+            Dict: {stock_code: entry} (파일이 없거나 다른 거래일/버전이면 빈 dict)
+                entry: stock_name, selected_time, data_complete, historical_count,
+                       current_price_info (오래되면 None), minutes, values
+        """
+        path = self.path_for(session_date)
+        if not path.exists():
+            return {}
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"⚠️ 장중 체크포인트 읽기 실패 ({path}): {e}")
+            return {}
+
+        if payload.get('version') != CHECKPOINT_VERSION or payload.get('session_date') != session_date:
+            return {}
+
+        now = now or now_kst()
+        stocks = payload.get('stocks', {})
+        for entry in stocks.values():
+            price_info = entry.get('current_price_info')
+            update_time = price_info.get('update_time') if price_info else None
+            try:
+                fresh = update_time is not None and (now - update_time).total_seconds() <= PRICE_MAX_AGE_SEC
+            except TypeError:
+                fresh = False
+            if not fresh:
+                entry['current_price_info'] = None
+        return stocks
@@ -3,7 +3,8 @@
 """
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 import pandas as pd
 from dataclasses import dataclass, field
 import threading
@@ -13,10 +14,15 @@ from utils.logger import setup_logger
 from utils.korean_time import now_kst, is_market_open
 from config.market_hours import MarketHours
 from api.kis_market_api import get_inquire_price
+from api.kis_async import run_blocking
+from utils.perf_monitor import timed
 from core.realtime_data_logger import log_intraday_data
 from core.dynamic_batch_calculator import DynamicBatchCalculator
 from core.intraday_data_utils import validate_minute_data_continuity
 from core.post_market_data_saver import PostMarketDataSaver
+from core.minute_bar_store import MinuteBarStore
+from core.intraday_checkpoint import IntradayCheckpoint
+from core.timeframe_converter import TimeFrameConverter
 
 
 logger = setup_logger(__name__)
@@ -24,22 +30,119 @@ logger = setup_logger(__name__)
 
 @dataclass
 class StockMinuteData:
-    """종목별 분봉 데이터 클래스"""
+    """종목별 분봉 데이터 클래스
+
+    당일 1분봉(historical + realtime)은 bars(MinuteBarStore)에 한 번만 저장된다.
+    historical_data / realtime_data 는 bars 의 구간 view 이다
+    (historical: 선정 시 수집 구간, realtime: 그 이후 실시간 추가분).
+    """
     stock_code: str
     stock_name: str
     selected_time: datetime
-    historical_data: pd.DataFrame = field(default_factory=pd.DataFrame)  # 오늘 분봉 데이터
-    realtime_data: pd.DataFrame = field(default_factory=pd.DataFrame)    # 실시간 분봉 데이터
     daily_data: pd.DataFrame = field(default_factory=pd.DataFrame)       # 과거 29일 일봉 데이터 (가격박스용)
     current_price_info: Optional[Dict[str, Any]] = None                  # 매도용 실시간 현재가 정보
     last_update: Optional[datetime] = None
     data_complete: bool = False
-    
+    bars: MinuteBarStore = field(default_factory=MinuteBarStore)         # 당일 1분봉 저장소
+    historical_end_minute: int = -1                                      # historical 구간 마지막 분 (minute-of-day)
+
     def __post_init__(self):
         """초기화 후 처리"""
         if self.last_update is None:
             self.last_update = self.selected_time
 
+    @property
+    def historical_data(self) -> pd.DataFrame:
+        """선정 시 수집한 당일 분봉 (bars view)"""
+        if self.historical_end_minute < 0:
+            return pd.DataFrame()
+        return self.bars.to_frame(end_minute=self.historical_end_minute)
+
+    @historical_data.setter
+    def historical_data(self, data: pd.DataFrame) -> None:
+        """수집 결과 반영 (같은 분의 기존 봉은 덮어씀). 빈 데이터면 저장소 초기화."""
+        if data is None or data.empty:
+            self.bars.reset()
+            self.historical_end_minute = -1
+            return
+        self.bars.upsert_frame(data)
+        self.historical_end_minute = self.bars.last_minute
+
+    @property
+    def realtime_data(self) -> pd.DataFrame:
+        """historical 이후 실시간으로 추가된 분봉 (bars view)"""
+        if not len(self.bars) or self.bars.last_minute <= self.historical_end_minute:
+            return pd.DataFrame()
+        return self.bars.to_frame(start_minute=self.historical_end_minute + 1)
+
+    @property
+    def realtime_count(self) -> int:
+        return self.bars.count_after(self.historical_end_minute)
+
+    def to_snapshot(self, previous: Optional['StockSnapshot'] = None) -> 'StockSnapshot':
+        """현재 상태의 불변 스냅샷 생성 (호출 측 락 보유 상태에서 호출).
+
+        봉이 previous 이후 바뀌지 않았으면 previous 의 DataFrame 을 그대로 재사용한다
+        (현재가만 갱신되는 경우 분봉 복사 없음).
+        """
+        if previous is not None and previous.bars_revision == self.bars.revision:
+            bars_frame = previous.bars
+        else:
+            bars_frame = self.bars.snapshot_frame()
+        realtime_count = self.realtime_count
+        return StockSnapshot(
+            stock_code=self.stock_code,
+            stock_name=self.stock_name,
+            selected_time=self.selected_time,
+            last_update=self.last_update,
+            data_complete=self.data_complete,
+            session_date=self.bars.session_date,
+            bars=bars_frame,
+            bars_revision=self.bars.revision,
+            has_historical=self.historical_end_minute >= 0,
+            realtime_count=realtime_count,
+            current_price_info=self.current_price_info,
+        )
+
+
+@dataclass(frozen=True)
+class StockSnapshot:
+    """종목 상태의 불변 스냅샷 (copy-on-write)
+
+    쓰기 측은 StockMinuteData 를 락 안에서 갱신한 뒤 새 스냅샷을 통째로 발행하고,
+    읽기 측은 락 없이 발행된 스냅샷 참조만 가져간다.
+    bars 의 OHLCV 는 읽기 전용 배열이며 current_price_info 는 교체만 되고 수정되지 않는다.
+    """
+    stock_code: str
+    stock_name: str
+    selected_time: datetime
+    last_update: Optional[datetime]
+    data_complete: bool
+    session_date: Optional[str]
+    bars: pd.DataFrame                                   # 당일 1분봉 (historical + realtime)
+    bars_revision: int
+    has_historical: bool
+    realtime_count: int
+    current_price_info: Optional[Dict[str, Any]] = None
+
+    @property
+    def total_count(self) -> int:
+        return len(self.bars)
+
+    @property
+    def historical_count(self) -> int:
+        return len(self.bars) - self.realtime_count
+
+    def chart_frame(self) -> pd.DataFrame:
+        """조회용 DataFrame (데이터 복사 없는 얕은 사본 — 컬럼 추가는 스냅샷에 영향 없음)"""
+        return self.bars.copy(deep=False)
+
+    def realtime_frame(self) -> pd.DataFrame:
+        """historical 이후 실시간 추가분"""
+        if self.realtime_count <= 0:
+            return pd.DataFrame()
+        return self.bars.iloc[len(self.bars) - self.realtime_count:]
+
 
 class IntradayStockManager:
     """
@@ -69,9 +172,12 @@ class IntradayStockManager:
         # 설정
         self.max_stocks = 80  # 최대 관리 종목 수
 
-        # 동기화
+        # 동기화 (쓰기 전용 — 읽기는 _snapshots 참조로 락 없이)
         self._lock = threading.RLock()
 
+        # copy-on-write 스냅샷: stock_code -> StockSnapshot. 발행 시 dict 를 통째로 교체한다.
+        self._snapshots: Dict[str, StockSnapshot] = {}
+
         # 동적 배치 계산기
         self.batch_calculator = DynamicBatchCalculator()
 
@@ -84,6 +190,11 @@ class IntradayStockManager:
         # 최대 종목 수 도달 경고 1회 제한
         self._max_stock_warned: bool = False
 
+        # warm-start 체크포인트 (재시작 시 분봉 전체 재수집 대신 꼬리 구간만 보충)
+        self._checkpoint = IntradayCheckpoint()
+        self._warm_start: Dict[str, Dict[str, Any]] = {}  # stock_code -> 체크포인트 entry (1회 소비)
+        self._last_checkpoint_snapshots: Optional[Mapping[str, StockSnapshot]] = None
+
         # 헬퍼 클래스 초기화 (리팩토링)
         from core.historical_data_collector import HistoricalDataCollector
         from core.realtime_data_updater import RealtimeDataUpdater
@@ -94,6 +205,89 @@ class IntradayStockManager:
         self._quality_checker = DataQualityChecker(self)
 
         self.logger.info("[초기화] 장중 종목 관리자 초기화 완료")
+
+    def publish_snapshot(self, stock_code: str) -> Optional[StockSnapshot]:
+        """
+        종목의 현재 상태를 새 스냅샷으로 발행 (selected_stocks 변경 직후 호출)
+
+        관리 목록에 없는 종목이면 스냅샷을 제거한다.
+
+        Returns:
+            StockSnapshot: 발행된 스냅샷 또는 None (제거된 경우)
+        """
+        with self._lock:
+            stock_data = self.selected_stocks.get(stock_code)
+            snapshots = dict(self._snapshots)
+            if stock_data is None:
+                snapshots.pop(stock_code, None)
+                snapshot = None
+            else:
+                snapshot = stock_data.to_snapshot(snapshots.get(stock_code))
+                snapshots[stock_code] = snapshot
+            self._snapshots = snapshots
+        return snapshot
+
+    def get_snapshot(self, stock_code: str) -> Optional[StockSnapshot]:
+        """종목 스냅샷 조회 (락 없음)"""
+        return self._snapshots.get(stock_code)
+
+    def get_snapshots(self) -> Mapping[str, StockSnapshot]:
+        """전체 스냅샷 조회 (락 없음, 읽기 전용 — 이후 발행과 무관한 고정 시점)"""
+        return MappingProxyType(self._snapshots)
+
+    def load_checkpoint(self, session_date: Optional[str] = None) -> int:
+        """
+        당일 체크포인트 로드 (봇 시작 시 1회, 종목 등록 전에 호출)
+
+        로드한 entry 는 종목이 다시 등록될 때 HistoricalDataCollector 가 1회 소비한다.
+
+        Args:
+            session_date: 거래일 (YYYYMMDD, 기본값: 오늘)
+
+        Returns:
+            int: 복원 가능한 종목 수
+        """
+        try:
+            self._warm_start = self._checkpoint.load(session_date or now_kst().strftime('%Y%m%d'))
+        except Exception as e:
+            self.logger.warning(f"⚠️ 장중 체크포인트 로드 실패: {e}")
+            self._warm_start = {}
+        if self._warm_start:
+            self.logger.info(f"♻️ 장중 체크포인트 로드: {len(self._warm_start)}개 종목 (꼬리 구간만 재수집)")
+        return len(self._warm_start)
+
+    def pop_warm_start(self, stock_code: str) -> Optional[Dict[str, Any]]:
+        """종목 체크포인트 entry 꺼내기 (없으면 None)"""
+        return self._warm_start.pop(stock_code, None)
+
+    def save_checkpoint(self, session_date: Optional[str] = None) -> Optional[Any]:
+        """현재 스냅샷을 체크포인트 파일로 저장 (변경 없으면 생략, session_date 기본값: 오늘)"""
+        snapshots = self._snapshots
+        if not snapshots or snapshots is self._last_checkpoint_snapshots:
+            return None
+        path = self._checkpoint.save(snapshots, session_date or now_kst().strftime('%Y%m%d'))
+        self._last_checkpoint_snapshots = snapshots
+        return path
+
+    async def run_checkpoint_loop(self, interval: float = 60.0):
+        """interval 초마다 체크포인트 저장 (장중에만, 파일 쓰기는 스레드에서)"""
+        while True:
+            await asyncio.sleep(interval)
+            if not is_market_open():
+                continue
+            try:
+                await asyncio.to_thread(self.save_checkpoint)
+            except Exception as e:
+                self.logger.warning(f"⚠️ 장중 체크포인트 저장 실패: {e}")
+
+    def update_current_price_info(self, stock_code: str, current_price_info: Dict[str, Any]) -> bool:
+        """캐시 현재가 교체 + 스냅샷 발행"""
+        with self._lock:
+            if stock_code not in self.selected_stocks:
+                return False
+            self.selected_stocks[stock_code].current_price_info = current_price_info
+            self.publish_snapshot(stock_code)
+        return True
     
     async def add_selected_stock(self, stock_code: str, stock_name: str, 
                                 selection_reason: str = "") -> bool:
@@ -138,6 +332,7 @@ class IntradayStockManager:
                 
                 # 메모리에 추가
                 self.selected_stocks[stock_code] = stock_data
+                self.publish_snapshot(stock_code)
                 
                 # 선정 이력 기록
                 self.selection_history.append({
@@ -170,6 +365,7 @@ class IntradayStockManager:
                 with self._lock:
                     if stock_code in self.selected_stocks:
                         self.selected_stocks[stock_code].data_complete = False
+                        self.publish_snapshot(stock_code)
                 success = True  # 종목은 추가하되 데이터는 나중에 재수집
             
             if success:
@@ -180,6 +376,7 @@ class IntradayStockManager:
                 with self._lock:
                     if stock_code in self.selected_stocks:
                         del self.selected_stocks[stock_code]
+                    self.publish_snapshot(stock_code)
                 self.logger.error(f"❌ {stock_code} 과거 데이터 수집 실패로 종목 추가 취소")
                 return False
                 
@@ -188,6 +385,7 @@ class IntradayStockManager:
             with self._lock:
                 if stock_code in self.selected_stocks:
                     del self.selected_stocks[stock_code]
+                self.publish_snapshot(stock_code)
             self.logger.error(f"❌ {stock_code} 종목 추가 오류: {e}")
             return False
     
@@ -270,7 +468,7 @@ class IntradayStockManager:
     
     def get_cached_current_price(self, stock_code: str) -> Optional[Dict[str, Any]]:
         """
-        캐시된 현재가 정보 조회 (매도 판단에서 사용)
+        캐시된 현재가 정보 조회 (매도 판단에서 사용, 락 없이 스냅샷 참조)
         
         Args:
             stock_code: 종목코드
@@ -278,17 +476,8 @@ class IntradayStockManager:
         Returns:
             Dict: 캐시된 현재가 정보 또는 None
         """
-        try:
-            with self._lock:
-                if stock_code not in self.selected_stocks:
-                    return None
-                    
-                stock_data = self.selected_stocks[stock_code]
-                return stock_data.current_price_info
-                
-        except Exception as e:
-            self.logger.error(f"❌ {stock_code} 캐시된 현재가 조회 오류: {e}")
-            return None
+        snapshot = self._snapshots.get(stock_code)
+        return snapshot.current_price_info if snapshot is not None else None
     
     def get_stock_data(self, stock_code: str) -> Optional[StockMinuteData]:
         """
@@ -314,37 +503,32 @@ class IntradayStockManager:
             stock_code: 종목코드
             
         Returns:
-            pd.DataFrame: 당일 전체 차트 데이터 (완성된 봉만)
+            pd.DataFrame: 당일 전체 차트 데이터 (완성된 봉만, OHLCV 읽기 전용)
         """
         try:
-            from utils.korean_time import now_kst
-            
-            with self._lock:
-                if stock_code not in self.selected_stocks:
-                    self.logger.debug(f"❌ {stock_code} 선정된 종목 아님")
-                    return None
-                
-                stock_data = self.selected_stocks[stock_code]
-                historical_data = stock_data.historical_data.copy() if not stock_data.historical_data.empty else pd.DataFrame()
-                realtime_data = stock_data.realtime_data.copy() if not stock_data.realtime_data.empty else pd.DataFrame()
+            snapshot = self._snapshots.get(stock_code)
+            if snapshot is None:
+                self.logger.debug(f"❌ {stock_code} 선정된 종목 아님")
+                return None
+
+            has_historical = snapshot.has_historical
+            realtime_count = snapshot.realtime_count
+            total_count = snapshot.total_count
             
-            # historical_data와 realtime_data 결합
-            if historical_data.empty and realtime_data.empty:
+            # historical_data와 realtime_data는 bars 하나에 분 단위로 병합/정렬되어 있음
+            if total_count == 0:
                 self.logger.error(f"❌ {stock_code} 과거 및 실시간 데이터 모두 없음")
                 return None
-            elif historical_data.empty:
-                combined_data = realtime_data.copy()
-                self.logger.error(f"📊 {stock_code} 실시간 데이터만 사용: {len(combined_data)}건")
+            elif not has_historical:
+                self.logger.error(f"📊 {stock_code} 실시간 데이터만 사용: {realtime_count}건")
                 return None
-            elif realtime_data.empty:
-                combined_data = historical_data.copy()
-                self.logger.debug(f"📊 {stock_code} 과거 데이터만 사용: {len(combined_data)}건 (realtime_data 아직 없음)")
+            elif realtime_count == 0:
+                self.logger.debug(f"📊 {stock_code} 과거 데이터만 사용: {total_count}건 (realtime_data 아직 없음)")
                 
                 # 데이터 부족 시 자동 수집 시도
-                if len(combined_data) < 15:
+                if total_count < 15:
                     try:
                         from trade_analysis.data_sufficiency_checker import collect_minute_data_from_api
-                        from utils.korean_time import now_kst
                         
                         today = now_kst().strftime('%Y%m%d')
                         self.logger.info(f"🔄 {stock_code} 데이터 부족으로 자동 수집 시도...")
@@ -361,10 +545,9 @@ class IntradayStockManager:
                                     self.selected_stocks[stock_code].historical_data = minute_data
                                     self.selected_stocks[stock_code].data_complete = True
                                     self.selected_stocks[stock_code].last_update = now_kst()
+                                    self.publish_snapshot(stock_code)
                             
-                            # 수정된 데이터로 다시 결합
-                            combined_data = minute_data.copy()
-                            self.logger.info(f"✅ {stock_code} 자동 수집 완료: {len(combined_data)}개 (메모리에만 저장)")
+                            self.logger.info(f"✅ {stock_code} 자동 수집 완료: {len(minute_data)}개 (메모리에만 저장)")
                         else:
                             self.logger.warning(f"❌ {stock_code} 자동 수집 실패")
                             return None
@@ -372,64 +555,18 @@ class IntradayStockManager:
                     except Exception as e:
                         self.logger.error(f"❌ {stock_code} 자동 수집 중 오류: {e}")
                         return None
-            else:
-                combined_data = pd.concat([historical_data, realtime_data], ignore_index=True)
-                #self.logger.debug(f"📊 {stock_code} 과거+실시간 데이터 결합: {len(historical_data)}+{len(realtime_data)}={len(combined_data)}건")
 
-            if combined_data.empty:
-                return None
-
-            # 🆕 당일 데이터만 필터링 (API 오류로 전날 데이터 섞일 수 있음)
+            # 🆕 당일 데이터만 사용 (bars는 거래일 단위로 관리되며 전날 봉은 저장되지 않음)
             today_str = now_kst().strftime('%Y%m%d')
-            before_filter_count = len(combined_data)
-
-            if 'date' in combined_data.columns:
-                combined_data = combined_data[combined_data['date'].astype(str) == today_str].copy()
-            elif 'datetime' in combined_data.columns:
-                combined_data['date_str'] = pd.to_datetime(combined_data['datetime']).dt.strftime('%Y%m%d')
-                combined_data = combined_data[combined_data['date_str'] == today_str].copy()
-                combined_data = combined_data.drop('date_str', axis=1)
-
-            if before_filter_count != len(combined_data):
-                removed = before_filter_count - len(combined_data)
-                #self.logger.warning(f"⚠️ {stock_code} 당일 외 데이터 {removed}건 제거: {before_filter_count} → {len(combined_data)}건")
-
-            if combined_data.empty:
+            snapshot = self._snapshots.get(stock_code)
+            if snapshot is None:
+                return None
+            if snapshot.session_date != today_str or snapshot.total_count == 0:
                 self.logger.error(f"❌ {stock_code} 당일 데이터 없음 (전일 데이터만 존재)")
                 return None
 
-            # 중복 제거 (같은 시간대 데이터가 있을 수 있음)
-            before_count = len(combined_data)
-            if 'datetime' in combined_data.columns:
-                combined_data = combined_data.drop_duplicates(subset=['datetime'], keep='last').sort_values('datetime').reset_index(drop=True)
-            elif 'time' in combined_data.columns:
-                combined_data = combined_data.drop_duplicates(subset=['time'], keep='last').sort_values('time').reset_index(drop=True)
-
-            if before_count != len(combined_data):
-                #self.logger.debug(f"📊 {stock_code} 중복 제거: {before_count} → {len(combined_data)}건")
-                pass
-            
             # 완성된 봉 필터링은 TimeFrameConverter.convert_to_3min_data()에서 처리됨
-            
-            # 시간순 정렬
-            if 'datetime' in combined_data.columns:
-                combined_data = combined_data.sort_values('datetime').reset_index(drop=True)
-            elif 'date' in combined_data.columns and 'time' in combined_data.columns:
-                combined_data = combined_data.sort_values(['date', 'time']).reset_index(drop=True)
-            
-            # 데이터 수집 현황 로깅
-            '''
-            if not combined_data.empty:
-                data_count = len(combined_data)
-                if 'time' in combined_data.columns:
-                    start_time = combined_data.iloc[0]['time']
-                    end_time = combined_data.iloc[-1]['time']
-                    self.logger.debug(f"📊 {stock_code} 당일 전체 데이터: {data_count}건 ({start_time}~{end_time})")
-                else:
-                    self.logger.debug(f"📊 {stock_code} 당일 전체 데이터: {data_count}건")
-            '''
-            
-            return combined_data
+            return snapshot.chart_frame()
             
         except Exception as e:
             self.logger.error(f"❌ {stock_code} 결합 차트 데이터 생성 오류: {e}")
@@ -452,22 +589,20 @@ class IntradayStockManager:
             if combined_data is None or combined_data.empty:
                 return None
             
-            with self._lock:
-                if stock_code not in self.selected_stocks:
-                    return None
-                    
-                stock_data = self.selected_stocks[stock_code]
+            snapshot = self._snapshots.get(stock_code)
+            if snapshot is None:
+                return None
             
             # 기본 정보
             analysis = {
                 'stock_code': stock_code,
-                'stock_name': stock_data.stock_name,
-                'selected_time': stock_data.selected_time,
-                'data_complete': stock_data.data_complete,
-                'last_update': stock_data.last_update,
+                'stock_name': snapshot.stock_name,
+                'selected_time': snapshot.selected_time,
+                'data_complete': snapshot.data_complete,
+                'last_update': snapshot.last_update,
                 'total_minutes': len(combined_data),
-                'historical_minutes': len(stock_data.historical_data),
-                'realtime_minutes': len(stock_data.realtime_data)
+                'historical_minutes': snapshot.historical_count,
+                'realtime_minutes': snapshot.realtime_count
             }
             
             # 가격 분석 (close 컬럼이 있는 경우)
@@ -506,8 +641,7 @@ class IntradayStockManager:
             Dict: 전체 요약 정보
         """
         try:
-            with self._lock:
-                stock_codes = list(self.selected_stocks.keys())
+            stock_codes = list(self._snapshots)
             
             summary = {
                 'total_stocks': len(stock_codes),
@@ -549,6 +683,8 @@ class IntradayStockManager:
                 if stock_code in self.selected_stocks:
                     stock_name = self.selected_stocks[stock_code].stock_name
                     del self.selected_stocks[stock_code]
+                    self.publish_snapshot(stock_code)
+                    TimeFrameConverter.clear_cache(stock_code)
                     self.logger.info(f"🗑️ {stock_code}({stock_name}) 관리 목록에서 제거")
                     return True
                 else:
@@ -560,6 +696,7 @@ class IntradayStockManager:
     
 
     
+    @timed('batch_update_realtime_data')
     async def batch_update_realtime_data(self):
         """
         모든 관리 종목의 실시간 데이터 일괄 업데이트 (분봉 + 현재가)
@@ -567,37 +704,22 @@ class IntradayStockManager:
         try:
             from utils.korean_time import now_kst
 
-            # 🆕 장 마감 시 메모리 데이터 자동 저장 (분봉 + 일봉) - 동적 시간 적용
+            # 장 마감 후 데이터 저장은 main 의 post-market 태스크가 담당 (분봉 갱신 경로와 분리)
             current_time = now_kst()
-            market_hours = MarketHours.get_market_hours('KRX', current_time)
-            market_close = market_hours['market_close']
-            close_hour = market_close.hour
-            close_minute = market_close.minute
-
-            if current_time.hour == close_hour and current_time.minute >= close_minute:
-                if not hasattr(self, '_data_saved_today'):
-                    self.logger.info(f"🔔 {close_hour}:{close_minute:02d} 장 마감 데이터 저장 시작...")
-                    # PostMarketDataSaver를 통해 모든 데이터 저장
-                    self.data_saver.save_all_data(self)
-                    self._data_saved_today = True  # 하루에 한 번만 저장
-                    self.logger.info(f"✅ {close_hour}:{close_minute:02d} 장 마감 데이터 저장 완료")
+            market_close = MarketHours.get_market_hours('KRX', current_time)['market_close']
 
+            if current_time.hour == market_close.hour and current_time.minute >= market_close.minute:
                 # 장 마감 후에는 분봉 조회 중단 (불필요한 API 호출 방지)
                 return
 
-            with self._lock:
-                stock_codes = list(self.selected_stocks.keys())
+            snapshots = self._snapshots
+            stock_codes = list(snapshots)
 
             if not stock_codes:
                 return
 
             # 🆕 data_complete = False인 종목 재수집 (09:05 이전 선정 종목)
-            incomplete_stocks = []
-            with self._lock:
-                for code in stock_codes:
-                    stock_data = self.selected_stocks.get(code)
-                    if stock_data and not stock_data.data_complete:
-                        incomplete_stocks.append(code)
+            incomplete_stocks = [code for code, snap in snapshots.items() if not snap.data_complete]
 
             if incomplete_stocks:
                 self.logger.info(f"🔄 미완성 데이터 재수집 시작: {len(incomplete_stocks)}개 종목")
@@ -638,11 +760,9 @@ class IntradayStockManager:
                 for j, (minute_result, price_result) in enumerate(zip(minute_results, price_results)):
                     stock_code = batch[j]
                     
-                    # 종목명 가져오기
-                    stock_name = None
-                    with self._lock:
-                        if stock_code in self.selected_stocks:
-                            stock_name = self.selected_stocks[stock_code].stock_name
+                    # 종목명 가져오기 (분봉/현재가 갱신 후 최신 스냅샷)
+                    snapshot = self._snapshots.get(stock_code)
+                    stock_name = snapshot.stock_name if snapshot is not None else None
                     
                     # 분봉 데이터 결과 처리
                     if isinstance(minute_result, Exception):
@@ -673,6 +793,7 @@ class IntradayStockManager:
                                                 current_time = now_kst()
                                                 old_time = self.selected_stocks[stock_code].selected_time
                                                 self.selected_stocks[stock_code].selected_time = current_time
+                                                self.publish_snapshot(stock_code)
                                                 self.logger.debug(
                                                     f"⏰ {stock_code} selected_time 업데이트: "
                                                     f"{old_time.strftime('%H:%M:%S')} → {current_time.strftime('%H:%M:%S')}"
@@ -695,29 +816,22 @@ class IntradayStockManager:
                         try:
                             # 분봉 데이터 준비
                             minute_data = None
-                            if not isinstance(minute_result, Exception):
-                                with self._lock:
-                                    if stock_code in self.selected_stocks:
-                                        realtime_data = self.selected_stocks[stock_code].realtime_data
-                                        if realtime_data is not None and not realtime_data.empty:
-                                            # 최근 3분봉 데이터만 로깅
-                                            minute_data = realtime_data.tail(3)
+                            if not isinstance(minute_result, Exception) and snapshot.realtime_count > 0:
+                                # 최근 3분봉 데이터만 로깅
+                                minute_data = snapshot.realtime_frame().tail(3)
                             
                             # 현재가 데이터 준비
                             price_data = None
-                            if not isinstance(price_result, Exception):
-                                with self._lock:
-                                    if stock_code in self.selected_stocks:
-                                        current_price_info = self.selected_stocks[stock_code].current_price_info
-                                        if current_price_info:
-                                            price_data = {
-                                                'current_price': current_price_info.get('current_price', 0),
-                                                'change_rate': current_price_info.get('change_rate', 0),
-                                                'volume': current_price_info.get('volume', 0),
-                                                'high_price': current_price_info.get('high_price', 0),
-                                                'low_price': current_price_info.get('low_price', 0),
-                                                'open_price': current_price_info.get('open_price', 0)
-                                            }
+                            current_price_info = snapshot.current_price_info
+                            if not isinstance(price_result, Exception) and current_price_info:
+                                price_data = {
+                                    'current_price': current_price_info.get('current_price', 0),
+                                    'change_rate': current_price_info.get('change_rate', 0),
+                                    'volume': current_price_info.get('volume', 0),
+                                    'high_price': current_price_info.get('high_price', 0),
+                                    'low_price': current_price_info.get('low_price', 0),
+                                    'open_price': current_price_info.get('open_price', 0)
+                                }
                             
                             # 실시간 데이터 로깅 호출
                             log_intraday_data(stock_code, stock_name, minute_data, price_data, None)
@@ -763,15 +877,14 @@ class IntradayStockManager:
             bool: 업데이트 성공 여부
         """
         try:
-            current_price_info = self.get_current_price_for_sell(stock_code)
+            # 동기 KIS 호출은 KIS executor 에서 실행 (이벤트 루프 블로킹 방지)
+            current_price_info = await run_blocking(self.get_current_price_for_sell, stock_code)
             
             if current_price_info is None:
                 return False
             
-            # 메모리에 현재가 정보 저장
-            with self._lock:
-                if stock_code in self.selected_stocks:
-                    self.selected_stocks[stock_code].current_price_info = current_price_info
+            # 메모리에 현재가 정보 저장 (스냅샷 발행)
+            self.update_current_price_info(stock_code, current_price_info)
             
             return True
             
@@ -0,0 +1,246 @@
+"""
+종목별 당일 1분봉 저장소 (사전 할당 배열 기반)
+
+기존에는 매 분 realtime_data 를 복사 → pd.concat → drop_duplicates →
+sort_values 하고, 조회 시마다 historical+realtime 을 다시 결합/정렬했다.
+MinuteBarStore 는 세션(거래일) 단위로 배열을 미리 할당하고
+분(minute-of-day) → 행 위치 인덱스로 O(1) 추가/갱신한다.
+
+- 행은 항상 시간 오름차순, 분 단위로 유일
+- 다른 거래일 봉이 들어오면: 과거 날짜는 무시, 새 날짜는 저장소 초기화
+- 조회는 배열 슬라이스(view) 기반 DataFrame/NumPy 반환 (읽기 전용)
+
+쓰기는 호출 측(IntradayStockManager._lock)에서 직렬화한다.
+같은 분의 봉을 다시 upsert 하면 제자리 갱신되므로 이전에 받은 view 에도 반영된다.
+쓰기와 무관한 고정 데이터가 필요하면 snapshot_frame() (분리 복사본) 을 사용한다.
+"""
+import itertools
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume', 'amount')
+MINUTES_PER_DAY = 24 * 60
+DEFAULT_CAPACITY = 400  # KRX 09:00~15:30 = 391분
+
+# 저장소 간에도 유일한 변경 번호 (스냅샷 재사용 판단용)
+_revision_counter = itertools.count(1)
+
+
+def _parse_minute(time_value) -> int:
+    """'HHMMSS' (str/int) → minute-of-day"""
+    s = str(time_value).split('.')[0].zfill(6)
+    return int(s[:2]) * 60 + int(s[2:4])
+
+
+class MinuteBarStore:
+    """당일 1분봉 배열 저장소 (분 단위 upsert, view 조회)"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self._capacity = max(1, capacity)
+        self.session_date: Optional[str] = None
+        self._allocate(self._capacity)
+        self._pos = np.full(MINUTES_PER_DAY, -1, dtype=np.int32)
+        self._n = 0
+        self.revision = next(_revision_counter)
+
+    def _allocate(self, capacity: int) -> None:
+        self._values = np.zeros((capacity, len(FIELDS)), dtype=np.float64)
+        self._minutes = np.zeros(capacity, dtype=np.int32)
+        self._times = np.empty(capacity, dtype=object)
+        self._dates = np.full(capacity, self.session_date, dtype=object)
+        self._datetimes = np.zeros(capacity, dtype='datetime64[ns]')
+
+    def _grow(self) -> None:
+        old = (self._values, self._minutes, self._times, self._datetimes)
+        n = self._n
+        self._capacity *= 2
+        self._allocate(self._capacity)
+        self._values[:n] = old[0][:n]
+        self._minutes[:n] = old[1][:n]
+        self._times[:n] = old[2][:n]
+        self._datetimes[:n] = old[3][:n]
+
+    def reset(self, session_date: Optional[str] = None) -> None:
+        """저장소 비우기 (배열은 재사용, 날짜 컬럼만 다시 채움)"""
+        self.session_date = session_date
+        self._dates[:] = session_date
+        self._pos[:] = -1
+        self._n = 0
+        self.revision = next(_revision_counter)
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def first_minute(self) -> int:
+        return int(self._minutes[0]) if self._n else -1
+
+    @property
+    def last_minute(self) -> int:
+        return int(self._minutes[self._n - 1]) if self._n else -1
+
+    def count_after(self, minute: int) -> int:
+        """minute 이후(초과) 봉 개수"""
+        return self._n - int(np.searchsorted(self._minutes[:self._n], minute, side='right'))
+
+    def _accept_date(self, date: Optional[str]) -> bool:
+        """봉의 거래일 확인: 새 날짜면 초기화, 과거 날짜면 거부"""
+        if date is None:
+            if self.session_date is None:
+                return False
+            return True
+        if self.session_date is None or date > self.session_date:
+            self.reset(date)
+            return True
+        return date == self.session_date
+
+    def _datetime_for(self, minute: int) -> np.datetime64:
+        d = self.session_date
+        return np.datetime64(f"{d[:4]}-{d[4:6]}-{d[6:8]}") + np.timedelta64(minute, 'm')
+
+    def upsert(self, minute: int, open_: float, high: float, low: float, close: float,
+               volume: float, amount: float = 0.0, date: Optional[str] = None) -> bool:
+        """1개 봉 추가/갱신. 마지막 분 이후 추가와 기존 분 갱신은 O(1)."""
+        if not self._accept_date(date):
+            return False
+
+        pos = self._pos[minute]
+        if pos < 0:
+            if self._n == self._capacity:
+                self._grow()
+            n = self._n
+            if n and minute < self._minutes[n - 1]:
+                # 중간 누락분 보충 (드묾): 뒤쪽 행을 한 칸씩 밀어 정렬 유지
+                pos = int(np.searchsorted(self._minutes[:n], minute))
+                for arr in (self._values, self._minutes, self._times, self._datetimes):
+                    arr[pos + 1:n + 1] = arr[pos:n].copy()
+                self._pos[self._minutes[pos + 1:n + 1]] += 1
+            else:
+                pos = n
+            self._minutes[pos] = minute
+            self._times[pos] = f"{minute // 60:02d}{minute % 60:02d}00"
+            self._datetimes[pos] = self._datetime_for(minute)
+            self._pos[minute] = pos
+            self._n = n + 1
+
+        self._values[pos] = (open_, high, low, close, volume, amount)
+        self.revision = next(_revision_counter)
+        return True
+
+    def upsert_frame(self, df: pd.DataFrame) -> int:
+        """API 분봉 DataFrame(date/time 또는 datetime + OHLCV) 반영. 반영한 행 수 반환."""
+        if df is None or df.empty:
+            return 0
+
+        if 'time' in df.columns:
+            minutes = [_parse_minute(t) for t in df['time'].to_numpy()]
+        elif 'datetime' in df.columns:
+            dt = pd.to_datetime(df['datetime'])
+            minutes = (dt.dt.hour * 60 + dt.dt.minute).tolist()
+        else:
+            return 0
+
+        if 'date' in df.columns:
+            dates = df['date'].astype(str).tolist()
+        elif 'datetime' in df.columns:
+            dates = pd.to_datetime(df['datetime']).dt.strftime('%Y%m%d').tolist()
+        else:
+            dates = [None] * len(df)
+
+        cols = [
+            df[f].to_numpy(dtype=np.float64, na_value=0.0) if f in df.columns else np.zeros(len(df))
+            for f in FIELDS
+        ]
+        values = np.column_stack(cols)
+
+        applied = 0
+        for i, minute in enumerate(minutes):
+            o, h, l, c, v, a = values[i]
+            if self.upsert(minute, o, h, l, c, v, a, date=dates[i]):
+                applied += 1
+        return applied
+
+    def load_arrays(self, session_date: str, minutes: np.ndarray, values: np.ndarray) -> int:
+        """체크포인트 복원용 일괄 적재 (기존 봉 폐기). minutes 는 오름차순·유일해야 한다.
+
+        Args:
+            session_date: 거래일 (YYYYMMDD)
+            minutes: minute-of-day 배열
+            values: (len(minutes), len(FIELDS)) OHLCV+amount 배열
+        """
+        minutes = np.asarray(minutes, dtype=np.int32)
+        values = np.asarray(values, dtype=np.float64).reshape(len(minutes), len(FIELDS))
+        n = len(minutes)
+        self.reset(session_date)
+        if n > self._capacity:
+            while self._capacity < n:
+                self._capacity *= 2
+            self._allocate(self._capacity)
+        self._values[:n] = values
+        self._minutes[:n] = minutes
+        self._times[:n] = [f"{m // 60:02d}{m % 60:02d}00" for m in minutes.tolist()]
+        if n:
+            self._datetimes[:n] = self._datetime_for(0) + minutes.astype('timedelta64[m]')
+        self._pos[minutes] = np.arange(n, dtype=np.int32)
+        self._n = n
+        self.revision = next(_revision_counter)
+        return n
+
+    def get_bar(self, minute: int) -> Optional[Dict[str, float]]:
+        """특정 분의 봉 (없으면 None)"""
+        pos = self._pos[minute]
+        if pos < 0:
+            return None
+        return dict(zip(FIELDS, self._values[pos].tolist()))
+
+    def _slice(self, start_minute: Optional[int], end_minute: Optional[int]) -> slice:
+        mins = self._minutes[:self._n]
+        lo = 0 if start_minute is None else int(np.searchsorted(mins, start_minute, side='left'))
+        hi = self._n if end_minute is None else int(np.searchsorted(mins, end_minute, side='right'))
+        return slice(lo, max(lo, hi))
+
+    @staticmethod
+    def _readonly(arr: np.ndarray) -> np.ndarray:
+        view = arr.view()
+        view.flags.writeable = False
+        return view
+
+    def arrays(self, start_minute: Optional[int] = None,
+               end_minute: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """컬럼별 읽기 전용 NumPy view (복사 없음). minute 범위는 양끝 포함."""
+        sl = self._slice(start_minute, end_minute)
+        result = {f: self._readonly(self._values[sl, i]) for i, f in enumerate(FIELDS)}
+        result['minute'] = self._readonly(self._minutes[sl])
+        result['time'] = self._readonly(self._times[sl])
+        result['datetime'] = self._readonly(self._datetimes[sl])
+        return result
+
+    def to_frame(self, start_minute: Optional[int] = None,
+                 end_minute: Optional[int] = None) -> pd.DataFrame:
+        """기존 분봉 DataFrame 과 같은 스키마(date, time, datetime, OHLCV, amount)로 반환.
+
+        OHLCV 블록은 내부 배열의 읽기 전용 view 이므로 수정이 필요하면 .copy() 후 사용.
+        """
+        sl = self._slice(start_minute, end_minute)
+        df = pd.DataFrame(self._readonly(self._values[sl]), columns=list(FIELDS), copy=False)
+        df.insert(0, 'date', self._dates[sl])
+        df.insert(1, 'time', self._times[sl])
+        df.insert(2, 'datetime', self._datetimes[sl])
+        return df
+
+    def snapshot_frame(self) -> pd.DataFrame:
+        """to_frame() 과 같은 스키마의 분리 복사본 (이후 upsert/reset 영향 없음).
+
+        OHLCV 블록은 읽기 전용이라 여러 스레드가 락 없이 공유해도 안전하다.
+        """
+        n = self._n
+        values = self._values[:n].copy()
+        values.flags.writeable = False
+        df = pd.DataFrame(values, columns=list(FIELDS), copy=False)
+        df.insert(0, 'date', self._dates[:n].copy())
+        df.insert(1, 'time', self._times[:n].copy())
+        df.insert(2, 'datetime', self._datetimes[:n].copy())
+        return df
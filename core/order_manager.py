@@ -8,7 +8,9 @@ from concurrent.futures import ThreadPoolExecutor
 
 from .models import Order, OrderType, OrderStatus, TradingConfig
 from api.kis_api_manager import KISAPIManager, OrderResult
+from api.kis_async import AsyncKISAPIManager
 from utils.logger import setup_logger
+from utils.perf_monitor import timed
 from utils.korean_time import now_kst, is_market_open
 
 
@@ -27,7 +29,9 @@ class OrderManager:
         self.completed_orders: List[Order] = []  # 완료된 주문 기록
         
         self.is_monitoring = False
+        # 주문/체결조회 전용 executor — 공용 조회 대기열에 막히지 않도록 분리
         self.executor = ThreadPoolExecutor(max_workers=2)
+        self.async_api = AsyncKISAPIManager(api_manager, executor=self.executor)
     
     def set_trading_manager(self, trading_manager):
         """TradingStockManager 참조를 등록 (가격 정정 시 주문ID 동기화용)"""
@@ -97,10 +101,7 @@ class OrderManager:
             self.logger.info(f"📈 매수 주문 시도: {stock_code} {quantity}주 @{price:,.0f}원 (타임아웃: {timeout_seconds}초, 시장가: {market})")
 
             # API 호출을 별도 스레드에서 실행
-            loop = asyncio.get_event_loop()
-            result: OrderResult = await loop.run_in_executor(
-                self.executor,
-                self.api_manager.place_buy_order,
+            result: OrderResult = await self.async_api.place_buy_order(
                 stock_code, quantity, int(price), ("01" if market else "00")
             )
             
@@ -154,10 +155,7 @@ class OrderManager:
             self.logger.info(f"📉 매도 주문 시도: {stock_code} {quantity}주 @{price:,.0f}원 (타임아웃: {timeout_seconds}초, 시장가: {market})")
             
             # API 호출을 별도 스레드에서 실행
-            loop = asyncio.get_event_loop()
-            result: OrderResult = await loop.run_in_executor(
-                self.executor,
-                self.api_manager.place_sell_order,
+            result: OrderResult = await self.async_api.place_sell_order(
                 stock_code, quantity, int(price), ("01" if market else "00")
             )
             
@@ -210,12 +208,7 @@ class OrderManager:
             self.logger.info(f"주문 취소 시도: {order_id} ({order.stock_code})")
             
             # API 호출을 별도 스레드에서 실행
-            loop = asyncio.get_event_loop()
-            result: OrderResult = await loop.run_in_executor(
-                self.executor,
-                self.api_manager.cancel_order,
-                order_id, order.stock_code
-            )
+            result: OrderResult = await self.async_api.cancel_order(order_id, order.stock_code)
             
             if result.success:
                 order.status = OrderStatus.CANCELLED
@@ -257,6 +250,7 @@ class OrderManager:
                 self.logger.error(f"주문 모니터링 중 오류: {e}")
                 await asyncio.sleep(10)
     
+    @timed('monitor_pending_orders')
     async def _monitor_pending_orders(self):
         """미체결 주문 모니터링"""
         current_time = now_kst()
@@ -268,6 +262,9 @@ class OrderManager:
         # 🆕 오탐지 복구: 최근 완료된 주문 중 실제 미체결인 것 확인
         await self._check_false_positive_filled_orders(current_time)
         
+        # 미체결 주문 체결 상태를 동시에 조회 (주문 수만큼 순차 대기하지 않도록)
+        prefetched = await self._prefetch_order_statuses(orders_to_process)
+        
         for order_id in orders_to_process:
             try:
                 order = self.pending_orders[order_id]
@@ -280,7 +277,7 @@ class OrderManager:
                                 f"경과 {elapsed_seconds:.0f}초, 남은시간 {remaining_seconds:.0f}초")
                 
                 # 1. 체결 상태 확인
-                await self._check_order_status(order_id)
+                await self._check_order_status(order_id, prefetched.get(order_id))
                 
                 # 주문이 처리되었으면 더 이상 확인하지 않음
                 if order_id not in self.pending_orders:
@@ -305,6 +302,20 @@ class OrderManager:
             except Exception as e:
                 self.logger.error(f"주문 모니터링 중 오류 {order_id}: {e}")
     
+    async def _prefetch_order_statuses(self, order_ids: List[str]) -> Dict[str, Dict]:
+        """주문별 체결 상태 동시 조회 (실패/빈 응답은 제외 → _check_order_status 에서 재조회)"""
+        order_ids = [order_id for order_id in order_ids if order_id in self.pending_orders]
+        if not order_ids:
+            return {}
+        results = await asyncio.gather(
+            *(self.async_api.get_order_status(order_id) for order_id in order_ids),
+            return_exceptions=True
+        )
+        return {
+            order_id: result for order_id, result in zip(order_ids, results)
+            if result and not isinstance(result, BaseException)
+        }
+    
     async def _check_false_positive_filled_orders(self, current_time):
         """오탐지된 체결 주문 복구 (최근 10분 이내 완료된 주문만 확인)"""
         try:
@@ -326,12 +337,7 @@ class OrderManager:
             
             for order in recent_completed:
                 # API에서 실제 상태 재확인
-                loop = asyncio.get_event_loop()
-                status_data = await loop.run_in_executor(
-                    self.executor,
-                    self.api_manager.get_order_status,
-                    order.order_id
-                )
+                status_data = await self.async_api.get_order_status(order.order_id)
                 
                 if status_data:
                     # 실제로는 미체결인지 확인
@@ -383,8 +389,8 @@ class OrderManager:
         except Exception as e:
             self.logger.error(f"❌ 오탐지 주문 복구 실패 {order.order_id}: {e}")
     
-    async def _check_order_status(self, order_id: str):
-        """주문 상태 확인"""
+    async def _check_order_status(self, order_id: str, status_data: Optional[Dict] = None):
+        """주문 상태 확인 (status_data: 미리 조회한 체결 상태, 없으면 여기서 조회)"""
         try:
             if order_id not in self.pending_orders:
                 return
@@ -392,12 +398,8 @@ class OrderManager:
             order = self.pending_orders[order_id]
             
             # API 호출을 별도 스레드에서 실행
-            loop = asyncio.get_event_loop()
-            status_data = await loop.run_in_executor(
-                self.executor,
-                self.api_manager.get_order_status,
-                order_id
-            )
+            if status_data is None:
+                status_data = await self.async_api.get_order_status(order_id)
             
             if status_data:
                 # 🆕 원본 데이터 로깅 (체결 판단 오류 디버깅용)
@@ -668,12 +670,7 @@ class OrderManager:
                 return
             
             # 현재가 조회
-            loop = asyncio.get_event_loop()
-            price_data = await loop.run_in_executor(
-                self.executor,
-                self.api_manager.get_current_price,
-                order.stock_code
-            )
+            price_data = await self.async_api.get_current_price(order.stock_code)
             
             if not price_data:
                 return
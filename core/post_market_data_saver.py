@@ -3,7 +3,11 @@
 - 분봉 데이터 저장 (PostgreSQL: minute_candles)
 - 일봉 데이터 저장 (PostgreSQL: daily_candles)
 - 텍스트 파일 저장 (디버깅용)
+
+save_all_data_async: 위 단계를 스레드로 넘겨 동시에 실행 (이벤트 루프 비블로킹)
 """
+import asyncio
+import time
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -54,43 +58,9 @@ class PostMarketDataSaver:
             failed_count = 0
 
             for stock_code in stock_codes:
-                try:
-                    # combined_data (historical + realtime 병합) 가져오기
-                    combined_data = intraday_manager.get_combined_chart_data(stock_code)
-
-                    if combined_data is None or combined_data.empty:
-                        self.logger.warning(f"⚠️ [{stock_code}] 저장할 분봉 데이터 없음")
-                        failed_count += 1
-                        continue
-
-                    # 당일 데이터만 필터링
-                    before_count = len(combined_data)
-                    if 'date' in combined_data.columns:
-                        combined_data = combined_data[combined_data['date'].astype(str) == today].copy()
-                    elif 'datetime' in combined_data.columns:
-                        combined_data['date_str'] = pd.to_datetime(combined_data['datetime']).dt.strftime('%Y%m%d')
-                        combined_data = combined_data[combined_data['date_str'] == today].copy()
-                        if 'date_str' in combined_data.columns:
-                            combined_data = combined_data.drop('date_str', axis=1)
-
-                    if before_count != len(combined_data):
-                        removed = before_count - len(combined_data)
-                        self.logger.warning(f"⚠️ [{stock_code}] 전날 데이터 {removed}건 제외: {before_count} → {len(combined_data)}건")
-
-                    if combined_data.empty:
-                        self.logger.warning(f"⚠️ [{stock_code}] 당일 분봉 데이터 없음")
-                        failed_count += 1
-                        continue
-
-                    # PostgreSQL에 저장
-                    if self.minute_cache.save_data(stock_code, today, combined_data):
-                        saved_count += 1
-                        self.logger.debug(f"💾 [{stock_code}] 분봉 캐시 저장: {len(combined_data)}건")
-                    else:
-                        failed_count += 1
-
-                except Exception as e:
-                    self.logger.error(f"❌ [{stock_code}] 분봉 캐시 저장 실패: {e}")
+                if self._save_minute_for_stock(intraday_manager, stock_code, today):
+                    saved_count += 1
+                else:
                     failed_count += 1
 
             self.logger.info(f"✅ 분봉 데이터 캐시 저장 완료: {saved_count}/{len(stock_codes)}개 종목 성공, {failed_count}개 실패")
@@ -105,6 +75,44 @@ class PostMarketDataSaver:
             self.logger.error(f"❌ 분봉 데이터 캐시 저장 중 오류: {e}")
             return {'total': 0, 'saved': 0, 'failed': 0}
 
+    def _save_minute_for_stock(self, intraday_manager, stock_code: str, today: str) -> bool:
+        """한 종목의 당일 분봉(combined_data)을 PostgreSQL에 저장. 성공 여부 반환."""
+        try:
+            # combined_data (historical + realtime 병합) 가져오기
+            combined_data = intraday_manager.get_combined_chart_data(stock_code)
+
+            if combined_data is None or combined_data.empty:
+                self.logger.warning(f"⚠️ [{stock_code}] 저장할 분봉 데이터 없음")
+                return False
+
+            # 당일 데이터만 필터링
+            before_count = len(combined_data)
+            if 'date' in combined_data.columns:
+                combined_data = combined_data[combined_data['date'].astype(str) == today].copy()
+            elif 'datetime' in combined_data.columns:
+                combined_data['date_str'] = pd.to_datetime(combined_data['datetime']).dt.strftime('%Y%m%d')
+                combined_data = combined_data[combined_data['date_str'] == today].copy()
+                if 'date_str' in combined_data.columns:
+                    combined_data = combined_data.drop('date_str', axis=1)
+
+            if before_count != len(combined_data):
+                removed = before_count - len(combined_data)
+                self.logger.warning(f"⚠️ [{stock_code}] 전날 데이터 {removed}건 제외: {before_count} → {len(combined_data)}건")
+
+            if combined_data.empty:
+                self.logger.warning(f"⚠️ [{stock_code}] 당일 분봉 데이터 없음")
+                return False
+
+            # PostgreSQL에 저장
+            if self.minute_cache.save_data(stock_code, today, combined_data):
+                self.logger.debug(f"💾 [{stock_code}] 분봉 캐시 저장: {len(combined_data)}건")
+                return True
+            return False
+
+        except Exception as e:
+            self.logger.error(f"❌ [{stock_code}] 분봉 캐시 저장 실패: {e}")
+            return False
+
     def save_minute_data_to_file(self, intraday_manager) -> Optional[str]:
         """
         메모리에 있는 모든 종목의 분봉 데이터를 텍스트 파일로 저장 (디버깅용)
@@ -189,48 +197,13 @@ class PostMarketDataSaver:
                         saved_count += 1
                         continue
 
-                    # 날짜 계산 (주말/휴일 고려해서 여유있게)
-                    target_date_obj = datetime.strptime(target_date, '%Y%m%d')
-                    start_date_obj = target_date_obj - timedelta(days=days_back + 50)  # 여유있게 50일 더
-
-                    start_date = start_date_obj.strftime('%Y%m%d')
-                    end_date = target_date
-
-                    self.logger.info(f"📡 [{stock_code}] 일봉 데이터 API 조회 중... ({start_date} ~ {end_date})")
-
-                    # KIS API로 일봉 데이터 수집 (최대 100건)
-                    daily_data = get_inquire_daily_itemchartprice(
-                        output_dv="2",          # 2: 차트 데이터 (output2)
-                        div_code="J",           # KRX 시장
-                        itm_no=stock_code,
-                        inqr_strt_dt=start_date,
-                        inqr_end_dt=end_date,
-                        period_code="D",        # 일봉
-                        adj_prc="0"             # 0:수정주가
-                    )
-
-                    if daily_data is None or daily_data.empty:
-                        self.logger.warning(f"⚠️ [{stock_code}] 일봉 데이터 없음")
+                    daily_data = self._fetch_daily_chart(stock_code, target_date, days_back)
+                    if daily_data is None:
                         failed_count += 1
                         continue
 
-                    # 데이터 검증 및 최신 100일만 유지
-                    original_count = len(daily_data)
-                    if original_count > days_back:
-                        daily_data = daily_data.tail(days_back)
-                        self.logger.debug(f"📈 [{stock_code}] 일봉 데이터 {original_count}건 → {days_back}건으로 조정")
-
-                    # PostgreSQL에 저장
-                    if self.daily_cache.save_data(stock_code, daily_data):
-                        # 날짜 범위 정보
-                        date_info = ""
-                        if 'stck_bsop_date' in daily_data.columns and not daily_data.empty:
-                            start_date_actual = daily_data.iloc[0]['stck_bsop_date']
-                            end_date_actual = daily_data.iloc[-1]['stck_bsop_date']
-                            date_info = f" ({start_date_actual}~{end_date_actual})"
-
+                    if self._store_daily_data(stock_code, daily_data):
                         saved_count += 1
-                        self.logger.info(f"✅ [{stock_code}] 일봉 데이터 저장 완료: {len(daily_data)}일치{date_info}")
                     else:
                         failed_count += 1
 
@@ -250,6 +223,54 @@ class PostMarketDataSaver:
             self.logger.error(f"❌ 일봉 데이터 저장 중 오류: {e}")
             return {'total': 0, 'saved': 0, 'failed': 0}
 
+    def _fetch_daily_chart(self, stock_code: str, target_date: str, days_back: int) -> Optional[pd.DataFrame]:
+        """KIS API로 일봉 조회 후 최신 days_back 일만 반환. 데이터 없으면 None."""
+        # 날짜 계산 (주말/휴일 고려해서 여유있게)
+        target_date_obj = datetime.strptime(target_date, '%Y%m%d')
+        start_date_obj = target_date_obj - timedelta(days=days_back + 50)  # 여유있게 50일 더
+
+        start_date = start_date_obj.strftime('%Y%m%d')
+        end_date = target_date
+
+        self.logger.info(f"📡 [{stock_code}] 일봉 데이터 API 조회 중... ({start_date} ~ {end_date})")
+
+        # KIS API로 일봉 데이터 수집 (최대 100건)
+        daily_data = get_inquire_daily_itemchartprice(
+            output_dv="2",          # 2: 차트 데이터 (output2)
+            div_code="J",           # KRX 시장
+            itm_no=stock_code,
+            inqr_strt_dt=start_date,
+            inqr_end_dt=end_date,
+            period_code="D",        # 일봉
+            adj_prc="0"             # 0:수정주가
+        )
+
+        if daily_data is None or daily_data.empty:
+            self.logger.warning(f"⚠️ [{stock_code}] 일봉 데이터 없음")
+            return None
+
+        # 데이터 검증 및 최신 100일만 유지
+        original_count = len(daily_data)
+        if original_count > days_back:
+            daily_data = daily_data.tail(days_back)
+            self.logger.debug(f"📈 [{stock_code}] 일봉 데이터 {original_count}건 → {days_back}건으로 조정")
+        return daily_data
+
+    def _store_daily_data(self, stock_code: str, daily_data: pd.DataFrame) -> bool:
+        """조회한 일봉을 PostgreSQL에 저장. 성공 여부 반환."""
+        if not self.daily_cache.save_data(stock_code, daily_data):
+            return False
+
+        # 날짜 범위 정보
+        date_info = ""
+        if 'stck_bsop_date' in daily_data.columns and not daily_data.empty:
+            start_date_actual = daily_data.iloc[0]['stck_bsop_date']
+            end_date_actual = daily_data.iloc[-1]['stck_bsop_date']
+            date_info = f" ({start_date_actual}~{end_date_actual})"
+
+        self.logger.info(f"✅ [{stock_code}] 일봉 데이터 저장 완료: {len(daily_data)}일치{date_info}")
+        return True
+
     def save_index_daily_data(self) -> bool:
         """
         장 마감 후 KOSPI/KOSDAQ 지수 일봉을 yfinance로 저장 (서킷브레이커용)
@@ -401,6 +422,133 @@ class PostMarketDataSaver:
                 'text_file': None
             }
 
+    async def save_all_data_async(self, intraday_manager, days_back: int = 100,
+                                  fetch_concurrency: int = 4, db_concurrency: int = 3) -> Dict[str, any]:
+        """
+        장 마감 후 모든 데이터 저장 (비동기 파이프라인)
+
+        save_all_data 와 같은 작업을 하되, 블로킹 작업(KIS 조회/DB 쓰기/파일 저장)을 모두
+        스레드로 넘겨 이벤트 루프를 막지 않는다.
+        - 분봉 저장 / 일봉 수집 / 지수 일봉 / 텍스트 파일 4단계를 동시에 진행
+        - 일봉은 종목별로 KIS 조회(공용 rate limiter 가 간격 제어)와 DB 쓰기를 겹쳐 실행
+        - DB 동시 사용은 db_concurrency 로 제한 (캐시 커넥션 풀 maxconn=5)
+
+        Args:
+            intraday_manager: IntradayStockManager 인스턴스
+            days_back: 일봉 저장 일수 (save_daily_data 와 동일)
+            fetch_concurrency: 동시 KIS 조회 수
+            db_concurrency: 동시 DB 작업 수
+
+        Returns:
+            Dict: save_all_data 결과 + 'timings' (단계별 소요 초)
+        """
+        start_ts = time.perf_counter()
+        timings: Dict[str, float] = {'daily_fetch': 0.0, 'daily_write': 0.0}
+        try:
+            self.logger.info("🏁 장 마감 후 데이터 저장 시작 (비동기)")
+
+            with intraday_manager._lock:
+                stock_codes = list(intraday_manager.selected_stocks.keys())
+
+            if not stock_codes:
+                self.logger.warning("⚠️ 저장할 종목이 없습니다")
+                return {
+                    'success': False,
+                    'message': '저장할 종목 없음',
+                    'minute_data': {'total': 0, 'saved': 0, 'failed': 0},
+                    'daily_data': {'total': 0, 'saved': 0, 'failed': 0},
+                    'text_file': None
+                }
+
+            self.logger.info(f"📋 대상 종목: {len(stock_codes)}개")
+            today = now_kst().strftime('%Y%m%d')
+            db_sem = asyncio.Semaphore(db_concurrency)
+            fetch_sem = asyncio.Semaphore(fetch_concurrency)
+
+            async def timed(stage: str, coro):
+                stage_start = time.perf_counter()
+                try:
+                    return await coro
+                finally:
+                    timings[stage] = time.perf_counter() - stage_start
+
+            async def save_minute(stock_code: str) -> bool:
+                async with db_sem:
+                    return await asyncio.to_thread(self._save_minute_for_stock, intraday_manager, stock_code, today)
+
+            async def save_daily(stock_code: str) -> bool:
+                try:
+                    async with db_sem:
+                        exists = await asyncio.to_thread(self.daily_cache.has_data, stock_code, days_back)
+                    if exists:
+                        self.logger.debug(f"⏭️ [{stock_code}] 일봉 데이터 이미 존재 (스킵)")
+                        return True
+
+                    async with fetch_sem:
+                        fetch_start = time.perf_counter()
+                        daily_data = await asyncio.to_thread(self._fetch_daily_chart, stock_code, today, days_back)
+                        timings['daily_fetch'] += time.perf_counter() - fetch_start
+                    if daily_data is None:
+                        return False
+
+                    async with db_sem:
+                        write_start = time.perf_counter()
+                        saved = await asyncio.to_thread(self._store_daily_data, stock_code, daily_data)
+                        timings['daily_write'] += time.perf_counter() - write_start
+                    return saved
+                except Exception as e:
+                    self.logger.error(f"❌ [{stock_code}] 일봉 데이터 저장 실패: {e}")
+                    return False
+
+            def summarize(results: List[bool]) -> Dict[str, int]:
+                saved = sum(1 for ok in results if ok)
+                return {'total': len(results), 'saved': saved, 'failed': len(results) - saved}
+
+            async def minute_stage():
+                return summarize(await asyncio.gather(*(save_minute(code) for code in stock_codes)))
+
+            async def daily_stage():
+                return summarize(await asyncio.gather(*(save_daily(code) for code in stock_codes)))
+
+            minute_result, daily_result, _, text_file = await asyncio.gather(
+                timed('minute_data', minute_stage()),
+                timed('daily_data', daily_stage()),
+                timed('index_data', asyncio.to_thread(self.save_index_daily_data)),
+                timed('text_file', asyncio.to_thread(self.save_minute_data_to_file, intraday_manager)),
+            )
+            timings['total'] = time.perf_counter() - start_ts
+
+            self.logger.info("=" * 80)
+            self.logger.info("✅ 장 마감 후 데이터 저장 완료 (비동기)")
+            self.logger.info(f"📊 분봉 데이터: {minute_result['saved']}/{minute_result['total']}개 저장 성공 "
+                             f"({timings['minute_data']:.1f}초)")
+            self.logger.info(f"📊 일봉 데이터: {daily_result['saved']}/{daily_result['total']}개 저장 성공 "
+                             f"({timings['daily_data']:.1f}초, 조회 누적 {timings['daily_fetch']:.1f}초 / "
+                             f"저장 누적 {timings['daily_write']:.1f}초)")
+            self.logger.info(f"📈 지수 일봉: {timings['index_data']:.1f}초")
+            self.logger.info(f"📝 텍스트 파일: {text_file if text_file else '저장 실패'} ({timings['text_file']:.1f}초)")
+            self.logger.info(f"⏱️ 전체 소요: {timings['total']:.1f}초")
+            self.logger.info("=" * 80)
+
+            return {
+                'success': True,
+                'minute_data': minute_result,
+                'daily_data': daily_result,
+                'text_file': text_file,
+                'timings': timings
+            }
+
+        except Exception as e:
+            self.logger.error(f"❌ 장 마감 후 데이터 저장 중 오류: {e}")
+            return {
+                'success': False,
+                'error': str(e),
+                'minute_data': {'total': 0, 'saved': 0, 'failed': 0},
+                'daily_data': {'total': 0, 'saved': 0, 'failed': 0},
+                'text_file': None,
+                'timings': timings
+            }
+
 
 # 독립 실행용 (테스트)
 if __name__ == "__main__":
@@ -67,7 +67,6 @@ class PreMarketAnalyzer:
 
         self._nxt_div_code = self.config.get('nxt_div_code', 'NX')
         self._max_stocks = self.config.get('max_bellwether_stocks', 30)
-        self._api_interval_ms = self.config.get('api_call_interval_ms', 100)
 
     def collect_snapshot(self) -> Optional[PreMarketSnapshot]:
         """
@@ -775,37 +774,37 @@ class PreMarketAnalyzer:
     def _collect_nxt_stock_prices(self) -> List[Dict]:
         """벨웨더 종목들의 NXT 현재가 수집"""
         from api.kis_market_api import get_inquire_price
+        from api.kis_rate_limiter import Lane, lane_scope
 
         stock_data = []
         stocks_to_check = NXT_BELLWETHER_STOCKS[:self._max_stocks]
 
-        for stock_code, stock_name in stocks_to_check:
-            try:
-                result = get_inquire_price(div_code=self._nxt_div_code, itm_no=stock_code)
-
-                if result is not None and not result.empty:
-                    row = result.iloc[0]
-                    current_price = self._safe_int(row.get('stck_prpr', '0'))
-                    prev_close = self._safe_int(row.get('stck_sdpr', '0'))
-                    volume = self._safe_int(row.get('acml_vol', '0'))
-
-                    if current_price > 0 and prev_close > 0:
-                        change_pct = (current_price - prev_close) / prev_close * 100
-                        stock_data.append({
-                            'code': stock_code,
-                            'name': stock_name,
-                            'price': current_price,
-                            'prev_close': prev_close,
-                            'change_pct': round(change_pct, 2),
-                            'volume': volume,
-                        })
-
-                # API 호출 간격 준수
-                time_module.sleep(self._api_interval_ms / 1000.0)
-
-            except Exception as e:
-                logger.debug(f"[프리마켓] {stock_code}({stock_name}) NXT 조회 실패: {e}")
-                continue
+        # 호출 간격은 kis_rate_limiter 스케줄러 (SCAN 레인) 가 제어
+        with lane_scope(Lane.SCAN):
+            for stock_code, stock_name in stocks_to_check:
+                try:
+                    result = get_inquire_price(div_code=self._nxt_div_code, itm_no=stock_code)
+
+                    if result is not None and not result.empty:
+                        row = result.iloc[0]
+                        current_price = self._safe_int(row.get('stck_prpr', '0'))
+                        prev_close = self._safe_int(row.get('stck_sdpr', '0'))
+                        volume = self._safe_int(row.get('acml_vol', '0'))
+
+                        if current_price > 0 and prev_close > 0:
+                            change_pct = (current_price - prev_close) / prev_close * 100
+                            stock_data.append({
+                                'code': stock_code,
+                                'name': stock_name,
+                                'price': current_price,
+                                'prev_close': prev_close,
+                                'change_pct': round(change_pct, 2),
+                                'volume': volume,
+                            })
+
+                except Exception as e:
+                    logger.debug(f"[프리마켓] {stock_code}({stock_name}) NXT 조회 실패: {e}")
+                    continue
 
         logger.debug(f"[프리마켓] NXT 종목 데이터 수집: {len(stock_data)}/{len(stocks_to_check)}건")
         return stock_data
@@ -70,6 +70,7 @@ class RealtimeDataUpdater:
                         elapsed_minutes = (current_time - old_time).total_seconds() / 60
                         if elapsed_minutes >= 5:
                             self.manager.selected_stocks[stock_code].selected_time = current_time
+                            self.manager.publish_snapshot(stock_code)
                             self.logger.info(
                                 f"[시간갱신] {stock_code} 데이터 부족 지속 (선정 후 {elapsed_minutes:.0f}분), "
                                 f"selected_time 업데이트: {old_time.strftime('%H:%M:%S')} -> {current_time.strftime('%H:%M:%S')}"
@@ -102,43 +103,20 @@ class RealtimeDataUpdater:
                 self.logger.error(f"[실패] {stock_code} 2차 검증 실패 - 전날 데이터만 존재")
                 return False
 
-            # 4. 기존 realtime_data에 최신 데이터 추가/업데이트
+            # 4. 분봉 저장소에 최신 데이터 추가/업데이트 (분 단위 O(1) upsert, 최신 데이터 우선)
             with self._lock:
                 if stock_code in self.manager.selected_stocks:
-                    current_realtime = self.manager.selected_stocks[stock_code].realtime_data.copy()
-                    before_count = len(current_realtime)
-
-                    # 새로운 데이터를 realtime_data에 추가
-                    if current_realtime.empty:
-                        updated_realtime = latest_minute_data
-                    else:
-                        # 중복 제거하면서 병합 (최신 데이터 우선)
-                        updated_realtime = pd.concat(
-                            [current_realtime, latest_minute_data],
-                            ignore_index=True
-                        )
+                    stock_data = self.manager.selected_stocks[stock_code]
+                    stock_data.bars.upsert_frame(latest_minute_data)
 
-                        if 'datetime' in updated_realtime.columns:
-                            updated_realtime = updated_realtime.drop_duplicates(
-                                subset=['datetime'],
-                                keep='last'
-                            ).sort_values('datetime').reset_index(drop=True)
-                        elif 'time' in updated_realtime.columns:
-                            updated_realtime = updated_realtime.drop_duplicates(
-                                subset=['time'],
-                                keep='last'
-                            ).sort_values('time').reset_index(drop=True)
-
-                    # 3차 검증: 저장 직전 최종 당일 데이터 확인
-                    updated_realtime = self._final_today_validation(updated_realtime, today_str, stock_code)
-
-                    if updated_realtime is None or updated_realtime.empty:
-                        self.logger.error(f"[실패] {stock_code} 3차 검증 실패 - realtime_data가 비었음")
+                    # 3차 검증: 저장소가 당일 거래일 기준인지 최종 확인
+                    if stock_data.bars.session_date != today_str or len(stock_data.bars) == 0:
+                        self.manager.publish_snapshot(stock_code)
+                        self.logger.error(f"[실패] {stock_code} 3차 검증 실패 - 당일 분봉 없음")
                         return False
 
-                    # 최종 저장
-                    self.manager.selected_stocks[stock_code].realtime_data = updated_realtime
-                    self.manager.selected_stocks[stock_code].last_update = current_time
+                    stock_data.last_update = current_time
+                    self.manager.publish_snapshot(stock_code)
 
             return True
 
@@ -392,25 +370,3 @@ class RealtimeDataUpdater:
                 )
 
         return data
-
-    def _final_today_validation(self, data: pd.DataFrame, today_str: str,
-                                stock_code: str) -> Optional[pd.DataFrame]:
-        """저장 직전 최종 당일 데이터 확인"""
-        before_final_count = len(data)
-
-        if 'date' in data.columns:
-            data = data[data['date'].astype(str) == today_str].copy()
-        elif 'datetime' in data.columns:
-            data['_date_str'] = pd.to_datetime(data['datetime']).dt.strftime('%Y%m%d')
-            data = data[data['_date_str'] == today_str].copy()
-
-            if '_date_str' in data.columns:
-                data = data.drop('_date_str', axis=1)
-
-        if before_final_count != len(data):
-            removed = before_final_count - len(data)
-            self.logger.error(
-                f"[경고] {stock_code} 저장 전 3차 검증에서 전날 데이터 {removed}건 최종 제거!"
-            )
-
-        return data
@@ -5,20 +5,44 @@
 기본 필터(거래량/가격/등락률)는 범용적으로 작동.
 3단계 파이프라인으로 거래량순위 API 기반 후보 발굴.
 
-Phase 1: get_volume_rank() 4회 호출 (KOSPI/KOSDAQ × 거래금액순/거래증가율) → ~80-100 후보
+Phase 1: get_volume_rank() 2회 호출 (KOSPI/KOSDAQ 거래금액순) → ~40-60 후보
 Phase 2: 등락률/가격/거래대금 기본 필터 (API 호출 없음)
 Phase 3: get_inquire_price()로 시가 대비 정밀 검증
+
+Phase 1/3 의 KIS 조회는 스크리너 전용 executor (SCAN_MAX_WORKERS) 로 동시에 제출하고
+호출 간격은 kis_rate_limiter 스케줄러(SCAN 레인)에 맡긴다 (parallel_api_calls=False 면
+순차 호출). 공용 KIS executor 는 매도 가격 갱신 경로가 쓰므로 사용하지 않는다.
+필터/점수는 DataFrame 컬럼 단위로 계산.
 """
-import time
+import contextvars
+import re
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Set
+from typing import Any, Callable, List, Dict, Optional, Sequence, Set
 from dataclasses import dataclass
 
+import numpy as np
+import pandas as pd
+
 from api.kis_market_api import get_volume_rank, get_inquire_price
+from api.kis_rate_limiter import Lane, lane_scope
 from utils.logger import setup_logger
 from utils.korean_time import now_kst
 
+# 스크리너 전용 KIS 조회 스레드 수 — 공용 kis_async executor (매도 가격 갱신 경로) 와 분리.
+# SCAN 레인 호출이 acquire() 에서 대기하며 공용 워커를 점유하면 PRICE 레인 호출이
+# executor 대기열에 막혀 스케줄러 우선순위에 도달하지 못한다.
+SCAN_MAX_WORKERS = 2
+
+# API 필드명 차이 대응 (앞쪽 키 우선)
+_CODE_KEYS = ('mksc_shrn_iscd', 'stck_shrn_iscd', 'shrn_iscd', 'code')
+_NAME_KEYS = ('hts_kor_isnm', 'kor_isnm', 'name')
+# Phase 3 에서 쓰는 현재가 응답 필드
+_PRICE_FIELDS = ('stck_prpr', 'stck_oprc', 'stck_sdpr', 'stck_hgpr', 'stck_lwpr',
+                 'acml_vol', 'acml_tr_pbmn', 'prdy_ctrt')
+
 
 @dataclass
 class ScreenedStock:
@@ -56,6 +80,12 @@ class StockScreener:
         self._rejected_stocks: Set[str] = set()
         # 날짜 변경 감지용
         self._current_date: Optional[str] = None
+        # preload_macd_cross_universe 가 같은 connection 으로 받아둔 daily history
+        # (before_date_iso, 조회 종목 set, DataFrame) — main 이 take_macd_cross_daily_history 로 1회 소비
+        self._macd_cross_history: Optional[tuple] = None
+        # Phase 1/3 동시 조회용 전용 executor (최초 사용 시 생성)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
     def reset_daily_state(self):
         """일일 상태 초기화"""
@@ -93,33 +123,103 @@ class StockScreener:
                 )
                 return []
 
-            # Phase 1: 거래량순위 API 조회
-            raw_stocks = self._scan_volume_rank()
-            if not raw_stocks:
-                self.logger.debug("[스크리너] Phase1: 후보 없음")
-                return []
+            # 스크리너 KIS 호출은 SCAN 레인 (주문/가격 체크보다 후순위)
+            with lane_scope(Lane.SCAN):
+                # Phase 1: 거래량순위 API 조회
+                raw_stocks = self._scan_volume_rank()
+                if raw_stocks.empty:
+                    self.logger.debug("[스크리너] Phase1: 후보 없음")
+                    return []
 
-            # Phase 2: 기본 필터
-            filtered_stocks = self._apply_basic_filters(raw_stocks)
-            if not filtered_stocks:
-                self.logger.debug("[스크리너] Phase2: 필터 통과 종목 없음")
-                return []
+                # Phase 2: 기본 필터
+                filtered_stocks = self._apply_basic_filters(raw_stocks)
+                if filtered_stocks.empty:
+                    self.logger.debug("[스크리너] Phase2: 필터 통과 종목 없음")
+                    return []
 
-            # Phase 3: 시가 기반 정밀 검증
-            candidates = self._validate_with_price_data(filtered_stocks)
+                # Phase 3: 시가 기반 정밀 검증
+                candidates = self._validate_with_price_data(filtered_stocks)
 
-            return candidates
+                return candidates
 
         except Exception as e:
             self.logger.error(f"[스크리너] 스캔 오류: {e}")
             self.logger.error(traceback.format_exc())
             return []
 
-    def _scan_volume_rank(self) -> List[Dict]:
+    def _call_kis_batch(self, func: Callable[..., Any], kwargs_list: List[Dict]) -> List[Any]:
+        """
+        KIS 조회 여러 건을 실행하고 입력 순서대로 결과 반환 (실패 건은 예외 객체)
+
+        parallel_api_calls=True 면 스크리너 전용 executor (SCAN_MAX_WORKERS) 로 동시에 제출한다.
+        호출 간격은 _url_fetch 의 kis_rate_limiter 스케줄러가 SCAN 레인으로 제어하므로
+        고정 sleep 없이 버킷 한도까지 쓰고, 주문/가격 체크 레인이 항상 먼저 토큰을 받는다.
+        (공용 kis_async executor 를 쓰지 않으므로 가격 갱신 호출이 스캔 작업 뒤에 줄서지 않음)
+        """
+        if not self.config.get('parallel_api_calls', True) or len(kwargs_list) <= 1:
+            results = []
+            for kwargs in kwargs_list:
+                try:
+                    results.append(func(**kwargs))
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        # 작업마다 컨텍스트 복사 → lane_scope(Lane.SCAN) 가 워커 스레드까지 전달됨
+        executor = self._get_executor()
+        futures = [
+            executor.submit(contextvars.copy_context().run, func, **kwargs)
+            for kwargs in kwargs_list
+        ]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=SCAN_MAX_WORKERS, thread_name_prefix='screener')
+        return self._executor
+
+    def shutdown(self) -> None:
+        """전용 executor 종료 (봇 종료 시)"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    @staticmethod
+    def _extract_column(df: pd.DataFrame, keys: Sequence[str], code: bool = False) -> pd.Series:
+        """종목코드(6자리 숫자) / 종목명 컬럼 추출 (API 필드명 차이 대응, 앞쪽 키 우선)"""
+        out = pd.Series('', index=df.index, dtype=object)
+        for key in keys:
+            if key not in df.columns:
+                continue
+            values = df[key].astype(str).str.strip()
+            valid = values.ne('')
+            if code:
+                valid &= values.str.len().eq(6) & values.str.isdigit()
+            out = out.where(out.ne('') | ~valid, values)
+        return out
+
+    def _numeric_column(self, df: pd.DataFrame, key: str, as_float: bool = False) -> pd.Series:
+        """API 문자열 컬럼 → 숫자 (_safe_int / _safe_float 와 동일 규칙, 컬럼 없으면 0)"""
+        if key not in df.columns:
+            return pd.Series(0.0 if as_float else 0, index=df.index)
+        convert = self._safe_float if as_float else self._safe_int
+        return df[key].map(convert)
+
+    def _scan_volume_rank(self) -> pd.DataFrame:
         """
         Phase 1: 거래량순위 API 2회 호출하여 후보 풀 구성
 
-        KOSPI/KOSDAQ 각각 거래금액순 = 2회 호출
+        KOSPI/KOSDAQ 각각 거래금액순 = 2회 호출 (parallel_api_calls 면 동시 호출)
         → 중복 제거 후 ~40-60개 후보
 
         거래증가율(sort=1) 제거 사유:
@@ -128,10 +228,8 @@ class StockScreener:
         - 시뮬(거래금액순)은 71.5% 승률, 실거래(급등주 혼합)는 ~5%
 
         Returns:
-            중복 제거된 종목 딕셔너리 리스트
+            중복 제거된 종목 DataFrame (API 컬럼 + code/name, 조회 순서 유지)
         """
-        all_stocks = {}  # {stock_code: row_dict} for dedup
-
         min_price = str(self.config.get('min_price', 5000))
         max_price = str(self.config.get('max_price', 500000))
 
@@ -141,45 +239,53 @@ class StockScreener:
             ("1001", "3", "KOSDAQ-거래금액순"),
         ]
 
-        for market_code, sort_code, label in scan_configs:
-            try:
-                df = get_volume_rank(
-                    fid_input_iscd=market_code,
-                    fid_div_cls_code="1",           # 보통주
-                    fid_blng_cls_code=sort_code,
-                    fid_input_price_1=min_price,
-                    fid_input_price_2=max_price,
+        results = self._call_kis_batch(get_volume_rank, [
+            dict(
+                fid_input_iscd=market_code,
+                fid_div_cls_code="1",           # 보통주
+                fid_blng_cls_code=sort_code,
+                fid_input_price_1=min_price,
+                fid_input_price_2=max_price,
+            )
+            for market_code, sort_code, _ in scan_configs
+        ])
+
+        frames = []
+        seen: Set[str] = set()
+        for (_, _, label), df in zip(scan_configs, results):
+            if isinstance(df, Exception):
+                self.logger.error(f"[스크리너] Phase1-{label} 오류: {df}")
+                continue
+            if df is None or df.empty:
+                continue
+            # 첫 호출 시 컬럼명 로깅 (필드 확인용)
+            if not hasattr(self, '_columns_logged'):
+                self.logger.info(
+                    f"[스크리너] 거래량순위 API 컬럼: {list(df.columns)}"
                 )
-                if df is not None and not df.empty:
-                    # 첫 호출 시 컬럼명 로깅 (필드 확인용)
-                    if not hasattr(self, '_columns_logged'):
-                        self.logger.info(
-                            f"[스크리너] 거래량순위 API 컬럼: {list(df.columns)}"
-                        )
-                        self._columns_logged = True
-
-                    new_count = 0
-                    for _, row in df.iterrows():
-                        code = self._extract_stock_code(row)
-                        if code and code not in all_stocks:
-                            all_stocks[code] = row.to_dict()
-                            new_count += 1
-                    self.logger.info(
-                        f"[스크리너] Phase1-{label}: {len(df)}건 조회, 신규 {new_count}건"
-                    )
-            except Exception as e:
-                self.logger.error(f"[스크리너] Phase1-{label} 오류: {e}")
-
-            time.sleep(0.1)  # API rate limit 준수
+                self._columns_logged = True
+
+            raw_count = len(df)
+            df = df.copy()
+            df['code'] = self._extract_column(df, _CODE_KEYS, code=True)
+            df['name'] = self._extract_column(df, _NAME_KEYS)
+            df = df[df['code'].ne('')].drop_duplicates('code')
+            df = df[~df['code'].isin(seen)]
+            seen.update(df['code'])
+            frames.append(df)
+            self.logger.info(
+                f"[스크리너] Phase1-{label}: {raw_count}건 조회, 신규 {len(df)}건"
+            )
 
+        all_stocks = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
         self.logger.info(
             f"[스크리너] Phase1 완료: 중복제거 후 {len(all_stocks)}개 종목"
         )
-        return list(all_stocks.values())
+        return all_stocks
 
-    def _apply_basic_filters(self, raw_stocks: List[Dict]) -> List[Dict]:
+    def _apply_basic_filters(self, raw_stocks: pd.DataFrame) -> pd.DataFrame:
         """
-        Phase 2: 기본 필터 적용 (API 호출 없음)
+        Phase 2: 기본 필터 적용 (API 호출 없음, 컬럼 단위 마스크)
 
         Filters:
         1. 등락률: 0.5% ~ 5.0%
@@ -187,6 +293,8 @@ class StockScreener:
         3. 거래대금: 10억+
         4. 이미 추가된/거부된 종목 제외
         5. 종목명 필터 (우선주, ETF, ETN 등 제외)
+
+        통계는 위에서부터 처음 걸린 필터 하나에만 집계 (기존 순차 판정과 동일).
         """
         min_change = self.config.get('min_change_rate', 0.5)
         max_change = self.config.get('max_change_rate', 5.0)
@@ -194,56 +302,40 @@ class StockScreener:
         max_price = self.config.get('max_price', 500000)
         min_amount = self.config.get('min_trading_amount', 1_000_000_000)
 
-        filtered = []
         stats = {
             'total': len(raw_stocks), 'already_known': 0,
             'name_filter': 0, 'change_rate': 0,
             'price': 0, 'amount': 0, 'passed': 0
         }
+        if raw_stocks.empty:
+            return raw_stocks
 
         exclude_keywords = ['우B', 'ETF', 'ETN', '스팩', 'SPAC', '리츠']
 
-        for stock in raw_stocks:
-            code = self._extract_stock_code(stock)
-            name = self._extract_stock_name(stock)
-
-            if not code:
-                continue
+        codes = raw_stocks['code']
+        names = raw_stocks['name']
+        change_rate = self._numeric_column(raw_stocks, 'prdy_ctrt', as_float=True)
+        price = self._numeric_column(raw_stocks, 'stck_prpr')
+        tr_amount = self._numeric_column(raw_stocks, 'acml_tr_pbmn')
 
+        checks = [
             # 이미 추가/거부된 종목 제외
-            if code in self._added_stocks or code in self._rejected_stocks:
-                stats['already_known'] += 1
-                continue
-
-            # 종목명 필터 (우선주, ETF, ETN, 스팩, 리츠)
-            if any(kw in name for kw in exclude_keywords):
-                stats['name_filter'] += 1
-                continue
-            # 우선주 코드 패턴 (끝자리 5)
-            if len(code) == 6 and code[-1] == '5':
-                stats['name_filter'] += 1
-                continue
-
-            # 등락률 필터
-            change_rate = self._safe_float(stock.get('prdy_ctrt', '0'))
-            if change_rate < min_change or change_rate > max_change:
-                stats['change_rate'] += 1
-                continue
-
-            # 가격 필터
-            price = self._safe_int(stock.get('stck_prpr', '0'))
-            if price < min_price or price > max_price:
-                stats['price'] += 1
-                continue
-
-            # 거래대금 필터
-            tr_amount = self._safe_int(stock.get('acml_tr_pbmn', '0'))
-            if tr_amount < min_amount:
-                stats['amount'] += 1
-                continue
+            ('already_known', codes.isin(self._added_stocks | self._rejected_stocks)),
+            # 종목명 필터 (우선주, ETF, ETN, 스팩, 리츠) + 우선주 코드 패턴 (끝자리 5)
+            ('name_filter', names.str.contains('|'.join(map(re.escape, exclude_keywords)))
+             | codes.str.endswith('5')),
+            ('change_rate', (change_rate < min_change) | (change_rate > max_change)),
+            ('price', (price < min_price) | (price > max_price)),
+            ('amount', tr_amount < min_amount),
+        ]
+        remaining = pd.Series(True, index=raw_stocks.index)
+        for key, failed in checks:
+            hit = remaining & failed
+            stats[key] = int(hit.sum())
+            remaining &= ~hit
 
-            stats['passed'] += 1
-            filtered.append(stock)
+        filtered = raw_stocks[remaining]
+        stats['passed'] = len(filtered)
 
         self.logger.info(
             f"[스크리너] Phase2: {stats['total']}개 -> {stats['passed']}개 통과 "
@@ -253,10 +345,13 @@ class StockScreener:
         )
         return filtered
 
-    def _validate_with_price_data(self, filtered_stocks: List[Dict]) -> List[ScreenedStock]:
+    def _validate_with_price_data(self, filtered_stocks: pd.DataFrame) -> List[ScreenedStock]:
         """
         Phase 3: 현재가 API로 시가 기반 정밀 검증
 
+        현재가 조회는 _call_kis_batch 로 한 번에 제출 (간격은 스케줄러),
+        판정/점수는 조회 결과 DataFrame 에서 컬럼 단위로 계산.
+
         검증 항목:
         1. 시가 대비 상승률: 0.8% ~ 4.0%
         2. 갭 필터: 시가 vs 전일종가 < 3%
@@ -268,129 +363,107 @@ class StockScreener:
         max_gap = self.config.get('max_gap_pct', 3.0)
         min_gap_down = self.config.get('min_gap_down_pct', -2.0)
         max_per_scan = self.config.get('max_candidates_per_scan', 5)
+        min_score = self.config.get('min_score', 0)
 
-        candidates = []
-        stocks_to_check = filtered_stocks[:max_checks]
-        checked = 0
         rejected_reasons = {'price_fail': 0, 'pct_filter': 0, 'gap_filter': 0, 'error': 0}
+        stocks_to_check = filtered_stocks.head(max_checks)
+        codes = list(stocks_to_check['code']) if not stocks_to_check.empty else []
+        names = list(stocks_to_check['name']) if not stocks_to_check.empty else []
 
-        for i, stock in enumerate(stocks_to_check):
-            code = self._extract_stock_code(stock)
-            name = self._extract_stock_name(stock)
+        results = self._call_kis_batch(get_inquire_price, [dict(itm_no=code) for code in codes])
 
-            if not code:
+        rows = []
+        for code, name, price_df in zip(codes, names, results):
+            if isinstance(price_df, Exception):
+                self.logger.warning(
+                    f"[스크리너] {code}({name}) Phase3 검증 오류: {price_df}"
+                )
+                rejected_reasons['error'] += 1
                 continue
+            if price_df is None or price_df.empty:
+                self.logger.debug(f"[스크리너] {code}({name}): 현재가 조회 실패")
+                self._rejected_stocks.add(code)
+                rejected_reasons['price_fail'] += 1
+                continue
+            row = price_df.iloc[0]
+            rows.append({'code': code, 'name': name,
+                         **{key: row.get(key, '0') for key in _PRICE_FIELDS}})
 
-            try:
-                # API rate limiting (80ms 간격)
-                if i > 0:
-                    time.sleep(0.08)
-
-                price_df = get_inquire_price(itm_no=code)
-                if price_df is None or price_df.empty:
-                    self.logger.debug(f"[스크리너] {code}({name}): 현재가 조회 실패")
-                    self._rejected_stocks.add(code)
-                    rejected_reasons['price_fail'] += 1
-                    continue
-
-                checked += 1
-                row = price_df.iloc[0]
-
-                current_price = self._safe_int(row.get('stck_prpr', '0'))
-                open_price = self._safe_int(row.get('stck_oprc', '0'))
-                prev_close = self._safe_int(row.get('stck_sdpr', '0'))
-                high_price = self._safe_int(row.get('stck_hgpr', '0'))
-                low_price = self._safe_int(row.get('stck_lwpr', '0'))
-                volume = self._safe_int(row.get('acml_vol', '0'))
-                tr_amount = self._safe_int(row.get('acml_tr_pbmn', '0'))
-                change_rate = self._safe_float(row.get('prdy_ctrt', '0'))
-
-                if open_price <= 0 or current_price <= 0:
-                    self._rejected_stocks.add(code)
-                    rejected_reasons['price_fail'] += 1
-                    continue
-
-                # 시가 대비 상승률
-                pct_from_open = (current_price / open_price - 1) * 100
-
-                # 시가 대비 필터
-                if pct_from_open < min_pct or pct_from_open >= max_pct:
-                    self.logger.debug(
-                        f"[스크리너] {code}({name}): "
-                        f"시가대비 {pct_from_open:.1f}% (범위 {min_pct}~{max_pct}%)"
-                    )
-                    rejected_reasons['pct_filter'] += 1
-                    continue
-
-                # 갭 필터 (시가 vs 전일종가)
-                if prev_close > 0:
-                    signed_gap_pct = (open_price / prev_close - 1) * 100
-                    # 상방 갭 제한 (abs 기존 유지)
-                    if abs(signed_gap_pct) > max_gap:
-                        self.logger.debug(
-                            f"[스크리너] {code}({name}): "
-                            f"갭 {signed_gap_pct:+.1f}% (상한 {max_gap}%)"
-                        )
-                        self._rejected_stocks.add(code)
-                        rejected_reasons['gap_filter'] += 1
-                        continue
-                    # 갭다운 하한 제한 (실거래 검증: -2% 이하 승률 9%)
-                    if signed_gap_pct < min_gap_down:
-                        self.logger.debug(
-                            f"[스크리너] {code}({name}): "
-                            f"갭다운 {signed_gap_pct:+.1f}% < {min_gap_down}%"
-                        )
-                        self._rejected_stocks.add(code)
-                        rejected_reasons['gap_filter'] += 1
-                        continue
-
-                # 점수 계산
-                score = self._calculate_score(
-                    pct_from_open=pct_from_open,
-                    change_rate=change_rate,
-                    tr_amount=tr_amount,
-                    current_price=current_price,
-                    high_price=high_price,
-                    low_price=low_price,
+        checked = len(rows)
+        candidates: List[ScreenedStock] = []
+        if rows:
+            prices = pd.DataFrame(rows)
+            current_price = self._numeric_column(prices, 'stck_prpr')
+            open_price = self._numeric_column(prices, 'stck_oprc')
+            prev_close = self._numeric_column(prices, 'stck_sdpr')
+            high_price = self._numeric_column(prices, 'stck_hgpr')
+            low_price = self._numeric_column(prices, 'stck_lwpr')
+            volume = self._numeric_column(prices, 'acml_vol')
+            tr_amount = self._numeric_column(prices, 'acml_tr_pbmn')
+            change_rate = self._numeric_column(prices, 'prdy_ctrt', as_float=True)
+
+            valid = (open_price > 0) & (current_price > 0)
+            # 시가 대비 상승률 / 갭 (시가 vs 전일종가, 전일종가 없으면 NaN → 갭 필터 생략)
+            pct_from_open = (current_price / open_price.where(valid) - 1) * 100
+            signed_gap_pct = (open_price / prev_close.where(prev_close > 0) - 1) * 100
+            score = self._score_frame(pct_from_open, change_rate, tr_amount,
+                                      current_price, high_price, low_price)
+
+            price_fail = ~valid
+            pct_fail = valid & ((pct_from_open < min_pct) | (pct_from_open >= max_pct))
+            remaining = valid & ~pct_fail
+            # 상방 갭 제한 (abs 기존 유지) + 갭다운 하한 제한 (실거래 검증: -2% 이하 승률 9%)
+            gap_fail = remaining & ((signed_gap_pct.abs() > max_gap) | (signed_gap_pct < min_gap_down))
+            remaining &= ~gap_fail
+            # 최소 점수 컷 (04-13 멀티버스: T65 = 5 fold 중 4 fold 우위)
+            low_score = remaining & ((score < min_score) if min_score > 0 else False)
+            passed = remaining & ~low_score
+
+            rejected_reasons['price_fail'] += int(price_fail.sum())
+            rejected_reasons['pct_filter'] = int(pct_fail.sum())
+            rejected_reasons['gap_filter'] = int(gap_fail.sum())
+            if low_score.any():
+                rejected_reasons['low_score'] = int(low_score.sum())
+            # 시가대비 탈락은 이후 재진입 가능 → 거부 목록에 넣지 않음
+            self._rejected_stocks.update(prices['code'][price_fail | gap_fail | low_score])
+
+            for i in prices.index[pct_fail]:
+                self.logger.debug(
+                    f"[스크리너] {prices.at[i, 'code']}({prices.at[i, 'name']}): "
+                    f"시가대비 {pct_from_open[i]:.1f}% (범위 {min_pct}~{max_pct}%)"
+                )
+            for i in prices.index[gap_fail]:
+                self.logger.debug(
+                    f"[스크리너] {prices.at[i, 'code']}({prices.at[i, 'name']}): "
+                    f"갭 {signed_gap_pct[i]:+.1f}% (상한 {max_gap}%, 하한 {min_gap_down}%)"
+                )
+            for i in prices.index[low_score]:
+                self.logger.debug(
+                    f"[스크리너] {prices.at[i, 'code']}({prices.at[i, 'name']}) 점수 부족: "
+                    f"{score[i]:.0f} < {min_score}"
                 )
 
-                # 최소 점수 컷 (04-13 멀티버스: T65 = 5 fold 중 4 fold 우위)
-                min_score = self.config.get('min_score', 0)
-                if min_score > 0 and score < min_score:
-                    self.logger.debug(
-                        f"[스크리너] {code}({name}) 점수 부족: "
-                        f"{score:.0f} < {min_score}"
-                    )
-                    self._rejected_stocks.add(code)
-                    rejected_reasons['low_score'] = rejected_reasons.get('low_score', 0) + 1
-                    continue
-
+            for i in prices.index[passed]:
+                pct, chg, sc = float(pct_from_open[i]), float(change_rate[i]), float(score[i])
                 candidates.append(ScreenedStock(
-                    code=code,
-                    name=name,
+                    code=prices.at[i, 'code'],
+                    name=prices.at[i, 'name'],
                     market='KOSPI',
-                    current_price=current_price,
-                    change_rate=change_rate,
-                    open_price=open_price,
-                    pct_from_open=pct_from_open,
-                    volume=volume,
-                    trading_amount=tr_amount,
-                    score=score,
+                    current_price=int(current_price[i]),
+                    change_rate=chg,
+                    open_price=int(open_price[i]),
+                    pct_from_open=pct,
+                    volume=int(volume[i]),
+                    trading_amount=int(tr_amount[i]),
+                    score=sc,
                     reason=(
-                        f"시가+{pct_from_open:.1f}%, "
-                        f"등락{change_rate:+.1f}%, "
-                        f"점수{score:.0f}"
+                        f"시가+{pct:.1f}%, "
+                        f"등락{chg:+.1f}%, "
+                        f"점수{sc:.0f}"
                     ),
                 ))
 
-            except Exception as e:
-                self.logger.warning(
-                    f"[스크리너] {code}({name}) Phase3 검증 오류: {e}"
-                )
-                rejected_reasons['error'] += 1
-                continue
-
-        # 점수순 정렬, 상위 N개 반환
+        # 점수순 정렬 (동점은 조회 순서 유지), 상위 N개 반환
         candidates.sort(key=lambda x: x.score, reverse=True)
         result = candidates[:max_per_scan]
 
@@ -412,59 +485,45 @@ class StockScreener:
 
         return result
 
-    def _calculate_score(
-        self,
-        pct_from_open: float,
-        change_rate: float,
-        tr_amount: int,
-        current_price: int,
-        high_price: int,
-        low_price: int,
-    ) -> float:
+    @staticmethod
+    def _score_frame(
+        pct_from_open: pd.Series,
+        change_rate: pd.Series,
+        tr_amount: pd.Series,
+        current_price: pd.Series,
+        high_price: pd.Series,
+        low_price: pd.Series,
+    ) -> pd.Series:
         """
-        스크리닝 점수 계산 (0~100)
+        스크리닝 점수 계산 (0~100, 종목별 컬럼 단위)
 
         - 시가대비 위치 (40점): sweet spot 1.5~2.5% = 만점
         - 거래대금 (30점): 500억+ = 만점
         - 당일 가격위치 (20점): 고가 근접 = 상승 추세
         - 등락률 적절성 (10점): 1~3% = 만점
         """
-        score = 0.0
-
+        p, a, c = pct_from_open, tr_amount, change_rate
         # 1. 시가대비 위치 (max 40)
-        if 1.5 <= pct_from_open <= 2.5:
-            score += 40
-        elif 1.0 <= pct_from_open < 1.5:
-            score += 30
-        elif 2.5 < pct_from_open <= 3.0:
-            score += 30
-        else:
-            score += 20
-
-        # 2. 거래대금 (max 30)
-        if tr_amount >= 50_000_000_000:      # 500억+
-            score += 30
-        elif tr_amount >= 20_000_000_000:    # 200억+
-            score += 25
-        elif tr_amount >= 10_000_000_000:    # 100억+
-            score += 20
-        elif tr_amount >= 5_000_000_000:     # 50억+
-            score += 15
-        else:
-            score += 10
-
+        pos_score = np.select(
+            [(p >= 1.5) & (p <= 2.5), (p >= 1.0) & (p < 1.5), (p > 2.5) & (p <= 3.0)],
+            [40.0, 30.0, 30.0], 20.0,
+        )
+        # 2. 거래대금 (max 30) — 500억+ / 200억+ / 100억+ / 50억+
+        amount_score = np.select(
+            [a >= 50_000_000_000, a >= 20_000_000_000, a >= 10_000_000_000, a >= 5_000_000_000],
+            [30.0, 25.0, 20.0, 15.0], 10.0,
+        )
         # 3. 당일 가격위치 (max 20) — 고가 근접 = 상승 추세
-        if high_price > low_price > 0:
-            position = (current_price - low_price) / (high_price - low_price)
-            score += position * 20
-
+        has_range = (high_price > low_price) & (low_price > 0)
+        span = (high_price - low_price).where(has_range)
+        range_score = ((current_price - low_price) / span * 20).where(has_range, 0.0)
         # 4. 등락률 적절성 (max 10)
-        if 1.0 <= change_rate <= 3.0:
-            score += 10
-        elif 0.5 <= change_rate < 1.0 or 3.0 < change_rate <= 5.0:
-            score += 5
-
-        return round(score, 1)
+        change_score = np.select(
+            [(c >= 1.0) & (c <= 3.0), ((c >= 0.5) & (c < 1.0)) | ((c > 3.0) & (c <= 5.0))],
+            [10.0, 5.0], 0.0,
+        )
+        score = 0.0 + pos_score + amount_score + range_score + change_score
+        return pd.Series(score, index=p.index).round(1)
 
     # ===== 프리로드 메서드 =====
 
@@ -731,8 +790,6 @@ class StockScreener:
                 [prev_date_iso, top_n * 2],
             )
             rows = cur.fetchall()
-            cur.close()
-            conn.close()
 
             # 의도된 sibling 차이 (Spec §G1: 백테스트 100% 재현):
             #   - sibling 의 `_added_stocks` 중복 가드 / 우선주 필터(`stock_code[-1]=='5'`)
@@ -759,6 +816,20 @@ class StockScreener:
                 if len(candidates) >= top_n:
                     break
 
+            # universe 최근 일봉 꼬리도 같은 connection 으로 일괄 조회
+            # (MACD 증분 상태 대조용 — 상태가 없는 종목만 main 에서 전체 이력 재조회)
+            from core.strategies.macd_cross_strategy import STATE_TAIL_DAYS
+            today_iso = now_kst().strftime('%Y-%m-%d')
+            codes = [c.code for c in candidates]
+            try:
+                history = self.fetch_daily_histories(cur, codes, today_iso, STATE_TAIL_DAYS)
+                self._macd_cross_history = (today_iso, set(codes), history)
+            except Exception as e:
+                self._macd_cross_history = None
+                self.logger.warning(f"[macd_cross.univ] daily history 조회 실패 (main 에서 재조회): {e}")
+            cur.close()
+            conn.close()
+
             self.logger.info(
                 f"[macd_cross.univ] preload 완료: {len(candidates)}종목 "
                 f"(date={prev_date_iso}, top_n={top_n})"
@@ -769,23 +840,54 @@ class StockScreener:
             self.logger.error(f"[macd_cross.univ] preload 실패: {e}")
             return []
 
-    # ===== 유틸리티 메서드 =====
+    @staticmethod
+    def fetch_daily_histories(cur, stock_codes: Sequence[str], before_date_iso: str,
+                              lookback: Optional[int] = None) -> pd.DataFrame:
+        """종목별 최근 lookback 거래일 일봉을 단일 윈도우 쿼리로 조회.
+
+        MACD 재계산 (증분 상태 seed 포함) 은 lookback=None (전체 이력) 으로 조회한다.
+        EWM 은 시작점에 따라 값이 달라지므로 고정 윈도우로 재계산하면 전체 이력을 따라
+        전진한 증분 상태 (및 백테스트) 와 hist 가 어긋난다.
+
+        Args:
+            cur: robotrader_quant DB cursor.
+            stock_codes: 종목 코드 목록.
+            before_date_iso: 조회 상한 (YYYY-MM-DD, 미포함).
+            lookback: 종목당 최대 일수. None 이면 before_date_iso 이전 전체.
 
-    def _extract_stock_code(self, stock: Dict) -> str:
-        """종목 코드 추출 (API 필드명 차이 대응)"""
-        for key in ('mksc_shrn_iscd', 'stck_shrn_iscd', 'shrn_iscd', 'code'):
-            val = str(stock.get(key, '')).strip()
-            if val and len(val) == 6 and val.isdigit():
-                return val
-        return ''
-
-    def _extract_stock_name(self, stock: Dict) -> str:
-        """종목명 추출 (API 필드명 차이 대응)"""
-        for key in ('hts_kor_isnm', 'kor_isnm', 'name'):
-            val = str(stock.get(key, '')).strip()
-            if val:
-                return val
-        return ''
+        Returns:
+            long-form DataFrame (stock_code, trade_date(YYYYMMDD), close, trading_value).
+        """
+        columns = ["stock_code", "trade_date", "close", "trading_value"]
+        if not stock_codes:
+            return pd.DataFrame(columns=columns)
+        cur.execute(
+            """SELECT stock_code, REPLACE(date, '-', '') AS trade_date, close, trading_value
+               FROM (
+                   SELECT stock_code, date, close, trading_value,
+                          ROW_NUMBER() OVER (PARTITION BY stock_code ORDER BY date DESC) AS rn
+                   FROM daily_prices
+                   WHERE stock_code = ANY(%s) AND date < %s AND close IS NOT NULL
+               ) t
+               WHERE %s IS NULL OR rn <= %s""",
+            [list(stock_codes), before_date_iso, lookback, lookback],
+        )
+        df = pd.DataFrame(cur.fetchall(), columns=columns)
+        df["close"] = df["close"].astype(float)
+        return df
+
+    def take_macd_cross_daily_history(self, before_date_iso: str,
+                                      stock_codes: Sequence[str]) -> Optional[pd.DataFrame]:
+        """preload 때 받아둔 daily history 반환 후 비움 (기준일이 다르거나 종목이 빠져 있으면 None)."""
+        cached, self._macd_cross_history = self._macd_cross_history, None
+        if cached is None:
+            return None
+        cached_date, cached_codes, history = cached
+        if cached_date != before_date_iso or not set(stock_codes) <= cached_codes:
+            return None
+        return history
+
+    # ===== 유틸리티 메서드 =====
 
     @staticmethod
     def _safe_int(value) -> int:
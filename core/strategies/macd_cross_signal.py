@@ -42,6 +42,50 @@ def compute_macd_histogram_series(
     return macd - sig
 
 
+def ewm_alpha(span: int) -> float:
+    """pandas ewm(span=...) 과 같은 방식으로 계산한 평활 계수."""
+    com = (span - 1) / 2.0
+    return 1.0 / (1.0 + com)
+
+
+def ewm_step(prev: float, value: float, span: int) -> float:
+    """ewm(span, adjust=False).mean() 의 1스텝 갱신.
+
+    pandas 구현과 같은 식·연산 순서를 써서 전체 재계산 결과와 비트 단위로 같다
+    (증분 MACD 상태 갱신용).
+    """
+    alpha = ewm_alpha(span)
+    old_wt = 1.0 - alpha
+    if prev != value:
+        return ((old_wt * prev) + (alpha * value)) / (old_wt + alpha)
+    return prev
+
+
+def compute_macd_histogram_matrix(
+    close: pd.DataFrame,
+    fast: int,
+    slow: int,
+    signal: int,
+) -> pd.DataFrame:
+    """compute_macd_histogram_series 의 종목 축 벡터화 버전 (universe 일괄 계산).
+
+    Args:
+        close: index=trade_date 오름차순, columns=stock_code 인 종가 행렬.
+            종목별로 봉이 없는 날(상장 전·거래정지)은 NaN.
+
+    Returns:
+        close 와 같은 모양의 histogram 행렬 (close 가 NaN 인 칸은 NaN).
+        ignore_na=True 로 NaN 칸을 건너뛰므로 각 열은 해당 종목 봉만으로 계산한
+        compute_macd_histogram_series 결과와 같다.
+    """
+    close = close.astype(float)
+    ema_fast = close.ewm(span=fast, adjust=False, ignore_na=True).mean()
+    ema_slow = close.ewm(span=slow, adjust=False, ignore_na=True).mean()
+    macd = (ema_fast - ema_slow).where(close.notna())
+    sig = macd.ewm(span=signal, adjust=False, ignore_na=True).mean()
+    return (macd - sig).where(close.notna())
+
+
 def is_macd_golden_cross(
     prev_hist: Optional[float],
     prev_prev_hist: Optional[float],
@@ -56,6 +100,21 @@ def is_macd_golden_cross(
     return prev_prev_hist < 0 and prev_hist >= 0
 
 
+def macd_golden_cross_mask(
+    prev_hist: pd.Series,
+    prev_prev_hist: pd.Series,
+) -> pd.Series:
+    """is_macd_golden_cross 의 종목 축 벡터화 버전 (동일 식, NaN → False).
+
+    Args:
+        prev_hist: 종목별 직전 거래일 hist
+        prev_prev_hist: 종목별 그 전 거래일 hist (prev_hist 와 같은 index)
+    """
+    prev_hist = pd.to_numeric(prev_hist, errors="coerce")
+    prev_prev_hist = pd.to_numeric(prev_prev_hist, errors="coerce")
+    return (prev_prev_hist < 0) & (prev_hist >= 0)
+
+
 def is_in_entry_window(hhmm: int, hhmm_min: int, hhmm_max: int) -> bool:
     """진입 시간대 검사 (HHMM int 비교)."""
     return hhmm_min <= hhmm <= hhmm_max
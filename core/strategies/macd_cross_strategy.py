@@ -9,16 +9,25 @@ Spec §4.2: 백테스트 macd_cross 의 시그널 식과 1:1 동등 보장.
 """
 from __future__ import annotations
 
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from core.strategies.macd_cross_signal import (
+    compute_macd_histogram_matrix,
     compute_macd_histogram_series,
     is_macd_golden_cross,
     is_in_entry_window,
+    macd_golden_cross_mask,
 )
 
+if TYPE_CHECKING:
+    from core.indicator_state import MacdStateStore
+
+# 증분 상태 대조에 쓰는 최근 일봉 수 (core.indicator_state.MacdStateStore.reconcile)
+STATE_TAIL_DAYS = 3
+
 
 class MacdCrossStrategy:
     """라이브 어댑터 (intraday_manager 와 결합)."""
@@ -31,6 +40,7 @@ class MacdCrossStrategy:
         entry_hhmm_min: int = 1430,
         entry_hhmm_max: int = 1500,
         logger=None,
+        state_store: Optional["MacdStateStore"] = None,
     ):
         self.fast = fast
         self.slow = slow
@@ -43,6 +53,12 @@ class MacdCrossStrategy:
         # {stock_code: (prev_close, prev_trading_value)} — feasibility 체크용 (Fix C)
         self._meta: Dict[str, Tuple[float, float]] = {}
         self._cache_date: Optional[str] = None
+        # 증분 EMA/MACD 상태 (없으면 매일 전체 재계산)
+        self.state_store = state_store
+
+    @property
+    def params(self) -> Tuple[int, int, int]:
+        return (self.fast, self.slow, self.signal)
 
     def set_daily_history(
         self,
@@ -84,6 +100,114 @@ class MacdCrossStrategy:
         except Exception:
             pass
 
+    def set_daily_histories(
+        self,
+        df_histories: pd.DataFrame,
+        today_yyyymmdd: str,
+        stock_codes: Optional[Iterable[str]] = None,
+    ) -> int:
+        """universe 전체 daily 시퀀스 일괄 주입 (set_daily_history 의 벡터화 버전).
+
+        (거래일 × 종목) 종가 행렬에 MACD 를 한 번에 계산해 종목별 prev/prev_prev hist 와
+        메타를 캐시한다. 종목별 결과는 set_daily_history 와 동일.
+
+        state_store 가 있으면 최근 STATE_TAIL_DAYS 일봉과 대조되는 종목은 저장된 상태를 쓰고
+        (df_histories 에 꼬리 구간만 있어도 됨), 나머지만 재계산한 뒤 상태를 새로 seed 한다.
+        재계산 대상 종목의 df_histories 는 전체 일봉 이력이어야 한다 (고정 윈도우로 자르면
+        전진된 상태와 hist 가 달라짐 — core.indicator_state 참고).
+
+        Args:
+            df_histories: long-form 일봉 (stock_code, trade_date, close, trading_value).
+            today_yyyymmdd: 진입 대상 거래일 (YYYYMMDD). 캐시 invalidation 키.
+            stock_codes: 캐시 주입 순서 (= universe 순위). None 이면 df_histories 등장 순서.
+        Returns:
+            캐시된 종목 수.
+        """
+        if self._cache_date != today_yyyymmdd:
+            self._cache.clear()
+            self._meta.clear()
+            self._cache_date = today_yyyymmdd
+
+        if df_histories is None or df_histories.empty:
+            return 0
+
+        d = (
+            df_histories.drop_duplicates(["stock_code", "trade_date"], keep="last")
+            .sort_values(["stock_code", "trade_date"], kind="stable")
+        )
+        last_rows = d.groupby("stock_code", sort=False).tail(1).set_index("stock_code")
+        results: Dict[str, Tuple[float, float]] = {}
+
+        # 1) 증분 상태와 대조되는 종목은 재계산 없이 사용
+        if self.state_store is not None:
+            tails = d.groupby("stock_code", sort=False).tail(STATE_TAIL_DAYS)
+            for code, tail in tails.groupby("stock_code", sort=False):
+                state = self.state_store.reconcile(
+                    code, self.params, tail["trade_date"].tolist(), tail["close"].tolist()
+                )
+                if state is not None:
+                    results[code] = (state.prev_hist, state.prev_prev_hist)
+
+        # 2) 나머지는 종가 행렬로 일괄 계산
+        close = d[~d["stock_code"].isin(results)].pivot(
+            index="trade_date", columns="stock_code", values="close"
+        ).astype(float)
+        close = close.loc[:, close.notna().sum() >= self.slow + self.signal]
+        if not close.empty:
+            hist = compute_macd_histogram_matrix(
+                close, fast=self.fast, slow=self.slow, signal=self.signal
+            ).to_numpy()
+            # 종목별 마지막 / 그 직전 유효 봉 위치 (열마다 길이가 다를 수 있음)
+            valid = ~np.isnan(hist)
+            n_rows, cols = len(hist), np.arange(hist.shape[1])
+            last = n_rows - 1 - np.argmax(valid[::-1], axis=0)
+            valid[last, cols] = False
+            second = n_rows - 1 - np.argmax(valid[::-1], axis=0)
+            for i, code in enumerate(close.columns):
+                results[code] = (float(hist[last[i], i]), float(hist[second[i], i]))
+                if self.state_store is not None:
+                    self.state_store.seed(code, self.params, d[d["stock_code"] == code])
+
+        order = list(stock_codes) if stock_codes is not None else list(pd.unique(df_histories["stock_code"]))
+        cached = 0
+        for code in order:
+            if code not in results:
+                continue
+            self._cache[code] = results[code]
+            tv = last_rows.at[code, "trading_value"]
+            self._meta[code] = (float(last_rows.at[code, "close"]), float(tv) if pd.notna(tv) else 0.0)
+            cached += 1
+        return cached
+
+    def codes_needing_history(self, df_tails: pd.DataFrame, stock_codes: Iterable[str]) -> List[str]:
+        """최근 일봉 꼬리만으로 캐시할 수 없는 (전체 일봉 재조회가 필요한) 종목.
+
+        state_store 가 없으면 전 종목. 대조 과정에서 하루 밀린 상태는 1일 전진된다.
+        """
+        codes = list(stock_codes)
+        if self.state_store is None or df_tails is None or df_tails.empty:
+            return codes
+        d = df_tails.sort_values(["stock_code", "trade_date"], kind="stable")
+        tails = {code: g.tail(STATE_TAIL_DAYS) for code, g in d.groupby("stock_code", sort=False)}
+        needed = []
+        for code in codes:
+            tail = tails.get(code)
+            if tail is None or self.state_store.reconcile(
+                code, self.params, tail["trade_date"].tolist(), tail["close"].tolist()
+            ) is None:
+                needed.append(code)
+        return needed
+
+    def advance_daily_closes(self, closes: Dict[str, float], trade_date: str) -> int:
+        """장 마감 후 당일 종가로 증분 상태 1일 전진. 전진한 종목 수 반환."""
+        if self.state_store is None:
+            return 0
+        advanced = 0
+        for code, close in closes.items():
+            if close and self.state_store.advance(code, self.params, trade_date, close) is not None:
+                advanced += 1
+        return advanced
+
     def get_cached_hist(self, stock_code: str) -> Tuple[Optional[float], Optional[float]]:
         return self._cache.get(stock_code, (None, None))
 
@@ -98,5 +222,41 @@ class MacdCrossStrategy:
         prev_hist, prev_prev_hist = self.get_cached_hist(stock_code)
         return is_macd_golden_cross(prev_hist, prev_prev_hist)
 
+    def entry_frame(self) -> pd.DataFrame:
+        """캐시된 universe 전체를 한 프레임으로 반환 (배치 진입 판정용).
+
+        index=stock_code, columns=[prev_hist, prev_prev_hist, prev_close,
+        prev_trading_value, universe_rank]. universe_rank 는 캐시 주입 순서
+        (= 거래대금 순위) 이며 백테스트와 같은 진입 우선순위로 쓰인다.
+        """
+        columns = ["prev_hist", "prev_prev_hist", "prev_close", "prev_trading_value", "universe_rank"]
+        if not self._cache:
+            return pd.DataFrame(columns=columns, dtype=float)
+        codes = list(self._cache.keys())
+        hist = [self._cache[c] for c in codes]
+        meta = [self._meta.get(c, (None, None)) for c in codes]
+        frame = pd.DataFrame(
+            {
+                "prev_hist": [h[0] for h in hist],
+                "prev_prev_hist": [h[1] for h in hist],
+                "prev_close": [m[0] for m in meta],
+                "prev_trading_value": [m[1] for m in meta],
+                "universe_rank": range(len(codes)),
+            },
+            index=pd.Index(codes, name="stock_code"),
+        )
+        return frame.astype({"prev_close": float, "prev_trading_value": float})
+
+    def check_entries(self, hhmm: int) -> pd.Series:
+        """check_entry 의 universe 일괄 버전. index=stock_code, bool."""
+        frame = self.entry_frame()
+        if frame.empty or not is_in_entry_window(hhmm, self.entry_hhmm_min, self.entry_hhmm_max):
+            return pd.Series(False, index=frame.index, dtype=bool)
+        return macd_golden_cross_mask(frame["prev_hist"], frame["prev_prev_hist"])
+
     def cached_universe_size(self) -> int:
         return len(self._cache)
+
+    def cached_codes(self) -> List[str]:
+        """캐시된 universe 종목 코드 (주입 순서)."""
+        return list(self._cache.keys())
@@ -3,14 +3,20 @@
 1분봉 데이터를 다양한 시간봉(3분, 5분 등)으로 변환하는 기능 제공
 완성된 캔들 필터링 기능 포함
 """
+import threading
+import numpy as np
 import pandas as pd
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from utils.logger import setup_logger
 
 
 class TimeFrameConverter:
     """시간봉 변환 전용 클래스"""
+
+    # (종목코드, 분) → CandleResampler (get_cached_nmin_data 용)
+    _resamplers: Dict[Tuple[str, int], 'CandleResampler'] = {}
+    _resamplers_lock = threading.Lock()
     
     def __init__(self):
         self.logger = setup_logger(__name__)
@@ -86,10 +92,24 @@ class TimeFrameConverter:
         Returns:
             3분봉 DataFrame 또는 None (완성된 봉만 포함)
         """
+        return TimeFrameConverter._convert_floor(data, 3)
+
+    @staticmethod
+    def _convert_floor(data: pd.DataFrame, interval_minutes: int,
+                       now: Optional[datetime] = None) -> Optional[pd.DataFrame]:
+        """
+        1분봉 → N분봉 전체 변환 (floor 방식, 완성된 봉만, candle_count 포함)
+
+        Args:
+            data: 1분봉 DataFrame
+            interval_minutes: 시간봉 (분)
+            now: 완성 여부 판단 기준 시각 (기본: 현재 KST)
+        """
         logger = setup_logger(__name__)
+        freq = f'{interval_minutes}min'
         
         try:
-            if data is None or len(data) < 3:
+            if data is None or len(data) < interval_minutes:
                 return None
             
             df = data.copy()
@@ -113,14 +133,14 @@ class TimeFrameConverter:
             df['datetime'] = pd.to_datetime(df['datetime'])
             df = df.set_index('datetime')
             
-            # floor 방식으로 3분봉 경계 계산 (signal_replay와 동일)
-            df['floor_3min'] = df.index.floor('3min')
+            # floor 방식으로 N분봉 경계 계산 (signal_replay와 동일)
+            df['floor_nmin'] = df.index.floor(freq)
 
-            # 🆕 각 3분봉의 1분봉 개수 카운트 (HTS 분봉 누락 감지)
-            candle_counts = df.groupby('floor_3min').size()
+            # 🆕 각 N분봉의 1분봉 개수 카운트 (HTS 분봉 누락 감지)
+            candle_counts = df.groupby('floor_nmin').size()
 
-            # 3분 구간별로 그룹핑하여 OHLCV 계산
-            resampled = df.groupby('floor_3min').agg({
+            # N분 구간별로 그룹핑하여 OHLCV 계산
+            resampled = df.groupby('floor_nmin').agg({
                 'open': 'first',
                 'high': 'max',
                 'low': 'min',
@@ -128,18 +148,20 @@ class TimeFrameConverter:
                 'volume': 'sum'
             }).reset_index()
 
-            resampled = resampled.rename(columns={'floor_3min': 'datetime'})
+            resampled = resampled.rename(columns={'floor_nmin': 'datetime'})
 
-            # 🆕 각 3분봉의 구성 분봉 개수 추가
+            # 🆕 각 N분봉의 구성 분봉 개수 추가
             resampled['candle_count'] = resampled['datetime'].map(candle_counts)
             
             # 현재 시간 기준으로 완성된 봉만 필터링
-            from utils.korean_time import now_kst
-            current_time = now_kst()
+            if now is None:
+                from utils.korean_time import now_kst
+                now = now_kst()
+            current_time = now
             
             try:
                 # pandas Timestamp로 변환하고 타임존 정보 처리
-                current_3min_floor = pd.Timestamp(current_time).floor('3min')
+                current_floor = pd.Timestamp(current_time).floor(freq)
                 
                 # resampled datetime과 같은 형태로 맞추기
                 if not resampled.empty:
@@ -147,16 +169,16 @@ class TimeFrameConverter:
                     resampled['datetime'] = pd.to_datetime(resampled['datetime'])
                     
                     # 타임존 정보 일치시키기
-                    if resampled['datetime'].dt.tz is None and hasattr(current_3min_floor, 'tz') and current_3min_floor.tz is not None:
+                    if resampled['datetime'].dt.tz is None and hasattr(current_floor, 'tz') and current_floor.tz is not None:
                         # resampled가 naive, current가 timezone aware인 경우
-                        current_3min_floor = current_3min_floor.tz_localize(None)
-                    elif resampled['datetime'].dt.tz is not None and (not hasattr(current_3min_floor, 'tz') or current_3min_floor.tz is None):
+                        current_floor = current_floor.tz_localize(None)
+                    elif resampled['datetime'].dt.tz is not None and (not hasattr(current_floor, 'tz') or current_floor.tz is None):
                         # resampled가 timezone aware, current가 naive인 경우  
-                        current_3min_floor = pd.Timestamp(current_3min_floor).tz_localize(resampled['datetime'].dt.tz.iloc[0])
+                        current_floor = pd.Timestamp(current_floor).tz_localize(resampled['datetime'].dt.tz.iloc[0])
                 
-                # 현재 진행중인 3분봉은 제외 (완성되지 않았으므로)
+                # 현재 진행중인 N분봉은 제외 (완성되지 않았으므로)
                 completed_data = resampled[
-                    resampled['datetime'] < current_3min_floor
+                    resampled['datetime'] < current_floor
                 ].copy()
                 
             except Exception as compare_error:
@@ -164,13 +186,48 @@ class TimeFrameConverter:
                 logger.warning(f"시간 비교 오류로 필터링 생략: {compare_error}")
                 completed_data = resampled.copy()
             
-            #logger.debug(f"📊 floor 방식 3분봉 변환: {len(data)}개 → {len(resampled)}개 (완성된 봉: {len(completed_data)}개)")
+            #logger.debug(f"📊 floor 방식 {interval_minutes}분봉 변환: {len(data)}개 → {len(resampled)}개 (완성된 봉: {len(completed_data)}개)")
             
             return completed_data
             
         except Exception as e:
-            logger.error(f"❌ floor 방식 3분봉 변환 오류: {e}")
+            logger.error(f"❌ floor 방식 {interval_minutes}분봉 변환 오류: {e}")
             return None
+
+    @classmethod
+    def get_cached_nmin_data(cls, stock_code: str, data: pd.DataFrame, interval_minutes: int = 3,
+                             now: Optional[datetime] = None) -> Optional[pd.DataFrame]:
+        """
+        종목별 증분 N분봉 (convert_to_3min_data 와 동일 스키마, 완성된 봉만)
+
+        종목마다 CandleResampler 를 유지해 이전 호출 이후 새로 들어온
+        1분봉만 반영한다. 같은 종목의 당일 1분봉을 반복 변환하는 곳에서 사용.
+
+        Args:
+            stock_code: 종목코드
+            data: 해당 종목의 당일 1분봉 DataFrame (시간 오름차순)
+            interval_minutes: 시간봉 (분, 기본 3)
+            now: 완성 여부 판단 기준 시각 (기본: 현재 KST)
+        """
+        key = (stock_code, interval_minutes)
+        with cls._resamplers_lock:
+            resampler = cls._resamplers.get(key)
+            if resampler is None:
+                resampler = cls._resamplers[key] = CandleResampler(interval_minutes)
+        return resampler.update(data, now=now)
+
+    @classmethod
+    def clear_cache(cls, stock_code: Optional[str] = None) -> None:
+        """증분 N분봉 캐시 초기화 (stock_code 없으면 전체)
+
+        이미 확정된 구간의 1분봉을 수정(재조회 보정 등)한 경우 호출한다.
+        """
+        with cls._resamplers_lock:
+            if stock_code is None:
+                cls._resamplers.clear()
+            else:
+                for key in [k for k in cls._resamplers if k[0] == stock_code]:
+                    del cls._resamplers[key]
     
     @staticmethod
     def convert_to_5min_data_hts_style(data: pd.DataFrame) -> Optional[pd.DataFrame]:
@@ -391,4 +448,183 @@ class TimeFrameConverter:
                 
         except Exception as e:
             logger.error(f"완성된 캔들 필터링 오류: {e}")
-            return chart_data  # 오류 시 원본 반환
\ No newline at end of file
+            return chart_data  # 오류 시 원본 반환
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+class CandleResampler:
+    """
+    1분봉 → N분봉 증분 변환기 (종목 1개 분량)
+
+    convert_to_3min_data 는 호출마다 당일 1분봉 전체를 복사/floor/groupby 한다.
+    CandleResampler 는 뒤에 다른 구간의 1분봉이 들어와 확정된 N분봉을 보관하고,
+    이후 호출에서는 새로 추가된 1분봉만 접어 넣는다 (진행 중인 마지막 구간만 재계산).
+
+    - 입력은 시간 오름차순 1분봉 (이전 호출 데이터 + 뒤에 추가된 행)
+    - 확정 구간 마지막 몇 개 행이 바뀌었거나 앞부분이 달라지면 자동으로 전체 재계산
+    - 그보다 오래된 행을 수정했다면 reset() (종목 캐시는 TimeFrameConverter.clear_cache)
+    - datetime 컬럼이 없거나 정렬/중복 문제가 있으면 기존 전체 변환으로 처리
+    """
+
+    # 확정 구간 끝에서 재검증할 1분봉 수 (실시간 갱신은 최근 2개 분봉을 덮어씀)
+    REVALIDATE_ROWS = 5
+
+    def __init__(self, interval_minutes: int = 3):
+        self.interval = interval_minutes
+        self._bucket_ns = interval_minutes * 60 * 1_000_000_000
+        self._lock = threading.Lock()
+        self.logger = setup_logger(__name__)
+        self.reset()
+
+    def reset(self) -> None:
+        """누적 상태 초기화"""
+        self._rows = 0  # 확정 N분봉에 반영된 1분봉 행 수
+        self._first_ns: Optional[int] = None
+        self._signature: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._tz = None
+        self._dtypes: Dict[str, np.dtype] = {}
+        self._starts: List[int] = []  # 확정 N분봉 시작 시각 (wall-clock ns)
+        self._bars: List[Tuple[float, float, float, float, float, int]] = []
+
+    def __len__(self) -> int:
+        """확정된 N분봉 개수"""
+        return len(self._starts)
+
+    @staticmethod
+    def _wall_ns(series: pd.Series) -> np.ndarray:
+        """datetime 컬럼 → wall-clock 기준 int64 ns (타임존은 제거)"""
+        dt = pd.to_datetime(series)
+        if dt.dt.tz is not None:
+            dt = dt.dt.tz_localize(None)
+        return dt.to_numpy(dtype='datetime64[ns]').astype(np.int64)
+
+    def _row_signature(self, data: pd.DataFrame, lo: int, hi: int) -> Tuple[np.ndarray, np.ndarray]:
+        part = data.iloc[lo:hi]
+        return self._wall_ns(part['datetime']), part[OHLCV_COLUMNS].to_numpy(dtype=np.float64)
+
+    def _prefix_unchanged(self, data: pd.DataFrame) -> bool:
+        """이미 반영한 구간(앞 _rows 행)이 그대로인지 확인 (첫 행 + 확정 구간 끝 몇 행)"""
+        if len(data) < self._rows:
+            return False
+        if int(self._wall_ns(data['datetime'].iloc[:1])[0]) != self._first_ns:
+            return False
+        lo = max(0, self._rows - self.REVALIDATE_ROWS)
+        ns, values = self._row_signature(data, lo, self._rows)
+        old_ns, old_values = self._signature
+        return np.array_equal(ns, old_ns) and np.array_equal(values, old_values)
+
+    def _fold(self, data: pd.DataFrame) -> Optional[Tuple[int, Tuple]]:
+        """_rows 이후 행을 접어 넣고 진행 중 구간 (시작 ns, bar) 반환. 처리 불가 시 False."""
+        tail = data.iloc[self._rows:]
+        if tail.empty:
+            return None
+
+        ns = self._wall_ns(tail['datetime'])
+        if len(ns) > 1 and (np.diff(ns) <= 0).any():
+            return False  # 정렬 안 됨/중복 분봉
+        if self._starts and ns[0] < self._starts[-1] + self._bucket_ns:
+            return False
+
+        keys = ns - ns % self._bucket_ns
+        seg_starts = np.concatenate(([0], np.flatnonzero(np.diff(keys)) + 1))
+        seg_ends = np.append(seg_starts[1:], len(ns))
+        values = tail[OHLCV_COLUMNS].to_numpy(dtype=np.float64)
+
+        highs = np.maximum.reduceat(values[:, 1], seg_starts)
+        lows = np.minimum.reduceat(values[:, 2], seg_starts)
+        volumes = np.add.reduceat(values[:, 4], seg_starts)
+        opens = values[seg_starts, 0]
+        closes = values[seg_ends - 1, 3]
+        counts = seg_ends - seg_starts
+
+        bars = [
+            (opens[i], highs[i], lows[i], closes[i], volumes[i], int(counts[i]))
+            for i in range(len(seg_starts))
+        ]
+
+        # 마지막 구간은 뒤에 1분봉이 더 들어올 수 있으므로 확정하지 않음
+        if len(bars) > 1:
+            self._starts.extend(int(k) for k in keys[seg_starts[:-1]])
+            self._bars.extend(bars[:-1])
+            self._rows += int(seg_starts[-1])
+            lo = max(0, self._rows - self.REVALIDATE_ROWS)
+            self._signature = self._row_signature(data, lo, self._rows)
+
+        return int(keys[seg_starts[-1]]), bars[-1]
+
+    def _now_floor_ns(self, now: Optional[datetime]) -> int:
+        if now is None:
+            from utils.korean_time import now_kst
+            now = now_kst()
+        ts = pd.Timestamp(now)
+        if ts.tz is not None:
+            if self._tz is not None:
+                ts = ts.tz_convert(self._tz)
+            ts = ts.tz_localize(None)
+        return ts.floor(f'{self.interval}min').value
+
+    def _build_frame(self, pending: Optional[Tuple[int, Tuple]], now: Optional[datetime]) -> pd.DataFrame:
+        starts = list(self._starts)
+        bars = list(self._bars)
+        if pending:
+            starts.append(pending[0])
+            bars.append(pending[1])
+
+        # 완성된 봉만 (현재 진행 중인 N분봉 제외)
+        cut = int(np.searchsorted(np.asarray(starts, dtype=np.int64), self._now_floor_ns(now), side='left'))
+        starts, bars = starts[:cut], bars[:cut]
+
+        dt = pd.to_datetime(np.asarray(starts, dtype=np.int64).astype('datetime64[ns]'))
+        if self._tz is not None:
+            dt = dt.tz_localize(self._tz)
+        table = np.asarray(bars, dtype=np.float64).reshape(len(bars), len(OHLCV_COLUMNS) + 1)
+
+        frame = pd.DataFrame({'datetime': dt})
+        for i, col in enumerate(OHLCV_COLUMNS):
+            values = table[:, i]
+            dtype = self._dtypes.get(col)
+            if dtype is not None and dtype.kind in 'iu':
+                values = values.astype(dtype)
+            frame[col] = values
+        frame['candle_count'] = table[:, -1].astype(np.int64)
+        return frame
+
+    def update(self, data: pd.DataFrame, now: Optional[datetime] = None) -> Optional[pd.DataFrame]:
+        """
+        1분봉 데이터 반영 후 완성된 N분봉 반환
+
+        Args:
+            data: 1분봉 DataFrame (datetime + OHLCV, 시간 오름차순)
+            now: 완성 여부 판단 기준 시각 (기본: 현재 KST)
+
+        Returns:
+            convert_to_3min_data 와 같은 스키마의 DataFrame
+            (datetime, open, high, low, close, volume, candle_count) 또는 None
+        """
+        if data is None or len(data) < self.interval:
+            return None
+        if 'datetime' not in data.columns:
+            return TimeFrameConverter._convert_floor(data, self.interval, now)
+
+        with self._lock:
+            try:
+                if self._rows and not self._prefix_unchanged(data):
+                    self.reset()
+                if not self._rows:
+                    self.reset()
+                    first = pd.to_datetime(data['datetime'].iloc[:1])
+                    self._tz = first.dt.tz
+                    self._first_ns = int(self._wall_ns(first)[0])
+                    self._dtypes = {col: data[col].dtype for col in OHLCV_COLUMNS}
+
+                pending = self._fold(data)
+                if pending is False:
+                    self.reset()
+                    return TimeFrameConverter._convert_floor(data, self.interval, now)
+                return self._build_frame(pending, now)
+
+            except Exception as e:
+                self.logger.error(f"❌ 증분 {self.interval}분봉 변환 오류: {e}")
+                self.reset()
+                return TimeFrameConverter._convert_floor(data, self.interval, now)
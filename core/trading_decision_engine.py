@@ -1,7 +1,7 @@
 """
 매매 판단 엔진 - 전략 기반 매수/매도 의사결정
 """
-from typing import Tuple, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any, List
 import pandas as pd
 from datetime import datetime
 
@@ -192,6 +192,7 @@ class TradingDecisionEngine:
             from config.strategy_settings import StrategySettings
             if (StrategySettings.ACTIVE_STRATEGY == 'macd_cross'
                     or StrategySettings.PAPER_STRATEGY == 'macd_cross'):
+                from core.indicator_state import MacdStateStore
                 from core.strategies.macd_cross_strategy import MacdCrossStrategy
                 cfg = StrategySettings.MacdCross
                 self.macd_cross_strategy = MacdCrossStrategy(
@@ -201,6 +202,7 @@ class TradingDecisionEngine:
                     entry_hhmm_min=cfg.ENTRY_HHMM_MIN,
                     entry_hhmm_max=cfg.ENTRY_HHMM_MAX,
                     logger=self.logger,
+                    state_store=MacdStateStore.load(),
                 )
                 mode = ('실거래' if StrategySettings.ACTIVE_STRATEGY == 'macd_cross'
                         and not cfg.VIRTUAL_ONLY else '가상')
@@ -281,7 +283,7 @@ class TradingDecisionEngine:
                             day_open: float, pct_from_open: float) -> float:
         """프리로드 진입 시점 간이 점수 계산 (max 90, change_rate 제외).
 
-        stock_screener._calculate_score와 동일 가중치이나 전일종가 없는 상황에서
+        StockScreener._score_frame 과 동일 가중치이나 전일종가 없는 상황에서
         change_rate 항목(10점)은 제외. 실효 임계값은 원 T70 대비 65~67 수준이 근사.
         """
         score = 0.0
@@ -555,6 +557,58 @@ class TradingDecisionEngine:
             self.logger.error(f"❌ {trading_stock.stock_code} 매수 판단 오류: {e}")
             return False, f"오류: {e}", {'buy_price': 0, 'quantity': 0, 'max_buy_amount': 0}
     
+    def analyze_buy_decisions_batch(self, price_panel, hhmm: int) -> List[Dict[str, Any]]:
+        """macd_cross universe 전체 매수 판단 (종목 축 벡터화 1회 계산)
+
+        종목별 analyze_buy_decision 반복 대신 캐시된 일봉 hist + 현재가 패널로
+        골든크로스 / 가격 유효성 / 상한가 buffer 가드를 한 번에 판정한다.
+        자금·일일 한도·당일 중복 진입처럼 순차 상태가 필요한 검사는 호출 측 몫.
+
+        Args:
+            price_panel: {stock_code: 현재가} dict 또는 Series (분봉 마감 시점 가격)
+            hhmm: 판정 시각 (HHMM int)
+
+        Returns:
+            진입 후보 리스트 (universe_rank 오름차순 = 거래대금 순위, 백테스트 우선순위와 동일)
+            [{'stock_code', 'current_price', 'prev_close', 'prev_trading_value',
+              'prev_hist', 'universe_rank'}, ...]
+        """
+        strategy = self.macd_cross_strategy
+        if strategy is None:
+            return []
+        try:
+            from backtests.common.execution_model import LIMIT_PRICE_BUFFER, PRICE_LIMIT_RATIO
+
+            entries = strategy.check_entries(hhmm)
+            if not entries.any():
+                return []
+            frame = strategy.entry_frame()[entries]
+
+            prices = pd.to_numeric(pd.Series(price_panel, dtype=object), errors='coerce')
+            frame = frame.assign(current_price=prices.reindex(frame.index))
+            frame = frame[frame['current_price'] > 0]
+
+            # ExecutionModel.is_price_limit_safe(side="buy") 동일 식 — prev_close 없으면 통과
+            upper_guard = frame['prev_close'] * (1 + PRICE_LIMIT_RATIO) * (1 - LIMIT_PRICE_BUFFER)
+            has_prev_close = frame['prev_close'].fillna(0) > 0
+            frame = frame[~has_prev_close | (frame['current_price'] < upper_guard)]
+
+            frame = frame.sort_values('universe_rank', kind='stable')
+            return [
+                {
+                    'stock_code': code,
+                    'current_price': float(row.current_price),
+                    'prev_close': None if pd.isna(row.prev_close) else float(row.prev_close),
+                    'prev_trading_value': None if pd.isna(row.prev_trading_value) else float(row.prev_trading_value),
+                    'prev_hist': float(row.prev_hist),
+                    'universe_rank': int(row.universe_rank),
+                }
+                for code, row in zip(frame.index, frame.itertuples(index=False))
+            ]
+        except Exception as e:
+            self.logger.error(f"❌ macd_cross 배치 매수 판단 오류: {e}")
+            return []
+
     # set_buy_cooldown 메서드 제거: TradingStock 모델에서 last_buy_time으로 관리
     
     def _get_max_buy_amount(self, stock_code: str = "") -> float:
@@ -0,0 +1,96 @@
+"""PostgreSQL COPY 기반 대량 적재 헬퍼.
+
+행 단위 iterrows + execute_batch INSERT 대신, DataFrame 컬럼(NumPy 배열)을 한 번에
+COPY text 포맷 버퍼로 직렬화해 `COPY ... FROM STDIN` 으로 임시 스테이징 테이블에 넣고,
+`INSERT ... SELECT ... ON CONFLICT` 한 문장으로 대상 테이블에 upsert 한다.
+
+- 커서만 받으므로 커밋/롤백은 호출자 트랜잭션을 그대로 따른다.
+- 스테이징 테이블은 ON COMMIT DROP 임시 테이블 (같은 트랜잭션에서 재호출 시 재생성).
+- 정수형(BIGINT/INTEGER) 대상 컬럼에는 정수 dtype 으로 넘겨야 한다 ('1.0' 은 COPY 에서 거부).
+"""
+import io
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+NULL = '\\N'
+_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def _format_column(series: pd.Series) -> List[str]:
+    """컬럼 하나를 COPY text 필드 문자열 리스트로 변환 (결측 → \\N)"""
+    missing = series.isna().to_numpy()
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+        values = series.dt.strftime('%Y-%m-%d %H:%M:%S').to_numpy(dtype=object)
+    elif pd.api.types.is_numeric_dtype(series):
+        values = series.astype(str).to_numpy(dtype=object)
+    else:
+        values = np.array(
+            [str(v).translate(_ESCAPES) for v in series.to_numpy(dtype=object)],
+            dtype=object,
+        )
+
+    if missing.any():
+        values[missing] = NULL
+    return values.tolist()
+
+
+def dataframe_to_copy_buffer(df: pd.DataFrame, columns: Optional[Sequence[str]] = None) -> io.StringIO:
+    """DataFrame → COPY text 포맷(탭 구분, \\N = NULL) 버퍼"""
+    columns = list(columns) if columns is not None else list(df.columns)
+    formatted = [_format_column(df[col]) for col in columns]
+    buf = io.StringIO()
+    if len(df):
+        buf.write('\n'.join(map('\t'.join, zip(*formatted))))
+        buf.write('\n')
+    buf.seek(0)
+    return buf
+
+
+def copy_upsert(cur, table: str, df: pd.DataFrame, key_columns: Sequence[str],
+                on_conflict: str = 'update', columns: Optional[Sequence[str]] = None) -> int:
+    """df 를 table 에 COPY + 스테이징 테이블 upsert
+
+    Args:
+        cur: psycopg2 커서 (호출자 트랜잭션 안에서 실행)
+        table: 대상 테이블 (key_columns 에 UNIQUE/PK 제약 필요)
+        df: 적재할 데이터 (컬럼명 = 대상 테이블 컬럼명)
+        key_columns: ON CONFLICT 키
+        on_conflict: 'update' (키 중복 시 나머지 컬럼 갱신, 마지막 행 우선)
+                     또는 'nothing' (기존 행 유지, 첫 행 우선)
+        columns: 적재할 컬럼 (None 이면 df 전체 컬럼)
+
+    Returns:
+        스테이징 테이블에 COPY 된 행 수
+    """
+    if on_conflict not in ('update', 'nothing'):
+        raise ValueError(f"on_conflict must be 'update' or 'nothing': {on_conflict}")
+    if df is None or df.empty:
+        return 0
+
+    columns = list(columns) if columns is not None else list(df.columns)
+    key_columns = list(key_columns)
+
+    # 한 INSERT 안에서 같은 키가 두 번 나오면 ON CONFLICT DO UPDATE 가 실패하므로 미리 제거
+    keep = 'last' if on_conflict == 'update' else 'first'
+    df = df.drop_duplicates(subset=key_columns, keep=keep)
+
+    stage = f'_stage_{table}'
+    col_list = ', '.join(columns)
+    if on_conflict == 'update':
+        updates = [c for c in columns if c not in key_columns]
+        action = ('DO UPDATE SET ' + ', '.join(f'{c} = EXCLUDED.{c}' for c in updates)
+                  if updates else 'DO NOTHING')
+    else:
+        action = 'DO NOTHING'
+
+    cur.execute(f'DROP TABLE IF EXISTS {stage}')
+    cur.execute(f'CREATE TEMP TABLE {stage} ON COMMIT DROP AS SELECT {col_list} FROM {table} WITH NO DATA')
+    cur.copy_expert(f'COPY {stage} ({col_list}) FROM STDIN', dataframe_to_copy_buffer(df, columns))
+    cur.execute(
+        f'INSERT INTO {table} ({col_list}) SELECT {col_list} FROM {stage} '
+        f'ON CONFLICT ({", ".join(key_columns)}) {action}'
+    )
+    return len(df)
@@ -13,6 +13,8 @@ from dataclasses import dataclass
 
 from core.candidate_selector import CandidateStock
 from db._connection import ConnectionPool
+from db.bulk_copy import copy_upsert
+from db.trade_ledger import get_trade_ledger
 from utils.logger import setup_logger
 from utils.korean_time import now_kst
 
@@ -255,28 +257,21 @@ class DatabaseManager:
                     AND date_time <= %s
                 ''', (stock_code, start_datetime, end_datetime))
 
-                rows = []
-                for _, row in df_minute.iterrows():
-                    rows.append((
-                        stock_code,
-                        row['datetime'].strftime('%Y-%m-%d %H:%M:%S'),
-                        row['open'],
-                        row['high'],
-                        row['low'],
-                        row['close'],
-                        row['volume'],
-                        now_kst().strftime('%Y-%m-%d %H:%M:%S')
-                    ))
-
-                if rows:
-                    psycopg2.extras.execute_batch(
-                        cur,
-                        '''INSERT INTO stock_prices
-                        (stock_code, date_time, open_price, high_price, low_price, close_price, volume, created_at)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)''',
-                        rows,
-                        page_size=500,
-                    )
+                copy_upsert(
+                    cur, 'stock_prices',
+                    pd.DataFrame({
+                        'stock_code': stock_code,
+                        'date_time': pd.to_datetime(df_minute['datetime']),
+                        'open_price': df_minute['open'].astype(float),
+                        'high_price': df_minute['high'].astype(float),
+                        'low_price': df_minute['low'].astype(float),
+                        'close_price': df_minute['close'].astype(float),
+                        # volume 은 BIGINT — COPY 는 '1.0' 을 받지 않으므로 반올림 후 정수로
+                        'volume': df_minute['volume'].astype(float).round().astype('Int64'),
+                        'created_at': now_kst().strftime('%Y-%m-%d %H:%M:%S'),
+                    }),
+                    key_columns=['stock_code', 'date_time'],
+                )
 
             self.logger.debug(f"{stock_code} 1분봉 데이터 {len(df_minute)}개 저장 ({date_str})")
             return True
@@ -485,6 +480,8 @@ class DatabaseManager:
                     now_kst().strftime('%Y-%m-%d %H:%M:%S')
                 ))
                 new_id = cur.fetchone()[0]
+            get_trade_ledger().record_buy('real', new_id, stock_code, stock_name, quantity, price,
+                                          timestamp, strategy, reason)
             self.logger.info(f"✅ 실거래 매수 기록 저장: {stock_code} {quantity}주 @{price:,.0f}")
             return new_id
         except Exception as e:
@@ -537,6 +534,7 @@ class DatabaseManager:
                      profit_loss, profit_rate, fee_amount, net_profit, net_profit_rate,
                      buy_record_id, created_at)
                     VALUES (%s, %s, 'SELL', %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    RETURNING id
                 ''', (
                     stock_code, stock_name, quantity, price,
                     timestamp.strftime('%Y-%m-%d %H:%M:%S'), strategy, reason,
@@ -544,6 +542,8 @@ class DatabaseManager:
                     buy_record_id,
                     now_kst().strftime('%Y-%m-%d %H:%M:%S')
                 ))
+                sell_id = cur.fetchone()[0]
+            get_trade_ledger().record_sell('real', sell_id, strategy, timestamp, net_profit, buy_record_id)
 
             self.logger.info(
                 f"✅ 실거래 매도 기록 저장: {stock_code} {quantity}주 @{price:,.0f} "
@@ -678,6 +678,8 @@ class DatabaseManager:
                       timestamp.strftime('%Y-%m-%d %H:%M:%S'), strategy, reason,
                       now_kst().strftime('%Y-%m-%d %H:%M:%S')))
                 new_id = cur.fetchone()[0]
+            get_trade_ledger().record_buy('virtual', new_id, stock_code, stock_name, quantity, price,
+                                          timestamp, strategy, reason)
 
             self.logger.info(f"🔥 가상 매수 기록 저장: {stock_code}({stock_name}) {quantity}주 @{price:,.0f}원 - {strategy}")
             return new_id
@@ -716,10 +718,14 @@ class DatabaseManager:
                     (stock_code, stock_name, action, quantity, price, timestamp, strategy, reason,
                      is_test, profit_loss, profit_rate, buy_record_id, created_at)
                     VALUES (%s, %s, 'SELL', %s, %s, %s, %s, %s, TRUE, %s, %s, %s, %s)
+                    RETURNING id
                 ''', (stock_code, stock_name, quantity, price,
                       timestamp.strftime('%Y-%m-%d %H:%M:%S'), strategy, reason,
                       profit_loss, profit_rate, buy_record_id,
                       now_kst().strftime('%Y-%m-%d %H:%M:%S')))
+                sell_id = cur.fetchone()[0]
+            get_trade_ledger().record_sell('virtual', sell_id, strategy, timestamp,
+                                           float(profit_loss), buy_record_id)
 
             profit_sign = "+" if profit_loss >= 0 else ""
             self.logger.info(f"📉 가상 매도 기록 저장: {stock_code}({stock_name}) {quantity}주 @{price:,.0f}원 - "
@@ -0,0 +1,225 @@
+"""
+인메모리 거래 원장 (실거래 / 가상거래)
+
+macd_cross 진입 창(14:31~15:00)에서는 매 사이클마다 종목별로 "오늘 이미 매수했는지",
+"오늘 매수 건수", "미청산 포지션" 을 real/virtual_trading_records 에 직접 조회했다
+(후보 종목 수 × 사이클 수 만큼의 DB 왕복). 청산 태스크와 킬 스위치도 같은 테이블을 매번 스캔했다.
+
+TradeLedger 는 시작 시 DB 에서 한 번 적재한 뒤 DatabaseManager.save_real_*/save_virtual_*
+가 INSERT 를 커밋할 때마다 같은 레코드를 메모리에 반영한다. 조회는 전부 메모리에서 처리.
+
+- 적재 범위: 미청산 BUY + 오늘 BUY + 전체 SELL 손익 (전략별 시간순)
+- 레코드 id 기준 중복 반영 무시 (적재와 저장이 겹쳐도 이중 집계 없음)
+- 적재 전에는 record_* 를 무시 (적재 시 DB 에서 함께 읽힘)
+- timestamp 는 tz 제거한 KST naive datetime 으로 정규화
+
+Usage:
+    ledger = get_trade_ledger()
+    ledger.ensure_loaded(db_manager)
+    ledger.has_buy_today('virtual', 'macd_cross', '005930')
+    ledger.open_positions('real', strategy='macd_cross')
+"""
+import bisect
+import threading
+from collections import Counter
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.korean_time import now_kst
+from utils.logger import setup_logger
+
+BOOKS = ('real', 'virtual')
+
+# 테이블별 조건 (virtual 은 is_test 레코드만 포지션으로 취급 — get_virtual_open_positions 와 동일)
+_TABLES = {
+    'real': ('real_trading_records', '', 'net_profit'),
+    'virtual': ('virtual_trading_records', 'AND b.is_test = TRUE', 'profit_loss'),
+}
+
+
+def _normalize_ts(ts: Any) -> Optional[datetime]:
+    """DB/호출자 timestamp → KST naive datetime"""
+    if ts is None:
+        return None
+    if isinstance(ts, str):
+        return datetime.strptime(ts[:19], '%Y-%m-%d %H:%M:%S')
+    if getattr(ts, 'tzinfo', None) is not None:
+        ts = ts.replace(tzinfo=None)
+    return ts
+
+
+class _Book:
+    """실거래 또는 가상거래 한쪽의 원장 상태"""
+
+    def __init__(self):
+        self.open_buys: Dict[int, Dict[str, Any]] = {}            # buy id → 레코드
+        self.buy_ids: set = set()
+        self.buys_by_day: Dict[date, Dict[str, Counter]] = {}      # 일자 → strategy → 종목별 BUY 건수
+        self.sells: Dict[str, List[Tuple[datetime, int, float]]] = {}  # strategy → (ts, id, 손익) 시간순
+        self.sell_ids: set = set()
+
+    def add_buy(self, record: Dict[str, Any]) -> None:
+        if record['id'] in self.buy_ids:
+            return
+        self.buy_ids.add(record['id'])
+        self.open_buys[record['id']] = record
+        ts = record['timestamp']
+        if ts is not None:
+            by_strategy = self.buys_by_day.setdefault(ts.date(), {})
+            by_strategy.setdefault(record['strategy'], Counter())[record['stock_code']] += 1
+
+    def add_sell(self, sell_id: Optional[int], strategy: str, timestamp: datetime,
+                 pnl: Optional[float], buy_record_id: Optional[int]) -> None:
+        if sell_id is not None:
+            if sell_id in self.sell_ids:
+                return
+            self.sell_ids.add(sell_id)
+        if buy_record_id is not None:
+            self.open_buys.pop(int(buy_record_id), None)
+        if pnl is not None and timestamp is not None:
+            bisect.insort(self.sells.setdefault(strategy, []), (timestamp, sell_id or 0, float(pnl)))
+
+
+class TradeLedger:
+    """실거래/가상거래 인메모리 원장 (스레드 안전)"""
+
+    def __init__(self):
+        self.logger = setup_logger(__name__)
+        self._lock = threading.RLock()
+        self._books: Dict[str, _Book] = {book: _Book() for book in BOOKS}
+        self._loaded = False
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    # 적재
+    def load(self, db_manager) -> None:
+        """DB 에서 원장 적재 (기존 상태 교체). DB 오류는 호출자에게 전파."""
+        today = now_kst().strftime('%Y-%m-%d')
+        with self._lock:
+            books = {book: _Book() for book in BOOKS}
+            for book, (table, extra_where, pnl_col) in _TABLES.items():
+                buys = db_manager._fetchall(f'''
+                    SELECT b.id, b.stock_code, b.stock_name, b.quantity, b.price,
+                           b.timestamp, b.strategy, b.reason
+                    FROM {table} b
+                    WHERE b.action = 'BUY' {extra_where}
+                      AND (DATE(b.timestamp) = %s OR NOT EXISTS (
+                        SELECT 1 FROM {table} s
+                        WHERE s.buy_record_id = b.id AND s.action = 'SELL'
+                      ))
+                ''', (today,))
+                for r in buys or []:
+                    books[book].add_buy(self._buy_record(
+                        r[0], r[1], r[2], r[3], r[4], r[5], r[6], r[7]))
+                sells = db_manager._fetchall(f'''
+                    SELECT id, strategy, timestamp, {pnl_col}, buy_record_id
+                    FROM {table}
+                    WHERE action = 'SELL'
+                ''')
+                for r in sells or []:
+                    books[book].add_sell(int(r[0]), r[1] or '', _normalize_ts(r[2]),
+                                         None if r[3] is None else float(r[3]), r[4])
+            self._books = books
+            self._loaded = True
+        self.logger.info(
+            f"📒 거래 원장 적재: 실거래 미청산 {len(books['real'].open_buys)}건, "
+            f"가상 미청산 {len(books['virtual'].open_buys)}건"
+        )
+
+    def ensure_loaded(self, db_manager) -> None:
+        """미적재 상태면 적재 (실패 시 예외 — 호출자의 DB 오류 처리 경로를 그대로 탄다)"""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self.load(db_manager)
+
+    # 반영 (DatabaseManager 저장 성공 직후 호출)
+    @staticmethod
+    def _buy_record(record_id, stock_code, stock_name, quantity, price,
+                    timestamp, strategy, reason) -> Dict[str, Any]:
+        return {
+            'id': int(record_id),
+            'stock_code': stock_code,
+            'stock_name': stock_name,
+            'quantity': int(quantity),
+            'price': float(price),
+            'timestamp': _normalize_ts(timestamp),
+            'strategy': strategy or '',
+            'reason': reason or '',
+        }
+
+    def record_buy(self, book: str, record_id: int, stock_code: str, stock_name: str,
+                   quantity: int, price: float, timestamp: datetime,
+                   strategy: str = '', reason: str = '') -> None:
+        if not self._loaded or record_id is None:
+            return
+        with self._lock:
+            self._books[book].add_buy(self._buy_record(
+                record_id, stock_code, stock_name, quantity, price, timestamp, strategy, reason))
+
+    def record_sell(self, book: str, sell_id: Optional[int], strategy: str, timestamp: datetime,
+                    pnl: Optional[float], buy_record_id: Optional[int] = None) -> None:
+        if not self._loaded:
+            return
+        with self._lock:
+            self._books[book].add_sell(sell_id, strategy or '', _normalize_ts(timestamp),
+                                       pnl, buy_record_id)
+
+    # 조회
+    def count_today_buys(self, book: str, strategy: str, today: Optional[date] = None) -> int:
+        """오늘 strategy BUY 레코드 수"""
+        today = today or now_kst().date()
+        with self._lock:
+            counter = self._books[book].buys_by_day.get(today, {}).get(strategy)
+            return sum(counter.values()) if counter else 0
+
+    def has_buy_today(self, book: str, strategy: str, stock_code: str,
+                      today: Optional[date] = None) -> bool:
+        """오늘 strategy 로 stock_code 를 매수한 기록이 있는지"""
+        today = today or now_kst().date()
+        with self._lock:
+            counter = self._books[book].buys_by_day.get(today, {}).get(strategy)
+            return bool(counter and counter.get(stock_code))
+
+    def open_positions(self, book: str, strategy: Optional[str] = None) -> List[Dict[str, Any]]:
+        """미청산 BUY 레코드 목록 (매수 시각 오름차순, 복사본)
+
+        Returns:
+            list of dict: [{'id', 'stock_code', 'stock_name', 'quantity', 'price',
+                            'timestamp', 'strategy', 'reason'}, ...]
+        """
+        with self._lock:
+            rows = [dict(r) for r in self._books[book].open_buys.values()
+                    if strategy is None or r['strategy'] == strategy]
+        rows.sort(key=lambda r: (r['timestamp'] or datetime.min, r['id']))
+        return rows
+
+    def count_open(self, book: str, strategy: str) -> int:
+        with self._lock:
+            return sum(1 for r in self._books[book].open_buys.values() if r['strategy'] == strategy)
+
+    def realized_pnl(self, book: str, strategy: str) -> List[float]:
+        """strategy SELL 손익 (real: net_profit, virtual: profit_loss) 시간순"""
+        with self._lock:
+            return [pnl for _, _, pnl in self._books[book].sells.get(strategy, [])]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._books = {book: _Book() for book in BOOKS}
+            self._loaded = False
+
+
+_ledger: Optional[TradeLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def get_trade_ledger() -> TradeLedger:
+    """프로세스 공용 TradeLedger (최초 호출 시 생성)"""
+    global _ledger
+    if _ledger is None:
+        with _ledger_lock:
+            if _ledger is None:
+                _ledger = TradeLedger()
+    return _ledger
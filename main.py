@@ -24,9 +24,12 @@ from core.trading_stock_manager import TradingStockManager
 from core.trading_decision_engine import TradingDecisionEngine
 from core.fund_manager import FundManager
 from db.database_manager import DatabaseManager
+from db.trade_ledger import get_trade_ledger
 from api.kis_api_manager import KISAPIManager
+from api.kis_async import AsyncKISAPIManager, run_blocking, shutdown_executor
 from config.settings import load_trading_config
 from utils.logger import setup_logger
+from utils.perf_monitor import get_perf_monitor, timed
 from utils.korean_time import now_kst, get_market_status, is_market_open, KST
 from config.market_hours import MarketHours
 from post_market_chart_generator import PostMarketChartGenerator
@@ -48,6 +51,8 @@ class DayTradingBot:
         self.pid_file = Path("bot.pid")
         self._last_eod_liquidation_date = None  # 장마감 일괄청산 실행 일자
         self._last_paper_morning_exit_date = None  # macd_cross paper morning exit 실행 일자 (Fix B)
+        self._post_market_save_task = None  # 장 마감 후 데이터 저장 태스크 (저장 의존 단계가 await)
+        self._post_market_followup_task = None  # 저장 완료 후 일봉 의존 단계 태스크
         
         # 프로세스 중복 실행 방지
         self._check_duplicate_process()
@@ -57,6 +62,7 @@ class DayTradingBot:
         
         # 핵심 모듈 초기화
         self.api_manager = KISAPIManager()
+        self.async_api = AsyncKISAPIManager(self.api_manager)  # 이벤트 루프용 비동기 파사드
         self.telegram = TelegramIntegration(trading_bot=self)
         self.data_collector = RealTimeDataCollector(self.config, self.api_manager)
         self.order_manager = OrderManager(self.config, self.api_manager, self.telegram)
@@ -76,6 +82,7 @@ class DayTradingBot:
             self.intraday_manager, self.data_collector, self.order_manager, self.telegram
         )  # 🆕 거래 상태 통합 관리자
         self.db_manager = DatabaseManager()
+        self.trade_ledger = get_trade_ledger()  # 실거래/가상 포지션·매수 건수 인메모리 원장
         self.decision_engine = TradingDecisionEngine(
             db_manager=self.db_manager,
             telegram_integration=self.telegram,
@@ -135,6 +142,7 @@ class DayTradingBot:
             'max_gap_pct': sc.MAX_GAP_PCT,
             'min_gap_down_pct': sc.MIN_GAP_DOWN_PCT,
             'max_phase3_checks': sc.MAX_PHASE3_CHECKS,
+            'parallel_api_calls': sc.PARALLEL_API_CALLS,
             'max_candidates_per_scan': sc.MAX_CANDIDATES_PER_SCAN,
             'max_total_candidates': sc.MAX_TOTAL_CANDIDATES,
             'min_score': sc.MIN_SCORE,
@@ -149,7 +157,6 @@ class DayTradingBot:
             'snapshot_interval': pm.SNAPSHOT_INTERVAL_SECONDS,
             'max_bellwether_stocks': pm.MAX_BELLWETHER_STOCKS,
             'nxt_div_code': pm.NXT_DIV_CODE,
-            'api_call_interval_ms': pm.API_CALL_INTERVAL_MS,
         }
 
     def _is_screening_time(self, current_time: datetime) -> bool:
@@ -261,8 +268,16 @@ class DayTradingBot:
             await self.telegram.initialize()
             
             # 4. DB에서 오늘 날짜의 후보 종목 복원
+            #    (장중 재시작이면 체크포인트 분봉을 먼저 로드 → 종목 등록 시 꼬리 구간만 재수집)
+            self.intraday_manager.load_checkpoint()
             await self._restore_todays_candidates()
 
+            # 4-1. 거래 원장 적재 (이후 포지션/매수 건수 조회는 메모리에서 처리)
+            try:
+                await asyncio.to_thread(self.trade_ledger.ensure_loaded, self.db_manager)
+            except Exception as e:
+                self.logger.warning(f"⚠️ 거래 원장 적재 실패 (첫 조회 시 재시도): {e}")
+
             # 5. 장중 재시작 시 DB에서 프리마켓 리포트 복원
             await self._restore_pre_market_report()
 
@@ -292,6 +307,8 @@ class DayTradingBot:
                 'trading_decision': self._trading_decision_task,
                 'system_monitoring': self._system_monitoring_task,
                 'telegram': self._telegram_task,
+                'perf_monitor': get_perf_monitor().run,
+                'intraday_checkpoint': self.intraday_manager.run_checkpoint_loop,
             }
 
             running_tasks: dict = {}
@@ -420,8 +437,7 @@ class DayTradingBot:
                 
                 # 매매 판단 시스템 실행 (5초 주기)
                 # 실시간 잔고 조회 후 자금 관리자 업데이트
-                loop = asyncio.get_event_loop()
-                balance_info = await loop.run_in_executor(None, self.api_manager.get_account_balance)
+                balance_info = await self.async_api.get_account_balance()
                 if balance_info:
                     self.fund_manager.update_total_funds(float(balance_info.account_balance))
 
@@ -438,6 +454,7 @@ class DayTradingBot:
         except Exception as e:
             self.logger.error(f"❌ 매매 의사결정 태스크 오류: {e}")
     
+    @timed('execute_trading_decision')
     async def _execute_trading_decision(self, available_funds: float = None):
         """매매 판단 시스템 실행 (매도 판단 + 포지션 동기화)
 
@@ -497,13 +514,15 @@ class DayTradingBot:
         except Exception as e:
             self.logger.error(f"❌ 매매 판단 시스템 오류: {e}")
     
+    def _ledger(self):
+        """적재된 거래 원장. 미적재 시 DB 에서 적재 (실패하면 예외 → 호출자의 DB 오류 경로)."""
+        self.trade_ledger.ensure_loaded(self.db_manager)
+        return self.trade_ledger
+
     def _count_open_paper_positions(self, strategy: str) -> int:
         """현재 미체결 paper 포지션 개수 (특정 strategy)."""
         try:
-            df = self.db_manager.get_virtual_open_positions()
-            if df is None or df.empty:
-                return 0
-            return int((df['strategy'] == strategy).sum())
+            return self._ledger().count_open('virtual', strategy)
         except Exception as e:
             self.logger.debug(f"_count_open_paper_positions 실패: {e}")
             return 0
@@ -511,10 +530,7 @@ class DayTradingBot:
     def _get_macd_cross_paper_open_codes(self) -> set:
         """현재 미체결 macd_cross 가상 포지션의 종목 코드 집합 (EOD 격리용)."""
         try:
-            df = self.db_manager.get_virtual_open_positions()
-            if df is None or df.empty:
-                return set()
-            return set(df.loc[df['strategy'] == 'macd_cross', 'stock_code'].tolist())
+            return {r['stock_code'] for r in self._ledger().open_positions('virtual', 'macd_cross')}
         except Exception as e:
             self.logger.debug(f"_get_macd_cross_paper_open_codes 실패: {e}")
             return set()
@@ -523,63 +539,29 @@ class DayTradingBot:
         """KRX 실거래일 기준 buy_date (exclusive) ~ today_date (inclusive) 영업일 수.
 
         backtests.common.trading_day.count_trading_days_between 와 동일 의미.
+        config.krx_calendar (공휴일 테이블 기반) 로 O(1) 계산 — 청산 태스크가 포지션마다
+        daily_candles / minute_candles 를 조회하던 것을 대체.
 
-        구현 노트 (2026-04-26 fix — off-by-one 제거):
-          daily_candles 는 EOD 후 post_market_data_saver 에서 갱신되므로
-          today (D2) row 가 09:01 시점에는 아직 없다. 단순히
-          `WHERE date <= today` 로 카운트하면 D2 09:01 morning trigger 에서
-          백테스트 대비 1일 적게 카운트되어 exit 1일 지연 (체계적 버그).
-
-          해결: 과거 거래일은 daily_candles (어제까지) 에서 count, 오늘 영업일
-          여부는 minute_candles (실시간 09:00 부터 갱신) 에 today row 존재
-          여부로 판정. 미래 데이터 미참조 — backtest 의 분봉 trade_date
-          nunique 와 의미 1:1 동등.
+        오늘이 영업일이면 장 시작 전이라도 +1 로 센다 (이전 구현의 "minute_candles 에
+        오늘 row 존재" 판정과 같은 결과 — 청산 트리거는 09:01 이후에만 실행됨).
 
         Args:
             buy_date: 매수일 (date 객체).
             today_date: 오늘 날짜 (date 객체).
         Returns:
-            거래일 수 (int). DB 오류 시 보수적으로 0 (만료 안 함).
+            거래일 수 (int). 오류 시 보수적으로 0 (만료 안 함).
         """
         try:
-            from datetime import timedelta
-            buy_str = buy_date.strftime('%Y%m%d')
-            yesterday_str = (today_date - timedelta(days=1)).strftime('%Y%m%d')
-            today_str = today_date.strftime('%Y%m%d')
-
-            # (a) 어제까지 EOD 마감된 과거 거래일 수
-            row_past = self.db_manager._fetchone(
-                """SELECT COUNT(DISTINCT stck_bsop_date) FROM daily_candles
-                   WHERE stck_bsop_date > %s AND stck_bsop_date <= %s""",
-                (buy_str, yesterday_str),
-            )
-            past_count = int(row_past[0]) if row_past else 0
-
-            # (b) today 가 영업일이면 +1 — minute_candles 에 today row 가 있으면 영업일.
-            #     09:00 부터 분봉 수집되므로 휴일에는 row 가 없고 영업일에는 있음.
-            row_today = self.db_manager._fetchone(
-                "SELECT 1 FROM minute_candles WHERE trade_date = %s LIMIT 1",
-                (today_str,),
-            )
-            today_count = 1 if row_today else 0
-
-            return past_count + today_count
+            from config.krx_calendar import get_krx_calendar
+            return max(get_krx_calendar().trading_days_between(buy_date, today_date), 0)
         except Exception as e:
-            self.logger.warning(f"_count_krx_trading_days_between DB 오류 → 0 반환: {e}")
+            self.logger.warning(f"_count_krx_trading_days_between 오류 → 0 반환: {e}")
             return 0
 
     def _has_macd_cross_buy_today(self, stock_code: str) -> bool:
         """오늘 macd_cross 로 이미 진입했는지. DB 오류 시 보수적으로 True (차단)."""
         try:
-            today = now_kst().strftime('%Y-%m-%d')
-            row = self.db_manager._fetchone(
-                """SELECT COUNT(*) FROM virtual_trading_records
-                   WHERE stock_code=%s AND action='BUY'
-                     AND strategy='macd_cross'
-                     AND DATE(timestamp) = %s""",
-                (stock_code, today),
-            )
-            return (row[0] if row else 0) > 0
+            return self._ledger().has_buy_today('virtual', 'macd_cross', stock_code)
         except Exception as e:
             self.logger.warning(f"_has_macd_cross_buy_today DB 오류 → 보수적 차단: {e}")
             return True
@@ -587,14 +569,7 @@ class DayTradingBot:
     def _count_today_macd_cross_real_buys(self) -> int:
         """오늘 macd_cross 실거래 BUY 건수 (real_trading_records 기준)."""
         try:
-            today = now_kst().strftime('%Y-%m-%d')
-            row = self.db_manager._fetchone(
-                """SELECT COUNT(*) FROM real_trading_records
-                   WHERE action='BUY' AND strategy='macd_cross'
-                     AND DATE(timestamp) = %s""",
-                (today,),
-            )
-            return int(row[0] if row else 0)
+            return self._ledger().count_today_buys('real', 'macd_cross')
         except Exception as e:
             self.logger.debug(f"_count_today_macd_cross_real_buys 실패: {e}")
             return 0
@@ -602,15 +577,7 @@ class DayTradingBot:
     def _has_macd_cross_real_buy_today(self, stock_code: str) -> bool:
         """오늘 macd_cross 실거래로 이미 진입했는지. DB 오류 시 보수적으로 True (차단)."""
         try:
-            today = now_kst().strftime('%Y-%m-%d')
-            row = self.db_manager._fetchone(
-                """SELECT COUNT(*) FROM real_trading_records
-                   WHERE stock_code=%s AND action='BUY'
-                     AND strategy='macd_cross'
-                     AND DATE(timestamp) = %s""",
-                (stock_code, today),
-            )
-            return (row[0] if row else 0) > 0
+            return self._ledger().has_buy_today('real', 'macd_cross', stock_code)
         except Exception as e:
             self.logger.warning(f"_has_macd_cross_real_buy_today DB 오류 → 보수적 차단: {e}")
             return True
@@ -677,25 +644,16 @@ class DayTradingBot:
                 return
             if self._is_macd_cross_kill_switch_active():
                 return  # 이미 발동됨
-            # SELL 레코드 시간순 조회
-            with self.db_manager._pool_obj.connection() as conn:
-                cur = conn.cursor()
-                cur.execute("""
-                    SELECT timestamp, net_profit
-                    FROM real_trading_records
-                    WHERE strategy='macd_cross' AND action='SELL'
-                      AND net_profit IS NOT NULL
-                    ORDER BY timestamp ASC
-                """)
-                rows = cur.fetchall()
-            if not rows:
+            # SELL 실손익 시간순 (거래 원장)
+            pnls = self._ledger().realized_pnl('real', 'macd_cross')
+            if not pnls:
                 return
             # 누적 net P&L
-            cumulative = sum(float(r[1]) for r in rows)
+            cumulative = sum(pnls)
             # 연속 손실 (시간역순으로 음수 카운트)
             consec_losses = 0
-            for r in reversed(rows):
-                if float(r[1]) < 0:
+            for pnl in reversed(pnls):
+                if pnl < 0:
                     consec_losses += 1
                 else:
                     break
@@ -833,31 +791,25 @@ class DayTradingBot:
         if _today_buy_count() >= cfg_mc.MAX_DAILY_POSITIONS:
             return
 
+        # universe 현재가 패널 → 엔진 배치 판정 (골든크로스 + 가격 유효성 + 상한가 buffer 일괄)
+        # 결과는 universe 순위(거래대금) 순 — 백테스트 진입 우선순위와 동일
+        price_panel = {}
         for stock_code in universe_codes:
+            price_info = self.intraday_manager.get_cached_current_price(stock_code)
+            if price_info:
+                price_panel[stock_code] = price_info.get('current_price', 0)
+        decisions = self.decision_engine.analyze_buy_decisions_batch(price_panel, hhmm)
+
+        for decision in decisions:
+            stock_code = decision['stock_code']
             try:
-                if not strategy.check_entry(stock_code, hhmm):
-                    continue
                 if _has_buy_today(stock_code):
                     continue
                 if _today_buy_count() >= cfg_mc.MAX_DAILY_POSITIONS:
                     break
 
-                price_info = self.intraday_manager.get_cached_current_price(stock_code)
-                if not price_info:
-                    continue
-                current_price = float(price_info.get('current_price', 0))
-                if current_price <= 0:
-                    continue
-
-                # 가격 제한 (상한가 buffer) — paper/real 동일
-                prev_close, prev_trading_value = strategy.get_daily_meta(stock_code)
-                if prev_close and not ExecutionModel.is_price_limit_safe(
-                    current_price, prev_close, side="buy"
-                ):
-                    self.logger.debug(
-                        f"[macd_cross] {stock_code} 상한가 buffer 위반 → skip"
-                    )
-                    continue
+                current_price = decision['current_price']
+                prev_trading_value = decision['prev_trading_value']
 
                 ts = self.trading_manager.get_trading_stock(stock_code)
                 stock_name = ts.stock_name if ts else f"MC_{stock_code}"
@@ -884,7 +836,8 @@ class DayTradingBot:
                             f"(주문 {order_value:,.0f} > {prev_trading_value*0.02:,.0f}) → skip"
                         )
                         continue
-                    buy_record_id = self.db_manager.save_virtual_buy(
+                    buy_record_id = await asyncio.to_thread(
+                        self.db_manager.save_virtual_buy,
                         stock_code=stock_code,
                         stock_name=stock_name,
                         price=buy_price_effective,
@@ -1089,6 +1042,7 @@ class DayTradingBot:
             import traceback
             self.logger.error(f"상세 오류 정보: {traceback.format_exc()}")
     
+    @timed('analyze_sell_decision')
     async def _analyze_sell_decision(self, trading_stock):
         """매도 판단 분석 (간단한 손절/익절 로직)"""
         try:
@@ -1100,12 +1054,11 @@ class DayTradingBot:
             if current_price_info is None:
                 # 폴백: 캐시 없으면 API로 직접 조회 (재시작 직후 매도 판단 보장)
                 try:
-                    current_price_info = self.intraday_manager.get_current_price_for_sell(stock_code)
+                    current_price_info = await run_blocking(self.intraday_manager.get_current_price_for_sell, stock_code)
                     if current_price_info is None:
                         return
-                    # 조회 결과를 캐시에도 저장
-                    if stock_code in self.intraday_manager.selected_stocks:
-                        self.intraday_manager.selected_stocks[stock_code].current_price_info = current_price_info
+                    # 조회 결과를 캐시에도 저장 (스냅샷 발행)
+                    self.intraday_manager.update_current_price_info(stock_code, current_price_info)
                 except Exception:
                     return
             
@@ -1324,7 +1277,7 @@ class DayTradingBot:
             except Exception as e:
                 self.logger.debug(f"[macd_cross] 등록 실패 {stock.code}: {e}")
 
-        # 3. daily history 주입 → MACD hist 캐시 (단일 connection 사용)
+        # 3. daily history 주입 → MACD hist 캐시 (preload 결과 재사용 / 윈도우 쿼리 1회)
         today_str = current_time.strftime("%Y%m%d")
         strategy = self.decision_engine.macd_cross_strategy
         if strategy is None:
@@ -1342,72 +1295,123 @@ class DayTradingBot:
         )
 
     def _load_macd_cross_daily_batch(self, stock_codes, today_yyyymmdd: str, strategy) -> int:
-        """macd_cross 일괄 daily history 로드 + 캐시 주입 (option B: 단일 connection).
+        """macd_cross 일괄 daily history 로드 + 캐시 주입.
+
+        1. 최근 일봉 꼬리 (preload_macd_cross_universe 가 같은 connection 으로 받아둔 것,
+           없으면 윈도우 쿼리 1회) 를 MACD 증분 상태와 대조
+        2. 상태가 없거나 이력이 바뀐 종목만 전체 이력 쿼리 1회 → (거래일 × 종목) 행렬로 재계산
+           (증분 상태와 같은 시작점 — 고정 윈도우로 자르면 EWM 값이 상태와 달라진다)
+        UNIVERSE_TOP_N 이 늘어도 DB 왕복 수는 일정, 평소 종목당 계산은 O(1).
 
         Args:
-            stock_codes: 종목 코드 리스트.
+            stock_codes: 종목 코드 리스트 (universe 순위 순).
             today_yyyymmdd: 오늘 (YYYYMMDD). daily_prices 조회 상한 기준.
             strategy: MacdCrossStrategy 인스턴스.
         Returns:
             성공 캐시된 종목 수.
         """
-        import psycopg2
         import pandas as pd
-        from config.settings import (
-            PG_HOST, PG_PORT, PG_DATABASE_QUANT, PG_USER, PG_PASSWORD,
-        )
+        from core.stock_screener import StockScreener
+        from core.strategies.macd_cross_strategy import STATE_TAIL_DAYS
 
-        # MACD warmup: slow * 3 + signal = 34*3 + 12 = 114 영업일 → 150 fetch 로 여유 확보
-        lookback = 150
         today_iso = f"{today_yyyymmdd[:4]}-{today_yyyymmdd[4:6]}-{today_yyyymmdd[6:]}"
+        conn = None
+
+        def fetch(codes, lookback=None):
+            nonlocal conn
+            if conn is None:
+                import psycopg2
+                from config.settings import (
+                    PG_HOST, PG_PORT, PG_DATABASE_QUANT, PG_USER, PG_PASSWORD,
+                )
+                conn = psycopg2.connect(
+                    host=PG_HOST, port=PG_PORT, database=PG_DATABASE_QUANT,
+                    user=PG_USER, password=PG_PASSWORD, connect_timeout=5,
+                )
+            cur = conn.cursor()
+            try:
+                return StockScreener.fetch_daily_histories(cur, codes, today_iso, lookback)
+            finally:
+                cur.close()
 
         try:
-            conn = psycopg2.connect(
-                host=PG_HOST, port=PG_PORT, database=PG_DATABASE_QUANT,
-                user=PG_USER, password=PG_PASSWORD, connect_timeout=5,
-            )
+            if strategy.state_store is None:
+                df = fetch(stock_codes)
+            else:
+                tails = self.stock_screener.take_macd_cross_daily_history(today_iso, stock_codes)
+                if tails is None:
+                    tails = fetch(stock_codes, STATE_TAIL_DAYS)
+                stale = strategy.codes_needing_history(tails, stock_codes)
+                df = tails
+                if stale:
+                    df = pd.concat(
+                        [tails[~tails["stock_code"].isin(stale)],
+                         fetch(stale)],
+                        ignore_index=True,
+                    )
+                self.logger.info(
+                    f"[macd_cross] MACD 증분 상태 사용 {len(stock_codes) - len(stale)}종목, "
+                    f"전체 재계산 {len(stale)}종목"
+                )
         except Exception as e:
-            self.logger.error(f"[macd_cross] daily DB 연결 실패: {e}")
+            self.logger.error(f"[macd_cross] daily history 조회 실패: {e}")
             return 0
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
 
-        cached = 0
         try:
-            for code in stock_codes:
-                try:
-                    cur = conn.cursor()
-                    cur.execute(
-                        """SELECT REPLACE(date, '-', '') AS trade_date, close, trading_value
-                           FROM daily_prices
-                           WHERE stock_code = %s AND date < %s AND close IS NOT NULL
-                           ORDER BY date DESC
-                           LIMIT %s""",
-                        [code, today_iso, lookback],
-                    )
-                    rows = cur.fetchall()
-                    cur.close()
-                    if not rows:
-                        continue
-                    df = pd.DataFrame(rows, columns=["trade_date", "close", "trading_value"])
-                    df["close"] = df["close"].astype(float)
-                    prev_tv = float(rows[0][2]) if rows[0][2] is not None else 0.0
-                    df = df.iloc[::-1].reset_index(drop=True)
-                    strategy.set_daily_history(
-                        code, df, today_yyyymmdd, prev_trading_value=prev_tv
-                    )
-                    cached += 1
-                except Exception as e:
-                    try:
-                        conn.rollback()
-                    except Exception:
-                        pass
-                    self.logger.debug(f"[macd_cross] daily prep {code}: {e}")
-        finally:
+            cached = strategy.set_daily_histories(df, today_yyyymmdd, stock_codes)
+        except Exception as e:
+            self.logger.error(f"[macd_cross] daily MACD 캐시 주입 실패: {e}")
+            return 0
+        if strategy.state_store is not None:
             try:
-                conn.close()
-            except Exception:
-                pass
+                strategy.state_store.save()
+            except Exception as e:
+                self.logger.warning(f"[macd_cross] MACD 상태 저장 실패: {e}")
         return cached
 
+    async def _after_post_market_save(self, save_task: asyncio.Task, trade_date: str) -> None:
+        """장 마감 후 데이터 저장 태스크 완료를 기다린 뒤 새 일봉에 의존하는 단계 실행."""
+        try:
+            result = await save_task
+            if result.get('success'):
+                self.logger.info("✅ 장 마감 후 데이터 저장 완료")
+            else:
+                self.logger.error(f"❌ 장 마감 후 데이터 저장 실패: {result.get('error') or result.get('message')}")
+            # 새 일봉이 저장됐으므로 고급 필터 일봉 특징 테이블 재생성 예약
+            adv_filter = getattr(self.decision_engine, 'advanced_filter_manager', None)
+            if adv_filter is not None:
+                adv_filter.invalidate_daily_features()
+        except Exception as e:
+            self.logger.error(f"❌ 장 마감 후 데이터 저장 실패: {e}")
+        # macd_cross MACD 증분 상태 당일 종가로 전진
+        try:
+            await asyncio.to_thread(self._advance_macd_cross_state, trade_date)
+        except Exception as e:
+            self.logger.warning(f"⚠️ MACD 증분 상태 전진 실패: {e}")
+
+    def _advance_macd_cross_state(self, trade_date: str) -> int:
+        """장 마감 후 universe 당일 종가(마지막 분봉)로 MACD 증분 상태 1일 전진 + 저장."""
+        strategy = self.decision_engine.macd_cross_strategy
+        if strategy is None or strategy.state_store is None:
+            return 0
+        codes = strategy.cached_codes()
+        closes = {}
+        for code in codes:
+            snapshot = self.intraday_manager.get_snapshot(code)
+            if snapshot is None or snapshot.session_date != trade_date or snapshot.total_count == 0:
+                continue
+            closes[code] = float(snapshot.bars['close'].iloc[-1])
+        advanced = strategy.advance_daily_closes(closes, trade_date)
+        strategy.state_store.save()
+        self.logger.info(f"[macd_cross] MACD 증분 상태 전진: {advanced}/{len(codes)}종목 ({trade_date})")
+        return advanced
+
     async def _send_morning_briefing(self, report):
         """프리마켓 모닝 브리핑 텔레그램 발송"""
         try:
@@ -1481,13 +1485,19 @@ class DayTradingBot:
                         close_time = market_hours_info['market_close']
                         minutes_after_close = (current_time.hour * 60 + current_time.minute) - (close_time.hour * 60 + close_time.minute)
                         if 1 <= minutes_after_close <= 15:
-                            # 1단계: 데이터 저장
-                            try:
-                                self.logger.info("🏁 장 마감 후 데이터 저장 시작...")
-                                self.intraday_manager.data_saver.save_all_data(self.intraday_manager)
-                                self.logger.info("✅ 장 마감 후 데이터 저장 완료")
-                            except Exception as e:
-                                self.logger.error(f"❌ 장 마감 후 데이터 저장 실패: {e}")
+                            # 1단계: 데이터 저장 (백그라운드 — 이후 단계는 저장 완료를 기다리지 않음)
+                            self.logger.info("🏁 장 마감 후 데이터 저장 시작...")
+                            self._post_market_save_task = asyncio.create_task(
+                                self.intraday_manager.data_saver.save_all_data_async(self.intraday_manager),
+                                name='post_market_save',
+                            )
+                            # 1-1단계: 저장 완료 후 일봉 의존 단계 (특징 테이블 재생성 예약, MACD 상태 전진)
+                            self._post_market_followup_task = asyncio.create_task(
+                                self._after_post_market_save(
+                                    self._post_market_save_task, current_time.strftime('%Y%m%d')
+                                ),
+                                name='post_market_followup',
+                            )
                             # 2단계: 가상 추적 처리
                             try:
                                 if self.decision_engine and hasattr(self.decision_engine, 'performance_gate'):
@@ -1495,7 +1505,7 @@ class DayTradingBot:
                                         self.decision_engine.performance_gate.process_shadow_entries()
                             except Exception as e:
                                 self.logger.warning(f"⚠️ 가상 추적 처리 실패: {e}")
-                            # 두 단계 모두 시도 후 날짜 플래그 설정
+                            # 저장 시작 + 가상 추적 시도 후 날짜 플래그 설정
                             post_market_data_saved_date = current_date
 
                 # 🆕 분봉 확대 수집 (15:45 1회 실행, 평일만)
@@ -1633,7 +1643,7 @@ class DayTradingBot:
                     if combined_data is not None and len(combined_data) > 0:
                         sell_price = float(combined_data['close'].iloc[-1])
                     else:
-                        price_obj = self.api_manager.get_current_price(stock_code)
+                        price_obj = await self.async_api.get_current_price(stock_code)
                         if price_obj:
                             sell_price = float(price_obj.current_price)
                     sell_price = self._round_to_tick(sell_price)
@@ -1670,10 +1680,11 @@ class DayTradingBot:
         elif mode == 'real':
             await self._macd_cross_live_exit_task()
 
+    @timed('macd_cross_live_exit')
     async def _macd_cross_live_exit_task(self):
         """macd_cross 실거래 포지션 hold_days=2 만료 시장가 청산.
 
-        - real_trading_records 에서 strategy='macd_cross' AND 미매칭 BUY 조회
+        - 거래 원장(real_trading_records 적재분) 에서 strategy='macd_cross' 미매칭 BUY 조회
         - KRX 영업일 기준 hold_days >= HOLD_DAYS=2 인 종목 시장가 매도
         - trading_manager.execute_sell_order(market=True) 경유 (price=0)
         - D+2 morning(09:01~05) + EOD(15:00 직후) 양쪽 트리거 → idempotent
@@ -1685,7 +1696,7 @@ class DayTradingBot:
             from core.models import StockState
             cfg = StrategySettings.MacdCross
 
-            rows = self.db_manager.get_open_real_buys_by_strategy('macd_cross')
+            rows = self._ledger().open_positions('real', 'macd_cross')
             if not rows:
                 return
 
@@ -1743,6 +1754,7 @@ class DayTradingBot:
         except Exception as e:
             self.logger.error(f"❌ macd_cross live exit 실패: {e}")
 
+    @timed('macd_cross_paper_exit')
     async def _macd_cross_paper_exit_task(self):
         """macd_cross 가상 포지션 hold_days=2 만료 청산.
 
@@ -1762,17 +1774,14 @@ class DayTradingBot:
             )
 
             cfg = StrategySettings.MacdCross
-            df = self.db_manager.get_virtual_open_positions()
-            if df is None or df.empty:
-                return
-            df_mc = df[df['strategy'] == 'macd_cross']
-            if df_mc.empty:
+            positions = self._ledger().open_positions('virtual', 'macd_cross')
+            if not positions:
                 return
 
             strategy = self.decision_engine.macd_cross_strategy
             today = now_kst().date()
-            for _, row in df_mc.iterrows():
-                buy_time = row['buy_time']
+            for row in positions:
+                buy_time = row['timestamp']
                 if isinstance(buy_time, str):
                     buy_dt = datetime.strptime(buy_time, "%Y-%m-%d %H:%M:%S")
                 else:
@@ -1813,7 +1822,8 @@ class DayTradingBot:
                 sell_fill = current_price * (1 - SLIPPAGE_ONE_WAY)
                 sell_price_effective = sell_fill * (1 - SELL_COMMISSION)
 
-                ok = self.db_manager.save_virtual_sell(
+                ok = await asyncio.to_thread(
+                    self.db_manager.save_virtual_sell,
                     stock_code=stock_code,
                     stock_name=stock_name,
                     price=sell_price_effective,
@@ -2101,7 +2111,7 @@ class DayTradingBot:
                 # 전날 종가 조회
                 prev_close = 0.0
                 try:
-                    daily_data = self.api_manager.get_ohlcv_data(stock_code, "D", 7)
+                    daily_data = await self.async_api.get_ohlcv_data(stock_code, "D", 7)
                     if daily_data is not None and len(daily_data) >= 2:
                         if hasattr(daily_data, 'iloc'):
                             daily_data = daily_data.sort_values('stck_bsop_date')
@@ -2196,6 +2206,7 @@ class DayTradingBot:
         except Exception as e:
             self.logger.error(f"❌ 프리마켓 리포트 복원 실패: {e}")
 
+    @timed('run_stock_screener')
     async def _run_stock_screener(self):
         """장중 실시간 종목 스크리닝"""
         try:
@@ -2220,7 +2231,7 @@ class DayTradingBot:
                 # 전날 종가 조회 (기존 패턴 재사용)
                 prev_close = 0.0
                 try:
-                    daily_data = self.api_manager.get_ohlcv_data(
+                    daily_data = await self.async_api.get_ohlcv_data(
                         stock.code, "D", 7
                     )
                     if daily_data is not None and len(daily_data) >= 2:
@@ -2388,6 +2399,7 @@ class DayTradingBot:
         except Exception as e:
             self.logger.error(f"[프리로드] 오류: {e}")
 
+    @timed('update_intraday_data')
     async def _update_intraday_data(self):
         """장중 종목 실시간 데이터 업데이트 + 매수 판단 실행 (완성된 분봉만 수집)"""
         try:
@@ -2442,8 +2454,7 @@ class DayTradingBot:
             if not should_stop_buy:
 
                 # 가용 자금 계산
-                loop = asyncio.get_event_loop()
-                balance_info = await loop.run_in_executor(None, self.api_manager.get_account_balance)
+                balance_info = await self.async_api.get_account_balance()
                 if balance_info:
                     self.fund_manager.update_total_funds(float(balance_info.account_balance))
 
@@ -2455,7 +2466,9 @@ class DayTradingBot:
                 completed_stocks = self.trading_manager.get_stocks_by_state(StockState.COMPLETED)
                 buy_candidates = selected_stocks + completed_stocks
 
-                if buy_candidates:
+                # macd_cross 는 위 _evaluate_macd_cross_window 배치 판정이 매수 경로 —
+                # 종목별 analyze_buy_decision 은 항상 미진입이므로 분봉 복사/정렬 비용만 든다.
+                if buy_candidates and self.decision_engine.active_strategy != 'macd_cross':
                     self.logger.info(f"🎯 {candle_interval}분봉 완성 후 매수 판단 실행: {current_time.strftime('%H:%M:%S')} - {len(buy_candidates)}개 종목")
 
                     for trading_stock in buy_candidates:
@@ -2499,12 +2512,8 @@ class DayTradingBot:
         try:
             self.logger.debug("🔧 긴급 포지션 동기화 시작")
 
-            # 실제 잔고 조회
-            loop = asyncio.get_event_loop()
-            balance = await loop.run_in_executor(
-                None,
-                self.api_manager.get_account_balance
-            )
+            # 실제 잔고 조회 (KIS 전용 executor)
+            balance = await self.async_api.get_account_balance()
             if not balance or not balance.positions:
                 self.logger.debug("📊 보유 종목 없음")
                 return
@@ -2763,6 +2772,8 @@ class DayTradingBot:
             
             # API 매니저 종료
             self.api_manager.shutdown()
+            shutdown_executor()
+            self.stock_screener.shutdown()
             
             # PID 파일 삭제
             if self.pid_file.exists():
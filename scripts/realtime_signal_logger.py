@@ -167,7 +167,7 @@ class RealtimeSignalLogger:
                     buy_signal, buy_reason, buy_info = await self.decision_engine.analyze_buy_decision(trading_stock, combined_data)
                     
                     # 3분봉 데이터로 변환하여 신호 분석 (signal_replay.py와 동일)
-                    data_3min = TimeFrameConverter.convert_to_3min_data(combined_data)
+                    data_3min = TimeFrameConverter.get_cached_nmin_data(stock_code, combined_data)
                     if data_3min is not None and not data_3min.empty:
                         # PullbackCandlePattern으로 상세 신호 분석
                         signals = PullbackCandlePattern.generate_trading_signals(
@@ -0,0 +1,74 @@
+"""api.kis_async 비동기 파사드 단위 테스트 (KIS 호출 없음)."""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from api.kis_async import AsyncKISAPIManager, run_blocking
+from api.kis_rate_limiter import Lane, lane_for_tr, lane_scope
+
+
+class _FakeManager:
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.threads = set()
+
+    def get_current_price(self, stock_code):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return None if stock_code == 'NONE' else f'price:{stock_code}'
+
+    def place_sell_order(self, stock_code, quantity, price, order_type="00"):
+        return (stock_code, quantity, price, order_type, threading.current_thread().name)
+
+
+def test_blocking_call_does_not_stall_event_loop():
+    async def run():
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(heartbeat())
+        await run_blocking(time.sleep, 0.2)
+        task.cancel()
+        return ticks
+
+    assert asyncio.run(run()) >= 5
+
+
+def test_run_blocking_propagates_lane_scope():
+    async def run():
+        with lane_scope(Lane.SCAN):
+            return await run_blocking(lane_for_tr, "FHKST01010100")
+
+    assert asyncio.run(run()) == Lane.SCAN
+
+
+def test_get_current_prices_runs_concurrently_and_drops_missing():
+    manager = _FakeManager(delay=0.1)
+    codes = ['A', 'NONE', 'B', 'C']
+
+    async def run():
+        start = time.monotonic()
+        prices = await AsyncKISAPIManager(manager).get_current_prices(codes)
+        return prices, time.monotonic() - start
+
+    prices, elapsed = asyncio.run(run())
+    assert prices == {'A': 'price:A', 'B': 'price:B', 'C': 'price:C'}
+    assert list(prices) == ['A', 'B', 'C']
+    assert elapsed < 0.35  # 순차 실행이면 0.4초 이상
+
+
+def test_dedicated_executor_is_used():
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='orders')
+    facade = AsyncKISAPIManager(_FakeManager(), executor=executor)
+    try:
+        result = asyncio.run(facade.place_sell_order('005930', 3, 70000, "01"))
+    finally:
+        executor.shutdown()
+    assert result[:4] == ('005930', 3, 70000, "01")
+    assert result[4].startswith('orders')
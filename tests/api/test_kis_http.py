@@ -0,0 +1,70 @@
+"""api.kis_http 단위 테스트 (공용 세션 + TR 별 호출 시간 계측)."""
+import pytest
+
+from api import kis_http
+
+
+class _FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class _FakeSession:
+    def __init__(self, status_code=200, exc=None):
+        self.status_code = status_code
+        self.exc = exc
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        if self.exc:
+            raise self.exc
+        return _FakeResponse(self.status_code)
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    kis_http.reset_call_stats()
+    yield
+    kis_http.reset_call_stats()
+
+
+def test_pool_size_follows_rate_limit():
+    # 0.06s 간격 → 0.5s 응답 동안 최대 9건 진행 + 여유 1
+    assert kis_http.pool_size_for_interval(0.06) == 10
+    # 느린 간격은 최소 크기
+    assert kis_http.pool_size_for_interval(0.35) == 4
+    # 상한
+    assert kis_http.pool_size_for_interval(0.001) == 32
+
+
+def test_session_is_shared():
+    assert kis_http.get_session() is kis_http.get_session()
+
+
+def test_request_records_timing_by_tr(monkeypatch):
+    fake = _FakeSession()
+    monkeypatch.setattr(kis_http, "get_session", lambda: fake)
+
+    kis_http.get("https://x/a", tr_id="FHKST01010100", params={"a": 1})
+    kis_http.post("https://x/b", tr_id="TTTC0011U", data="{}")
+    kis_http.get("https://x/a", tr_id="FHKST01010100")
+
+    stats = kis_http.get_call_stats()
+    assert stats["FHKST01010100"]["calls"] == 2
+    assert stats["TTTC0011U"]["calls"] == 1
+    assert stats["TTTC0011U"]["errors"] == 0
+    assert fake.calls[0][0] == "GET" and fake.calls[1][0] == "POST"
+
+
+def test_request_counts_http_errors_and_exceptions(monkeypatch):
+    monkeypatch.setattr(kis_http, "get_session", lambda: _FakeSession(status_code=500))
+    kis_http.get("https://x", tr_id="T1")
+
+    monkeypatch.setattr(kis_http, "get_session", lambda: _FakeSession(exc=ConnectionError("x")))
+    with pytest.raises(ConnectionError):
+        kis_http.get("https://x", tr_id="T1")
+
+    stats = kis_http.get_call_stats()
+    assert stats["T1"]["calls"] == 2
+    assert stats["T1"]["errors"] == 2
@@ -0,0 +1,91 @@
+"""api.kis_rate_limiter 단위 테스트 (토큰 버킷 + 우선순위 레인)."""
+import asyncio
+import threading
+import time
+
+from api.kis_rate_limiter import (
+    KISRateScheduler,
+    Lane,
+    lane_for_tr,
+    lane_scope,
+)
+
+
+def test_lane_for_tr_mapping():
+    assert lane_for_tr("TTTC0011U") == Lane.ORDER
+    assert lane_for_tr("FHKST01010100") == Lane.PRICE
+    assert lane_for_tr("FHKST03010200") == Lane.CHART
+    assert lane_for_tr("FHPST01710000") == Lane.SCAN
+    # 미등록 TR 은 PRICE
+    assert lane_for_tr("UNKNOWN") == Lane.PRICE
+
+
+def test_lane_scope_overrides_tr_mapping():
+    with lane_scope(Lane.SCAN):
+        assert lane_for_tr("FHKST01010100") == Lane.SCAN
+    assert lane_for_tr("FHKST01010100") == Lane.PRICE
+
+
+def test_min_interval_enforced():
+    sched = KISRateScheduler(min_interval=0.05)
+    start = time.monotonic()
+    for _ in range(4):
+        sched.acquire(Lane.PRICE)
+    # 첫 토큰은 즉시, 이후 3회는 간격 대기
+    assert time.monotonic() - start >= 0.14
+
+
+def test_order_lane_served_before_queued_scan():
+    sched = KISRateScheduler(min_interval=0.05)
+    sched.acquire(Lane.PRICE)  # 버킷 비우기
+    served = []
+
+    def worker(lane, name):
+        sched.acquire(lane)
+        served.append(name)
+
+    scans = [threading.Thread(target=worker, args=(Lane.SCAN, f"scan{i}")) for i in range(3)]
+    for t in scans:
+        t.start()
+    time.sleep(0.01)  # SCAN 요청이 먼저 대기열에 들어가도록
+    order = threading.Thread(target=worker, args=(Lane.ORDER, "order"))
+    order.start()
+    for t in scans + [order]:
+        t.join(timeout=2)
+
+    assert served[0] == "order"
+    assert sorted(served[1:]) == ["scan0", "scan1", "scan2"]
+
+
+def test_async_acquire_shares_bucket_with_threads():
+    sched = KISRateScheduler(min_interval=0.05)
+
+    async def run():
+        return await asyncio.gather(*(sched.acquire_async(Lane.CHART) for _ in range(3)))
+
+    start = time.monotonic()
+    asyncio.run(run())
+    sched.acquire(Lane.ORDER)
+    assert time.monotonic() - start >= 0.14
+
+    stats = sched.get_stats()
+    assert stats["CHART"]["calls"] == 3
+    assert stats["ORDER"]["calls"] == 1
+    assert stats["_queue"]["waiting"] == 0
+
+
+def test_async_cancel_removes_waiter():
+    sched = KISRateScheduler(min_interval=0.5)
+    sched.acquire(Lane.PRICE)
+
+    async def run():
+        task = asyncio.create_task(sched.acquire_async(Lane.SCAN))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(run())
+    assert sched.get_stats()["_queue"]["waiting"] == 0
@@ -0,0 +1,116 @@
+"""backtests.common.bar_archive 단위 테스트 (DB 불필요, tmp 경로 사용)."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtests.common import bar_archive, data_loader
+
+
+def _minute_rows(code, trade_date, n=3, base=100.0):
+    return pd.DataFrame({
+        "stock_code": code,
+        "trade_date": trade_date,
+        "trade_time": [f"09{m:02d}00" for m in range(n)],
+        "open": base + np.arange(n), "high": base + 1 + np.arange(n),
+        "low": base - 1 + np.arange(n), "close": base + np.arange(n),
+        "volume": np.arange(n, dtype=np.int64) * 10, "amount": base * np.arange(n),
+    })
+
+
+@pytest.fixture
+def root(tmp_path):
+    return tmp_path / "archive"
+
+
+def _write_days(root, days, codes):
+    for d in days:
+        df = pd.concat([_minute_rows(c, d, base=float(i * 100 + int(d[-2:])))
+                        for i, c in enumerate(codes)], ignore_index=True)
+        bar_archive.write_partition("minute", d, df.sample(frac=1, random_state=0), root)
+
+
+def test_minute_roundtrip_matches_db_order(root):
+    _write_days(root, ["20250102", "20250103"], ["000660", "005930", "035720"])
+    bar_archive.record_export("minute", "20250101", "20250131", None, root)
+
+    df = bar_archive.load_frame("minute", ["035720", "005930"], "20250102", "20250103", root)
+    expected = pd.concat([
+        _minute_rows("005930", "20250102", base=102.0), _minute_rows("005930", "20250103", base=103.0),
+        _minute_rows("035720", "20250102", base=202.0), _minute_rows("035720", "20250103", base=203.0),
+    ], ignore_index=True)
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_uncovered_range_or_codes_returns_none(root):
+    _write_days(root, ["20250102"], ["005930"])
+    bar_archive.record_export("minute", "20250102", "20250102", ["005930"], root)
+
+    assert bar_archive.load_frame("minute", ["005930"], "20250102", "20250103", root) is None
+    assert bar_archive.load_frame("minute", ["000660"], "20250102", "20250102", root) is None
+    assert len(bar_archive.load_frame("minute", ["005930"], "20250102", "20250102", root)) == 3
+
+
+def test_partition_rewrite_keeps_other_codes(root):
+    _write_days(root, ["20250102"], ["005930", "000660"])
+    bar_archive.write_partition("minute", "20250102", _minute_rows("005930", "20250102", n=5), root)
+
+    part = bar_archive.read_partition("minute", "20250102", root)
+    assert part.groupby("stock_code").size().to_dict() == {"000660": 3, "005930": 5}
+
+
+def test_daily_month_partition_filters_rows(root):
+    days = pd.date_range("2025-01-01", "2025-02-28", freq="B").strftime("%Y%m%d")
+    df = pd.DataFrame({
+        "stock_code": "005930", "trade_date": days,
+        "open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5,
+        "volume": 100, "amount": [str(i) for i in range(len(days))],  # Decimal 대용 object
+    })
+    for month in ("202501", "202502"):
+        bar_archive.write_partition("daily", month, df[df["trade_date"].str[:6] == month], root)
+    bar_archive.record_export("daily", "20250101", "20250228", None, root)
+
+    out = bar_archive.load_frame("daily", ["005930"], "20250115", "20250205", root)
+    assert out["trade_date"].min() >= "20250115" and out["trade_date"].max() <= "20250205"
+    assert list(out.columns) == ["stock_code", "trade_date", "open", "high", "low",
+                                 "close", "volume", "amount"]
+    assert out["amount"].dtype == np.float64
+
+
+def test_loader_prefers_archive(root, monkeypatch):
+    _write_days(root, ["20250102"], ["005930"])
+    bar_archive.record_export("minute", "20250102", "20250102", None, root)
+    monkeypatch.setenv("BAR_ARCHIVE_DIR", str(root))
+
+    def _no_db(*args, **kwargs):
+        raise AssertionError("DB 조회 발생")
+
+    monkeypatch.setattr(data_loader, "_query_minute_df", _no_db)
+    df = data_loader.load_minute_df(["005930"], "20250102", "20250102")
+    assert len(df) == 3
+
+    with pytest.raises(AssertionError):
+        data_loader.load_minute_df(["005930"], "20250102", "20250102", use_archive=False)
+
+
+def test_export_records_only_written_range(root, monkeypatch):
+    minute_days = {"20250102": _minute_rows("005930", "20250102"),
+                   "20250103": _minute_rows("005930", "20250103"),
+                   "20250106": _minute_rows("005930", "20250106").iloc[0:0]}
+    monkeypatch.setattr(data_loader, "list_minute_dates", lambda s, e: sorted(minute_days))
+    monkeypatch.setattr(data_loader, "_query_minute_df", lambda codes, s, e: minute_days[s])
+    bar_archive.export_minute("20250101", "20250131", ["005930"], root, verbose=False)
+    assert bar_archive.covers("minute", ["005930"], "20250102", "20250103", root)
+    assert not bar_archive.covers("minute", ["005930"], "20250102", "20250106", root)
+
+    days = pd.date_range("2025-01-01", "2025-01-15", freq="B").strftime("%Y%m%d")
+    daily = pd.DataFrame({"stock_code": "005930", "trade_date": days, "open": 1.0,
+                          "high": 2.0, "low": 0.5, "close": 1.5, "volume": 100, "amount": 1.0})
+    monkeypatch.setattr(data_loader, "_query_daily_df",
+                        lambda codes, s, e: daily[(daily["trade_date"] >= s) & (daily["trade_date"] <= e)])
+    bar_archive.export_daily("20250101", "20250331", ["005930"], root, verbose=False)
+    assert bar_archive.covers("daily", ["005930"], "20250101", "20250115", root)
+    assert not bar_archive.covers("daily", ["005930"], "20250101", "20250131", root)
+
+    monkeypatch.setattr(data_loader, "list_minute_dates", lambda s, e: [])
+    bar_archive.export_minute("20250201", "20250228", None, root, verbose=False)
+    assert len(bar_archive._read_manifest("minute", root)) == 1  # 기록 없음 → 구간 미추가
@@ -0,0 +1,165 @@
+"""BacktestEngine(vectorized=True) — bar 루프 모드와 결과 동일성 검증."""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtests.common.engine import BacktestEngine
+from backtests.common.signal_masks import hold_limit_exit_mask, tp_sl_exit_mask
+from backtests.common.trading_day import count_trading_days_between
+from backtests.strategies.base import StrategyBase, EntryOrder, ExitOrder
+from backtests.strategies.bb_lower_bounce import BBLowerBounceStrategy
+from backtests.strategies.breakout_52w import Breakout52wStrategy
+from backtests.strategies.close_to_open import CloseToOpenStrategy
+from backtests.strategies.closing_drift import ClosingDriftStrategy
+from backtests.strategies.gap_down_reversal import GapDownReversalStrategy
+from backtests.strategies.gap_up_chase import GapUpChaseStrategy
+from backtests.strategies.intraday_pullback import IntradayPullbackStrategy
+from backtests.strategies.limit_up_chase import LimitUpChaseStrategy
+from backtests.strategies.macd_cross import MACDCrossStrategy
+from backtests.strategies.orb import ORBStrategy
+from backtests.strategies.post_drop_rebound import PostDropReboundStrategy
+from backtests.strategies.rsi_oversold import RSIOversoldStrategy
+from backtests.strategies.trend_followthrough import TrendFollowthroughStrategy
+from backtests.strategies.volume_surge import VolumeSurgeStrategy
+from backtests.strategies.vwap_bounce import VWAPBounceStrategy
+
+STRATEGIES_DIR = Path(__file__).resolve().parents[2] / "backtests" / "strategies"
+
+# 마스크 구현 전략 전체 — 합성 데이터(09:00~10:59 분봉)에서 거래가 나도록 시간대/임계값만 완화
+MASKED_STRATEGIES = {
+    "bb_lower_bounce": lambda: BBLowerBounceStrategy(),
+    "breakout_52w": lambda: Breakout52wStrategy(lookback_days=5, entry_hhmm_min=900, entry_hhmm_max=1100),
+    "close_to_open": lambda: CloseToOpenStrategy(min_change_pct=-5.0, entry_hhmm_min=900, entry_hhmm_max=1100),
+    "closing_drift": lambda: ClosingDriftStrategy(min_prev_body_pct=0.0, max_day_decline_pct=-10.0,
+                                                  entry_hhmm_start=900, entry_hhmm_end=1100),
+    "gap_down_reversal": lambda: GapDownReversalStrategy(),
+    "gap_up_chase": lambda: GapUpChaseStrategy(),
+    "intraday_pullback": lambda: IntradayPullbackStrategy(),
+    "limit_up_chase": lambda: LimitUpChaseStrategy(chase_threshold_pct=0.5, volume_mult=1.0),
+    "macd_cross": lambda: MACDCrossStrategy(entry_hhmm_min=900, entry_hhmm_max=1100),
+    "orb": lambda: ORBStrategy(opening_window_min=10, take_profit_pct=1.0, stop_loss_pct=-1.0),
+    "post_drop_rebound": lambda: PostDropReboundStrategy(max_prev_return_pct=-1.0, vol_mult=0.5,
+                                                         entry_hhmm_min=900, entry_hhmm_max=1100),
+    "rsi_oversold": lambda: RSIOversoldStrategy(),
+    "trend_followthrough": lambda: TrendFollowthroughStrategy(entry_hhmm_min=900, entry_hhmm_max=1100),
+    "volume_surge": lambda: VolumeSurgeStrategy(),
+    "vwap_bounce": lambda: VWAPBounceStrategy(),
+}
+
+
+def _make_data(n_stocks=4, n_days=4, bars_per_day=120, seed=13):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range("20260105", periods=n_days + 40).strftime("%Y%m%d")
+    minute, daily = {}, {}
+    for s in range(n_stocks):
+        code = f"S{s:03d}"
+        rows = []
+        price = 10000.0 + 500 * s
+        for td in dates[40:]:
+            for i in range(bars_per_day):
+                price *= 1 + rng.normal(0, 0.004)
+                rows.append({
+                    "stock_code": code, "trade_date": td,
+                    "trade_time": f"{9 + i // 60:02d}{i % 60:02d}00",
+                    "open": price * (1 + rng.normal(0, 0.001)),
+                    "high": price * 1.002, "low": price * 0.998, "close": price,
+                    "volume": float(rng.integers(100, 20000)),
+                })
+        # 종목별 길이를 다르게 (끝 bar 강제청산·범위 밖 bar 경로 검증)
+        minute[code] = pd.DataFrame(rows).iloc[: len(rows) - 7 * s].reset_index(drop=True)
+        closes = 10000.0 * np.cumprod(1 + rng.normal(0, 0.03, len(dates)))
+        daily[code] = pd.DataFrame({
+            "stock_code": code, "trade_date": list(dates), "open": closes,
+            "high": closes * 1.01, "low": closes * 0.99, "close": closes,
+            "volume": 1e6,
+        })
+    return minute, daily
+
+
+def _run(strategy_factory, minute, daily, vectorized):
+    return BacktestEngine(
+        strategy=strategy_factory(), initial_capital=10_000_000,
+        universe=list(minute), minute_df_by_code=minute,
+        daily_df_by_code=daily, vectorized=vectorized,
+    ).run()
+
+
+def _assert_same(a, b):
+    assert a.trades == b.trades
+    pd.testing.assert_series_equal(a.equity_curve, b.equity_curve)
+    assert a.final_equity == b.final_equity
+    assert a.metrics.keys() == b.metrics.keys()
+    for k in a.metrics:
+        assert a.metrics[k] == b.metrics[k] or (np.isnan(a.metrics[k]) and np.isnan(b.metrics[k]))
+
+
+def test_every_masked_strategy_is_covered():
+    masked = {
+        path.stem for path in STRATEGIES_DIR.glob("*.py")
+        if path.stem != "base" and (
+            "def entry_mask" in path.read_text(encoding="utf-8")
+            or "def exit_mask" in path.read_text(encoding="utf-8"))
+    }
+    assert masked == set(MASKED_STRATEGIES)
+
+
+@pytest.mark.parametrize("name", sorted(MASKED_STRATEGIES))
+def test_vectorized_matches_bar_loop(name):
+    factory = MASKED_STRATEGIES[name]
+    minute, daily = _make_data()
+    loop = _run(factory, minute, daily, vectorized=False)
+    vec = _run(factory, minute, daily, vectorized=True)
+    assert len(loop.trades) > 0
+    _assert_same(loop, vec)
+
+
+class _EveryTenBarsNoMasks(StrategyBase):
+    """마스크 미구현 전략 — 엔진 fallback (bar 별 호출) 경로."""
+    name = "every_ten"
+
+    def prepare_features(self, df_minute, df_daily):
+        return pd.DataFrame({"close": df_minute["close"]}, index=df_minute.index)
+
+    def entry_signal(self, features, bar_idx, stock_code):
+        if bar_idx % 10 == 3:
+            return EntryOrder(stock_code=stock_code, priority=int(stock_code[1:]) % 2, budget_ratio=0.4)
+        return None
+
+    def exit_signal(self, position, features, bar_idx, current_price=None):
+        if bar_idx - position.entry_bar_idx >= 4:
+            return ExitOrder(stock_code=position.stock_code, reason="hold_limit")
+        return None
+
+
+class _EveryTenBarsLooseMasks(_EveryTenBarsNoMasks):
+    """상위집합 마스크 (모든 bar True) — 최종 판정은 signal 메서드."""
+
+    def entry_mask(self, features):
+        return np.ones(len(features), dtype=bool)
+
+    def exit_mask(self, position, features, close):
+        return np.ones(len(features), dtype=bool)
+
+
+@pytest.mark.parametrize("cls", [_EveryTenBarsNoMasks, _EveryTenBarsLooseMasks])
+def test_vectorized_fallback_and_superset_masks(cls):
+    minute, daily = _make_data(n_stocks=3, n_days=2)
+    _assert_same(_run(cls, minute, daily, False), _run(cls, minute, daily, True))
+
+
+def test_tp_sl_exit_mask_matches_signal_formula():
+    close = np.array([100.0, 103.0, 97.9, 98.0, 102.99])
+    mask = tp_sl_exit_mask(close, 100.0, 3.0, -2.0)
+    assert mask.tolist() == [False, True, True, True, False]
+    assert not tp_sl_exit_mask(close, 0.0, 3.0, -2.0).any()
+
+
+def test_hold_limit_exit_mask_covers_trading_day_count():
+    df = pd.DataFrame({"trade_date": ["d1"] * 3 + ["d2"] * 3 + ["d3"] * 2})
+    for start in range(len(df)):
+        mask = hold_limit_exit_mask(df, start, 1, len(df) + 2)
+        for t in range(start, len(df) + 2):
+            expected = count_trading_days_between(df, start, t) >= 1
+            assert mask[t] == expected
@@ -0,0 +1,90 @@
+"""backtests.common.shared_frames 단위 테스트 (공유 메모리 배치/복원)."""
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtests.common.shared_frames import SharedFrames, load_worker_data, publish_worker_data
+
+
+def _minute(code, n):
+    return pd.DataFrame({
+        "stock_code": code,
+        "trade_date": ["20250102"] * (n // 2) + ["20250103"] * (n - n // 2),
+        "trade_time": [f"09{m:02d}00" for m in range(n)],
+        "open": np.arange(n, dtype=float), "close": np.arange(n, dtype=float) + 0.5,
+        "volume": np.arange(n, dtype=np.int64),
+        "amount": [Decimal(i) for i in range(n)],
+    })
+
+
+def _groups():
+    minute = {"005930": _minute("005930", 6), "000660": _minute("000660", 4),
+              "035720": _minute("035720", 2).iloc[:0]}
+    daily = {"005930": _minute("005930", 3).drop(columns="trade_time"),
+             "000660": pd.DataFrame(), "035720": pd.DataFrame()}
+    return minute, daily
+
+
+def _assert_frames_equal(restored, original):
+    assert list(restored) == list(original)
+    for code, df in original.items():
+        expected = df.copy()
+        if "amount" in expected:
+            expected["amount"] = expected["amount"].astype(float)
+        pd.testing.assert_frame_equal(restored[code], expected, check_index_type=False)
+
+
+def test_roundtrip_preserves_frames():
+    minute, daily = _groups()
+    with SharedFrames.create({"minute": minute, "daily": daily}) as shared:
+        attached = SharedFrames.attach(shared.handle)
+        _assert_frames_equal(attached.frames("minute"), minute)
+        _assert_frames_equal(attached.frames("daily"), daily)
+
+
+def test_numeric_columns_are_readonly_shared_views():
+    minute, daily = _groups()
+    with SharedFrames.create({"minute": minute, "daily": daily}) as shared:
+        a = SharedFrames.attach(shared.handle).frames("minute")["005930"]
+        b = SharedFrames.attach(shared.handle).frames("minute")["005930"]
+        assert np.shares_memory(a["open"].to_numpy(), b["open"].to_numpy()) is False  # 별도 매핑
+        assert not a["open"].to_numpy().flags.writeable
+        with pytest.raises(ValueError):
+            a.loc[0, "open"] = 1.0
+        # 컬럼 교체/파생 컬럼 추가는 가능 (전략 prepare_features 패턴)
+        a = a.copy()
+        a["open"] = 0.0
+        a["bar_in_day"] = a.groupby("trade_date").cumcount()
+
+
+def _child_sum(handle):
+    frames = SharedFrames.attach(handle).frames("minute")
+    return {c: float(df["close"].sum()) for c, df in frames.items()}
+
+
+def test_worker_process_reads_shared_data():
+    minute, daily = _groups()
+    with SharedFrames.create({"minute": minute, "daily": daily}) as shared:
+        with ProcessPoolExecutor(max_workers=2) as ex:
+            results = list(ex.map(_child_sum, [shared.handle] * 2))
+    expected = {c: float(df["close"].sum()) for c, df in minute.items()}
+    assert results == [expected, expected]
+
+
+def test_publish_worker_data_falls_back_to_pickle(monkeypatch):
+    minute, daily = _groups()
+
+    def _fail(groups):
+        raise OSError("no space")
+
+    monkeypatch.setattr(SharedFrames, "create", staticmethod(_fail))
+    source, cleanup = publish_worker_data(minute, daily)
+    try:
+        assert "pickle" in source
+        m, d = load_worker_data(source)
+        assert list(m) == list(minute)
+    finally:
+        cleanup()
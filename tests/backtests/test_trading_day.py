@@ -2,9 +2,11 @@
 import pandas as pd
 import pytest
 
+from backtests.common.signal_masks import hold_limit_exit_mask
 from backtests.common.trading_day import (
     count_trading_days_between,
     bar_idx_to_trade_date,
+    get_day_index,
 )
 
 
@@ -59,3 +61,58 @@ def test_bar_idx_out_of_range():
     df = _make_df(["20260401", "20260402"])
     with pytest.raises(IndexError):
         bar_idx_to_trade_date(df, 5)
+
+
+def test_day_index_matches_nunique_on_all_ranges():
+    df = _make_df(["d1"] * 3 + ["d2"] * 2 + ["d3"] * 4)
+    for i in range(len(df) + 2):
+        for j in range(i, len(df) + 3):
+            expected = int(df["trade_date"].iloc[i : j + 1].nunique() - 1)
+            assert count_trading_days_between(df, i, j) == expected
+
+
+def test_day_index_falls_back_for_non_contiguous_dates():
+    df = _make_df(["d1", "d2", "d1", "d2"])
+    assert not get_day_index(df).contiguous
+    assert count_trading_days_between(df, 0, 3) == 1
+
+
+def test_day_index_cached_and_invalidated():
+    df = _make_df(["d1", "d1", "d2"])
+    idx = get_day_index(df)
+    assert get_day_index(df) is idx
+    # 파생 DF (copy·컬럼 접근) 로 전파돼도 deepcopy 없이 공유
+    assert get_day_index(df.copy()) is idx
+    # 길이가 다른 슬라이스 / 다른 내용은 재계산
+    assert get_day_index(df.iloc[:2]) is not idx
+    assert count_trading_days_between(df.iloc[:2], 0, 1) == 0
+    df2 = _make_df(["d2", "d3", "d3"])
+    df2.attrs.update(df.attrs)
+    assert count_trading_days_between(df2, 0, 2) == 1
+    # concat 시 attrs 비교 오류 없음
+    pd.concat([df, df])
+
+
+def test_count_missing_trading_day_frame_vs_calendar():
+    # 20260402(목) 분봉 결측 (거래정지 등)
+    df = _make_df(["20260401", "20260401", "20260403", "20260403"])
+    # 기본: DF 에 나타난 날짜 기준 → 1일
+    assert count_trading_days_between(df, from_idx=0, to_idx=2) == 1
+    # calendar=True: 빠진 영업일 포함 KRX 영업일 차이 → 2일
+    assert count_trading_days_between(df, from_idx=0, to_idx=2, calendar=True) == 2
+    assert hold_limit_exit_mask(df, 0, 2, len(df)).tolist() == [False] * 4
+    assert hold_limit_exit_mask(df, 0, 2, len(df), calendar=True).tolist() == [False, False, True, True]
+
+
+def test_count_mixed_non_trading_date():
+    # 20260404(토) 이 섞인 DF
+    df = _make_df(["20260403", "20260404", "20260406"])
+    # 기본 카운트는 날짜 종류와 무관하게 DF 기준
+    assert count_trading_days_between(df, from_idx=0, to_idx=2) == 2
+    # calendar=True 는 조용히 대체하지 않고 ValueError
+    with pytest.raises(ValueError, match="20260404"):
+        count_trading_days_between(df, from_idx=0, to_idx=2, calendar=True)
+    with pytest.raises(ValueError):
+        count_trading_days_between(_make_df(["d1", "d2"]), 0, 1, calendar=True)
+    with pytest.raises(ValueError):
+        count_trading_days_between(_make_df(["20260401", "20260402", "20260401"]), 0, 2, calendar=True)
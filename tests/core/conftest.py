@@ -0,0 +1,38 @@
+"""tests/core 공용 fixture (분봉 프레임, KIS 없이 만든 IntradayStockManager)."""
+import logging
+import threading
+
+import pandas as pd
+import pytest
+
+from core.intraday_stock_manager import IntradayStockManager
+
+
+@pytest.fixture
+def make_bars():
+    """분봉 DataFrame 팩토리: make_bars(date, times, closes) — OHLC 는 모두 close."""
+    def _bars(date, times, closes):
+        return pd.DataFrame({
+            "date": [date] * len(times),
+            "time": times,
+            "open": closes,
+            "high": closes,
+            "low": closes,
+            "close": closes,
+            "volume": [100.0] * len(times),
+            "amount": [0.0] * len(times),
+        })
+    return _bars
+
+
+@pytest.fixture
+def make_manager():
+    """__init__ (KIS/DB 초기화) 없이 종목/스냅샷이 빈 IntradayStockManager 를 만드는 팩토리."""
+    def _manager():
+        obj = IntradayStockManager.__new__(IntradayStockManager)
+        obj.logger = logging.getLogger("test_intraday_manager")
+        obj._lock = threading.RLock()
+        obj.selected_stocks = {}
+        obj._snapshots = {}
+        return obj
+    return _manager
@@ -0,0 +1,93 @@
+"""db.bulk_copy COPY 버퍼 / upsert SQL 및 캐시 적재 프레임 테스트 (DB 불필요)."""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from db.bulk_copy import copy_upsert, dataframe_to_copy_buffer
+from utils.data_cache import _minute_cache_frame
+
+
+class _FakeCursor:
+    def __init__(self):
+        self.statements = []
+        self.copied = None
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+
+    def copy_expert(self, sql, buf):
+        self.statements.append(sql)
+        self.copied = buf.read()
+
+
+def _rows(buf):
+    return [line.split('\t') for line in buf.getvalue().splitlines()]
+
+
+def test_copy_buffer_formats_types_and_nulls():
+    df = pd.DataFrame({
+        'code': ['005930', None, 'a\tb\\c\nd'],
+        'price': [70000.5, np.nan, 1e16],
+        'volume': pd.Series([10, None, 3], dtype='Int64'),
+        'ts': pd.to_datetime(['2026-01-05 09:00:00', None, '2026-01-05 15:30:00']),
+    })
+    assert _rows(dataframe_to_copy_buffer(df)) == [
+        ['005930', '70000.5', '10', '2026-01-05 09:00:00'],
+        ['\\N', '\\N', '\\N', '\\N'],
+        ['a\\tb\\\\c\\nd', '1e+16', '3', '2026-01-05 15:30:00'],
+    ]
+
+
+def test_copy_buffer_float_round_trip():
+    values = np.random.default_rng(0).normal(0, 1e5, 200)
+    parsed = [float(r[0]) for r in _rows(dataframe_to_copy_buffer(pd.DataFrame({'v': values})))]
+    assert parsed == values.tolist()
+
+
+def test_copy_upsert_update_sql_and_dedupe():
+    cur = _FakeCursor()
+    df = pd.DataFrame({'stock_code': ['A', 'A', 'B'], 'd': ['1', '1', '1'], 'v': [1.0, 2.0, 3.0]})
+    assert copy_upsert(cur, 'daily_candles', df, key_columns=['stock_code', 'd']) == 2
+
+    drop, create, copy, insert = cur.statements
+    assert drop == 'DROP TABLE IF EXISTS _stage_daily_candles'
+    assert 'ON COMMIT DROP' in create and 'FROM daily_candles WITH NO DATA' in create
+    assert copy == 'COPY _stage_daily_candles (stock_code, d, v) FROM STDIN'
+    assert insert.endswith('ON CONFLICT (stock_code, d) DO UPDATE SET v = EXCLUDED.v')
+    assert cur.copied == 'A\t1\t2.0\nB\t1\t3.0\n'
+
+
+def test_copy_upsert_nothing_keeps_first_and_skips_empty():
+    cur = _FakeCursor()
+    df = pd.DataFrame({'k': [1, 1], 'v': ['x', 'y']})
+    copy_upsert(cur, 't', df, key_columns=['k'], on_conflict='nothing')
+    assert cur.statements[-1].endswith('ON CONFLICT (k) DO NOTHING')
+    assert cur.copied == '1\tx\n'
+
+    cur = _FakeCursor()
+    assert copy_upsert(cur, 't', df.iloc[:0], key_columns=['k']) == 0
+    assert cur.statements == []
+    with pytest.raises(ValueError):
+        copy_upsert(cur, 't', df, key_columns=['k'], on_conflict='replace')
+
+
+def test_minute_cache_frame_matches_row_conversion():
+    df = pd.DataFrame({
+        'date': ['20260105', '20260105'],
+        'time': ['090000', None],
+        'close': [100, np.nan],
+        'open': [99.5, 101],
+        'high': [101, 102],
+        'low': [98, 100],
+        'volume': [1000, 2000],
+        'datetime': [datetime(2026, 1, 5, 9, 0), datetime(2026, 1, 5, 9, 1)],
+    }, index=[7, 7])
+    frame = _minute_cache_frame('005930', '20260105', df)
+    assert _rows(dataframe_to_copy_buffer(frame)) == [
+        ['005930', '20260105', '0', '20260105', '090000', '100.0', '99.5', '101.0', '98.0',
+         '1000.0', '0.0', '2026-01-05 09:00:00'],
+        ['005930', '20260105', '1', '20260105', '\\N', '0.0', '101.0', '102.0', '100.0',
+         '2000.0', '0.0', '2026-01-05 09:01:00'],
+    ]
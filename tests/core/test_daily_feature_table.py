@@ -0,0 +1,115 @@
+"""core.indicators.daily_feature_table 단위 테스트 — 기존 행 단위 계산과 동일성."""
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.indicators.daily_feature_table import DailyFeatureTable
+
+
+def _reference(daily_df: pd.DataFrame, trade_date: str) -> Optional[Dict]:
+    """AdvancedFilterManager._extract_daily_features 의 기존 계산식."""
+    daily_df = daily_df.copy()
+    for col in ['stck_clpr', 'stck_oprc', 'stck_hgpr', 'stck_lwpr', 'acml_vol']:
+        daily_df[col] = pd.to_numeric(daily_df[col], errors='coerce')
+    daily_df = daily_df[daily_df['stck_bsop_date'] < trade_date].copy()
+    daily_df = daily_df.sort_values('stck_bsop_date').tail(20)
+    if len(daily_df) < 5:
+        return None
+    features = {}
+    high_20d = daily_df['stck_hgpr'].max()
+    low_20d = daily_df['stck_lwpr'].min()
+    last_close = daily_df['stck_clpr'].iloc[-1]
+    features['price_position_20d'] = (
+        (last_close - low_20d) / (high_20d - low_20d) if high_20d > low_20d else 0.5
+    )
+    vol_ma20 = daily_df['acml_vol'].mean()
+    last_vol = daily_df['acml_vol'].iloc[-1]
+    features['volume_ratio_20d'] = last_vol / vol_ma20 if vol_ma20 > 0 else 1.0
+    consecutive_up = 0
+    closes = daily_df['stck_clpr'].values
+    for i in range(len(closes) - 1, 0, -1):
+        if closes[i] > closes[i - 1]:
+            consecutive_up += 1
+        else:
+            break
+    features['consecutive_up_days'] = consecutive_up
+    prev_close = daily_df['stck_clpr'].iloc[-2]
+    features['prev_day_change'] = (
+        (last_close - prev_close) / prev_close * 100 if prev_close > 0 else 0
+    )
+    return features
+
+
+def _make_daily(n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range('20250101', periods=n).strftime('%Y%m%d')
+    close = np.round(10000 * np.cumprod(1 + rng.normal(0, 0.02, n)))
+    df = pd.DataFrame({
+        'stck_bsop_date': list(dates),
+        'stck_clpr': close.astype(int).astype(str),
+        'stck_oprc': close.astype(int).astype(str),
+        'stck_hgpr': (close * 1.02).astype(int).astype(str),
+        'stck_lwpr': (close * 0.98).astype(int).astype(str),
+        'acml_vol': rng.integers(0, 1_000_000, n).astype(str),
+    })
+    # 빈 문자열/0 종가 등 (to_numeric coerce 경로)
+    df.loc[7, 'acml_vol'] = ''
+    df.loc[12, 'stck_clpr'] = ''
+    df.loc[30, 'stck_clpr'] = '0'
+    # DB 순서와 무관하게 동작
+    return df.sample(frac=1.0, random_state=seed).reset_index(drop=True)
+
+
+class _FakeDailyCache:
+    def __init__(self, frames):
+        self.frames = frames
+        self.loads = 0
+
+    def load_data(self, stock_code):
+        self.loads += 1
+        return self.frames.get(stock_code)
+
+
+def _assert_features_equal(actual, expected):
+    if expected is None:
+        assert actual is None
+        return
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        if pd.isna(value):
+            assert pd.isna(actual[key]), key
+        else:
+            assert actual[key] == pytest.approx(value, rel=1e-12), key
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_matches_reference_for_every_trade_date(seed):
+    df = _make_daily(seed=seed)
+    table = DailyFeatureTable(_FakeDailyCache({'005930': df}))
+    dates = sorted(df['stck_bsop_date'])
+    probes = ['20240101'] + dates + ['20991231', dates[10][:6] + '99']
+    for trade_date in probes:
+        _assert_features_equal(table.get('005930', trade_date), _reference(df, trade_date))
+
+
+def test_table_built_once_per_stock_and_invalidated():
+    df = _make_daily()
+    cache = _FakeDailyCache({'005930': df})
+    table = DailyFeatureTable(cache)
+    for d in sorted(df['stck_bsop_date'])[:20]:
+        table.get('005930', d)
+    assert cache.loads == 1
+    assert table.get('000000', '20250301') is None
+    table.invalidate('005930')
+    table.get('005930', '20250301')
+    assert cache.loads == 3
+
+
+def test_missing_stock_is_not_cached():
+    cache = _FakeDailyCache({})
+    table = DailyFeatureTable(cache)
+    assert table.get('000660', '20250301') is None
+    cache.frames['000660'] = _make_daily()
+    assert table.get('000660', '20250301') is not None
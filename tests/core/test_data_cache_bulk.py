@@ -0,0 +1,61 @@
+"""utils.data_cache 일괄 로드 헬퍼 테스트 (DB 불필요)."""
+from datetime import datetime, time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.data_cache import _split_bulk_frame, required_last_bar_time
+
+
+def _legacy_is_complete(times, date_str):
+    """batch_signal_replay_fast 기존 any(t >= ...) 검사"""
+    from config.market_hours import MarketHours
+    market_hours = MarketHours.get_market_hours('KRX', datetime.strptime(date_str, '%Y%m%d'))
+    check_time = time(market_hours['market_close'].hour - 1, 0)
+    has_morning = any(t >= market_hours['market_open'] for t in times)
+    has_afternoon = any(t >= check_time for t in times)
+    return has_morning and has_afternoon
+
+
+@pytest.mark.parametrize('date_str,expected', [
+    ('20260105', time(14, 0)),
+    ('20251113', time(15, 0)),  # 수능일 10:00~16:30
+])
+def test_required_last_bar_time(date_str, expected):
+    assert required_last_bar_time(date_str) == expected
+
+
+@pytest.mark.parametrize('date_str', ['20260105', '20251113'])
+def test_last_bar_threshold_matches_legacy_scan(date_str):
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        start, end = sorted(rng.integers(8 * 60, 17 * 60, 2))
+        times = [time(m // 60, m % 60) for m in range(start, end + 1, 7)]
+        assert (max(times) >= required_last_bar_time(date_str)) == _legacy_is_complete(times, date_str)
+
+
+def test_split_bulk_frame_matches_load_data_layout():
+    rows = []
+    for code, date, n in [('000660', '20260105', 3), ('005930', '20260105', 2), ('005930', '20260106', 1)]:
+        for i in range(n):
+            rows.append({
+                'stock_code': code, 'trade_date': date, 'idx': i,
+                'date': date, 'time': f'09{i:02d}00',
+                'close': 100 + i, 'open': 100, 'high': 101 + i, 'low': 99, 'volume': 10 * (i + 1), 'amount': None,
+                'datetime': datetime.strptime(f'{date} 09{i:02d}00', '%Y%m%d %H%M%S'),
+            })
+    frames = _split_bulk_frame(pd.DataFrame(rows))
+
+    assert list(frames) == [('000660', '20260105'), ('005930', '20260105'), ('005930', '20260106')]
+    df = frames[('000660', '20260105')]
+    assert df.index.name == 'idx'
+    assert df.index.tolist() == [0, 1, 2]
+    assert df.columns.tolist() == ['date', 'time', 'close', 'open', 'high', 'low', 'volume', 'amount', 'datetime']
+    assert pd.api.types.is_datetime64_any_dtype(df['datetime'])
+    assert df['close'].dtype == np.float64 and df['amount'].isna().all()
+    assert len(frames[('005930', '20260106')]) == 1
+
+
+def test_split_bulk_frame_empty():
+    assert _split_bulk_frame(pd.DataFrame(columns=['stock_code', 'trade_date', 'idx'])) == {}
@@ -0,0 +1,114 @@
+"""core.indicator_state MACD 증분 상태 단위 테스트."""
+import numpy as np
+import pandas as pd
+
+from core.indicator_state import MacdStateStore, seed_macd_state
+from core.stock_screener import StockScreener
+from core.strategies.macd_cross_signal import compute_macd_histogram_series
+from core.strategies.macd_cross_strategy import MacdCrossStrategy
+
+PARAMS = (14, 34, 12)
+
+
+def _daily(n=160, seed=3):
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2025-01-02", periods=n, freq="B").strftime("%Y%m%d")
+    return pd.DataFrame({"trade_date": list(dates),
+                         "close": 20000 + rng.normal(0, 150, n).cumsum()})
+
+
+def _full_hist(df):
+    hist = compute_macd_histogram_series(df, *PARAMS)
+    return float(hist.iloc[-1]), float(hist.iloc[-2])
+
+
+def test_advance_is_bit_identical_to_full_recompute(tmp_path):
+    df = _daily()
+    store = MacdStateStore(tmp_path / "state.pkl")
+    store.seed("005930", PARAMS, df.iloc[:100])
+    for _, row in df.iloc[100:].iterrows():
+        state = store.advance("005930", PARAMS, row["trade_date"], row["close"])
+    assert (state.prev_hist, state.prev_prev_hist) == _full_hist(df)
+
+    store.save()
+    loaded = MacdStateStore.load(tmp_path / "state.pkl")
+    assert loaded.get("005930", PARAMS) == store.get("005930", PARAMS)
+
+
+def test_reconcile_corrects_close_catches_up_and_detects_history_change(tmp_path):
+    df = _daily()
+    store = MacdStateStore(tmp_path / "state.pkl")
+    store.seed("A", PARAMS, df.iloc[:-1])
+    # 장 마감 후 마지막 분봉 종가로 전진 → 다음 날 DB 확정 종가와 다름 → 1일 전 상태에서 재전진
+    store.advance("A", PARAMS, df["trade_date"].iloc[-1], df["close"].iloc[-1] + 50)
+    tail = df.tail(3)
+    state = store.reconcile("A", PARAMS, tail["trade_date"].tolist(), tail["close"].tolist())
+    assert (state.prev_hist, state.prev_prev_hist) == _full_hist(df)
+
+    # 장 마감 후 전진 누락 → DB 꼬리로 1일 전진
+    store.seed("B", PARAMS, df.iloc[:-1])
+    state = store.reconcile("B", PARAMS, tail["trade_date"].tolist(), tail["close"].tolist())
+    assert (state.prev_hist, state.prev_prev_hist) == _full_hist(df)
+
+    # 수정주가 반영 (과거 종가 변경) → 재계산 필요
+    adjusted = tail["close"].tolist()
+    adjusted[0] *= 0.5
+    adjusted[1] *= 0.5
+    assert store.reconcile("A", PARAMS, tail["trade_date"].tolist(), adjusted) is None
+    assert store.get("A", PARAMS) is None
+    assert seed_macd_state(df.iloc[:1], PARAMS) is None
+
+
+class _DailyPricesCursor:
+    """fetch_daily_histories 용 daily_prices 가짜 cursor (종목별 최근 lookback 행)."""
+
+    def __init__(self, df):
+        self.df = df
+        self.rows = []
+
+    def execute(self, sql, params):
+        codes, before_iso, lookback, _ = params
+        before = before_iso.replace("-", "")
+        d = self.df[self.df["stock_code"].isin(codes) & (self.df["trade_date"] < before)]
+        if lookback is not None:
+            d = d.groupby("stock_code").tail(lookback)
+        self.rows = list(d[["stock_code", "trade_date", "close", "trading_value"]]
+                         .itertuples(index=False, name=None))
+
+    def fetchall(self):
+        return self.rows
+
+
+def _fetch(df, before_iso, lookback=None):
+    return StockScreener.fetch_daily_histories(_DailyPricesCursor(df), ["005930"], before_iso, lookback)
+
+
+def test_strategy_uses_state_for_tail_only_input(tmp_path):
+    df = _daily(n=400).assign(stock_code="005930", trading_value=1e9)
+    day1, day2 = df["trade_date"].iloc[-1], "20270101"
+    iso = lambda d: f"{d[:4]}-{d[4:6]}-{d[6:]}"
+    store = MacdStateStore(tmp_path / "state.pkl")
+
+    # 1일차: 상태 없음 → 전체 이력 재계산 + seed, 장 마감 후 당일 종가로 전진
+    first = MacdCrossStrategy(state_store=store)
+    tails = _fetch(df, iso(day1), 3)
+    assert first.codes_needing_history(tails, ["005930"]) == ["005930"]
+    assert first.set_daily_histories(_fetch(df, iso(day1)), day1, ["005930"]) == 1
+    assert first.advance_daily_closes({"005930": df["close"].iloc[-1]}, day1) == 1
+
+    # 2일차: 꼬리만으로 상태 사용
+    second = MacdCrossStrategy(state_store=store)
+    tails = _fetch(df, iso(day2), 3)
+    assert second.codes_needing_history(tails, ["005930"]) == []
+    assert second.set_daily_histories(tails, day2, ["005930"]) == 1
+
+    # 같은 날 상태 없이 재계산하는 fallback 이 실제로 받는 입력과 비트 단위 동일
+    fallback = MacdCrossStrategy()
+    fallback.set_daily_histories(_fetch(df, iso(day2)), day2, ["005930"])
+    assert second.get_cached_hist("005930") == fallback.get_cached_hist("005930")
+    assert second.get_daily_meta("005930") == fallback.get_daily_meta("005930")
+
+    # 고정 150일 윈도우는 EWM 시작점이 달라 상태와 일치하지 않는다 (전체 이력을 쓰는 이유)
+    windowed = MacdCrossStrategy()
+    windowed.set_daily_histories(_fetch(df, iso(day2), 150), day2, ["005930"])
+    assert windowed.get_cached_hist("005930") != second.get_cached_hist("005930")
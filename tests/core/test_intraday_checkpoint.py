@@ -0,0 +1,110 @@
+"""장중 warm-start 체크포인트 테스트 (KIS 불필요)."""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+import core.historical_data_collector as collector_module
+from core.historical_data_collector import HistoricalDataCollector
+from core.intraday_checkpoint import IntradayCheckpoint
+from core.intraday_stock_manager import StockMinuteData
+from utils.korean_time import KST
+
+DATE = "20260105"
+
+
+def _times(start_minute, count):
+    return [f"{m // 60:02d}{m % 60:02d}00" for m in range(start_minute, start_minute + count)]
+
+
+@pytest.fixture
+def checkpoint_manager(make_manager, tmp_path):
+    """tmp_path 체크포인트를 쓰는 매니저 팩토리 (재시작 전/후 각각 생성)."""
+    def _manager():
+        obj = make_manager()
+        obj._checkpoint = IntradayCheckpoint(tmp_path)
+        obj._warm_start = {}
+        obj._last_checkpoint_snapshots = None
+        obj._historical_collector = HistoricalDataCollector(obj)
+        return obj
+    return _manager
+
+
+def _add(manager, code, selected_time, bars=None):
+    stock = StockMinuteData(code, f"name_{code}", selected_time)
+    if bars is not None:
+        stock.historical_data = bars
+    manager.selected_stocks[code] = stock
+    manager.publish_snapshot(code)
+    return stock
+
+
+def test_checkpoint_roundtrip_drops_stale_price(checkpoint_manager, make_bars):
+    saved_at = KST.localize(datetime(2026, 1, 5, 10, 30))
+    manager = checkpoint_manager()
+    _add(manager, "A", saved_at, make_bars(DATE, _times(540, 90), [float(i) for i in range(90)]))
+    _add(manager, "OLD", saved_at, make_bars("20260102", _times(540, 3), [1.0, 2.0, 3.0]))
+    manager.update_current_price_info("A", {"current_price": 89.0, "update_time": saved_at})
+
+    path = manager._checkpoint.save(manager.get_snapshots(), DATE)
+    assert path.name == f"checkpoint_{DATE}.pkl"
+
+    fresh = manager._checkpoint.load(DATE, now=saved_at + timedelta(seconds=30))
+    assert set(fresh) == {"A"}  # 다른 거래일 봉은 제외
+    assert fresh["A"]["minutes"].tolist() == list(range(540, 630))
+    assert fresh["A"]["values"][-1][3] == 89.0
+    assert fresh["A"]["current_price_info"]["current_price"] == 89.0
+
+    stale = manager._checkpoint.load(DATE, now=saved_at + timedelta(minutes=5))
+    assert stale["A"]["current_price_info"] is None
+    assert manager._checkpoint.load("20260106") == {}
+
+
+def test_restart_fetches_only_tail(checkpoint_manager, make_bars, monkeypatch):
+    before = checkpoint_manager()
+    _add(before, "A", KST.localize(datetime(2026, 1, 5, 10, 0)), make_bars(DATE, _times(540, 60), [1.0] * 60))
+    before.save_checkpoint(DATE)
+    assert before.save_checkpoint(DATE) is None  # 변경 없으면 생략
+
+    calls = []
+
+    async def fake_fetch(stock_code, target_date, selected_time, start_time):
+        calls.append((stock_code, start_time, selected_time))
+        return make_bars(DATE, _times(600, 5), [2.0] * 5)
+
+    monkeypatch.setattr(collector_module, "get_full_trading_day_data_async", fake_fetch)
+
+    after = checkpoint_manager()
+    after.load_checkpoint(DATE)
+    _add(after, "A", KST.localize(datetime(2026, 1, 5, 10, 4, 30)))
+
+    assert asyncio.run(after._collect_historical_data("A")) is True
+    assert calls == [("A", "100000", "100430")]
+    snap = after.get_snapshot("A")
+    assert snap.total_count == 65 and snap.data_complete
+    assert snap.bars["close"].tolist()[-6:] == [1.0, 2.0, 2.0, 2.0, 2.0, 2.0]
+    assert after.pop_warm_start("A") is None  # 1회 소비
+
+
+def test_tail_failure_falls_back_to_full_collection(checkpoint_manager, make_bars, monkeypatch):
+    before = checkpoint_manager()
+    _add(before, "A", KST.localize(datetime(2026, 1, 5, 10, 0)), make_bars(DATE, _times(540, 60), [1.0] * 60))
+    before.save_checkpoint(DATE)
+
+    calls = []
+
+    async def fake_fetch(stock_code, target_date, selected_time, start_time):
+        calls.append(start_time)
+        if start_time != "090000":
+            return None
+        return make_bars(DATE, _times(540, 65), [3.0] * 65)
+
+    monkeypatch.setattr(collector_module, "get_full_trading_day_data_async", fake_fetch)
+
+    after = checkpoint_manager()
+    after.load_checkpoint(DATE)
+    _add(after, "A", KST.localize(datetime(2026, 1, 5, 10, 4, 30)))
+
+    assert asyncio.run(after._collect_historical_data("A")) is True
+    assert calls == ["100000", "090000"]
+    assert after.get_snapshot("A").bars["close"].tolist() == [3.0] * 65
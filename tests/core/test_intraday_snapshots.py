@@ -0,0 +1,68 @@
+"""IntradayStockManager copy-on-write 스냅샷 테스트 (KIS 불필요)."""
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from core.intraday_stock_manager import StockMinuteData
+from utils.korean_time import now_kst
+
+
+@pytest.fixture
+def manager(make_manager, make_bars):
+    obj = make_manager()
+    today = now_kst().strftime("%Y%m%d")
+    stock = StockMinuteData("005930", "삼성전자", datetime(2026, 1, 5, 9, 3))
+    times = [f"09{m:02d}00" for m in range(20)]
+    stock.historical_data = make_bars(today, times, [float(i + 1) for i in range(20)])
+    obj.selected_stocks["005930"] = stock
+    obj.publish_snapshot("005930")
+    obj.today = today
+    return obj
+
+
+def test_snapshot_is_isolated_from_later_writes(manager, make_bars):
+    before = manager.get_combined_chart_data("005930")
+    snap = manager.get_snapshot("005930")
+
+    stock = manager.get_stock_data("005930")
+    stock.bars.upsert_frame(make_bars(manager.today, ["091900", "092000"], [190.0, 21.0]))
+
+    # 발행 전: 기존 스냅샷/조회 결과 불변
+    assert before["close"].tolist()[-2:] == [19.0, 20.0]
+    assert len(manager.get_combined_chart_data("005930")) == 20
+
+    manager.publish_snapshot("005930")
+    after = manager.get_combined_chart_data("005930")
+    assert after["close"].tolist()[-3:] == [19.0, 190.0, 21.0]
+    assert snap.bars["close"].tolist()[-1] == 20.0
+    assert manager.get_snapshot("005930").realtime_count == 1
+    assert manager.get_snapshot("005930").realtime_frame()["time"].tolist() == ["092000"]
+
+
+def test_reads_share_snapshot_data_without_copying(manager):
+    snap = manager.get_snapshot("005930")
+    a = manager.get_combined_chart_data("005930")
+    b = manager.get_combined_chart_data("005930")
+    assert np.shares_memory(a["close"].to_numpy(), b["close"].to_numpy())
+    assert np.shares_memory(a["close"].to_numpy(), snap.bars["close"].to_numpy())
+
+    a["signal"] = 1  # 조회 측 컬럼 추가는 스냅샷에 영향 없음
+    assert "signal" not in snap.bars.columns
+    with pytest.raises(ValueError):
+        a.iloc[0, a.columns.get_loc("close")] = 99.0
+    assert snap.bars["close"].iloc[0] == 1.0
+
+
+def test_price_update_reuses_bars_and_remove_drops_snapshot(manager):
+    bars_frame = manager.get_snapshot("005930").bars
+    assert manager.update_current_price_info("005930", {"current_price": 70000.0})
+    snap = manager.get_snapshot("005930")
+    assert snap.bars is bars_frame
+    assert manager.get_cached_current_price("005930") == {"current_price": 70000.0}
+    assert not manager.update_current_price_info("999999", {"current_price": 1.0})
+
+    manager.remove_stock("005930")
+    assert manager.get_snapshot("005930") is None
+    assert manager.get_cached_current_price("005930") is None
+    assert manager.get_combined_chart_data("005930") is None
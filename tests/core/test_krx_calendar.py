@@ -0,0 +1,58 @@
+"""config.krx_calendar 영업일 캘린더 단위 테스트."""
+from datetime import date, datetime, time
+
+import pandas as pd
+
+from backtests.common.trading_day import count_trading_days_between
+from config.krx_calendar import KRXCalendar, get_krx_calendar
+from config.market_hours import MarketHours
+
+
+def test_trading_days_between_skips_weekends_and_holidays():
+    cal = get_krx_calendar()
+    # 2026 추석 연휴 (9/24~9/26) + 주말: 9/23(수) → 9/28(월) = 1 영업일
+    assert cal.trading_days_between(date(2026, 9, 23), date(2026, 9, 28)) == 1
+    assert cal.trading_days_between('20260923', '2026-09-23') == 0
+    assert cal.trading_days_between(date(2026, 4, 3), date(2026, 4, 7)) == 2
+    assert cal.next_trading_day(date(2026, 9, 23)) == date(2026, 9, 28)
+    assert cal.prev_trading_day(date(2026, 9, 28)) == date(2026, 9, 23)
+    assert cal.next_trading_day(date(2026, 12, 30)) == date(2027, 1, 4)
+    assert not cal.is_trading_day(datetime(2026, 10, 9, 10, 0))
+
+
+def test_session_hours_and_market_hours_routing():
+    cal = get_krx_calendar()
+    exam_day = cal.session('2025-11-13')
+    assert exam_day['market_open'] == time(10, 0) and exam_day['is_special_day']
+    assert cal.session(date(2025, 11, 14))['market_open'] == time(9, 0)
+
+    holiday_open = datetime(2026, 10, 9, 10, 0)  # 한글날 (금)
+    assert not MarketHours.is_market_open('KRX', holiday_open)
+    assert MarketHours.get_market_status('KRX', holiday_open) == 'weekend'
+    assert MarketHours.is_market_open('KRX', datetime(2026, 10, 8, 10, 0))
+
+
+def test_out_of_table_range_extends_with_weekend_rule():
+    cal = KRXCalendar(holidays=['20260101'])
+    assert cal.trading_days_between(date(2030, 1, 4), date(2030, 1, 7)) == 1  # 금 → 월
+    assert cal.is_trading_day('20260102') and not cal.is_trading_day('20260101')
+
+
+def test_range_extension_mid_call_uses_one_table_base():
+    warm = KRXCalendar()
+    warm.is_trading_day('20000103')  # 이미 과거로 확장된 테이블
+    span = warm.trading_days_between('20230105', '20260105')
+    assert span > 700
+
+    # 새 캘린더에서 호출 도중 과거로 확장돼도 결과는 동일
+    assert KRXCalendar().trading_days_between('20260105', '20230105') == -span
+    ordinals = KRXCalendar().day_ordinals(['20260105', '20230105'])
+    assert ordinals[0] - ordinals[1] == span
+
+
+def test_backtest_day_index_counts_calendar_days_across_missing_bars():
+    # 9/28 분봉 누락 (거래정지) → 9/23 → 9/29 는 KRX 영업일 2일 경과
+    df = pd.DataFrame({"trade_date": ["20260923", "20260923", "20260929"]})
+    assert count_trading_days_between(df, 0, 2) == 2
+    ords = get_krx_calendar().day_ordinals(pd.Series(["20260923", "20260928", "20260924"]))
+    assert ords[1] - ords[0] == 1 and ords[2] == -1
@@ -0,0 +1,84 @@
+"""core.minute_bar_store 단위 테스트."""
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from core.minute_bar_store import MinuteBarStore
+
+
+def _minute(hhmm):
+    return int(hhmm[:2]) * 60 + int(hhmm[2:4])
+
+
+def test_upsert_frame_sorted_and_deduplicated(make_bars):
+    store = MinuteBarStore()
+    store.upsert_frame(make_bars("20260105", ["090000", "090100", "090200"], [1, 2, 3]))
+    # 마지막 분 재수신(갱신) + 새 분 추가
+    store.upsert_frame(make_bars("20260105", ["090200", "090300"], [30, 4]))
+
+    df = store.to_frame()
+    assert df["time"].tolist() == ["090000", "090100", "090200", "090300"]
+    assert df["close"].tolist() == [1, 2, 30, 4]
+    assert df["datetime"].iloc[-1] == pd.Timestamp("2026-01-05 09:03:00")
+    assert (df["date"] == "20260105").all()
+
+
+def test_out_of_order_minute_inserted_in_place(make_bars):
+    store = MinuteBarStore()
+    store.upsert_frame(make_bars("20260105", ["090000", "090200"], [1, 3]))
+    store.upsert(_minute("0901"), 2, 2, 2, 2, 10, date="20260105")
+
+    assert store.to_frame()["close"].tolist() == [1, 2, 3]
+    assert store.get_bar(_minute("0902"))["close"] == 3
+
+
+def test_grows_past_initial_capacity(make_bars):
+    store = MinuteBarStore(capacity=2)
+    times = [f"09{m:02d}00" for m in range(10)]
+    store.upsert_frame(make_bars("20260105", times, list(range(10))))
+    assert len(store) == 10
+    assert store.to_frame()["close"].tolist() == list(range(10))
+
+
+def test_previous_day_rejected_and_new_day_resets(make_bars):
+    store = MinuteBarStore()
+    store.upsert_frame(make_bars("20260105", ["090000"], [1]))
+    assert store.upsert_frame(make_bars("20260102", ["090100"], [9])) == 0
+    assert len(store) == 1
+
+    store.upsert_frame(make_bars("20260106", ["090000"], [5]))
+    assert store.session_date == "20260106"
+    assert store.to_frame()["close"].tolist() == [5]
+
+
+def test_range_views_are_read_only(make_bars):
+    store = MinuteBarStore()
+    store.upsert_frame(make_bars("20260105", ["090000", "090100", "090200"], [1, 2, 3]))
+
+    assert store.to_frame(end_minute=_minute("0901"))["close"].tolist() == [1, 2]
+    assert store.to_frame(start_minute=_minute("0901"))["close"].tolist() == [2, 3]
+    assert store.count_after(_minute("0900")) == 2
+
+    arrays = store.arrays()
+    with pytest.raises(ValueError):
+        arrays["close"][0] = 99
+    df = store.to_frame()
+    with pytest.raises(ValueError):
+        df.loc[0, "close"] = 99
+
+
+def test_stock_minute_data_historical_realtime_split(make_bars):
+    from core.intraday_stock_manager import StockMinuteData
+
+    stock = StockMinuteData("005930", "삼성전자", datetime(2026, 1, 5, 9, 2))
+    stock.historical_data = make_bars("20260105", ["090000", "090100", "090200"], [1, 2, 3])
+    assert stock.realtime_data.empty
+
+    stock.bars.upsert_frame(make_bars("20260105", ["090200", "090300"], [3, 4]))
+    assert len(stock.historical_data) == 3
+    assert stock.realtime_data["time"].tolist() == ["090300"]
+    assert stock.realtime_count == 1
+
+    stock.historical_data = pd.DataFrame()
+    assert len(stock.bars) == 0
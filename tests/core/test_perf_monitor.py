@@ -0,0 +1,71 @@
+"""utils.perf_monitor 계측 단위 테스트."""
+import asyncio
+import json
+import time
+
+import pytest
+
+from utils.perf_monitor import LatencyHistogram, PerfMonitor, get_perf_monitor, timed
+
+
+def test_histogram_percentiles_and_buckets():
+    hist = LatencyHistogram(bounds_ms=[10, 100, 1000])
+    for ms in [1] * 90 + [50] * 9 + [3000]:
+        hist.record(ms / 1000)
+    s = hist.summary()
+    assert s['count'] == 100
+    assert s['p50_ms'] == 10
+    assert s['p95_ms'] == 100
+    assert s['p99_ms'] == 100
+    assert s['max_ms'] == pytest.approx(3000)
+    assert s['buckets'] == {'<=10': 90, '<=100': 9, '>1000': 1}
+    assert LatencyHistogram().summary()['p95_ms'] == 0.0
+
+
+def test_timed_records_sync_and_async_including_errors():
+    monitor = get_perf_monitor()
+    monitor.reset()
+
+    @timed('t_sync')
+    def work():
+        time.sleep(0.01)
+        return 1
+
+    @timed('t_async')
+    async def awork(fail=False):
+        await asyncio.sleep(0.01)
+        if fail:
+            raise ValueError('x')
+        return 2
+
+    assert work() == 1
+    assert asyncio.run(awork()) == 2
+    with pytest.raises(ValueError):
+        asyncio.run(awork(fail=True))
+
+    tasks = monitor.snapshot()['tasks']
+    assert tasks['t_sync']['count'] == 1 and tasks['t_sync']['max_ms'] >= 10
+    assert tasks['t_async']['count'] == 2
+    monitor.reset()
+
+
+def test_loop_lag_sampler_detects_blocking(tmp_path):
+    monitor = PerfMonitor(lag_interval=0.02, dump_dir=tmp_path)
+
+    async def run():
+        sampler = asyncio.create_task(monitor.sample_loop_lag())
+        await asyncio.sleep(0.05)
+        time.sleep(0.2)  # 루프 블로킹
+        await asyncio.sleep(0.05)
+        sampler.cancel()
+
+    asyncio.run(run())
+    lag = monitor.snapshot()['loop_lag']
+    assert lag['count'] >= 2
+    assert lag['max_ms'] >= 150
+
+    path = monitor.dump_json()
+    assert path.parent == tmp_path
+    data = json.loads(path.read_text(encoding='utf-8'))
+    assert set(data) >= {'loop_lag', 'tasks', 'kis_calls', 'kis_rate_lanes'}
+    assert '루프 지연' in monitor.format_summary()
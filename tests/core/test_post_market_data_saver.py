@@ -0,0 +1,96 @@
+"""PostMarketDataSaver.save_all_data_async 파이프라인 테스트 (KIS/DB 불필요)."""
+import asyncio
+import logging
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+import core.post_market_data_saver as saver_module
+from core.post_market_data_saver import PostMarketDataSaver
+
+
+class _FakeMinuteCache:
+    def __init__(self):
+        self.saved = {}
+
+    def save_data(self, stock_code, date_str, df):
+        self.saved[stock_code] = len(df)
+        return True
+
+
+class _FakeDailyCache:
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.saved = {}
+
+    def has_data(self, stock_code, min_records=50):
+        return stock_code in self.existing
+
+    def save_data(self, stock_code, df):
+        self.saved[stock_code] = len(df)
+        return stock_code != 'FAILDB'
+
+
+class _FakeIntraday:
+    def __init__(self, codes, today):
+        self._lock = threading.Lock()
+        self.selected_stocks = {code: None for code in codes}
+        self._today = today
+
+    def get_combined_chart_data(self, stock_code):
+        if stock_code == 'NOMIN':
+            return None
+        return pd.DataFrame({'date': [self._today, self._today, '20000101'], 'close': [1, 2, 3]})
+
+
+@pytest.fixture
+def saver(monkeypatch):
+    in_flight = {'now': 0, 'peak': 0}
+    lock = threading.Lock()
+
+    def fake_fetch(itm_no, **kwargs):
+        with lock:
+            in_flight['now'] += 1
+            in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+        time.sleep(0.02)
+        with lock:
+            in_flight['now'] -= 1
+        if itm_no == 'NODAILY':
+            return None
+        return pd.DataFrame({'stck_bsop_date': [f'2026{i:04d}' for i in range(150)]})
+
+    monkeypatch.setattr(saver_module, 'get_inquire_daily_itemchartprice', fake_fetch)
+    obj = PostMarketDataSaver.__new__(PostMarketDataSaver)
+    obj.logger = logging.getLogger('test_post_market_data_saver')
+    obj.minute_cache = _FakeMinuteCache()
+    obj.daily_cache = _FakeDailyCache(existing={'HAS'})
+    obj.save_index_daily_data = lambda: True
+    obj.save_minute_data_to_file = lambda manager: 'dump.txt'
+    obj.in_flight = in_flight
+    return obj
+
+
+def test_async_pipeline_matches_sequential_results(saver):
+    today = saver_module.now_kst().strftime('%Y%m%d')
+    codes = ['A', 'B', 'HAS', 'NODAILY', 'FAILDB', 'NOMIN'] + [f'C{i}' for i in range(10)]
+    manager = _FakeIntraday(codes, today)
+
+    result = asyncio.run(saver.save_all_data_async(manager, fetch_concurrency=4))
+
+    assert result['success'] is True
+    assert result['text_file'] == 'dump.txt'
+    assert result['minute_data'] == {'total': 16, 'saved': 15, 'failed': 1}
+    assert result['daily_data'] == saver.save_daily_data(codes, target_date=today)
+    assert saver.minute_cache.saved['A'] == 2  # 전날 행 제외
+    assert saver.daily_cache.saved['A'] == 100  # 최신 100일만
+    assert 'HAS' not in saver.daily_cache.saved
+    assert set(result['timings']) >= {'minute_data', 'daily_data', 'index_data', 'text_file', 'total'}
+    assert 1 < saver.in_flight['peak'] <= 4
+
+
+def test_async_pipeline_no_stocks(saver):
+    result = asyncio.run(saver.save_all_data_async(_FakeIntraday([], '20260105')))
+    assert result['success'] is False
+    assert result['daily_data'] == {'total': 0, 'saved': 0, 'failed': 0}
@@ -0,0 +1,100 @@
+"""PullbackCandlePattern.iter_improved_signals 스트리밍 평가 동등성 테스트."""
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.indicators.pullback_candle_pattern import PullbackCandlePattern
+from core.indicators.pullback_utils import SignalType
+
+
+@pytest.fixture(autouse=True)
+def _quiet_logs():
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def _day_frame(seed, n=100, date='2026-03-03'):
+    """상승 → 저거래량 하락 → 지지 → 돌파 구간을 반복한 하루치 3분봉"""
+    rng = np.random.default_rng(seed)
+    closes = [10000.0]
+    while len(closes) < n:
+        up = np.linspace(closes[-1], closes[-1] * (1 + rng.uniform(0.02, 0.06)), 7)[1:]
+        down = np.linspace(up[-1], up[-1] * (1 - rng.uniform(0.005, 0.03)), 5)[1:]
+        flat = down[-1] * (1 + rng.normal(0, 0.002, 5))
+        closes += list(up) + list(down) + list(flat) + [flat[-1] * 1.01]
+    closes = np.array(closes[:n]) * (1 + rng.normal(0, 0.002, n))
+    opens = np.roll(closes, 1) * (1 + rng.normal(0, 0.001, n))
+    opens[0] = closes[0] * 0.99
+    volumes = rng.integers(300, 20000, n).astype(float)
+    return pd.DataFrame({
+        'datetime': pd.date_range(f'{date} 09:00', periods=n, freq='3min'),
+        'open': opens,
+        'high': np.maximum(opens, closes) * (1 + rng.uniform(0, 0.003, n)),
+        'low': np.minimum(opens, closes) * (1 - rng.uniform(0, 0.003, n)),
+        'close': closes,
+        'volume': volumes,
+    })
+
+
+def _key(signal):
+    if signal is None:
+        return None
+    return (
+        signal.signal_type, signal.confidence, signal.target_profit, tuple(signal.reasons),
+        signal.volume_ratio, signal.bisector_status, signal.buy_price, signal.entry_low,
+        repr(signal.pattern_data),
+    )
+
+
+def _prefix_signals(df, **kwargs):
+    return [
+        _key(PullbackCandlePattern.generate_improved_signals(df.iloc[:i + 1].copy(), **kwargs))
+        for i in range(len(df))
+    ]
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_streaming_matches_prefix_evaluation(seed):
+    df = _day_frame(seed)
+    expected = _prefix_signals(df, stock_code='T', debug=True)
+    streamed = [(i, _key(s)) for i, s in PullbackCandlePattern.iter_improved_signals(df, stock_code='T', debug=True)]
+
+    assert [i for i, _ in streamed] == list(range(len(df)))
+    assert [k for _, k in streamed] == expected
+
+
+def test_streaming_covers_buy_signals():
+    buys = [
+        i for i, s in PullbackCandlePattern.iter_improved_signals(_day_frame(1), stock_code='T')
+        if s is not None and s.signal_type in (SignalType.STRONG_BUY, SignalType.CAUTIOUS_BUY)
+    ]
+    assert buys
+
+
+def test_streaming_subset_indices_and_string_columns():
+    df = _day_frame(3, n=60)
+    raw = df.copy()
+    raw['volume'] = [f"{int(v):,}" for v in df['volume']]
+    indices = [0, 3, 4, 10, 30, 52, 59]
+    streamed = dict(
+        (i, (_key(s), risks))
+        for i, (s, risks) in PullbackCandlePattern.iter_improved_signals(
+            raw, stock_code='T', return_risk_signals=True, indices=indices
+        )
+    )
+    assert list(streamed) == indices
+    for i in indices:
+        signal, risks = PullbackCandlePattern.generate_improved_signals(
+            raw.iloc[:i + 1].copy(), stock_code='T', return_risk_signals=True
+        )
+        assert streamed[i] == (_key(signal), risks)
+
+
+def test_streaming_missing_market_open_candle():
+    df = _day_frame(2, n=30).iloc[2:].reset_index(drop=True)
+    expected = _prefix_signals(df, stock_code='T')
+    streamed = [_key(s) for _, s in PullbackCandlePattern.iter_improved_signals(df, stock_code='T')]
+    assert streamed == expected
@@ -0,0 +1,125 @@
+"""core.stock_screener 장중 스캔 파이프라인 테스트 (KIS 호출은 가짜 함수로 대체)."""
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+import core.stock_screener as screener_module
+from api.kis_rate_limiter import Lane, lane_for_tr
+from core.stock_screener import StockScreener
+
+CONFIG = {
+    'min_change_rate': 0.5, 'max_change_rate': 5.0,
+    'min_price': 5000, 'max_price': 500000,
+    'min_trading_amount': 1_000_000_000,
+    'min_pct_from_open': 0.8, 'max_pct_from_open': 4.0,
+    'max_gap_pct': 1.5, 'min_gap_down_pct': -2.0,
+    'max_phase3_checks': 15, 'max_candidates_per_scan': 5,
+    'max_total_candidates': 15, 'min_score': 65,
+}
+
+# (코드, 종목명, 등락률, 현재가, 거래대금) — 거래량순위 응답
+RANK = {
+    '0001': [
+        ('000010', '통과A', '2.0', '10000', '60000000000'),
+        ('000020', '통과B', '1.2', '20000', '12000000000'),
+        ('000030', '갭초과', '2.5', '30000', '30000000000'),
+        ('000040', '시가대비', '1.0', '40000', '30000000000'),
+        ('000055', '우선주', '1.0', '40000', '30000000000'),
+        ('000060', 'TIGER ETF', '1.0', '40000', '30000000000'),
+        ('000070', '등락률', '7.0', '40000', '30000000000'),
+    ],
+    '1001': [
+        ('000010', '통과A', '2.0', '10000', '60000000000'),  # KOSPI 와 중복
+        ('000080', '저가', '1.0', '3000', '30000000000'),
+        ('000090', '거래대금', '1.0', '9000', '500000000'),
+        ('000100', '저점수', '0.6', '9000', '2000000000'),
+        ('000110', '조회실패', '1.0', '9000', '30000000000'),
+    ],
+}
+
+# 코드 → (현재가, 시가, 전일종가, 고가, 저가, 등락률, 거래대금)
+PRICES = {
+    '000010': (10200, 10000, 9950, 10250, 9900, '2.5', '60000000000'),
+    '000020': (20300, 20000, 20000, 20400, 19900, '1.5', '12000000000'),
+    '000030': (30600, 30000, 29000, 30700, 29900, '5.5', '30000000000'),
+    '000040': (40100, 40000, 39900, 40200, 39800, '0.5', '30000000000'),
+    '000100': (9100, 9000, 9000, 9200, 8900, '0.6', '2000000000'),
+}
+
+
+def _volume_rank(fid_input_iscd, **kwargs):
+    rows = RANK[fid_input_iscd]
+    return pd.DataFrame(rows, columns=['mksc_shrn_iscd', 'hts_kor_isnm', 'prdy_ctrt',
+                                       'stck_prpr', 'acml_tr_pbmn'])
+
+
+class _FakePriceAPI:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lanes = set()
+        self.threads = set()
+
+    def __call__(self, itm_no, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.lanes.add(lane_for_tr(None))
+            self.threads.add(threading.current_thread().name)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        if itm_no not in PRICES:
+            return None
+        cur, opn, prev, high, low, chg, amount = PRICES[itm_no]
+        return pd.DataFrame([{
+            'stck_prpr': str(cur), 'stck_oprc': str(opn), 'stck_sdpr': str(prev),
+            'stck_hgpr': str(high), 'stck_lwpr': str(low), 'acml_vol': '1000',
+            'acml_tr_pbmn': amount, 'prdy_ctrt': chg,
+        }])
+
+
+@pytest.mark.parametrize('parallel', [True, False])
+def test_scan_filters_and_ranks_like_sequential_pipeline(monkeypatch, parallel):
+    fake = _FakePriceAPI()
+    monkeypatch.setattr(screener_module, 'get_volume_rank', _volume_rank)
+    monkeypatch.setattr(screener_module, 'get_inquire_price', fake)
+
+    screener = StockScreener(config={**CONFIG, 'parallel_api_calls': parallel})
+    try:
+        result = screener.scan()
+    finally:
+        screener.shutdown()
+
+    assert [s.code for s in result] == ['000010', '000020']
+    top = result[0]
+    assert top.pct_from_open == (10200 / 10000 - 1) * 100
+    # 시가대비 2.0% (40) + 거래대금 600억 (30) + 가격위치 300/350 (17.1) + 등락률 2.5% (10)
+    assert top.score == 97.1
+    # 갭/조회실패/점수 미달은 재조회 방지, 시가대비 탈락은 다음 스캔에서 재검증
+    assert screener._rejected_stocks == {'000030', '000100', '000110'}
+    assert fake.lanes == {Lane.SCAN}
+    if parallel:
+        assert fake.max_in_flight > 1
+        # 공용 kis_async executor (매도 가격 갱신 경로) 가 아닌 스크리너 전용 워커에서 실행
+        assert all(name.startswith('screener') for name in fake.threads)
+    else:
+        assert fake.max_in_flight == 1
+
+
+def test_score_frame_bands():
+    # (시가대비, 등락률, 거래대금, 현재가, 고가, 저가) → 점수
+    cases = [
+        (2.0, 2.0, 50_000_000_000, 10130, 10250, 9870, 93.7),   # 40 + 30 + 13.7 + 10
+        (1.5, 1.0, 10_000_000_000, 10250, 10250, 9870, 90.0),   # 구간 경계: 40 + 20 + 20 + 10
+        (1.49, 0.99, 20_000_000_000, 10000, 10000, 10000, 60.0),  # 30 + 25 + 0 (고가=저가) + 5
+        (2.51, 3.01, 5_000_000_000, 10000, 10100, 0, 50.0),     # 30 + 15 + 0 (저가 0) + 5
+        (3.5, 6.0, 1_000_000_000, 10000, 10100, 9900, 40.0),    # 20 + 10 + 10 + 0
+    ]
+    frame = pd.DataFrame(cases, columns=['pct', 'chg', 'amount', 'cur', 'high', 'low', 'expected'])
+    scores = StockScreener._score_frame(frame['pct'], frame['chg'], frame['amount'],
+                                        frame['cur'], frame['high'], frame['low'])
+    assert scores.tolist() == frame['expected'].tolist()
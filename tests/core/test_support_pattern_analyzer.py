@@ -0,0 +1,71 @@
+"""SupportPatternAnalyzer 벡터화 사전 필터 동등성 테스트."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.indicators.pullback.support_pattern_analyzer import SupportPatternAnalyzer
+
+
+def _pattern_frame(seed, n=40):
+    """상승(고거래량) → 저거래량 하락 → 지지 → 돌파 형태에 잡음을 섞은 3분봉"""
+    rng = np.random.default_rng(seed)
+    up = np.linspace(10000, 10000 * (1 + rng.uniform(0.02, 0.07)), 8)
+    down = np.linspace(up[-1], up[-1] * (1 - rng.uniform(0.005, 0.04)), 5)[1:]
+    flat = down[-1] * (1 + rng.normal(0, 0.002, 6))
+    closes = np.concatenate([np.full(n - 19, 10000.0), up, down, flat, [flat[-1] * 1.01]])
+    closes = closes * (1 + rng.normal(0, 0.002, len(closes)))
+    opens = np.roll(closes, 1) * (1 + rng.normal(0, 0.001, len(closes)))
+    opens[0] = closes[0]
+    opens[-1] = min(opens[-1], closes[-1] * 0.995)
+    volumes = np.concatenate([
+        rng.integers(1000, 3000, n - 19), rng.integers(8000, 20000, 8),
+        rng.integers(500, 4000, 4), rng.integers(300, 2500, 6), rng.integers(3000, 6000, 1),
+    ]).astype(float)
+    return pd.DataFrame({
+        'open': opens,
+        'high': np.maximum(opens, closes) * (1 + rng.uniform(0, 0.003, len(closes))),
+        'low': np.minimum(opens, closes) * (1 - rng.uniform(0, 0.003, len(closes))),
+        'close': closes,
+        'volume': volumes,
+    })
+
+
+def _random_frame(seed, n=35):
+    rng = np.random.default_rng(seed)
+    closes = 10000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    opens = closes * (1 + rng.normal(0, 0.005, n))
+    return pd.DataFrame({
+        'open': opens,
+        'high': np.maximum(opens, closes) * 1.002,
+        'low': np.minimum(opens, closes) * 0.998,
+        'close': closes,
+        'volume': rng.integers(100, 20000, n).astype(float),
+    })
+
+
+def _reference():
+    analyzer = SupportPatternAnalyzer()
+    analyzer.use_vectorized_filters = False
+    return analyzer
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_filtered_search_matches_full_search(seed):
+    fast = SupportPatternAnalyzer()
+    reference = _reference()
+    for frame in (_pattern_frame(seed), _random_frame(seed)):
+        for end in range(20, len(frame) + 1, 3):
+            prefix = frame.iloc[:end]
+            assert fast.analyze(prefix) == reference.analyze(prefix)
+
+
+def test_synthetic_patterns_are_detected():
+    fast = SupportPatternAnalyzer()
+    found = [fast.analyze(_pattern_frame(seed)).has_pattern for seed in range(40)]
+    assert any(found)
+
+
+def test_nan_input_uses_full_search():
+    frame = _pattern_frame(3)
+    frame.loc[25, 'volume'] = np.nan
+    assert SupportPatternAnalyzer().analyze(frame) == _reference().analyze(frame)
@@ -0,0 +1,103 @@
+"""TimeFrameConverter 증분 N분봉 (CandleResampler) 단위 테스트."""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.timeframe_converter import CandleResampler, TimeFrameConverter
+
+
+NOW = datetime(2025, 1, 3, 15, 40)
+
+
+def _minute_frame(n=60, start='2025-01-03 09:00', skip=(), tz=None):
+    rng = np.random.default_rng(7)
+    dt = pd.date_range(start, periods=n, freq='1min', tz=tz)
+    close = 10000 + rng.integers(-50, 50, n).cumsum()
+    df = pd.DataFrame({
+        'datetime': dt,
+        'open': close + rng.integers(-10, 10, n),
+        'high': close + 20,
+        'low': close - 20,
+        'close': close,
+        'volume': rng.integers(100, 1000, n),
+    })
+    return df.drop(index=list(skip)).reset_index(drop=True)
+
+
+def _assert_same(actual, expected):
+    pd.testing.assert_frame_equal(
+        actual.reset_index(drop=True), expected.reset_index(drop=True), check_index_type=False
+    )
+
+
+def test_incremental_prefixes_match_full_conversion():
+    df = _minute_frame(70, skip=(10, 11, 40))
+    resampler = CandleResampler(3)
+    for end in range(3, len(df) + 1):
+        prefix = df.iloc[:end]
+        _assert_same(resampler.update(prefix, now=NOW),
+                     TimeFrameConverter._convert_floor(prefix, 3, now=NOW))
+    # 마지막 진행 구간만 남기고 확정 구간은 보관
+    assert len(resampler) == len(TimeFrameConverter._convert_floor(df, 3, now=NOW)) - 1
+
+
+def test_in_progress_bucket_is_excluded_by_now():
+    df = _minute_frame(10)  # 09:00 ~ 09:09
+    now = pd.Timestamp('2025-01-03 09:10:05', tz='Asia/Seoul').to_pydatetime()
+    result = CandleResampler(3).update(df, now=now)
+    assert list(result['datetime'].dt.strftime('%H:%M')) == ['09:00', '09:03', '09:06']
+    _assert_same(result, TimeFrameConverter._convert_floor(df, 3, now=now))
+
+
+def test_revised_recent_bar_triggers_recompute():
+    df = _minute_frame(30)
+    resampler = CandleResampler(3)
+    resampler.update(df.iloc[:20], now=NOW)
+
+    # 실시간 갱신처럼 확정 구간 마지막 분봉을 덮어씀
+    revised = df.copy()
+    revised.loc[17, ['close', 'volume']] = [1, 1]
+    _assert_same(resampler.update(revised, now=NOW),
+                 TimeFrameConverter._convert_floor(revised, 3, now=NOW))
+
+
+def test_new_session_and_unsorted_input_fall_back_to_full():
+    resampler = CandleResampler(3)
+    resampler.update(_minute_frame(30), now=NOW)
+
+    next_day = _minute_frame(12, start='2025-01-06 09:00')
+    now = datetime(2025, 1, 6, 15, 40)
+    _assert_same(resampler.update(next_day, now=now),
+                 TimeFrameConverter._convert_floor(next_day, 3, now=now))
+
+    shuffled = next_day.iloc[::-1].reset_index(drop=True)
+    _assert_same(resampler.update(shuffled, now=now),
+                 TimeFrameConverter._convert_floor(shuffled, 3, now=now))
+
+
+@pytest.mark.parametrize('interval', [3, 5])
+def test_timezone_aware_input_and_other_intervals(interval):
+    df = _minute_frame(40, tz='Asia/Seoul')
+    resampler = CandleResampler(interval)
+    now = pd.Timestamp('2025-01-03 09:31', tz='Asia/Seoul').to_pydatetime()
+    for end in (interval, 17, 25, 40):
+        prefix = df.iloc[:end]
+        _assert_same(resampler.update(prefix, now=now),
+                     TimeFrameConverter._convert_floor(prefix, interval, now=now))
+
+
+def test_cached_view_per_stock_and_clear():
+    TimeFrameConverter.clear_cache()
+    df = _minute_frame(30)
+    a = TimeFrameConverter.get_cached_nmin_data('005930', df, now=NOW)
+    b = TimeFrameConverter.get_cached_nmin_data('000660', df.iloc[:9], now=NOW)
+    assert len(a) == 10 and len(b) == 3
+    assert ('005930', 3) in TimeFrameConverter._resamplers
+
+    TimeFrameConverter.clear_cache('005930')
+    assert ('005930', 3) not in TimeFrameConverter._resamplers
+    assert ('000660', 3) in TimeFrameConverter._resamplers
+    TimeFrameConverter.clear_cache()
+    assert not TimeFrameConverter._resamplers
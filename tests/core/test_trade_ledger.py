@@ -0,0 +1,73 @@
+"""db.trade_ledger 인메모리 거래 원장 단위 테스트 (DB 없음)."""
+from datetime import datetime
+
+from db.trade_ledger import TradeLedger
+from utils.korean_time import KST, now_kst
+
+
+class _FakeDB:
+    """_fetchall 만 흉내내는 DatabaseManager 대역 (쿼리 텍스트로 테이블/종류 구분)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def _fetchall(self, query, params=None):
+        self.calls += 1
+        table = 'real' if 'real_trading_records' in query else 'virtual'
+        kind = 'buys' if "action = 'BUY'" in query else 'sells'
+        return self.rows.get((table, kind), [])
+
+
+def _ts(day_offset_hhmm='09:10:00', date=None):
+    date = date or now_kst().strftime('%Y-%m-%d')
+    return f"{date} {day_offset_hhmm}"
+
+
+def test_load_and_queries_match_db_semantics():
+    db = _FakeDB({
+        ('real', 'buys'): [
+            (1, '005930', '삼성전자', 10, 70000.0, datetime(2026, 1, 2, 14, 40), 'macd_cross', 'sig'),
+            (2, '000660', 'SK하이닉스', 5, 120000.0, _ts('14:35:00'), 'macd_cross', 'sig'),
+        ],
+        ('real', 'sells'): [
+            (11, 'macd_cross', '2026-01-05 09:01:00', -3000.0, 9),
+            (10, 'macd_cross', '2026-01-04 09:01:00', 5000.0, 8),
+            (12, 'pullback', '2026-01-05 10:00:00', -100.0, 7),
+        ],
+        ('virtual', 'buys'): [
+            (3, '035720', '카카오', 7, 50000.0, _ts('14:32:00'), 'macd_cross', 'sig'),
+        ],
+    })
+    ledger = TradeLedger()
+    ledger.ensure_loaded(db)
+    ledger.ensure_loaded(db)
+    assert db.calls == 4  # 테이블당 BUY/SELL 1회씩, 재적재 없음
+
+    assert [r['id'] for r in ledger.open_positions('real', 'macd_cross')] == [1, 2]
+    assert ledger.count_today_buys('real', 'macd_cross') == 1
+    assert ledger.has_buy_today('real', 'macd_cross', '000660')
+    assert not ledger.has_buy_today('real', 'macd_cross', '005930')
+    assert ledger.realized_pnl('real', 'macd_cross') == [5000.0, -3000.0]
+    assert ledger.count_open('virtual', 'macd_cross') == 1
+    assert ledger.has_buy_today('virtual', 'macd_cross', '035720')
+
+
+def test_records_update_ledger_idempotently():
+    ledger = TradeLedger()
+    ledger.record_buy('virtual', 1, '005930', '삼성전자', 10, 70000, now_kst(), 'macd_cross')
+    assert not ledger.is_loaded and ledger.count_open('virtual', 'macd_cross') == 0  # 적재 전 무시
+
+    ledger.ensure_loaded(_FakeDB({}))
+    buy_time = KST.localize(datetime(2026, 1, 2, 14, 40))
+    ledger.record_buy('virtual', 1, '005930', '삼성전자', 10, 70000, now_kst(), 'macd_cross')
+    ledger.record_buy('virtual', 1, '005930', '삼성전자', 10, 70000, now_kst(), 'macd_cross')
+    ledger.record_buy('real', 2, '000660', 'SK하이닉스', 3, 120000, buy_time, 'macd_cross')
+    assert ledger.count_today_buys('virtual', 'macd_cross') == 1
+    assert ledger.open_positions('real')[0]['timestamp'] == datetime(2026, 1, 2, 14, 40)
+
+    ledger.record_sell('virtual', 5, 'macd_cross', now_kst(), -1200.0, buy_record_id=1)
+    ledger.record_sell('virtual', 5, 'macd_cross', now_kst(), -1200.0, buy_record_id=1)
+    assert ledger.open_positions('virtual') == []
+    assert ledger.has_buy_today('virtual', 'macd_cross', '005930')  # 청산돼도 당일 매수 이력은 유지
+    assert ledger.realized_pnl('virtual', 'macd_cross') == [-1200.0]
@@ -17,6 +17,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from config.strategy_settings import StrategySettings
+from db.trade_ledger import TradeLedger
 
 
 class _FakeBot:
@@ -39,6 +40,19 @@ def _bind(bot, *method_names):
         setattr(bot, name, DayTradingBot.__dict__[name].__get__(bot, _FakeBot))
 
 
+def _load_ledger_sells(bot, sell_rows):
+    """real_trading_records macd_cross SELL (timestamp, net_profit) 을 거래 원장 적재 결과로 주입."""
+    rows = [(i + 1, 'macd_cross', ts, pnl, None) for i, (ts, pnl) in enumerate(sell_rows)]
+
+    def fetchall(query, params=None):
+        if 'real_trading_records' in query and "action = 'BUY'" not in query:
+            return rows
+        return []
+
+    bot.db_manager._fetchall.side_effect = fetchall
+    bot.trade_ledger = TradeLedger()
+
+
 def test_macd_cross_mode_off_when_kill_switch_active(tmp_path, monkeypatch):
     """킬 스위치 발동 시 ACTIVE='macd_cross' + VIRTUAL_ONLY=False 라도 'off' 반환."""
     bot = _FakeBot()
@@ -100,7 +114,7 @@ def test_kill_switch_threshold_cumulative_loss(tmp_path):
     bot = _FakeBot()
     _bind(bot, '_check_macd_cross_kill_switch_thresholds',
           '_macd_cross_mode', '_is_macd_cross_kill_switch_active',
-          '_trigger_macd_cross_kill_switch')
+          '_trigger_macd_cross_kill_switch', '_ledger')
 
     # SELL records: 누적 -600,000 (10M 의 -6%)
     sell_rows = [
@@ -108,11 +122,7 @@ def test_kill_switch_threshold_cumulative_loss(tmp_path):
         (datetime(2026, 4, 28, 14, 31), -100_000),
         (datetime(2026, 4, 29, 14, 31), -300_000),  # 마지막 1건만 음수
     ]
-    cur_mock = MagicMock()
-    cur_mock.fetchall.return_value = sell_rows
-    conn_mock = MagicMock()
-    conn_mock.cursor.return_value = cur_mock
-    bot.db_manager._pool_obj.connection.return_value.__enter__.return_value = conn_mock
+    _load_ledger_sells(bot, sell_rows)
 
     with patch('main.__file__', str(tmp_path / 'main.py')):
         with patch.object(StrategySettings, 'ACTIVE_STRATEGY', 'macd_cross'):
@@ -131,7 +141,7 @@ def test_kill_switch_threshold_consecutive_losses(tmp_path):
     bot = _FakeBot()
     _bind(bot, '_check_macd_cross_kill_switch_thresholds',
           '_macd_cross_mode', '_is_macd_cross_kill_switch_active',
-          '_trigger_macd_cross_kill_switch')
+          '_trigger_macd_cross_kill_switch', '_ledger')
 
     # SELL: 처음 1건 +1M (이익), 이후 5연속 -100K = +500K 누적 (5%) but 5연속 손실
     sell_rows = [
@@ -142,11 +152,7 @@ def test_kill_switch_threshold_consecutive_losses(tmp_path):
         (datetime(2026, 4, 24, 14, 31), -100_000),
         (datetime(2026, 4, 27, 14, 31), -100_000),
     ]
-    cur_mock = MagicMock()
-    cur_mock.fetchall.return_value = sell_rows
-    conn_mock = MagicMock()
-    conn_mock.cursor.return_value = cur_mock
-    bot.db_manager._pool_obj.connection.return_value.__enter__.return_value = conn_mock
+    _load_ledger_sells(bot, sell_rows)
 
     with patch('main.__file__', str(tmp_path / 'main.py')):
         with patch.object(StrategySettings, 'ACTIVE_STRATEGY', 'macd_cross'):
@@ -165,7 +171,7 @@ def test_kill_switch_no_trigger_when_under_threshold(tmp_path):
     bot = _FakeBot()
     _bind(bot, '_check_macd_cross_kill_switch_thresholds',
           '_macd_cross_mode', '_is_macd_cross_kill_switch_active',
-          '_trigger_macd_cross_kill_switch')
+          '_trigger_macd_cross_kill_switch', '_ledger')
 
     sell_rows = [
         (datetime(2026, 4, 21, 14, 31), -100_000),
@@ -173,11 +179,7 @@ def test_kill_switch_no_trigger_when_under_threshold(tmp_path):
         (datetime(2026, 4, 23, 14, 31), -50_000),
         (datetime(2026, 4, 24, 14, 31), -50_000),  # 4연속 손실, 누적 -300K (=-3%)
     ]
-    cur_mock = MagicMock()
-    cur_mock.fetchall.return_value = sell_rows
-    conn_mock = MagicMock()
-    conn_mock.cursor.return_value = cur_mock
-    bot.db_manager._pool_obj.connection.return_value.__enter__.return_value = conn_mock
+    _load_ledger_sells(bot, sell_rows)
 
     with patch('main.__file__', str(tmp_path / 'main.py')):
         with patch.object(StrategySettings, 'ACTIVE_STRATEGY', 'macd_cross'):
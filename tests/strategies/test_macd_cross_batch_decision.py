@@ -0,0 +1,78 @@
+"""macd_cross 배치 매수 판단 (TradingDecisionEngine.analyze_buy_decisions_batch) 테스트."""
+import logging
+
+import numpy as np
+import pandas as pd
+
+from backtests.common.execution_model import ExecutionModel
+from core.strategies.macd_cross_signal import is_macd_golden_cross, macd_golden_cross_mask
+from core.strategies.macd_cross_strategy import MacdCrossStrategy
+from core.trading_decision_engine import TradingDecisionEngine
+
+
+def _engine(strategy):
+    engine = TradingDecisionEngine.__new__(TradingDecisionEngine)
+    engine.logger = logging.getLogger("test_macd_cross_batch_decision")
+    engine.macd_cross_strategy = strategy
+    return engine
+
+
+def _strategy(entries):
+    s = MacdCrossStrategy(entry_hhmm_min=1430, entry_hhmm_max=1500)
+    for code, hist, meta in entries:
+        s._cache[code] = hist
+        if meta is not None:
+            s._meta[code] = meta
+    return s
+
+
+def test_golden_cross_mask_matches_scalar():
+    rng = np.random.default_rng(0)
+    prev = pd.Series(rng.normal(size=500))
+    prev_prev = pd.Series(rng.normal(size=500))
+    prev[::17] = np.nan
+    prev_prev[::23] = np.nan
+    prev[5], prev_prev[5] = 0.0, -0.1  # 경계값
+    mask = macd_golden_cross_mask(prev, prev_prev)
+    expected = [is_macd_golden_cross(a, b) for a, b in zip(prev, prev_prev)]
+    assert mask.tolist() == expected
+
+
+def test_batch_matches_per_stock_loop_and_keeps_universe_order():
+    strategy = _strategy([
+        ("C", (0.4, -0.2), (10000.0, 5e9)),
+        ("A", (0.5, -0.3), (10000.0, 4e9)),
+        ("NOCROSS", (-0.1, -0.3), (10000.0, 4e9)),
+        ("LIMIT", (0.2, -0.1), (10000.0, 3e9)),  # 상한가 buffer 위반
+        ("NOPRICE", (0.2, -0.1), (10000.0, 3e9)),
+        ("NOMETA", (0.2, -0.1), None),
+        ("B", (0.1, -0.1), (20000.0, 2e9)),
+    ])
+    prices = {"A": 10100, "B": 20500, "C": 9900, "NOCROSS": 10000,
+              "LIMIT": 12900, "NOPRICE": 0, "NOMETA": 5000}
+
+    decisions = _engine(strategy).analyze_buy_decisions_batch(prices, hhmm=1431)
+
+    expected = []
+    for code in strategy._cache:
+        price = float(prices.get(code, 0))
+        prev_close, _ = strategy.get_daily_meta(code)
+        if not strategy.check_entry(code, 1431) or price <= 0:
+            continue
+        if prev_close and not ExecutionModel.is_price_limit_safe(price, prev_close, side="buy"):
+            continue
+        expected.append(code)
+
+    assert [d["stock_code"] for d in decisions] == expected == ["C", "A", "NOMETA", "B"]
+    first = decisions[0]
+    assert first["current_price"] == 9900.0
+    assert first["prev_trading_value"] == 5e9
+    assert first["universe_rank"] == 0
+    assert decisions[2]["prev_close"] is None
+
+
+def test_batch_outside_window_or_without_strategy_is_empty():
+    strategy = _strategy([("A", (0.5, -0.3), (10000.0, 4e9))])
+    assert _engine(strategy).analyze_buy_decisions_batch({"A": 10000}, hhmm=1400) == []
+    assert _engine(MacdCrossStrategy()).analyze_buy_decisions_batch({}, hhmm=1431) == []
+    assert _engine(None).analyze_buy_decisions_batch({"A": 10000}, hhmm=1431) == []
@@ -83,3 +83,33 @@ def test_set_daily_history_clears_meta_on_date_change():
     )
     assert s.get_daily_meta("005930") == (None, None)
     assert s.get_daily_meta("000660") != (None, None)
+
+
+def test_set_daily_histories_matches_per_stock_path():
+    """일괄 주입 (종가 행렬 MACD) 결과가 종목별 set_daily_history 와 동일 + universe 순서 유지."""
+    import numpy as np
+
+    rng = np.random.default_rng(7)
+    dates = pd.date_range("2025-01-02", periods=150, freq="B").strftime("%Y%m%d")
+    frames = []
+    for code, start in [("000660", 0), ("005930", 40), ("035720", 130)]:  # 035720: 이력 부족
+        closes = 10000 + rng.normal(0, 80, 150 - start).cumsum()
+        frame = pd.DataFrame({"trade_date": dates[start:], "close": closes,
+                              "trading_value": rng.uniform(1e9, 5e9, 150 - start)})
+        if code == "000660":
+            frame = frame.drop(index=[60, 61])  # 거래정지 구간
+        frames.append(frame.assign(stock_code=code))
+    long_df = pd.concat(frames, ignore_index=True)
+
+    single = MacdCrossStrategy()
+    for code, g in long_df.groupby("stock_code"):
+        single.set_daily_history(code, g[["trade_date", "close"]], "20250801",
+                                 prev_trading_value=g["trading_value"].iloc[-1])
+
+    batch = MacdCrossStrategy()
+    order = ["005930", "035720", "000660"]
+    assert batch.set_daily_histories(long_df.sample(frac=1, random_state=1), "20250801", order) == 2
+    assert list(batch._cache) == ["005930", "000660"]
+    for code in ["005930", "000660"]:
+        assert batch.get_cached_hist(code) == single.get_cached_hist(code)
+        assert batch.get_daily_meta(code) == single.get_daily_meta(code)
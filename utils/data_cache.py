@@ -7,8 +7,10 @@
 """
 import pandas as pd
 import threading
-from typing import Optional
+from datetime import datetime, time as dt_time
+from typing import Dict, Iterable, List, Optional, Tuple
 from utils.logger import setup_logger
+from db.bulk_copy import copy_upsert
 
 # PostgreSQL connection pool
 import psycopg2
@@ -26,7 +28,7 @@ def _get_pg_pool():
         with _pg_pool_lock:
             if _pg_pool is None or _pg_pool.closed:
                 from config.settings import PG_HOST, PG_PORT, PG_DATABASE, PG_USER, PG_PASSWORD
-                _pg_pool = psycopg2.pool.SimpleConnectionPool(
+                _pg_pool = psycopg2.pool.ThreadedConnectionPool(
                     minconn=1,
                     maxconn=5,
                     host=PG_HOST,
@@ -111,6 +113,92 @@ def _ensure_tables_once():
                 _tables_ensured = True
 
 
+# load_data_bulk / load_day_stats 공통: 요청 (종목, 날짜) 쌍별 서버측 완결성 통계
+_BULK_STATS_CTE = '''
+    WITH req AS (
+        SELECT DISTINCT * FROM unnest(%(codes)s::varchar[], %(dates)s::varchar[]) AS r(stock_code, trade_date)
+    ),
+    stats AS (
+        SELECT m.stock_code, m.trade_date,
+               MIN(m.datetime::time) AS first_time,
+               MAX(m.datetime::time) AS last_time,
+               COUNT(*) AS bar_count
+        FROM minute_candles m
+        JOIN req ON m.stock_code = req.stock_code AND m.trade_date = req.trade_date
+        GROUP BY m.stock_code, m.trade_date
+    )
+'''
+
+_MINUTE_COLUMNS = ['date', 'time', 'close', 'open', 'high', 'low', 'volume', 'amount', 'datetime']
+
+
+def required_last_bar_time(date_str: str) -> dt_time:
+    """완결된 하루 분봉으로 인정할 마지막 봉 최소 시각
+
+    기존 검사 (시장 시작 이후 봉 존재 + 마감 1시간 전 이후 봉 존재) 는
+    마지막 봉 시각 >= max(시장 시작, 마감 1시간 전) 과 같습니다.
+    """
+    from config.market_hours import MarketHours
+    market_hours = MarketHours.get_market_hours('KRX', datetime.strptime(date_str, '%Y%m%d'))
+    market_open_time = market_hours['market_open']
+    check_time = dt_time(market_hours['market_close'].hour - 1, 0)
+    return max(market_open_time, check_time)
+
+
+def _split_bulk_frame(df: pd.DataFrame) -> Dict[Tuple[str, str], pd.DataFrame]:
+    """(stock_code, trade_date, idx) 정렬된 bulk 조회 결과 → {(종목, 날짜): load_data 와 같은 형식 DF}"""
+    if df.empty:
+        return {}
+    df['datetime'] = pd.to_datetime(df['datetime'])
+    for col in ['close', 'open', 'high', 'low', 'volume', 'amount']:
+        df[col] = df[col].astype(float)
+
+    result: Dict[Tuple[str, str], pd.DataFrame] = {}
+    for key, part in df.groupby(['stock_code', 'trade_date'], sort=False):
+        frame = part[['idx'] + _MINUTE_COLUMNS].set_index('idx')
+        result[key] = frame
+    return result
+
+
+def _minute_cache_frame(stock_code: str, date_str: str, df_minute: pd.DataFrame) -> pd.DataFrame:
+    """분봉 DF → minute_candles 적재용 컬럼 (기존 행 단위 변환과 동일한 값)"""
+    df_minute = df_minute.reset_index(drop=True)
+
+    def text(col):
+        if col not in df_minute.columns:
+            return None
+        values = df_minute[col]
+        return values.astype(str).where(values.notna(), None)
+
+    def number(col):
+        if col not in df_minute.columns:
+            return 0.0
+        return df_minute[col].astype(float).fillna(0)
+
+    dt_values = df_minute['datetime'] if 'datetime' in df_minute.columns else None
+    if dt_values is not None and not pd.api.types.is_datetime64_any_dtype(dt_values):
+        dt_values = dt_values.map(
+            lambda v: v.strftime('%Y-%m-%d %H:%M:%S') if hasattr(v, 'strftime') and pd.notna(v)
+            else (str(v) if v is not None else None)
+        )
+
+    frame = pd.DataFrame({
+        'stock_code': stock_code,
+        'trade_date': date_str,
+        'idx': df_minute.index,
+        'date': text('date'),
+        'time': text('time'),
+        'close': number('close'),
+        'open': number('open'),
+        'high': number('high'),
+        'low': number('low'),
+        'volume': number('volume'),
+        'amount': number('amount'),
+        'datetime': dt_values,
+    }, index=df_minute.index)
+    return frame
+
+
 class DataCache:
     """PostgreSQL 기반 분봉 데이터 캐시 관리자"""
 
@@ -164,41 +252,8 @@ class DataCache:
             cur.execute("DELETE FROM minute_candles WHERE stock_code = %s AND trade_date = %s",
                         (stock_code, date_str))
 
-            # DataFrame 준비
-            df_to_save = df_minute.copy().reset_index(drop=True)
-
-            rows = []
-            for idx, row in df_to_save.iterrows():
-                dt_val = row.get('datetime', None)
-                if dt_val is not None and hasattr(dt_val, 'strftime'):
-                    dt_str = dt_val.strftime('%Y-%m-%d %H:%M:%S')
-                else:
-                    dt_str = str(dt_val) if dt_val is not None else None
-
-                rows.append((
-                    stock_code,
-                    date_str,
-                    int(idx),
-                    str(row.get('date', '')) if pd.notna(row.get('date', None)) else None,
-                    str(row.get('time', '')) if pd.notna(row.get('time', None)) else None,
-                    float(row.get('close', 0)) if pd.notna(row.get('close', 0)) else 0,
-                    float(row.get('open', 0)) if pd.notna(row.get('open', 0)) else 0,
-                    float(row.get('high', 0)) if pd.notna(row.get('high', 0)) else 0,
-                    float(row.get('low', 0)) if pd.notna(row.get('low', 0)) else 0,
-                    float(row.get('volume', 0)) if pd.notna(row.get('volume', 0)) else 0,
-                    float(row.get('amount', 0)) if pd.notna(row.get('amount', 0)) else 0,
-                    dt_str,
-                ))
-
-            if rows:
-                psycopg2.extras.execute_batch(
-                    cur,
-                    '''INSERT INTO minute_candles
-                    (stock_code, trade_date, idx, date, time, close, open, high, low, volume, amount, datetime)
-                    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)''',
-                    rows,
-                    page_size=500,
-                )
+            copy_upsert(cur, 'minute_candles', _minute_cache_frame(stock_code, date_str, df_minute),
+                        key_columns=['stock_code', 'trade_date', 'idx'])
 
             conn.commit()
             self.logger.debug(f"[{stock_code}] PG 저장 완료 ({len(df_minute)}개)")
@@ -245,6 +300,76 @@ class DataCache:
             self.logger.debug(f"PG 로드 실패: {e}")
             return None
 
+    def load_data_bulk(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        min_last_time: Optional[dt_time] = None
+    ) -> Dict[Tuple[str, str], pd.DataFrame]:
+        """여러 (종목, 날짜) 1분봉을 쿼리 한 번으로 로드
+
+        Args:
+            pairs: (stock_code, date_str) 목록
+            min_last_time: 지정 시 마지막 봉 시각이 이 값 이상인 (완결된) 날만 반환
+                (서버측 집계로 판단, 예: required_last_bar_time(date_str))
+
+        Returns:
+            {(stock_code, date_str): DataFrame} — load_data 와 같은 컬럼/idx 인덱스,
+            datetime 은 datetime64, 가격/거래량은 float. 데이터가 없거나 불완전한 쌍은 제외.
+        """
+        codes, dates = self._unzip_pairs(pairs)
+        if not codes:
+            return {}
+        try:
+            pool = _get_pg_pool()
+            conn = pool.getconn()
+            try:
+                df = pd.read_sql_query(
+                    _BULK_STATS_CTE + '''
+                    SELECT m.stock_code, m.trade_date, m.idx, m.date, m.time,
+                           m.close, m.open, m.high, m.low, m.volume, m.amount, m.datetime
+                    FROM minute_candles m
+                    JOIN stats s ON m.stock_code = s.stock_code AND m.trade_date = s.trade_date
+                    WHERE %(min_last)s::time IS NULL OR s.last_time >= %(min_last)s::time
+                    ORDER BY m.stock_code, m.trade_date, m.idx''',
+                    conn,
+                    params={'codes': codes, 'dates': dates, 'min_last': min_last_time}
+                )
+            finally:
+                pool.putconn(conn)
+            return _split_bulk_frame(df)
+        except Exception as e:
+            self.logger.error(f"캐시 일괄 로드 실패 ({len(codes)}건): {e}")
+            return {}
+
+    def load_day_stats(self, pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict]:
+        """(종목, 날짜) 별 분봉 완결성 통계 (첫/마지막 봉 시각, 봉 개수) 일괄 조회"""
+        codes, dates = self._unzip_pairs(pairs)
+        if not codes:
+            return {}
+        try:
+            pool = _get_pg_pool()
+            conn = pool.getconn()
+            try:
+                cur = conn.cursor()
+                cur.execute(
+                    _BULK_STATS_CTE + "SELECT stock_code, trade_date, first_time, last_time, bar_count FROM stats",
+                    {'codes': codes, 'dates': dates}
+                )
+                return {
+                    (code, date): {'first_time': first, 'last_time': last, 'bar_count': int(count)}
+                    for code, date, first, last, count in cur.fetchall()
+                }
+            finally:
+                pool.putconn(conn)
+        except Exception as e:
+            self.logger.error(f"캐시 통계 조회 실패 ({len(codes)}건): {e}")
+            return {}
+
+    @staticmethod
+    def _unzip_pairs(pairs: Iterable[Tuple[str, str]]) -> Tuple[List[str], List[str]]:
+        pairs = list(pairs)
+        return [code for code, _ in pairs], [date for _, date in pairs]
+
     def clear_cache(self, stock_code: str = None, date_str: str = None):
         """캐시 정리"""
         try:
@@ -358,53 +483,16 @@ class DailyDataCache:
                     'acml_vol', 'acml_tr_pbmn', 'flng_cls_code', 'prtt_rate', 'mod_yn',
                     'prdy_vrss_sign', 'prdy_vrss', 'revl_issu_reas']
 
-            df_to_save = df_daily.copy()
-            for col in cols:
-                if col not in df_to_save.columns:
-                    df_to_save[col] = ''
-
-            rows = []
-            dates = []
-            for _, row in df_to_save.iterrows():
-                date_val = str(row.get('stck_bsop_date', ''))
-                if not date_val:
-                    continue
-                dates.append(date_val)
-                rows.append((
-                    stock_code,
-                    date_val,
-                    str(row.get('stck_clpr', '')),
-                    str(row.get('stck_oprc', '')),
-                    str(row.get('stck_hgpr', '')),
-                    str(row.get('stck_lwpr', '')),
-                    str(row.get('acml_vol', '')),
-                    str(row.get('acml_tr_pbmn', '')),
-                    str(row.get('flng_cls_code', '')),
-                    str(row.get('prtt_rate', '')),
-                    str(row.get('mod_yn', '')),
-                    str(row.get('prdy_vrss_sign', '')),
-                    str(row.get('prdy_vrss', '')),
-                    str(row.get('revl_issu_reas', '')),
-                ))
-
-            if rows:
-                # 기존 날짜 데이터 삭제
-                if dates:
-                    cur.execute(
-                        "DELETE FROM daily_candles WHERE stock_code = %s AND stck_bsop_date = ANY(%s)",
-                        (stock_code, dates)
-                    )
-
-                psycopg2.extras.execute_batch(
-                    cur,
-                    '''INSERT INTO daily_candles
-                    (stock_code, stck_bsop_date, stck_clpr, stck_oprc, stck_hgpr, stck_lwpr,
-                     acml_vol, acml_tr_pbmn, flng_cls_code, prtt_rate, mod_yn,
-                     prdy_vrss_sign, prdy_vrss, revl_issu_reas)
-                    VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)''',
-                    rows,
-                    page_size=500,
-                )
+            # 기존 행 단위 str(row.get(col, '')) 와 동일한 문자열 변환
+            frame = pd.DataFrame({
+                col: df_daily[col].astype(str) if col in df_daily.columns else ''
+                for col in cols
+            }, index=df_daily.index)
+            frame = frame[frame['stck_bsop_date'] != '']
+            frame.insert(0, 'stock_code', stock_code)
+
+            # 같은 날짜는 DELETE 후 INSERT 하던 것을 (stock_code, stck_bsop_date) upsert 로 대체
+            copy_upsert(cur, 'daily_candles', frame, key_columns=['stock_code', 'stck_bsop_date'])
 
             conn.commit()
             self.logger.debug(f"[{stock_code}] 일봉 PG 저장 완료 ({len(df_daily)}개)")
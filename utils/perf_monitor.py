@@ -0,0 +1,245 @@
+"""
+트레이딩 봇 성능 계측 (태스크 주기 소요 시간 / 이벤트 루프 지연 / KIS 호출 지연)
+
+매도 누락 등이 API 지연 때문인지, CPU 작업 때문인지, 이벤트 루프 블로킹 때문인지
+구분할 수 있도록 다음을 상시 수집한다.
+- 태스크 사이클별 소요 시간 히스토그램 (@timed / measure())
+- 이벤트 루프 지연: 주기적으로 sleep 후 예정 시각 대비 늦게 깨어난 시간
+- KIS 호출 지연: api.kis_http TR ID 별 통계 + 레이트 리미터 레인별 대기 시간
+
+요약은 주기적으로 로그와 logs/perf/perf_YYYYMMDD.json 으로 기록되고,
+텔레그램 /perf 명령으로 조회할 수 있다.
+
+Usage:
+    from utils.perf_monitor import get_perf_monitor, timed
+
+    @timed('update_intraday_data')
+    async def _update_intraday_data(self): ...
+
+    with get_perf_monitor().measure('screener'):
+        run_screener()
+
+    asyncio.create_task(get_perf_monitor().run())  # 루프 지연 샘플링 + 주기 덤프
+"""
+import asyncio
+import bisect
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from utils.korean_time import now_kst
+from utils.logger import setup_logger
+
+# 히스토그램 버킷 상한 (ms). 마지막 버킷은 그 이상 전부.
+BUCKET_BOUNDS_MS: List[float] = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000]
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램 (스레드 안전)"""
+
+    def __init__(self, bounds_ms: Optional[List[float]] = None):
+        self.bounds_ms = list(bounds_ms or BUCKET_BOUNDS_MS)
+        self.labels = [f'<={b:g}' for b in self.bounds_ms] + [f'>{self.bounds_ms[-1]:g}']
+        self._buckets = [0] * (len(self.bounds_ms) + 1)
+        self._count = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+        self._last_ms = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        ms = max(seconds, 0.0) * 1000.0
+        with self._lock:
+            self._buckets[bisect.bisect_left(self.bounds_ms, ms)] += 1
+            self._count += 1
+            self._total_ms += ms
+            self._last_ms = ms
+            if ms > self._max_ms:
+                self._max_ms = ms
+
+    def _percentile(self, q: float) -> float:
+        """q 분위가 속한 버킷의 상한 (최대값으로 제한)"""
+        if self._count == 0:
+            return 0.0
+        target = q * self._count
+        seen = 0
+        for i, n in enumerate(self._buckets):
+            seen += n
+            if seen >= target and n:
+                upper = self.bounds_ms[i] if i < len(self.bounds_ms) else self._max_ms
+                return min(upper, self._max_ms)
+        return self._max_ms
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            count = self._count
+            return {
+                'count': count,
+                'avg_ms': self._total_ms / count if count else 0.0,
+                'p50_ms': self._percentile(0.50),
+                'p95_ms': self._percentile(0.95),
+                'p99_ms': self._percentile(0.99),
+                'max_ms': self._max_ms,
+                'last_ms': self._last_ms,
+                'buckets': {label: n for label, n in zip(self.labels, self._buckets) if n},
+            }
+
+
+class PerfMonitor:
+    """태스크 소요 시간 / 루프 지연 수집기"""
+
+    def __init__(self, lag_interval: float = 0.5, dump_interval: float = 300.0,
+                 dump_dir: Optional[Path] = None):
+        """
+        Args:
+            lag_interval: 이벤트 루프 지연 샘플링 주기 (초)
+            dump_interval: 요약 로그/JSON 기록 주기 (초)
+            dump_dir: JSON 저장 디렉토리 (기본 logs/perf)
+        """
+        self.logger = setup_logger(__name__)
+        self.lag_interval = lag_interval
+        self.dump_interval = dump_interval
+        self.dump_dir = Path(dump_dir) if dump_dir else Path('logs') / 'perf'
+        self._tasks: Dict[str, LatencyHistogram] = {}
+        self._loop_lag = LatencyHistogram()
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+
+    # 수집
+    def record(self, name: str, seconds: float) -> None:
+        hist = self._tasks.get(name)
+        if hist is None:
+            with self._lock:
+                hist = self._tasks.setdefault(name, LatencyHistogram())
+        hist.record(seconds)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """블록 소요 시간 기록 (예외가 나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record_loop_lag(self, seconds: float) -> None:
+        self._loop_lag.record(seconds)
+
+    async def sample_loop_lag(self) -> None:
+        """lag_interval 마다 예정 대비 늦게 깨어난 시간을 루프 지연으로 기록"""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.lag_interval
+            await asyncio.sleep(self.lag_interval)
+            self.record_loop_lag(loop.time() - expected)
+
+    async def run(self) -> None:
+        """루프 지연 샘플링 + 주기적 요약 덤프 (봇 종료 시 cancel)"""
+        sampler = asyncio.create_task(self.sample_loop_lag(), name='perf_loop_lag')
+        try:
+            while True:
+                await asyncio.sleep(self.dump_interval)
+                try:
+                    self.logger.info(self.format_summary())
+                    await asyncio.to_thread(self.dump_json)
+                except Exception as e:
+                    self.logger.warning(f"성능 요약 기록 실패: {e}")
+        finally:
+            sampler.cancel()
+
+    # 조회
+    def snapshot(self) -> Dict[str, Any]:
+        """전체 계측 값 (JSON 직렬화 가능)"""
+        with self._lock:
+            tasks = dict(self._tasks)
+        result: Dict[str, Any] = {
+            'timestamp': now_kst().strftime('%Y-%m-%d %H:%M:%S'),
+            'uptime_sec': time.time() - self._started_at,
+            'loop_lag': self._loop_lag.summary(),
+            'tasks': {name: hist.summary() for name, hist in sorted(tasks.items())},
+        }
+        try:
+            from api import kis_http, kis_rate_limiter
+            result['kis_calls'] = kis_http.get_call_stats()
+            result['kis_rate_lanes'] = kis_rate_limiter.get_scheduler().get_stats()
+        except Exception:
+            result['kis_calls'] = {}
+            result['kis_rate_lanes'] = {}
+        return result
+
+    def format_summary(self, top_kis: int = 5) -> str:
+        """텔레그램/로그용 요약 텍스트"""
+        snap = self.snapshot()
+        lag = snap['loop_lag']
+        lines = [
+            f"⏱️ 성능 요약 ({snap['timestamp']})",
+            f"루프 지연: p50 {lag['p50_ms']:.0f} / p95 {lag['p95_ms']:.0f} / max {lag['max_ms']:.0f}ms "
+            f"({lag['count']}회)",
+        ]
+        if snap['tasks']:
+            lines.append("태스크 (avg / p95 / max ms, 횟수):")
+            for name, s in snap['tasks'].items():
+                lines.append(f"• {name}: {s['avg_ms']:.0f} / {s['p95_ms']:.0f} / {s['max_ms']:.0f} ({s['count']})")
+        calls = sorted(snap['kis_calls'].items(), key=lambda kv: kv[1]['calls'] * kv[1]['avg_ms'], reverse=True)
+        if calls:
+            lines.append("KIS 호출 (avg / max ms, 횟수, 오류):")
+            for tr_id, s in calls[:top_kis]:
+                lines.append(f"• {tr_id}: {s['avg_ms']:.0f} / {s['max_ms']:.0f} ({s['calls']}, {s['errors']})")
+        lanes = {k: v for k, v in snap['kis_rate_lanes'].items() if not k.startswith('_') and v.get('calls')}
+        if lanes:
+            lines.append("레이트 리미터 대기 (avg / max ms): " + ', '.join(
+                f"{lane} {s['avg_wait_ms']:.0f}/{s['max_wait_ms']:.0f}" for lane, s in lanes.items()
+            ))
+        return '\n'.join(lines)
+
+    def dump_json(self, path: Optional[Path] = None) -> Path:
+        """스냅샷을 JSON 파일로 저장 (기본 logs/perf/perf_YYYYMMDD.json, 덮어쓰기)"""
+        if path is None:
+            path = self.dump_dir / f"perf_{now_kst().strftime('%Y%m%d')}.json"
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False, indent=2)
+        return path
+
+    def reset(self) -> None:
+        with self._lock:
+            self._tasks.clear()
+            self._loop_lag = LatencyHistogram()
+            self._started_at = time.time()
+
+
+_monitor: Optional[PerfMonitor] = None
+_monitor_lock = threading.Lock()
+
+
+def get_perf_monitor() -> PerfMonitor:
+    """프로세스 공용 PerfMonitor (최초 호출 시 생성)"""
+    global _monitor
+    if _monitor is None:
+        with _monitor_lock:
+            if _monitor is None:
+                _monitor = PerfMonitor()
+    return _monitor
+
+
+def timed(name: str) -> Callable:
+    """async/sync 함수 호출 소요 시간을 name 으로 기록하는 데코레이터"""
+    def decorator(func: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with get_perf_monitor().measure(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with get_perf_monitor().measure(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
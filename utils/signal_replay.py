@@ -293,29 +293,24 @@ def list_all_buy_signals(df_3min: pd.DataFrame, df_1min: Optional[pd.DataFrame]
         
         buy_signals = []
 
-        # 각 3분봉 시점에서 실시간과 동일한 방식으로 신호 체크 (시계열 순서 유지)
-        for i in range(len(df_3min)):
-            # 해당 시점까지의 데이터만 사용 (실시간과 동일)
-            current_data = df_3min.iloc[:i+1].copy()
-
-            if len(current_data) < 5:  # 최소 데이터 요구사항
-                continue
+        # 평가 대상 봉: 최소 5개 데이터 이후, ⚡ 12시 이후 신호는 건너뛰기
+        if 'datetime' in df_3min.columns:
+            candle_times = df_3min['datetime'].tolist()
+            indices = [
+                i for i in range(4, len(df_3min))
+                if not (hasattr(candle_times[i], 'hour') and candle_times[i].hour >= 12)
+            ]
+        else:
+            indices = list(range(4, len(df_3min)))
 
-            # ⚡ 성능 최적화: 12시 이후 신호는 건너뛰기
-            current_row = df_3min.iloc[i]
-            if 'datetime' in current_row:
-                current_time = current_row['datetime']
-                if hasattr(current_time, 'hour') and current_time.hour >= 12:
-                    continue  # 12시 이후는 신호 계산 생략
-            
-            # ==================== 신호 생성 로직 선택 ====================
-            # 🔄 현재 로직 사용 (개선된 버전)
-            signal_strength = PullbackCandlePattern.generate_improved_signals(
-                current_data,
-                stock_code=stock_code,
-                debug=True
-            )
-            
+        # 각 3분봉 시점에서 실시간과 동일한 방식으로 신호 체크 (시계열 순서 유지)
+        # 스트리밍 평가: 봉마다 generate_improved_signals(df_3min.iloc[:i+1]) 와 동일한 결과
+        for i, signal_strength in PullbackCandlePattern.iter_improved_signals(
+            df_3min,
+            stock_code=stock_code,
+            debug=True,
+            indices=indices
+        ):
             if signal_strength is None:
                 continue
             
@@ -323,6 +318,9 @@ def list_all_buy_signals(df_3min: pd.DataFrame, df_1min: Optional[pd.DataFrame]
             if signal_strength.signal_type in [SignalType.STRONG_BUY, SignalType.CAUTIOUS_BUY]:
                 print(f"✅ {stock_code} 매수 신호 감지: {signal_strength.signal_type.value} (신뢰도: {signal_strength.confidence:.1f}%)")
 
+                # 해당 시점까지의 데이터만 사용 (실시간과 동일)
+                current_data = df_3min.iloc[:i+1].copy()
+
                 # 🎯 간단한 패턴 필터 적용 (명백히 약한 패턴만 차단)
                 try:
                     from core.indicators.simple_pattern_filter import SimplePatternFilter
@@ -928,6 +926,10 @@ def simulate_trades(df_3min: pd.DataFrame, df_1min: Optional[pd.DataFrame] = Non
             max_loss_rate = 0.0
             sell_reason = ""
             
+            # 3분봉 증분 변환기 (매도 구간 동안 새 1분봉만 반영)
+            from core.timeframe_converter import CandleResampler
+            resampler_3min = CandleResampler(3)
+
             for i, row in remaining_data.iterrows():
                 candle_time = row['datetime']
                 candle_high = row['high']
@@ -997,8 +999,7 @@ def simulate_trades(df_3min: pd.DataFrame, df_1min: Optional[pd.DataFrame] = Non
                     data_until_now = df_1min[df_1min['datetime'] <= current_time]
                     if len(data_until_now) >= 15:  # 최소 15개 1분봉 필요
                         try:
-                            from core.timeframe_converter import TimeFrameConverter
-                            data_3min_current = TimeFrameConverter.convert_to_3min_data(data_until_now)
+                            data_3min_current = resampler_3min.update(data_until_now)
                             
                             if data_3min_current is not None and len(data_3min_current) >= 5:
                                 # 3분봉 기반 매도 신호 계산
@@ -1446,9 +1447,15 @@ def main():
             # 과거 날짜인 경우 캐시 먼저 확인
             if date_str != today_str:
                 # PG 캐시에서 먼저 시도
-                from utils.data_cache import DataCache
+                from utils.data_cache import DataCache, required_last_bar_time
                 minute_cache = DataCache()
-                cached_data = minute_cache.load_data(stock_code, date_str)
+                if stock_code in prefetched_minute:
+                    # 일괄 로드에서 이미 완결성 검증된 데이터
+                    cached_data = None
+                    df_1min = prefetched_minute[stock_code]
+                    logger.info(f"💾 [{stock_code}] 캐시 데이터 사용 - {len(df_1min)}개 봉")
+                else:
+                    cached_data = minute_cache.load_data(stock_code, date_str)
 
                 if cached_data is not None:
                     try:
@@ -1464,16 +1471,10 @@ def main():
                             market_open_time = market_hours['market_open']
                             market_close_time = market_hours['market_close']
 
-                            # 시간대 추출
-                            times = cached_data['datetime'].dt.time
+                            # 시장 시작 이후 + 마감 1시간 전 이후 데이터 확인 (마지막 봉 시각 기준)
+                            last_time = cached_data['datetime'].dropna().dt.time.max()
 
-                            # 시장 시작 시간 이후 데이터 확인
-                            has_morning = any(t >= market_open_time for t in times)
-                            # 시장 마감 시간 이전 데이터 확인 (15:00 또는 16:00 체크)
-                            check_time = time(market_close_time.hour - 1, 0)  # 마감 1시간 전 체크
-                            has_afternoon = any(t >= check_time for t in times)
-
-                            if has_morning and has_afternoon:
+                            if pd.notna(last_time) and last_time >= required_last_bar_time(date_str):
                                 df_1min = cached_data
                                 logger.info(f"💾 [{stock_code}] 캐시 데이터 사용 - {len(df_1min)}개 봉")
                             else:
@@ -1584,6 +1585,23 @@ def main():
     all_stock_data: Dict[str, pd.DataFrame] = {}  # 🆕 상세 분석용 데이터 저장
     all_missed_opportunities: Dict[str, List[Dict[str, object]]] = {}  # 🆕 매수 못한 기회들
     
+    # 과거 날짜는 1분봉을 쿼리 한 번으로 일괄 로드 (완결된 날만, 나머지는 종목별 경로)
+    prefetched_minute: Dict[str, pd.DataFrame] = {}
+    from utils.korean_time import now_kst
+    if date_str != now_kst().strftime("%Y%m%d"):
+        from utils.data_cache import DataCache, required_last_bar_time
+        bulk = DataCache().load_data_bulk(
+            [(code, date_str) for code in codes_union],
+            min_last_time=required_last_bar_time(date_str)
+        )
+        prefetched_minute = {code: df for (code, _), df in bulk.items()}
+        logger.info(f"💾 1분봉 일괄 로드: {len(prefetched_minute)}/{len(codes_union)}종목")
+
+    # 일봉 특징 테이블 선생성 (고급 필터 — 종목별 일봉 로드를 스레드 시작 전에 한 번씩)
+    if advanced_filter_enabled and advanced_filter_manager is not None:
+        loaded = advanced_filter_manager.preload_daily_features(codes_union)
+        logger.info(f"🔰 일봉 특징 테이블 생성: {loaded}/{len(codes_union)}종목")
+
     with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
         # 모든 종목을 병렬로 처리
         future_to_stock = {
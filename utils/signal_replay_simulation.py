@@ -264,6 +264,10 @@ class TradeSellSimulator:
         profit_target_price = buy_price * (1.0 + target_profit_rate)
         stop_loss_target_price = buy_price * (1.0 - stop_loss_rate)
 
+        # 3분봉 증분 변환기 (매도 구간 동안 새 1분봉만 반영)
+        from core.timeframe_converter import CandleResampler
+        resampler_3min = CandleResampler(3)
+
         for i, row in remaining_data.iterrows():
             candle_time = row['datetime']
             candle_high = row['high']
@@ -320,7 +324,7 @@ class TradeSellSimulator:
             # 3분봉 기반 기술적 분석 매도 신호
             if candle_time.minute % 3 == 0:
                 technical_result = self._check_technical_sell(
-                    df_1min, candle_time, entry_low
+                    df_1min, candle_time, entry_low, resampler_3min
                 )
                 if technical_result['should_sell']:
                     return {
@@ -343,15 +347,19 @@ class TradeSellSimulator:
         }
 
     def _check_technical_sell(self, df_1min: pd.DataFrame,
-                              current_time: datetime, entry_low: float) -> Dict:
-        """3분봉 기반 기술적 분석 매도 신호"""
+                              current_time: datetime, entry_low: float,
+                              resampler=None) -> Dict:
+        """3분봉 기반 기술적 분석 매도 신호 (resampler: 증분 3분봉 변환기, 없으면 전체 변환)"""
         try:
             data_until_now = df_1min[df_1min['datetime'] <= current_time]
             if len(data_until_now) < 15:
                 return {'should_sell': False, 'reason': ''}
 
-            from core.timeframe_converter import TimeFrameConverter
-            data_3min_current = TimeFrameConverter.convert_to_3min_data(data_until_now)
+            if resampler is not None:
+                data_3min_current = resampler.update(data_until_now)
+            else:
+                from core.timeframe_converter import TimeFrameConverter
+                data_3min_current = TimeFrameConverter.convert_to_3min_data(data_until_now)
 
             if data_3min_current is None or len(data_3min_current) < 5:
                 return {'should_sell': False, 'reason': ''}
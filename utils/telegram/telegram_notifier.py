@@ -101,6 +101,7 @@ class TelegramNotifier:
             CommandHandler("positions", self._cmd_positions),
             CommandHandler("orders", self._cmd_orders),
             CommandHandler("virtual", self._cmd_virtual_stats),
+            CommandHandler("perf", self._cmd_perf),
             CommandHandler("help", self._cmd_help),
             CommandHandler("stop", self._cmd_stop),
         ]
@@ -419,6 +420,18 @@ class TelegramNotifier:
             self.logger.error(f"가상 매매 통계 조회 오류: {e}")
             await update.message.reply_text(f"⚠️ 통계 조회 중 오류가 발생했습니다: {str(e)}")
     
+    async def _cmd_perf(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """성능 계측 요약 명령어 (루프 지연 / 태스크 소요 시간 / KIS 호출 지연)"""
+        if str(update.effective_chat.id) != self.chat_id:
+            return
+        
+        try:
+            from utils.perf_monitor import get_perf_monitor
+            await update.message.reply_text(get_perf_monitor().format_summary())
+        except Exception as e:
+            self.logger.error(f"성능 요약 조회 오류: {e}")
+            await update.message.reply_text(f"⚠️ 성능 요약 조회 중 오류가 발생했습니다: {str(e)}")
+    
     async def _cmd_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """도움말 명령어"""
         if str(update.effective_chat.id) != self.chat_id:
@@ -431,6 +444,7 @@ class TelegramNotifier:
 /positions - 보유 포지션 조회  
 /orders - 주문 현황 조회
 /virtual - 가상 매매 통계 조회
+/perf - 성능 계측 요약 (루프 지연/태스크/KIS)
 /help - 도움말 표시
 /stop - 시스템 종료
 